@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import json
+import time
+import tracemalloc
+
+
+def pod(i=0):
+    """
+    A pod as the API server returns it: labels, annotations, an owner, two containers
+    with probes, env, ports, resources and mounts, volumes, and a full status.
+    """
+
+    name = "web-7d9f8b6c4d-{0:05d}".format(i)
+    return {
+        "kind": "Pod",
+        "apiVersion": "v1",
+        "metadata": {
+            "name": name,
+            "generateName": "web-7d9f8b6c4d-",
+            "namespace": "ns-{0}".format(i % 20),
+            "selfLink": "/api/v1/namespaces/ns-{0}/pods/{1}".format(i % 20, name),
+            "uid": "8a1b2c3d-0000-4000-8000-{0:012d}".format(i),
+            "resourceVersion": str(100000 + i),
+            "creationTimestamp": "2018-06-01T12:00:00Z",
+            "labels": {"app": "web", "tier": "frontend", "pod-template-hash": "7d9f8b6c4d", "shard": str(i % 8)},
+            "annotations": {"prometheus.io/scrape": "true", "prometheus.io/port": "9102"},
+            "ownerReferences": [
+                {
+                    "apiVersion": "extensions/v1beta1",
+                    "kind": "ReplicaSet",
+                    "name": "web-7d9f8b6c4d",
+                    "uid": "5e6f7a8b-0000-4000-8000-000000000001",
+                    "controller": True,
+                    "blockOwnerDeletion": True,
+                }
+            ],
+        },
+        "spec": {
+            "volumes": [
+                {"name": "config", "configMap": {"name": "web-config", "defaultMode": 420}},
+                {"name": "default-token-abcde", "secret": {"secretName": "default-token-abcde", "defaultMode": 420}},
+            ],
+            "containers": [
+                {
+                    "name": "web",
+                    "image": "nginx:1.15.0",
+                    "ports": [{"name": "http", "containerPort": 80, "protocol": "TCP"}],
+                    "env": [{"name": "ENV", "value": "production"}, {"name": "SHARD", "value": str(i % 8)}],
+                    "resources": {"limits": {"cpu": "500m", "memory": "256Mi"}, "requests": {"cpu": "100m", "memory": "128Mi"}},
+                    "volumeMounts": [
+                        {"name": "config", "mountPath": "/etc/nginx/conf.d"},
+                        {"name": "default-token-abcde", "readOnly": True, "mountPath": "/var/run/secrets/kubernetes.io/serviceaccount"},
+                    ],
+                    "livenessProbe": {
+                        "httpGet": {"path": "/healthz", "port": 80, "scheme": "HTTP"},
+                        "initialDelaySeconds": 10,
+                        "timeoutSeconds": 1,
+                        "periodSeconds": 10,
+                        "successThreshold": 1,
+                        "failureThreshold": 3,
+                    },
+                    "readinessProbe": {
+                        "httpGet": {"path": "/ready", "port": 80, "scheme": "HTTP"},
+                        "timeoutSeconds": 1,
+                        "periodSeconds": 5,
+                        "successThreshold": 1,
+                        "failureThreshold": 3,
+                    },
+                    "terminationMessagePath": "/dev/termination-log",
+                    "terminationMessagePolicy": "File",
+                    "imagePullPolicy": "IfNotPresent",
+                },
+                {
+                    "name": "exporter",
+                    "image": "nginx/nginx-prometheus-exporter:0.1.0",
+                    "ports": [{"name": "metrics", "containerPort": 9102, "protocol": "TCP"}],
+                    "resources": {"limits": {"cpu": "50m", "memory": "32Mi"}, "requests": {"cpu": "10m", "memory": "16Mi"}},
+                    "terminationMessagePath": "/dev/termination-log",
+                    "terminationMessagePolicy": "File",
+                    "imagePullPolicy": "IfNotPresent",
+                },
+            ],
+            "restartPolicy": "Always",
+            "terminationGracePeriodSeconds": 30,
+            "dnsPolicy": "ClusterFirst",
+            "serviceAccountName": "default",
+            "serviceAccount": "default",
+            "nodeName": "node-{0}".format(i % 100),
+            "securityContext": {},
+            "schedulerName": "default-scheduler",
+            "tolerations": [
+                {"key": "node.kubernetes.io/not-ready", "operator": "Exists", "effect": "NoExecute", "tolerationSeconds": 300}
+            ],
+        },
+        "status": {
+            "phase": "Running",
+            "conditions": [
+                {"type": "Initialized", "status": "True", "lastTransitionTime": "2018-06-01T12:00:00Z"},
+                {"type": "Ready", "status": "True", "lastTransitionTime": "2018-06-01T12:00:10Z"},
+                {"type": "PodScheduled", "status": "True", "lastTransitionTime": "2018-06-01T12:00:00Z"},
+            ],
+            "hostIP": "10.0.{0}.{1}".format(i % 100 // 250, i % 100),
+            "podIP": "10.244.{0}.{1}".format(i // 250, i % 250),
+            "startTime": "2018-06-01T12:00:00Z",
+            "containerStatuses": [
+                {
+                    "name": c,
+                    "state": {"running": {"startedAt": "2018-06-01T12:00:05Z"}},
+                    "lastState": {},
+                    "ready": True,
+                    "restartCount": 0,
+                    "image": "nginx:1.15.0",
+                    "imageID": "docker-pullable://nginx@sha256:{0}".format("0" * 64),
+                    "containerID": "docker://{0:064d}".format(i),
+                }
+                for c in ("web", "exporter")
+            ],
+            "qosClass": "Burstable",
+        },
+    }
+
+
+def node(i=0):
+    """
+    A node as the API server returns it, with its capacity, conditions, addresses and images.
+    """
+
+    name = "node-{0}".format(i)
+    resources = {"cpu": "8", "memory": "32883512Ki", "pods": "110", "ephemeral-storage": "101445540Ki"}
+    return {
+        "kind": "Node",
+        "apiVersion": "v1",
+        "metadata": {
+            "name": name,
+            "selfLink": "/api/v1/nodes/{0}".format(name),
+            "uid": "1c2d3e4f-0000-4000-8000-{0:012d}".format(i),
+            "resourceVersion": str(300000 + i),
+            "creationTimestamp": "2018-05-01T08:00:00Z",
+            "labels": {
+                "beta.kubernetes.io/arch": "amd64",
+                "beta.kubernetes.io/os": "linux",
+                "kubernetes.io/hostname": name,
+                "failure-domain.beta.kubernetes.io/zone": "us-east-1{0}".format("abc"[i % 3]),
+            },
+            "annotations": {"node.alpha.kubernetes.io/ttl": "0"},
+        },
+        "spec": {"podCIDR": "10.244.{0}.0/24".format(i % 250), "externalID": name, "providerID": "aws:///" + name},
+        "status": {
+            "capacity": dict(resources),
+            "allocatable": dict(resources, cpu="7800m"),
+            "conditions": [
+                {
+                    "type": t,
+                    "status": "False" if t != "Ready" else "True",
+                    "lastHeartbeatTime": "2018-06-01T12:00:00Z",
+                    "lastTransitionTime": "2018-05-01T08:00:00Z",
+                    "reason": "Kubelet" + t,
+                    "message": "kubelet is posting its status",
+                }
+                for t in ("OutOfDisk", "MemoryPressure", "DiskPressure", "PIDPressure", "Ready")
+            ],
+            "addresses": [
+                {"type": "InternalIP", "address": "10.0.{0}.{1}".format(i // 250, i % 250)},
+                {"type": "Hostname", "address": name},
+            ],
+            "daemonEndpoints": {"kubeletEndpoint": {"Port": 10250}},
+            "nodeInfo": {
+                "machineID": "{0:032d}".format(i),
+                "systemUUID": "EC2{0:033d}".format(i),
+                "bootID": "{0:036d}".format(i),
+                "kernelVersion": "4.14.0-generic",
+                "osImage": "Ubuntu 18.04 LTS",
+                "containerRuntimeVersion": "docker://17.3.2",
+                "kubeletVersion": "v1.10.5",
+                "kubeProxyVersion": "v1.10.5",
+                "operatingSystem": "linux",
+                "architecture": "amd64",
+            },
+            "images": [
+                {"names": ["nginx@sha256:{0}".format("0" * 64), "nginx:1.15.0"], "sizeBytes": 108975101},
+                {"names": ["k8s.gcr.io/pause:3.1"], "sizeBytes": 742472},
+            ],
+        },
+    }
+
+
+def deployment(i=0):
+    """
+    A deployment as the API server returns it, with the template of the pods above.
+    """
+
+    template = pod(i)
+    name = "web-{0}".format(i)
+    return {
+        "kind": "Deployment",
+        "apiVersion": "extensions/v1beta1",
+        "metadata": {
+            "name": name,
+            "namespace": "ns-{0}".format(i % 20),
+            "selfLink": "/apis/extensions/v1beta1/namespaces/ns-{0}/deployments/{1}".format(i % 20, name),
+            "uid": "9b8c7d6e-0000-4000-8000-{0:012d}".format(i),
+            "resourceVersion": str(400000 + i),
+            "generation": 3,
+            "creationTimestamp": "2018-06-01T11:00:00Z",
+            "labels": {"app": "web"},
+            "annotations": {"deployment.kubernetes.io/revision": "3"},
+        },
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": {"app": "web"}},
+            "template": {"metadata": {"labels": {"app": "web", "tier": "frontend"}}, "spec": template["spec"]},
+            "strategy": {"type": "RollingUpdate", "rollingUpdate": {"maxUnavailable": 1, "maxSurge": 1}},
+            "revisionHistoryLimit": 10,
+        },
+        "status": {"observedGeneration": 3, "replicas": 3, "updatedReplicas": 3, "availableReplicas": 3},
+    }
+
+
+def pod_list(count=10000):
+    return {"kind": "PodList", "apiVersion": "v1", "metadata": {"resourceVersion": "200000"}, "items": [pod(i) for i in range(count)]}
+
+
+def pod_list_bytes(count=10000):
+    return json.dumps(pod_list(count)).encode("utf-8")
+
+
+def measure(func=None, repeat=3):
+    """
+    :return: A tuple of (the best time in seconds, the peak memory allocated in bytes) of 'func()'.
+    """
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def report(rows=None):
+    print("{0:<40} {1:>10} {2:>12}".format("", "time (s)", "peak (MiB)"))
+    for label, (elapsed, peak) in rows:
+        print("{0:<40} {1:>10.3f} {2:>12.1f}".format(label, elapsed, peak / 1024.0 / 1024.0))
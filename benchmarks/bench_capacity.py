@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+The requests and limits of the pods of each node, against what it can allocate, grouped by zone: a loop over
+Node and Pod models summing Quantity objects, on a tenth of the cluster, and K8sCapacity on all of it.
+
+    python -m benchmarks.bench_capacity [nodes] [pods]
+"""
+
+import sys
+
+from kubernetes_py.K8sCapacity import K8sCapacity
+from kubernetes_py.models.v1.Node import Node
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.utils import Quantity
+from benchmarks._pods import measure, node, pod, report
+
+ZONE = "failure-domain.beta.kubernetes.io/zone"
+
+# (cpu, memory) allocatable of each instance type.
+TYPES = [("m5.large", "1930m", "7Gi"), ("m5.2xlarge", "7800m", "31Gi"), ("r5.4xlarge", "15800m", "124Gi")]
+
+TAINTS = [
+    [],
+    [],
+    [{"key": "dedicated", "value": "gpu", "effect": "NoSchedule"}],
+    [{"key": "spot", "effect": "PreferNoSchedule"}],
+]
+
+
+def nodes(count=None):
+    items = list()
+    for i in range(count):
+        item = node(i)
+        kind, cpu, memory = TYPES[i % len(TYPES)]
+        item["metadata"]["labels"]["beta.kubernetes.io/instance-type"] = kind
+        item["status"]["allocatable"].update(cpu=cpu, memory=memory)
+        item["spec"]["taints"] = TAINTS[i % len(TAINTS)]
+        items.append(item)
+    return items
+
+
+def pods(count=None, node_count=None):
+    # the specs of a few workloads, shared by the pods, as the informer's cache would hold the same values.
+    specs = list()
+    for j, (cpu, memory) in enumerate([("100m", "128Mi"), ("250m", "512Mi"), ("1", "2Gi"), ("50m", "64Mi")]):
+        spec = pod(j)["spec"]
+        spec["containers"][0]["resources"] = {"requests": {"cpu": cpu, "memory": memory}}
+        if j == 2:
+            spec["containers"][0]["resources"]["limits"] = {"cpu": "2", "memory": "2Gi"}
+            spec["initContainers"] = [{"name": "migrate", "resources": {"requests": {"cpu": "2", "memory": "1Gi"}}}]
+        specs.append(spec)
+    items = list()
+    for i in range(count):
+        metadata = {"name": "pod-{0}".format(i), "namespace": "ns-{0}".format(i % 20)}
+        spec = dict(specs[i % len(specs)], nodeName="node-{0}".format(i * 7 % node_count))
+        items.append({"metadata": metadata, "spec": spec, "status": {"phase": "Running"}})
+    return items
+
+
+def with_models(node_items=None, pod_items=None):
+    zones = dict()
+    by_node = dict()
+    for item in node_items:
+        model = Node(model=item)
+        allocatable = model.status.allocatable_quantities
+        by_node[model.metadata.name] = zone = model.metadata.labels.get(ZONE)
+        total = zones.setdefault(zone, {"allocatable": [0, 0], "requested": [0, 0]})
+        total["allocatable"][0] += allocatable["cpu"]
+        total["allocatable"][1] += allocatable["memory"]
+    for item in pod_items:
+        model = Pod(model=item)
+        zone = by_node.get(model.spec.node_name)
+        if zone is None:
+            continue
+        total = zones[zone]["requested"]
+        for container in model.spec.containers:
+            requests = container.resources.request_quantities
+            total[0] += requests.get("cpu", Quantity(0))
+            total[1] += requests.get("memory", Quantity(0))
+    return zones
+
+
+def main(node_count=5000, pod_count=150000):
+    node_items = nodes(node_count)
+    pod_items = pods(pod_count, node_count)
+    tenth = (node_items[: node_count // 10], pods(pod_count // 10, node_count // 10))
+    print("{0} nodes, {1} pods\n".format(node_count, pod_count))
+
+    def vectorized():
+        capacity = K8sCapacity(nodes=node_items, pods=pod_items)
+        capacity.by_label(ZONE)
+        capacity.by_taint()
+        capacity.by_node()
+
+    rows = [
+        ("Node and Pod models, a tenth", measure(lambda: with_models(*tenth), 1)),
+        ("K8sCapacity, zones, taints, nodes", measure(vectorized, 3)),
+    ]
+    report(rows)
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:3]])
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Decoding a 10k pod list response, as HttpRequest.send() does.
+
+    python -m benchmarks.bench_decode [count]
+"""
+
+import json
+import sys
+
+from kubernetes_py.utils import JsonBackend
+from kubernetes_py.utils.ConvertData import convert
+from benchmarks._pods import measure, pod_list_bytes, report
+
+
+def before(content=None):
+    # the decoded text, the decoded document, then its converted copy.
+    return convert(data=json.loads(content.decode("utf-8")))
+
+
+def main(count=10000):
+    content = pod_list_bytes(count)
+    print("{0} pods, {1:.1f} MiB of JSON\n".format(count, len(content) / 1024.0 / 1024.0))
+
+    rows = [("before: decode + json.loads + convert", measure(lambda: before(content)))]
+    for backend in JsonBackend.VALID_BACKENDS:
+        if JsonBackend.use_backend(backend) == backend:
+            rows.append(("after: JsonBackend.loads ({0})".format(backend), measure(lambda: JsonBackend.loads(content))))
+    JsonBackend.use_backend(None)
+    report(rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
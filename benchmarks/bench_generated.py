@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Building and serializing the hand-written models, and the models generated from the OpenAPI spec.
+
+    python -m benchmarks.bench_generated [count]
+"""
+
+import sys
+
+from kubernetes_py.models.generated import core_v1, extensions_v1beta1
+from kubernetes_py.models.v1.Node import Node
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.models.v1beta1.Deployment import Deployment
+from benchmarks._pods import deployment, measure, node, pod, report
+
+
+def main(count=2000):
+    print("{0} objects of each kind\n".format(count))
+    rows = []
+    kinds = (
+        (Pod, core_v1.Pod, pod),
+        (Node, core_v1.Node, node),
+        (Deployment, extensions_v1beta1.Deployment, deployment),
+    )
+    for model_class, generated_class, build in kinds:
+        items = [build(i) for i in range(count)]
+        name = model_class.__name__
+        for label, cls in (("models", model_class), ("generated", generated_class)):
+            models = [cls(item) for item in items]
+            rows.append(("{0}: {1}: build".format(name, label), measure(lambda: [cls(item) for item in items])))
+            rows.append(("{0}: {1}: serialize".format(name, label), measure(lambda: [m.serialize() for m in models])))
+    report(rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Building Pod models from decoded pods, as K8sPod.list() does, and reading their name, labels and phase.
+
+    python -m benchmarks.bench_hydrate [count]
+"""
+
+import copy
+import sys
+
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.utils import filter_model
+from benchmarks._pods import measure, pod, report
+
+
+def deepcopy_filter_model(model=None):
+    # filter_model as it was: every model copies its whole subtree before dropping the None keys.
+    mutable = copy.deepcopy(model)
+    for key in model:
+        if model[key] is None:
+            mutable.pop(key)
+    return mutable
+
+
+def use_filter_model(func=None):
+    # the models import filter_model by name, so it is swapped in each of them.
+    for name, module in list(sys.modules.items()):
+        if name.startswith("kubernetes_py.models.") and hasattr(module, "filter_model"):
+            module.filter_model = func
+
+
+def hydrate(items=None):
+    return [Pod(item) for item in items]
+
+
+def inventory(models=None):
+    return [(m.name, m.metadata.labels, m.status.phase) for m in models]
+
+
+def main(count=2000):
+    items = [pod(i) for i in range(count)]
+    print("{0} pods\n".format(count))
+
+    use_filter_model(deepcopy_filter_model)
+    try:
+        before = measure(lambda: inventory(hydrate(items)))
+    finally:
+        use_filter_model(filter_model)
+    after = measure(lambda: inventory(hydrate(items)))
+    lazy = measure(lambda: inventory([Pod.lazy(item) for item in items]))
+
+    rows = [("before: deepcopy in filter_model", before), ("after: filter_model", after), ("after: Pod.lazy()", lazy)]
+    report(rows)
+    print("")
+    for label, (elapsed, _) in rows:
+        print("{0:<40} {1:>10.0f} pods/s".format(label, count / elapsed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
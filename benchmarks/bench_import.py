@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+The cold import time of kubernetes_py, and the modules it loads, each measured in a fresh interpreter.
+
+    python -m benchmarks.bench_import [repeat]
+"""
+
+import json
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import kubernetes_py",
+    "from kubernetes_py import K8sConfig",
+    "from kubernetes_py import K8sPod",
+    "from kubernetes_py import *",
+]
+
+HEAVY = ["yaml", "dateutil", "requests", "kubernetes_py.K8sDeployment", "kubernetes_py.models.v1.Pod"]
+
+PROBE = """
+import sys, time
+before = set(sys.modules)
+start = time.time()
+{0}
+elapsed = time.time() - start
+loaded = set(sys.modules) - before
+print(json.dumps([elapsed, len(loaded), len([x for x in loaded if x.startswith("kubernetes_py")]), sorted(loaded)]))
+"""
+
+
+def probe(statement=None):
+    """
+    :return: The seconds taken by 'statement' in a fresh interpreter, the number of modules it loaded,
+        the number of kubernetes_py modules among them, and their names.
+    """
+
+    code = "import json\n" + PROBE.format(statement)
+    out = subprocess.check_output([sys.executable, "-c", code])
+    return json.loads(out.decode("utf-8"))
+
+
+def main(repeat=5):
+    print("best of {0} fresh interpreters\n".format(repeat))
+    print("{0:<40} {1:>10} {2:>10} {3:>14}   {4}".format("", "time (ms)", "modules", "kubernetes_py", "heavy"))
+    for statement in STATEMENTS:
+        runs = [probe(statement) for _ in range(repeat)]
+        elapsed, count, ours, loaded = min(runs)
+        heavy = ", ".join(x for x in HEAVY if x in loaded) or "-"
+        print("{0:<40} {1:>10.1f} {2:>10} {3:>14}   {4}".format(statement, elapsed * 1000, count, ours, heavy))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Reading the logs of the replicas of a deployment from a local stand-in API server that answers each
+request after a delay: one pod after the other with get_log(), and all at once with K8sLogAggregator.
+
+    python -m benchmarks.bench_log_aggregator [pods] [lines per pod] [latency ms]
+"""
+
+import sys
+import time
+
+from kubernetes_py import K8sConfig, K8sLogAggregator, K8sPod
+from tests._server import StandInServer
+from benchmarks._pods import measure, report
+
+LINE = '{0} {{"level": "info", "msg": "GET /healthz 200", "pod": {1}}}\n'
+
+
+def log(pod=None, lines=None, latency=None):
+    def chunks():
+        time.sleep(latency)
+        block = list()
+        for i in range(lines):
+            ts = "2018-06-01T12:{0:02d}:{1:02d}.{2:06d}Z".format(i // 6000 % 60, i // 100 % 60, i % 100 * 10000 + pod)
+            block.append(LINE.format(ts, pod))
+            if len(block) == 500:
+                yield "".join(block)
+                block = list()
+        if block:
+            yield "".join(block)
+
+    return lambda req: (200, chunks())
+
+
+def serial(pods=None):
+    count = 0
+    for pod in pods:
+        count += len(pod.get_log())
+    return count
+
+
+def aggregated(pods=None, max_workers=None):
+    count = [0]
+
+    def received(line):
+        count[0] += 1
+
+    K8sLogAggregator(pods=pods, max_workers=max_workers).write(received)
+    return count[0]
+
+
+def main(count=100, lines=2000, latency=50):
+    server = StandInServer().start()
+    try:
+        config = K8sConfig(kubeconfig=None, api_host=server.url)
+        pods = [K8sPod(config=config, name="redis-{0}".format(i)) for i in range(count)]
+        for i, pod in enumerate(pods):
+            server.route("GET", "/api/v1/namespaces/default/pods/{0}/log".format(pod.name), log(i, lines, latency / 1000.0))
+        print("{0} pods, {1} lines each, {2}ms per request\n".format(count, lines, latency))
+        rows = [("get_log(), one pod after the other", measure(lambda: serial(pods), 1))]
+        for workers in (4, 10):
+            name = "K8sLogAggregator, {0} workers, merged".format(workers)
+            rows.append((name, measure(lambda: aggregated(pods, workers), 1)))
+        report(rows)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:4]])
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Reading a large pod log from a local stand-in API server: the whole body at once, as get_log()
+used to, and one line at a time with stream_log().
+
+    python -m benchmarks.bench_logs [megabytes]
+"""
+
+import sys
+
+from kubernetes_py import K8sConfig, K8sPod
+from tests._server import StandInServer
+from benchmarks._pods import measure, report
+
+LINE = '2018-06-01T12:00:00.000000000Z {"level": "info", "msg": "GET /healthz 200", "latency_ms": 1.52}\n'
+
+
+def chunks(megabytes=None):
+    block = LINE * 500
+    for _ in range(int(megabytes * 1024 * 1024 / len(block))):
+        yield block
+
+
+def whole_body(pod=None):
+    # get_log() as it was: the body is decoded as JSON first, then as text, then split.
+    state = pod.request(method="GET", url=pod._log_url())
+    return len(pod._log_result(state))
+
+
+def streamed(pod=None):
+    count = 0
+    for _ in pod.stream_log():
+        count += 1
+    return count
+
+
+def main(megabytes=50):
+    server = StandInServer().start()
+    try:
+        server.route("GET", "/api/v1/namespaces/default/pods/yo/log", lambda req: (200, chunks(megabytes)))
+        pod = K8sPod(config=K8sConfig(kubeconfig=None, api_host=server.url), name="yo")
+        print("{0} MiB of log\n".format(megabytes))
+        rows = [("get_log(): whole body", measure(lambda: whole_body(pod), 1))]
+        rows.append(("stream_log()", measure(lambda: streamed(pod), 1)))
+        report(rows)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
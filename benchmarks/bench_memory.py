@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+The memory held by hydrated models, as kept by a cache of listed objects.
+
+    python -m benchmarks.bench_memory [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from kubernetes_py.models.v1.Node import Node
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.models.v1beta1.Deployment import Deployment
+from benchmarks._pods import deployment, node, pod
+
+
+def retained(model_class=None, items=None):
+    """
+    :return: The number of bytes allocated by the models of 'items', and kept once they are built.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    models = [model_class(item) for item in items]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return after - before
+
+
+def main(count=2000):
+    print("{0} objects of each kind\n".format(count))
+    print("{0:<12} {1:>16} {2:>12}".format("", "bytes / object", "total (MiB)"))
+    for model_class, build in ((Pod, pod), (Node, node), (Deployment, deployment)):
+        items = [build(i) for i in range(count)]
+        size = retained(model_class, items)
+        print("{0:<12} {1:>16.0f} {2:>12.1f}".format(model_class.__name__, size / float(count), size / 1024.0 / 1024.0))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
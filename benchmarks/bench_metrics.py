@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Summing up the cpu and memory used per deployment, from a local stand-in API server that answers each
+request after a delay: K8sPod.get_metrics() for each pod, and one K8sMetrics.usage_by() call.
+
+    python -m benchmarks.bench_metrics [pods] [latency ms]
+"""
+
+import sys
+import time
+
+from kubernetes_py import K8sConfig, K8sMetrics, K8sPod
+from kubernetes_py.utils import parse_quantity
+from tests._server import StandInServer
+from benchmarks._pods import measure, pod, report
+
+METRICS = "/apis/metrics.k8s.io/v1beta1"
+
+
+def pod_metrics(i=None):
+    usage = {"cpu": "{0}n".format(1000000 + i * 7919), "memory": "{0}Ki".format(20000 + i % 5000)}
+    metadata = pod(i)["metadata"]
+    return {
+        "metadata": {"name": metadata["name"], "namespace": metadata["namespace"]},
+        "timestamp": "2018-06-01T12:00:00Z",
+        "window": "30s",
+        "containers": [{"name": "web", "usage": usage}, {"name": "sidecar", "usage": {"cpu": "1m", "memory": "8Mi"}}],
+    }
+
+
+def delayed(payload=None, latency=None):
+    def answer(req):
+        time.sleep(latency)
+        return 200, payload
+
+    return answer
+
+
+def one_per_pod(pods=None):
+    usage = dict()
+    for p in pods:
+        items = p.get_metrics()["containers"]
+        cpu = sum(parse_quantity(x["usage"]["cpu"], -9) for x in items)
+        memory = sum(parse_quantity(x["usage"]["memory"]) for x in items)
+        # pods and their owner, as the caller had them already.
+        key = (p.config.namespace, "web")
+        total = usage.setdefault(key, [0, 0])
+        total[0] += cpu
+        total[1] += memory
+    return usage
+
+
+def main(count=2000, latency=2):
+    server = StandInServer().start()
+    try:
+        latency /= 1000.0
+        config = K8sConfig(kubeconfig=None, api_host=server.url, namespace="ns-0")
+        items = [x for x in (pod_metrics(i) for i in range(count)) if x["metadata"]["namespace"] == "ns-0"]
+        pods = [pod(i) for i in range(count) if i % 20 == 0]
+        owner = {"kind": "Deployment", "name": "web", "uid": "1", "controller": True}
+        replicasets = [{"metadata": {"namespace": "ns-0", "name": "web-7d9f8b6c4d", "ownerReferences": [owner]}}]
+        server.route("GET", METRICS + "/namespaces/ns-0/pods", delayed({"items": items}, latency))
+        server.route("GET", "/api/v1/namespaces/ns-0/pods", delayed({"items": pods}, latency))
+        url = "/apis/extensions/v1beta1/namespaces/ns-0/replicasets"
+        server.route("GET", url, delayed({"items": replicasets}, latency))
+        for item in items:
+            url = "{0}/namespaces/ns-0/pods/{1}".format(METRICS, item["metadata"]["name"])
+            server.route("GET", url, delayed(item, latency))
+
+        k8s_pods = [K8sPod(config=config, name=x["metadata"]["name"]) for x in items]
+        print("{0} pods in the namespace, {1}ms per request\n".format(len(items), latency * 1000))
+        rows = [("K8sPod.get_metrics(), one request per pod", measure(lambda: one_per_pod(k8s_pods), 1))]
+        metrics = K8sMetrics(config=config)
+        rows.append(("K8sMetrics.usage_by('deployment')", measure(lambda: metrics.usage_by(group="deployment"), 3)))
+        report(rows)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:3]])
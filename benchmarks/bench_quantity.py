@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Summing up the cpu requested by the containers of a cluster: a float parser written for the occasion,
+as callers used to, Quantity objects, parse_quantity(), and quantity_array() with numpy.
+
+    python -m benchmarks.bench_quantity [pods]
+"""
+
+import re
+import sys
+
+from kubernetes_py.utils import Quantity, parse_quantity, quantity_array
+from benchmarks._pods import measure, pod, report
+
+RE_CPU = re.compile(r"^([0-9.]+)(m?)$")
+
+
+def ad_hoc(values=None):
+    # what callers wrote for themselves: a float, and a regex matched every time.
+    total = 0.0
+    for v in values:
+        number, milli = RE_CPU.match(v).groups()
+        total += float(number) / 1000 if milli else float(number)
+    return total
+
+
+def with_quantities(values=None):
+    return sum(Quantity(x) for x in values)
+
+
+def with_parse_quantity(values=None):
+    return sum(parse_quantity(x, -3) for x in values)
+
+
+def with_array(values=None):
+    return int(quantity_array(values, -3).sum())
+
+
+def main(count=150000):
+    containers = [c for i in range(count % 1000 or 1000) for c in pod(i)["spec"]["containers"]]
+    values = [c["resources"]["requests"]["cpu"] for c in containers] * (count // len(containers) * 2 or 1)
+    # a few distinct values, as set by hand, and a long tail written by autoscalers.
+    values += ["{0}m".format(i) for i in range(count // 10)]
+    print("{0} cpu requests\n".format(len(values)))
+    rows = [("ad hoc float parser", measure(lambda: ad_hoc(values), 3))]
+    rows.append(("sum(Quantity(x))", measure(lambda: with_quantities(values), 3)))
+    rows.append(("sum(parse_quantity(x, -3))", measure(lambda: with_parse_quantity(values), 3)))
+    try:
+        rows.append(("quantity_array(values, -3).sum()", measure(lambda: with_array(values), 3)))
+    except ImportError:
+        print("numpy is not installed: quantity_array() is left out.\n")
+    report(rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 150000)
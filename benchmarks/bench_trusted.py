@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Building models with their values validated, as for objects built by hand, and trusted,
+as for objects sent by the API server.
+
+    python -m benchmarks.bench_trusted [count]
+"""
+
+import sys
+
+from kubernetes_py.models.v1.Node import Node
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.models.v1beta1.Deployment import Deployment
+from kubernetes_py.utils import build_trusted
+from benchmarks._pods import deployment, measure, node, pod, report
+
+
+def main(count=2000):
+    print("{0} objects of each kind\n".format(count))
+    rows = []
+    for model_class, build in ((Pod, pod), (Node, node), (Deployment, deployment)):
+        items = [build(i) for i in range(count)]
+        name = model_class.__name__
+        rows.append(("{0}: validated".format(name), measure(lambda: [model_class(item) for item in items])))
+        rows.append(("{0}: trusted".format(name), measure(lambda: [build_trusted(model_class, item) for item in items])))
+    report(rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Generates the models of kubernetes_py.models.generated from the definitions of an OpenAPI spec.
+
+Each definition reachable from ROOTS becomes a class in the module of its group and version
+(io.k8s.api.core.v1.Pod -> core_v1.Pod), with straight-line _build_with_model() and serialize()
+methods: one statement per field, no validation, no filter_model().
+
+    python -m codegen.generate [spec]
+"""
+
+import json
+import keyword
+import os
+import re
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SPEC = os.path.join(HERE, "swagger-v1.10.json")
+PACKAGE = "kubernetes_py.models.generated"
+TARGET = os.path.join(os.path.dirname(HERE), *PACKAGE.split("."))
+
+CORE_V1 = [
+    "ComponentStatus",
+    "ConfigMap",
+    "Event",
+    "Namespace",
+    "Node",
+    "PersistentVolume",
+    "PersistentVolumeClaim",
+    "Pod",
+    "ReplicationController",
+    "Secret",
+    "Service",
+    "ServiceAccount",
+]
+
+# the kinds managed by the K8s* classes, and their lists.
+ROOTS = ["io.k8s.api.core.v1.{0}".format(x) for x in CORE_V1] + [
+    "io.k8s.api.apps.v1beta1.StatefulSet",
+    "io.k8s.api.autoscaling.v1.HorizontalPodAutoscaler",
+    "io.k8s.api.batch.v1.Job",
+    "io.k8s.api.batch.v1beta1.CronJob",
+    "io.k8s.api.extensions.v1beta1.DaemonSet",
+    "io.k8s.api.extensions.v1beta1.Deployment",
+    "io.k8s.api.extensions.v1beta1.ReplicaSet",
+    "io.k8s.api.storage.v1beta1.StorageClass",
+]
+ROOTS += ["{0}List".format(x) for x in ROOTS]
+
+HEADER = """#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/{0}: do not edit.
+"""
+
+LINE_LENGTH = 120
+
+
+# ------------------------------------------------------------------------------------- names
+
+
+def attribute_name(name=None):
+    """
+    :param name: A field of the API, in camelCase: 'externalIPs', 'hostIPC', 'continue'.
+    :return: The attribute holding it, in snake_case: 'external_ips', 'host_ipc', 'continue_'.
+    """
+
+    name = re.sub(r"([A-Z]{2,})s(?=[A-Z]|$)", lambda m: m.group(1).capitalize() + "s", name)
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+def module_name(definition=None):
+    """
+    :param definition: A definition of the spec: 'io.k8s.api.core.v1.Pod'.
+    :return: The module of its class: 'core_v1'.
+    """
+
+    parts = definition.split(".")
+    return "{0}_{1}".format(parts[-3], parts[-2])
+
+
+def class_name(definition=None):
+    return definition.split(".")[-1]
+
+
+# ------------------------------------------------------------------------------------- schema
+
+
+class Generator(object):
+    def __init__(self, spec=None, roots=None):
+        self.definitions = spec["definitions"]
+        self.roots = ROOTS if roots is None else roots
+
+    def is_object(self, definition=None):
+        # Time, Quantity and IntOrString are defined without properties: their values are kept as they are.
+        return "properties" in self.definitions[definition]
+
+    def reachable(self):
+        found = set()
+        pending = list(self.roots)
+        while pending:
+            definition = pending.pop()
+            if definition in found:
+                continue
+            found.add(definition)
+            pending.extend(self._refs(self.definitions[definition]))
+        return sorted(x for x in found if self.is_object(x))
+
+    def _refs(self, schema=None):
+        if isinstance(schema, dict):
+            for key, value in schema.items():
+                if key == "$ref":
+                    yield value.split("/")[-1]
+                else:
+                    for ref in self._refs(value):
+                        yield ref
+        elif isinstance(schema, list):
+            for value in schema:
+                for ref in self._refs(value):
+                    yield ref
+
+    def _class(self, schema=None, module=None):
+        # the class building the values of 'schema', or None for the values kept as they are.
+        if "$ref" not in schema:
+            return None
+        definition = schema["$ref"].split("/")[-1]
+        if not self.is_object(definition):
+            return None
+        if module_name(definition) == module:
+            return class_name(definition)
+        return "{0}.{1}".format(module_name(definition), class_name(definition))
+
+    # ------------------------------------------------------------------------------------- expressions
+
+    def load(self, schema=None, value=None, module=None, depth=0):
+        """
+        :return: The expression building the model of 'value', a decoded value of 'schema'.
+        """
+
+        cls = self._class(schema, module)
+        if cls is not None:
+            return "{0}({1})".format(cls, value)
+        x, k = "x{0}".format(depth or ""), "k{0}".format(depth or "")
+        if schema.get("type") == "array":
+            item = self.load(schema["items"], x, module, depth + 1)
+            if item == x:
+                return "list({0})".format(value)
+            return "[{0} for {1} in {2}]".format(item, x, value)
+        if schema.get("type") == "object" and "additionalProperties" in schema:
+            item = self.load(schema["additionalProperties"], x, module, depth + 1)
+            if item == x:
+                return "dict({0})".format(value)
+            return "{{{0}: {1} for {0}, {2} in {3}.items()}}".format(k, item, x, value)
+        return value
+
+    def dump(self, schema=None, value=None, module=None, depth=0):
+        """
+        :return: The expression serializing 'value', a model of 'schema'.
+        """
+
+        if self._class(schema, module) is not None:
+            return "{0}.serialize()".format(value)
+        x, k = "x{0}".format(depth or ""), "k{0}".format(depth or "")
+        if schema.get("type") == "array":
+            item = self.dump(schema["items"], x, module, depth + 1)
+            if item != x:
+                return "[{0} for {1} in {2}]".format(item, x, value)
+        if schema.get("type") == "object" and "additionalProperties" in schema:
+            item = self.dump(schema["additionalProperties"], x, module, depth + 1)
+            if item != x:
+                return "{{{0}: {1} for {0}, {2} in {3}.items()}}".format(k, item, x, value)
+        return value
+
+    # ------------------------------------------------------------------------------------- source
+
+    def render_class(self, definition=None):
+        module = module_name(definition)
+        schema = self.definitions[definition]
+        fields = sorted((attribute_name(x), x, s) for x, s in schema["properties"].items())
+        names = [x[0] for x in fields]
+        if len(set(names)) != len(names):
+            raise SyntaxError("Generator: {0}: fields: [ {1} ] are ambiguous.".format(definition, names))
+
+        lines = ["", "", "class {0}(object):".format(class_name(definition)), '    """']
+        lines.extend(_wrap("{0}: {1}".format(definition, _summary(schema.get("description", ""))), "    "))
+        lines.extend(['    """', ""])
+        lines.extend(_wrap_tuple("__slots__", names, "    "))
+        lines.extend(["", "    def __init__(self, model=None):", "        self._build_with_model({} if model is None else model)"])
+
+        lines.extend(["", "    def _build_with_model(self, model=None):", "        get = model.get"])
+        for attr, field, s in fields:
+            load = self.load(s, "v", module)
+            if load == "v":
+                lines.append('        self.{0} = get("{1}")'.format(attr, field))
+            else:
+                lines.append('        v = get("{0}")'.format(field))
+                lines.extend(_assign("self." + attr, "None if v is None else " + load, "        "))
+
+        lines.extend(["", "    def serialize(self):", "        data = {}"])
+        for attr, field, s in fields:
+            lines.append("        v = self.{0}".format(attr))
+            lines.append("        if v is not None:")
+            lines.extend(_assign('data["{0}"]'.format(field), self.dump(s, "v", module), "            "))
+        lines.append("        return data")
+        return lines
+
+    def render(self, source=None):
+        """
+        :param source: The name of the spec, for the header of the modules.
+        :return: A dict of the source of each module, by module name.
+        """
+
+        modules = {}
+        for definition in self.reachable():
+            modules.setdefault(module_name(definition), []).append(definition)
+
+        sources = {}
+        for module, definitions in sorted(modules.items()):
+            lines = [HEADER.format(source).rstrip("\n")]
+            imports = set()
+            body = []
+            for definition in definitions:
+                cls = self.render_class(definition)
+                body.extend(cls)
+                imports.update(re.findall(r"\b([a-z]+_v\w+)\.[A-Z]", "\n".join(cls)))
+            if imports:
+                lines.append("")
+                lines.extend("from {0} import {1}".format(PACKAGE, x) for x in sorted(imports))
+            lines.extend(body)
+            sources[module] = "\n".join(lines) + "\n"
+        return sources
+
+
+# ------------------------------------------------------------------------------------- formatting
+
+
+def _summary(description=None):
+    # the first sentence of a description.
+    match = re.match(r"(.+?\.)(\s|$)", description.strip(), re.S)
+    return " ".join((match.group(1) if match else description).split())
+
+
+def _wrap(text=None, indent=None):
+    lines, line = [], indent
+    for word in text.split():
+        if line.strip() and len(line) + len(word) + 1 > LINE_LENGTH:
+            lines.append(line)
+            line = indent
+        line += word if not line.strip() else " " + word
+    lines.append(line)
+    return [x.rstrip() for x in lines]
+
+
+def _assign(target=None, value=None, indent=None):
+    one = "{0}{1} = {2}".format(indent, target, value)
+    if len(one) <= LINE_LENGTH:
+        return [one]
+    return ["{0}{1} = (".format(indent, target), "{0}    {1}".format(indent, value), indent + ")"]
+
+
+def _wrap_tuple(name=None, items=None, indent=None):
+    quoted = ['"{0}"'.format(x) for x in items]
+    one = "{0}{1} = ({2}{3})".format(indent, name, ", ".join(quoted), "," if len(quoted) == 1 else "")
+    if len(one) <= LINE_LENGTH:
+        return [one]
+    return ["{0}{1} = (".format(indent, name)] + ["{0}    {1},".format(indent, x) for x in quoted] + [indent + ")"]
+
+
+# ------------------------------------------------------------------------------------- main
+
+
+def generate(spec_path=None):
+    """
+    :param spec_path: An OpenAPI spec, in JSON.
+    :return: A dict of the source of each module of kubernetes_py.models.generated, by module name.
+    """
+
+    spec_path = SPEC if spec_path is None else spec_path
+    with open(spec_path) as f:
+        spec = json.load(f)
+    return Generator(spec).render(os.path.basename(spec_path))
+
+
+def main(spec_path=None):
+    for module, source in sorted(generate(spec_path).items()):
+        path = os.path.join(TARGET, "{0}.py".format(module))
+        with open(path, "w") as f:
+            f.write(source)
+        print(path)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
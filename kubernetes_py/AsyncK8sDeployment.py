@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import asyncio
+
+from kubernetes_py.AsyncK8sObject import AsyncK8sObject
+from kubernetes_py.AsyncK8sPod import AsyncK8sPod
+from kubernetes_py.K8sDeployment import K8sDeployment
+from kubernetes_py.K8sExceptions import BadRequestException, NotFoundException
+from kubernetes_py.models.v1beta1.Deployment import Deployment
+from kubernetes_py.models.v1beta1.DeploymentRollback import DeploymentRollback
+from kubernetes_py.models.v1beta1.RollbackConfig import RollbackConfig
+
+
+class AsyncK8sDeployment(AsyncK8sObject, K8sDeployment):
+
+    # -------------------------------------------------------------------------------------  override
+
+    async def create(self):
+        await super(AsyncK8sDeployment, self).create()
+        await self.get()
+        if self.desired_replicas > 0:
+            await self._wait_for_desired_replicas()
+        return self
+
+    async def update(self):
+        await super(AsyncK8sDeployment, self).update()
+        await self.get()
+        if self.desired_replicas > 0:
+            await self._wait_for_desired_replicas()
+        return self
+
+    async def list(self, pattern=None, labels=None, fields=None):
+        ls = await super(AsyncK8sDeployment, self).list(labels=labels, fields=fields)
+        deploys = list(map(lambda d: self._as_model(Deployment, d), ls))
+        if pattern is not None:
+            deploys = list(filter(lambda dep: pattern in dep.name, deploys))
+        k8s = list()
+        for x in deploys:
+            j = AsyncK8sDeployment(config=self.config, name=x.name).from_model(m=x)
+            k8s.append(j)
+        return k8s
+
+    async def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        async for item in super(AsyncK8sDeployment, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Deployment, item)
+            if pattern is None or pattern in x.name:
+                yield AsyncK8sDeployment(config=self.config, name=x.name).from_model(m=x)
+
+    async def delete(self, cascade=False):
+        # delete cascade on top level
+        await super(AsyncK8sDeployment, self).delete(cascade)
+        if cascade:
+            rs = AsyncK8sObject(config=self.config, obj_type="ReplicaSet", name="yo")
+            rsets = [
+                AsyncK8sObject(config=self.config, obj_type="ReplicaSet", name=x["metadata"]["name"])
+                for x in await rs.list()
+                if self.name in x["metadata"]["name"]
+            ]
+            # the pods of every replicaset carry its name, hence the deployment's; they go below.
+            await asyncio.gather(*[self._delete_ignoring_missing(x, cascade) for x in rsets])
+            pods = await AsyncK8sPod(config=self.config, name="yo").list(pattern=self.name)
+            await asyncio.gather(*[self._delete_ignoring_missing(x, cascade) for x in pods])
+        return self
+
+    @staticmethod
+    async def _delete_ignoring_missing(obj=None, cascade=False):
+        try:
+            await obj.delete(cascade=cascade)
+        except NotFoundException:
+            pass
+
+    # -------------------------------------------------------------------------------------  wait
+
+    async def _wait_for_desired_replicas(self):
+        message = "Timed out scaling Deployment: [ {} ] to replica count: [ {} ]".format(self.name, self.desired_replicas)
+        await self._wait_for(self._has_desired_replicas, timeout=self.SCALE_WAIT_TIMEOUT_SECONDS, message=message)
+
+    # -------------------------------------------------------------------------------------  get
+
+    async def get(self):
+        self.model = self._as_model(Deployment, await self.get_model(), lazy=False)
+        return self
+
+    # -------------------------------------------------------------------------------------  get by name
+
+    @staticmethod
+    async def get_by_name(config=None, name=None, name_label="name"):
+        if name is None:
+            raise SyntaxError("Deployment: name: [ {0} ] cannot be None.".format(name))
+        if not isinstance(name, str):
+            raise SyntaxError("Deployment: name: [ {0} ] must be a string.".format(name))
+
+        return await AsyncK8sDeployment(config=config, name=name).list(labels={name_label: name})
+
+    # -------------------------------------------------------------------------------------  rollback
+
+    async def rollback(self, revision=None, annotations=None):
+        rollback = DeploymentRollback()
+        rollback.name = self.name
+
+        rollback_config = RollbackConfig()
+
+        # to the specified revision
+        if revision is not None:
+            rollback_config.revision = revision
+        # to the revision immediately preceding the current revision
+        else:
+            current_revision = int(self.get_annotation(self.REVISION_ANNOTATION))
+            rev = max(current_revision - 1, 0)
+            rollback_config.revision = rev
+
+        rollback.rollback_to = rollback_config
+
+        if annotations is not None:
+            rollback.updated_annotations = annotations
+
+        url = "{base}/{name}/rollback".format(base=self.base_url, name=self.name)
+        state = await self.request(method="POST", url=url, data=rollback.serialize())
+
+        if not state.get("success"):
+            status = state.get("status", "")
+            reason = state.get("data", dict()).get("message", None)
+            message = "K8sDeployment: ROLLBACK failed : HTTP {0} : {1}".format(status, reason)
+            raise BadRequestException(message)
+
+        await asyncio.sleep(0.2)
+        await self._wait_for_desired_replicas()
+        await self.get()
+
+        return self
+
+    # -------------------------------------------------------------------------------------  scale
+
+    async def scale(self, replicas=None):
+        self.desired_replicas = replicas
+        await self.update()
+        return self
+
+    # -------------------------------------------------------------------------------------  purge replica sets
+
+    async def purge_replica_sets(self, keep=3):
+        rs = AsyncK8sObject(config=self.config, obj_type="ReplicaSet", name="yo")
+        rsets = [x for x in await rs.list() if self.name in x["metadata"]["name"]]
+        rsets.sort(key=lambda x: x["metadata"].get("creationTimestamp", ""), reverse=True)
+
+        to_purge = [
+            AsyncK8sObject(config=self.config, obj_type="ReplicaSet", name=x["metadata"]["name"]) for x in rsets[keep:]
+        ]
+        await asyncio.gather(*[self._delete_ignoring_missing(x, True) for x in to_purge])
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import asyncio
+import time
+
+from kubernetes_py.K8sExceptions import *
+from kubernetes_py.K8sObject import K8sObject
+from kubernetes_py.utils import is_valid_dict
+from kubernetes_py.utils.AsyncHttpRequest import AsyncHttpRequest
+
+
+def _not_streamed(obj=None, method=None):
+    """
+    :return: The TypeError raised by the methods of the blocking classes that stream from the API server.
+    """
+
+    # the blocking class it is built on, e.g. K8sPod for AsyncK8sPod.
+    blocking = [x for x in type(obj).__mro__ if not issubclass(x, AsyncK8sObject)][0]
+    return TypeError(
+        "{0}: {1}() streams from the API server, which the asyncio client does not do: "
+        "call {2}.{1}() in a thread instead.".format(type(obj).__name__, method, blocking.__name__)
+    )
+
+
+class AsyncK8sObject(K8sObject):
+    """
+    The asyncio flavour of K8sObject.
+
+    Objects are built and manipulated exactly like their blocking counterparts, using the same models
+    and BaseUrls; only the methods talking to the API server are coroutines. Every AsyncK8sObject built
+    from a K8sConfig shares its pool of keep-alive connections, so thousands of calls can be in flight
+    from a single thread:
+
+        pods = await asyncio.gather(*[AsyncK8sPod(config=cfg, name=n).get() for n in names])
+    """
+
+    # ------------------------------------------------------------------------------------- remote API calls
+
+    async def request(
+        self,
+        method="GET",
+        host=None,
+        url=None,
+        auth=None,
+        cert=None,
+        cert_data=None,
+        data=None,
+        token=None,
+        ca_cert=None,
+        ca_cert_data=None,
+        text=False,
+        timeout=None,
+    ):
+
+        host = self.config.api_host if host is None else host
+        url = self.base_url if url is None else url
+        auth = self.config.auth if auth is None else auth
+        cert = self.config.cert if cert is None else cert
+        cert_data = self.config.cert_data if cert_data is None else cert_data
+        token = self.config.token if token is None else token
+        ca_cert = self.config.ca_cert if ca_cert is None else ca_cert
+        ca_cert_data = self.config.ca_cert_data if ca_cert_data is None else ca_cert_data
+
+        try:
+            r = AsyncHttpRequest(
+                method=method,
+                host=host,
+                url=url,
+                auth=auth,
+                cert=cert,
+                cert_data=cert_data,
+                ca_cert=ca_cert,
+                ca_cert_data=ca_cert_data,
+                data=data,
+                token=token,
+                session=self.config.async_session,
+                text=text,
+                timeout=timeout,
+                rate_limiter=self.config.rate_limiter,
+                retry_policy=self.config.retry_policy,
+            )
+            return await r.send()
+        except (IOError, asyncio.IncompleteReadError, asyncio.TimeoutError) as err:
+            raise BadRequestException("K8sObject: IOError: {0}".format(err))
+
+    async def list(self, labels=None, fields=None):
+        state = await self.request(method="GET", data=self._selector_params(labels=labels, fields=fields))
+        return self._list_result(state)
+
+    async def list_iter(self, labels=None, fields=None, limit=None):
+        if limit is None:
+            limit = self.LIST_PAGE_SIZE
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise SyntaxError("K8sObject.list_iter(): limit: [ {0} ] is invalid.".format(limit))
+
+        data = self._selector_params(labels=labels, fields=fields) or dict()
+        data["limit"] = limit
+        while True:
+            state = await self.request(method="GET", data=data)
+            for item in self._list_result(state):
+                yield item
+            token = (state.get("data", None) or dict()).get("metadata", dict()).get("continue", None)
+            if not token:
+                return
+            data["continue"] = token
+
+    async def get_model(self):
+        state = await self.request(method="GET", url=self._object_url("fetch"))
+        return self._get_result(state)
+
+    async def get_with_params(self, data=None):
+        if not is_valid_dict(data):
+            raise SyntaxError("K8sObject.get_with_params(): data: [ {0} ] is invalid.".format(data))
+        url = "{base}".format(base=self.base_url)
+        state = await self.request(method="GET", url=url, data=data)
+        items = state.get("data", None).get("items", list())
+        if items is None:
+            return list()
+        return items
+
+    async def get_exportable(self):
+        url = "{0}?export=true".format(self._object_url("fetch"))
+        state = await self.request(method="GET", url=url)
+        return self._get_result(state)
+
+    async def create(self):
+        self._check_name("CREATE")
+
+        # HTTP 500 : resourceVersion may not be set on objects to be created
+        if self.model.metadata.resource_version is not None:
+            self.model.metadata.resource_version = None
+
+        url = "{base}".format(base=self.base_url)
+        post_data = self.serialize()
+        state = await self.request(method="POST", url=url, data=post_data)
+        self._create_result(state, post_data)
+        return self
+
+    async def update(self):
+        url = self._object_url("UPDATE")
+        self.model.metadata.strip(self.model.kind)  # strip server-generated metadata before posting updates
+        state = await self.request(method="PUT", url=url, data=self.serialize())
+        self._update_result(state, "UPDATE")
+        return self
+
+    async def patch(self):
+        url = self._object_url("PATCH")
+        self.model.metadata.strip(self.model.kind)  # strip server-generated metadata before posting updates
+        state = await self.request(method="PATCH", url=url, data=self.serialize())
+        self._update_result(state, "PATCH")
+        return self
+
+    async def delete(self, cascade=False):
+        url = self._object_url("DELETE")
+        state = await self.request(method="DELETE", url=url, data=self._delete_options(cascade))
+        self._delete_result(state)
+
+        if state.get("success"):
+            message = "Timed out on DELETE object: [ {0} ]".format(self.name)
+            await self._wait_for(predicate=None, timeout=self.DELETE_TIMEOUT_SECONDS, message=message)
+
+        return self
+
+    async def server_version(self):
+        url = "/version"
+        state = await self.request(method="GET", url=url)
+        return self._server_version_result(state)
+
+    # ------------------------------------------------------------------------------------- watch
+
+    def watch(self, *args, **kwargs):
+        raise _not_streamed(self, "watch")
+
+    def _relist(self, *args, **kwargs):
+        raise _not_streamed(self, "watch")
+
+    # ------------------------------------------------------------------------------------- wait
+
+    async def _wait_for(self, predicate=None, timeout=None, message=None):
+        """
+        Waits until predicate() is true, keeping self.model up to date. With no predicate, waits until the
+        object is deleted, leaving self.model as it is. There is no watch over asyncio yet: the object is polled, as K8sObject does when
+        it can't watch.
+
+        :param predicate: A callable without arguments checking self.model, or a coroutine function.
+        :param timeout: The number of seconds after which to raise a TimedOutException. Waits forever if None.
+        :param message: The message of the TimedOutException.
+        :return: self
+        """
+
+        deadline = None if timeout is None else time.time() + timeout
+        return await self._poll_for(predicate, deadline, message)
+
+    async def _poll_for(self, predicate=None, deadline=None, message=None):
+        # the interval grows from WAIT_POLL_MIN_SECONDS to WAIT_POLL_MAX_SECONDS: thousands of objects
+        # waited for at once would otherwise each be fetched several times a second.
+        interval = self.WAIT_POLL_MIN_SECONDS
+        while True:
+            try:
+                current = await self._fetch()
+            except NotFoundException:
+                if predicate is None:
+                    return self
+                raise
+            if predicate is not None:
+                self.model = current
+                done = predicate()
+                if asyncio.iscoroutine(done):
+                    done = await done
+                if done:
+                    return self
+            if deadline is not None and time.time() + interval > deadline:
+                raise TimedOutException(message)
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, self.WAIT_POLL_MAX_SECONDS)
+
+    async def _fetch(self):
+        return self._as_model(self._model_class, await self.get_model(), lazy=False)
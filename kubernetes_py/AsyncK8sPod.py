@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes_py.AsyncK8sObject import AsyncK8sObject, _not_streamed
+from kubernetes_py.K8sConfig import K8sConfig
+from kubernetes_py.K8sPod import K8sPod
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.utils import is_valid_dict, is_valid_string
+from kubernetes_py.utils.Selectors import Selector
+
+
+class AsyncK8sPod(AsyncK8sObject, K8sPod):
+
+    # -------------------------------------------------------------------------------------  override
+
+    async def create(self):
+        await super(AsyncK8sPod, self).create()
+        await self.get()
+        await self._wait_for_readiness()
+        return self
+
+    async def update(self):
+        await super(AsyncK8sPod, self).update()
+        await self.get()
+        await self._wait_for_readiness()
+        return self
+
+    async def list(self, pattern=None, labels=None, fields=None):
+        ls = await super(AsyncK8sPod, self).list(labels=labels, fields=fields)
+        pods = list(map(lambda pod: self._as_model(Pod, pod), ls))
+        if pattern is not None:
+            pods = list(filter(lambda pod: pattern in pod.name, pods))
+        k8s = list()
+        for x in pods:
+            p = AsyncK8sPod(config=self.config, name=x.name).from_model(m=x)
+            k8s.append(p)
+        return k8s
+
+    async def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        async for item in super(AsyncK8sPod, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Pod, item)
+            if pattern is None or pattern in x.name:
+                yield AsyncK8sPod(config=self.config, name=x.name).from_model(m=x)
+
+    # -------------------------------------------------------------------------------------  wait
+
+    async def _wait_for_readiness(self):
+        message = "Timed out on Pod readiness: [ {0} ]".format(self.name)
+        await self._wait_for(self._is_ready_status, timeout=self.POD_READY_TIMEOUT_SECONDS, message=message)
+
+    # ------------------------------------------------------------------------------------- get
+
+    async def get(self):
+        self.model = self._as_model(Pod, await self.get_model(), lazy=False)
+        return self
+
+    # ------------------------------------------------------------------------------------- polling readiness
+
+    async def is_ready(self):
+        await self.get()
+        return self._is_ready_status()
+
+    # ------------------------------------------------------------------------------------- logs
+
+    async def get_log(self, container=None):
+        # read as text, as K8sPod.stream_log() does: a line may well be valid JSON.
+        state = await self.request(method="GET", url=self._log_url(container), text=True)
+        return self._log_result(state)
+
+    def stream_log(self, *args, **kwargs):
+        raise _not_streamed(self, "stream_log")
+
+    # ------------------------------------------------------------------------------------- metrics
+
+    async def get_metrics(self):
+        state = await self.request(method="GET", url=self._metrics_url())
+        return self._metrics_result(state)
+
+    # ------------------------------------------------------------------------------------- status
+
+    @property
+    def status(self):
+        # the blocking K8sPod refreshes the pod here; call 'await pod.get()' instead.
+        return self.model.status
+
+    @status.setter
+    def status(self, status=None):
+        self.model.status = status
+
+    # ------------------------------------------------------------------------------------- filtering
+
+    @staticmethod
+    async def get_by_labels(config=None, labels=None):
+        if config is None:
+            config = K8sConfig()
+        if not is_valid_dict(labels) and not isinstance(labels, Selector):
+            raise SyntaxError("K8sPod.get_by_labels(): labels: [ {} ] is invalid.".format(labels))
+
+        pods = await AsyncK8sPod(config=config, name="whatever").list(labels=labels)
+
+        return pods
+
+    @staticmethod
+    async def get_by_pod_ip(config=None, ip=None, labels=None):
+        if config is None:
+            config = K8sConfig()
+        if not is_valid_string(ip):
+            raise SyntaxError("K8sPod.get_by_pod_ip(): ip: [ {0} ] is invalid.".format(ip))
+
+        pods = await AsyncK8sPod(config=config, name="throwaway").list(labels=labels, fields={"status.podIP": ip})
+
+        for pod in pods:
+            if pod.pod_ip == ip:
+                return pod
+        return None
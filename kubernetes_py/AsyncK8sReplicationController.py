@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+import uuid
+
+from kubernetes_py.AsyncK8sObject import AsyncK8sObject
+from kubernetes_py.AsyncK8sPod import AsyncK8sPod
+from kubernetes_py.K8sConfig import K8sConfig
+from kubernetes_py.K8sExceptions import NotFoundException, UnprocessableEntityException
+from kubernetes_py.K8sReplicationController import K8sReplicationController
+from kubernetes_py.models.v1.ReplicationController import ReplicationController
+from kubernetes_py.utils import is_valid_string
+
+
+class AsyncK8sReplicationController(AsyncK8sObject, K8sReplicationController):
+
+    # -------------------------------------------------------------------------------------  override
+
+    async def create(self):
+        await super(AsyncK8sReplicationController, self).create()
+        if self.desired_replicas > 0:
+            await self._wait_for_desired_replicas()
+        return self
+
+    async def update(self):
+        await super(AsyncK8sReplicationController, self).update()
+        if self.desired_replicas > 0:
+            await self._wait_for_desired_replicas()
+        return self
+
+    async def list(self, pattern=None, fields=None):
+        ls = await super(AsyncK8sReplicationController, self).list(fields=fields)
+        rcs = list(map(lambda x: self._as_model(ReplicationController, x), ls))
+        if pattern is not None:
+            rcs = list(filter(lambda x: pattern in x.name, rcs))
+        k8s = []
+        for x in rcs:
+            j = AsyncK8sReplicationController(config=self.config, name=x.name)
+            j.model = x
+            k8s.append(j)
+        return k8s
+
+    async def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        async for item in super(AsyncK8sReplicationController, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(ReplicationController, item)
+            if pattern is None or pattern in x.name:
+                j = AsyncK8sReplicationController(config=self.config, name=x.name)
+                j.model = x
+                yield j
+
+    # -------------------------------------------------------------------------------------  get
+
+    async def get(self):
+        self.model = self._as_model(ReplicationController, await self.get_model(), lazy=False)
+        return self
+
+    # -------------------------------------------------------------------------------------  wait
+
+    async def _wait_for_desired_replicas(self):
+        message = "Timed out scaling RC: [ {0} ] to replica count: [ {1} ]".format(self.name, self.desired_replicas)
+        await self._wait_for(self._check_pod_readiness, timeout=self.SCALE_WAIT_TIMEOUT_SECONDS, message=message)
+        return self
+
+    async def _check_pod_readiness(self):
+        if self.current_replicas == self.desired_replicas:
+            # the pods were just listed, their status is as fresh as a GET on each of them.
+            pods = await self.get_pods()
+            return all(pod._is_ready_status() for pod in pods)
+        return False
+
+    # -------------------------------------------------------------------------------------  get pods
+
+    async def get_pods(self):
+        pods = await AsyncK8sPod.get_by_labels(config=self.config, labels=self.pod_labels)
+        return pods
+
+    # -------------------------------------------------------------------------------------  get by name
+
+    @staticmethod
+    async def get_by_name(config=None, name=None, name_label="name"):
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError("ReplicationController.get_by_name(): config: [ {0} ] is invalid.".format(config))
+        if not is_valid_string(name):
+            raise SyntaxError("K8sReplicationController.get_by_name() name: [ {0} ] is invalid.".format(name))
+
+        data = {"labelSelector": "{0}={1}".format(name_label, name)}
+        rcs = await AsyncK8sReplicationController(config=config, name=name).get_with_params(data=data)
+
+        rc_list = []
+        for rc in rcs:
+            model = ReplicationController(rc)
+            obj = AsyncK8sReplicationController(config=config, name=model.metadata.name).from_model(m=model)
+            rc_list.append(obj)
+        return rc_list
+
+    # -------------------------------------------------------------------------------------  scale
+
+    @staticmethod
+    async def scale(config=None, name=None, replicas=None):
+        """
+        Scales the number of pods in the specified ReplicationController to the desired replica count.
+
+        :param config: an instance of K8sConfig
+
+        :param name: the name of the ReplicationController we want to scale.
+
+        :param replicas: the desired number of replicas.
+
+        :return: An instance of AsyncK8sReplicationController
+        """
+
+        rc = await AsyncK8sReplicationController(config=config, name=name).get()
+        rc.desired_replicas = replicas
+        await rc.update()
+        return rc
+
+    # -------------------------------------------------------------------------------------  rolling update
+
+    @staticmethod
+    async def rolling_update(config=None, name=None, image=None, container_name=None, rc_new=None):
+        """
+        Performs a simple rolling update of a ReplicationController, as K8sReplicationController.rolling_update() does.
+
+        :param config: An instance of K8sConfig. If omitted, reads from ~/.kube/config.
+
+        :param name: The name of the ReplicationController we want to update.
+
+        :param image: The updated image version we want applied.
+
+        :param container_name: The name of the container we're targeting for the update.
+               Required if more than one container is present.
+
+        :param rc_new: An instance of AsyncK8sReplicationController with the new configuration to apply.
+               Mutually exclusive with [image, container_name] if specified.
+
+        :return: An instance of AsyncK8sReplicationController
+        """
+
+        if name is None:
+            raise SyntaxError("K8sReplicationController: name: [ {0} ] cannot be None.".format(name))
+        if image is None and rc_new is None:
+            raise SyntaxError("K8sReplicationController: please specify either 'image' or 'rc_new'")
+        if container_name is not None and image is not None and rc_new is not None:
+            raise SyntaxError(
+                "K8sReplicationController: rc_new is mutually exclusive with an (container_name, image) pair."
+            )
+
+        return await AsyncK8sReplicationController._rolling_update_init(
+            config=config, name=name, image=image, container_name=container_name, rc_new=rc_new
+        )
+
+    async def restart(self):
+        """
+        Forces a rolling update of the ReplicationController to its current revision, as the blocking restart() does.
+        """
+
+        rc_new = copy.deepcopy(self)
+        return await AsyncK8sReplicationController.rolling_update(config=self.config, name=self.name, rc_new=rc_new)
+
+    @staticmethod
+    async def _get_or_none(config=None, name=None):
+        try:
+            return await AsyncK8sReplicationController(config=config, name=name).get()
+        except NotFoundException:
+            return None
+
+    @staticmethod
+    async def _rolling_update_init(config=None, name=None, image=None, container_name=None, rc_new=None):
+        foo = await AsyncK8sReplicationController._get_or_none(config, name)
+        foo_next = await AsyncK8sReplicationController._get_or_none(config, "{}-next".format(name))
+
+        if foo is None and foo_next is None:
+            raise NotFoundException("K8sReplicationController.rolling_update() RC: [ {} ] not found.".format(name))
+
+        if foo is not None and foo_next is None:
+
+            if rc_new is not None:
+                foo_next = copy.deepcopy(rc_new)
+
+            else:
+                foo_next = AsyncK8sReplicationController(config=config, name=name)
+
+            foo_old = copy.deepcopy(foo)
+            foo_old.name = "{}-old".format(foo.name)
+            foo_old.selector = copy.deepcopy(foo.selector)
+            foo_old.pod_labels = copy.deepcopy(foo.pod_labels)
+
+            await foo.delete(cascade=False)
+            await foo_old.create()
+
+            if image and len(foo_old.containers) > 1 and not container_name:
+                raise UnprocessableEntityException(
+                    "K8sReplicationController: Please specify the target container_name "
+                    "on which to apply image: [ {} ].".format(image)
+                )
+
+            if len(foo_old.containers) == 1 and not container_name:
+                container_name = foo_old.containers[0].name
+
+            if container_name and image:
+                existing = list(filter(lambda x: x.name != container_name, foo_old.containers))
+                if existing:
+                    [foo_next.add_container(x) for x in existing]
+                filtered = list(filter(lambda x: x.name == container_name, foo_old.containers))
+                if filtered:
+                    container = filtered[0]
+                    container.image = image
+                    foo_next.add_container(container)
+
+            new_version = str(uuid.uuid4())
+            foo_next.name = name
+            foo_next.add_pod_label(k="name", v=name)
+            foo_next.add_pod_label(k="rc_version", v=new_version)
+            foo_next.selector = {"name": name, "rc_version": new_version}
+            foo_next.add_annotation(foo_next.DESIRED_REPLICAS_ANNOTATION, foo_old.desired_replicas)
+            foo_next.desired_replicas = 0
+
+            await foo_next.create()
+            return await AsyncK8sReplicationController._rolling_update_rollout(config, name)
+
+        if foo is None and foo_next is not None:
+            return await AsyncK8sReplicationController._rolling_update_rename(config, name)
+
+        if AsyncK8sReplicationController.DESIRED_REPLICAS_ANNOTATION not in foo_next.annotations:
+            foo_next.add_annotation(AsyncK8sReplicationController.DESIRED_REPLICAS_ANNOTATION, foo.current_replicas)
+            await foo_next.update()
+        return await AsyncK8sReplicationController._rolling_update_rollout(config, name)
+
+    @staticmethod
+    async def _rolling_update_rollout(config=None, name=None):
+        name_old = "{}-old".format(name)
+        foo = await AsyncK8sReplicationController(config=config, name=name_old).get()
+        foo_next = await AsyncK8sReplicationController(config=config, name=name).get()
+        desired = foo_next.get_annotation(AsyncK8sReplicationController.DESIRED_REPLICAS_ANNOTATION)
+
+        while foo_next.current_replicas < int(desired):
+
+            await AsyncK8sReplicationController.scale(config=config, name=name, replicas=foo_next.current_replicas + 1)
+
+            if foo.current_replicas > 0:
+                replicas = foo.current_replicas - 1
+                await AsyncK8sReplicationController.scale(config=config, name=name_old, replicas=replicas)
+
+            await foo.get()
+            await foo_next.get()
+
+        return await AsyncK8sReplicationController._rolling_update_rename(config, name)
+
+    @staticmethod
+    async def _rolling_update_rename(config=None, name=None):
+        foo = await AsyncK8sReplicationController(config=config, name="{}-old".format(name)).get()
+        foo_next = await AsyncK8sReplicationController(config=config, name=name).get()
+        await foo.delete()
+        return foo_next
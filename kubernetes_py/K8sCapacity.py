@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from kubernetes_py.K8sConfig import K8sConfig
+from kubernetes_py.K8sInformer import K8sInformer
+from kubernetes_py.K8sObject import K8sObject
+from kubernetes_py.utils.Quantity import parse_quantity, quantity_array
+
+# the resources reported when none are asked for.
+RESOURCES = ["cpu", "memory", "pods"]
+
+# the decimal exponent of the unit each resource is counted in: cpu in millicores, the others in units.
+SCALES = {"cpu": -3}
+
+# the pods in these phases hold no resources on their node any more.
+TERMINATED_PHASES = ("Succeeded", "Failed")
+
+_EMPTY = {}
+
+
+class K8sCapacity(object):
+    """
+    How much of the allocatable resources of each node is requested, and limited, by the pods running there,
+    from one list of the nodes and one of the pods.
+
+    'allocatable', 'requested' and 'limits' are numpy int64 matrices of one row per node, in 'names' order, and
+    one column per resource, in 'resources' order: cpu in millicores, memory in bytes, pods in pods. The reports
+    are computed from them with array operations, grouping nodes by label or by taint, rather than with K8sNode
+    and K8sPod objects, which keeps thousands of nodes to seconds.
+
+        capacity = K8sCapacity.load(config=cfg)
+        capacity.by_label('failure-domain.beta.kubernetes.io/zone')
+        # {'us-east-1a': {'nodes': 1700, 'allocatable': {'cpu': 13260000, ...}, 'headroom': {...}, ...}, ...}
+
+    Each report holds, per resource:
+
+    - allocatable, requested, limits: the sums over the nodes.
+    - headroom: allocatable - requested.
+    - utilization: requested / allocatable.
+    - overcommit: limits / allocatable, above 1 when the limits can't all be honored at once.
+    - fragmentation: the share of the headroom that can't hold one more pod of 'shape', because another
+      resource of the same node runs out first. 'shape' is the average pod if None.
+    """
+
+    def __init__(self, nodes=None, pods=None, resources=None):
+        """
+        :param nodes: The raw nodes, as listed.
+        :param pods: The raw pods, as listed. Those not scheduled, or terminated, are left out.
+        :param resources: The resources to report on. RESOURCES if None.
+        """
+
+        if numpy is None:
+            raise ImportError("K8sCapacity needs numpy: pip install kubernetes-py[numpy]")
+        if not isinstance(nodes, list):
+            raise SyntaxError("K8sCapacity: nodes: [ {0} ] is invalid.".format(nodes))
+        if not isinstance(pods, list):
+            raise SyntaxError("K8sCapacity: pods: [ {0} ] is invalid.".format(pods))
+        if resources is not None and (not isinstance(resources, list) or not resources):
+            raise SyntaxError("K8sCapacity: resources: [ {0} ] is invalid.".format(resources))
+
+        self.resources = list(resources or RESOURCES)
+        self._read_nodes(nodes)
+        self._read_pods(pods)
+
+    @classmethod
+    def load(cls, config=None, resources=None):
+        """
+        Lists all the nodes and all the pods, once each, or reads them from the K8sInformer kept of each.
+        """
+
+        if config is None:
+            config = K8sConfig()
+        if not isinstance(config, K8sConfig):
+            raise SyntaxError("K8sCapacity: config: [ {0} ] must be of type K8sConfig.".format(config))
+        return cls(nodes=cls._list(config, "Node"), pods=cls._list(config, "Pod"), resources=resources)
+
+    @staticmethod
+    def _list(config=None, obj_type=None):
+        informer = K8sInformer.lookup(config=config, obj_type=obj_type, namespace=None)
+        if informer is not None:
+            return informer.list()
+        config = copy.deepcopy(config)
+        config.namespace = None
+        return list(K8sObject(config=config, obj_type=obj_type, name="capacity").list_iter())
+
+    # ------------------------------------------------------------------------------------- read
+
+    def _column(self, values=None, resource=None):
+        return quantity_array(values, SCALES.get(resource, 0))
+
+    def _matrix(self, rows=None):
+        columns = [self._column([x.get(r, None) for x in rows], r) for r in self.resources]
+        return numpy.stack(columns, axis=1)
+
+    def _read_nodes(self, nodes=None):
+        self.names = list()
+        self.labels = list()
+        self.taints = list()
+        statuses = list()
+        unschedulable = list()
+        for node in nodes:
+            metadata = node.get("metadata", None) or _EMPTY
+            spec = node.get("spec", None) or _EMPTY
+            self.names.append(metadata.get("name", None))
+            self.labels.append(metadata.get("labels", None) or _EMPTY)
+            self.taints.append(spec.get("taints", None) or [])
+            unschedulable.append(bool(spec.get("unschedulable", False)))
+            statuses.append(node.get("status", None) or _EMPTY)
+
+        self._index = dict((name, i) for i, name in enumerate(self.names))
+        self.unschedulable = numpy.array(unschedulable, dtype=bool)
+        self.allocatable = self._matrix([x.get("allocatable", None) or _EMPTY for x in statuses])
+
+    def _read_pods(self, pods=None):
+        # the containers of every pod are laid out flat, with the position of their pod, to be summed per pod
+        # then per node with bincount.
+        nodes, owners, containers, init_owners, init_containers = list(), list(), list(), list(), list()
+        index = self._index
+        for pod in pods:
+            spec = pod.get("spec", None) or _EMPTY
+            node = index.get(spec.get("nodeName", None), None)
+            if node is None or (pod.get("status", None) or _EMPTY).get("phase", None) in TERMINATED_PHASES:
+                continue
+            position = len(nodes)
+            nodes.append(node)
+            for container in spec.get("containers", None) or []:
+                owners.append(position)
+                containers.append(container.get("resources", None) or _EMPTY)
+            for container in spec.get("initContainers", None) or []:
+                init_owners.append(position)
+                init_containers.append(container.get("resources", None) or _EMPTY)
+
+        nodes = numpy.array(nodes, dtype=numpy.intp)
+        self.pods = numpy.bincount(nodes, minlength=len(self.names))
+        owners = numpy.array(owners, dtype=numpy.intp)
+        init_owners = numpy.array(init_owners, dtype=numpy.intp)
+        count = len(nodes)
+
+        requests, limits, unlimited = list(), list(), list()
+        for r in self.resources:
+            if r == "pods":
+                # each pod takes one of the pods of its node, and sets no request for it.
+                ones = numpy.ones(count, dtype=numpy.int64)
+                requests.append(ones)
+                limits.append(ones)
+                unlimited.append(numpy.zeros(count, dtype=bool))
+                continue
+            for kind, sums in (("requests", requests), ("limits", limits)):
+                values = [(x.get(kind, None) or _EMPTY).get(r, None) for x in containers]
+                init_values = [(x.get(kind, None) or _EMPTY).get(r, None) for x in init_containers]
+                # a pod needs the sum of its containers, or the most any of its init containers needs, if more.
+                total = numpy.bincount(owners, weights=self._column(values, r), minlength=count)
+                if len(init_owners):
+                    init = numpy.zeros(count)
+                    numpy.maximum.at(init, init_owners, self._column(init_values, r))
+                    total = numpy.maximum(total, init)
+                sums.append(numpy.rint(total).astype(numpy.int64))
+                if kind == "limits":
+                    missing = numpy.array([x is None for x in values], dtype=numpy.float64)
+                    unlimited.append(numpy.bincount(owners, weights=missing, minlength=count) > 0)
+
+        # the pods' requests are kept, for the average pod.
+        self.pod_requests = numpy.stack(requests, axis=1)
+        self.requested = self._per_node(nodes, self.pod_requests)
+        self.limits = self._per_node(nodes, numpy.stack(limits, axis=1))
+        # the pods with a container setting no limit: the limits of their node understate what they can use.
+        self.unlimited = self._per_node(nodes, numpy.stack(unlimited, axis=1).astype(numpy.int64))
+
+    def _per_node(self, nodes=None, matrix=None):
+        sums = numpy.zeros((len(self.names), len(self.resources)), dtype=numpy.int64)
+        for j in range(len(self.resources)):
+            column = numpy.bincount(nodes, weights=matrix[:, j], minlength=len(self.names))
+            sums[:, j] = numpy.rint(column).astype(numpy.int64)
+        return sums
+
+    # ------------------------------------------------------------------------------------- derived
+
+    @property
+    def headroom(self):
+        return self.allocatable - self.requested
+
+    @property
+    def utilization(self):
+        return self._ratio(self.requested, self.allocatable)
+
+    @property
+    def overcommit(self):
+        return self._ratio(self.limits, self.allocatable)
+
+    @property
+    def stranded(self):
+        """
+        Per node, the share of the node left unused by the most used resource: the gap between the largest
+        and the smallest share of each resource still free. A node with 60% of its cpu and 5% of its memory
+        free strands 55% of its cpu.
+        """
+
+        # a node's pods are a count, not a capacity left unused.
+        columns = [j for j, r in enumerate(self.resources) if r != "pods"]
+        free = numpy.clip(self._ratio(self.headroom, self.allocatable), 0, 1)[:, columns]
+        if not len(free) or not columns:
+            return numpy.zeros(len(self.names))
+        return free.max(axis=1) - free.min(axis=1)
+
+    @staticmethod
+    def _ratio(a=None, b=None):
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            ratio = numpy.true_divide(a, b)
+        ratio[b == 0] = 0
+        return ratio
+
+    def shape(self, shape=None):
+        """
+        :param shape: A dict of resource to quantity: {'cpu': '500m', 'memory': '1Gi'}. The average pod if None.
+        :return: The shape as a row of the matrices. A pod always takes one of the pods of a node.
+        """
+
+        if shape is None:
+            if len(self.pod_requests):
+                row = numpy.ceil(self.pod_requests.mean(axis=0)).astype(numpy.int64)
+            else:
+                row = numpy.zeros(len(self.resources), dtype=numpy.int64)
+        elif isinstance(shape, dict):
+            unknown = [x for x in shape if x not in self.resources]
+            if unknown:
+                raise SyntaxError("K8sCapacity: shape: [ {0} ] is invalid.".format(shape))
+            row = [parse_quantity(shape.get(r, 0), SCALES.get(r, 0)) for r in self.resources]
+            row = numpy.array(row, dtype=numpy.int64)
+        else:
+            raise SyntaxError("K8sCapacity: shape: [ {0} ] is invalid.".format(shape))
+        if "pods" in self.resources:
+            row[self.resources.index("pods")] = 1
+        return row
+
+    def fits(self, shape=None):
+        """
+        :return: Per node, how many more pods of 'shape' fit in its headroom. 0 on unschedulable nodes.
+        """
+
+        row = self.shape(shape)
+        used = row > 0
+        if not used.any():
+            if shape is None:
+                # no pod scheduled, and no pods counted.
+                return numpy.zeros(len(self.names), dtype=numpy.int64)
+            raise SyntaxError("K8sCapacity: shape: [ {0} ] requests nothing.".format(shape))
+        free = numpy.maximum(self.headroom[:, used], 0)
+        fits = (free // row[used]).min(axis=1)
+        fits[self.unschedulable] = 0
+        return fits
+
+    # ------------------------------------------------------------------------------------- reports
+
+    def _reports(self, members=None, codes=None, groups=None, shape=None):
+        """
+        :param members: The nodes of each (node, group) pair.
+        :param codes: The group of each (node, group) pair.
+        :param groups: The key of each group.
+        :return: A dict of group key to its report.
+        """
+
+        count = len(groups)
+        row = self.shape(shape)
+        fits = self.fits(shape)
+        free = numpy.maximum(self.headroom, 0)
+        usable = fits[:, None] * row[None, :]
+
+        sums = dict()
+        for name, matrix in (
+            ("allocatable", self.allocatable),
+            ("requested", self.requested),
+            ("limits", self.limits),
+            ("free", free),
+            ("usable", usable),
+        ):
+            total = numpy.zeros((count, len(self.resources)), dtype=numpy.int64)
+            numpy.add.at(total, codes, matrix[members])
+            sums[name] = total
+        nodes = numpy.bincount(codes, minlength=count)
+        pods = numpy.zeros(count, dtype=numpy.int64)
+        numpy.add.at(pods, codes, self.pods[members])
+
+        headroom = sums["allocatable"] - sums["requested"]
+        utilization = self._ratio(sums["requested"], sums["allocatable"])
+        overcommit = self._ratio(sums["limits"], sums["allocatable"])
+        fragmentation = 1 - self._ratio(sums["usable"], sums["free"])
+        fragmentation[sums["free"] == 0] = 0
+        fragmentation[:, row == 0] = 0
+
+        reports = dict()
+        for g, key in enumerate(groups):
+            reports[key] = {
+                "nodes": int(nodes[g]),
+                "pods": int(pods[g]),
+                "allocatable": dict(zip(self.resources, sums["allocatable"][g].tolist())),
+                "requested": dict(zip(self.resources, sums["requested"][g].tolist())),
+                "limits": dict(zip(self.resources, sums["limits"][g].tolist())),
+                "headroom": dict(zip(self.resources, headroom[g].tolist())),
+                "utilization": dict(zip(self.resources, utilization[g].tolist())),
+                "overcommit": dict(zip(self.resources, overcommit[g].tolist())),
+                "fragmentation": dict(zip(self.resources, fragmentation[g].tolist())),
+            }
+        return reports
+
+    def report(self, shape=None):
+        """
+        :return: The report of all the nodes together.
+        """
+
+        members = numpy.arange(len(self.names))
+        return self._reports(members, numpy.zeros(len(members), dtype=numpy.intp), [None], shape)[None]
+
+    def by_node(self, shape=None):
+        """
+        :return: A dict of node name to its report, which also holds the share of the node 'stranded'.
+        """
+
+        members = numpy.arange(len(self.names))
+        reports = self._reports(members, members, self.names, shape)
+        for name, stranded in zip(self.names, self.stranded.tolist()):
+            reports[name]["stranded"] = stranded
+        return reports
+
+    def by_label(self, key=None, shape=None):
+        """
+        :param key: A label key: 'failure-domain.beta.kubernetes.io/zone', 'beta.kubernetes.io/instance-type'...
+        :return: A dict of label value to the report of its nodes. The nodes without the label are under None.
+        """
+
+        groups = dict()
+        codes = numpy.array([groups.setdefault(x.get(key, None), len(groups)) for x in self.labels], dtype=numpy.intp)
+        keys = sorted(groups, key=groups.get)
+        return self._reports(numpy.arange(len(self.names)), codes, keys, shape)
+
+    def by_taint(self, shape=None):
+        """
+        :return: A dict of taint, as 'key=value:effect', to the report of its nodes. A node with several taints
+            is counted in each. The nodes without taints are under None.
+        """
+
+        groups = dict()
+        members, codes = list(), list()
+        for i, taints in enumerate(self.taints):
+            keys = [self._taint(x) for x in taints] or [None]
+            for key in keys:
+                members.append(i)
+                codes.append(groups.setdefault(key, len(groups)))
+        keys = sorted(groups, key=groups.get)
+        members = numpy.array(members, dtype=numpy.intp)
+        return self._reports(members, numpy.array(codes, dtype=numpy.intp), keys, shape)
+
+    @staticmethod
+    def _taint(taint=None):
+        value = taint.get("value", None)
+        key = taint.get("key", None) if value is None else "{0}={1}".format(taint.get("key", None), value)
+        return "{0}:{1}".format(key, taint.get("effect", None))
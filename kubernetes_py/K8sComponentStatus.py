@@ -26,9 +26,9 @@ class K8sComponentStatus(K8sObject):
         super(K8sComponentStatus, self).delete(cascade)
         return self
 
-    def list(self, pattern=None):
-        ls = super(K8sComponentStatus, self).list()
-        comps = list(map(lambda x: ComponentStatus(x), ls))
+    def list(self, pattern=None, fields=None):
+        ls = super(K8sComponentStatus, self).list(fields=fields)
+        comps = list(map(lambda x: self._as_model(ComponentStatus, x), ls))
         if pattern is not None:
             comps = list(filter(lambda x: pattern in x.name, comps))
         k8s = []
@@ -38,10 +38,18 @@ class K8sComponentStatus(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sComponentStatus, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(ComponentStatus, item)
+            if pattern is None or pattern in x.name:
+                j = K8sComponentStatus(config=self.config, name=x.name)
+                j.model = x
+                yield j
+
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = ComponentStatus(self.get_model())
+        self.model = self._as_model(ComponentStatus, self.get_model(), lazy=False)
         return self
 
     # ------------------------------------------------------------------------------------- conditions
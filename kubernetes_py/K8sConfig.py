@@ -8,12 +8,18 @@
 
 import re
 from os.path import expanduser, isfile
+import copy
 import logging
 import os
+import threading
 
 import yaml
 from yaml import YAMLError
 
+from kubernetes_py.utils.HttpSession import HttpSession, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from kubernetes_py.utils.RateLimiter import RateLimiter, RetryPolicy, DEFAULT_MAX_RETRIES
+from kubernetes_py.utils.TLSContext import ssl_context_for
+
 KUBECONFIG_ENV_VAR = "KUBECONFIG"
 KUBECONFIG_FILE = "{0}/.kube/config".format(expanduser("~"))
 DEFAULT_API_HOST = "http://localhost:8080"
@@ -32,10 +38,53 @@ VALID_IP_RE = re.compile(
 )
 VALID_HOST_RE = re.compile(r"^(http[s]?\:\/\/)?([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-\.]*[A-Za-z])+(:[0-9]+)?$")
 
+# the C loader of libyaml, when PyYAML was built with it, parses several times faster.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_KUBECONFIGS = {}
+_KUBECONFIGS_LOCK = threading.Lock()
+
+
+def load_kubeconfig(filename=None):
+    """
+    Parses a kubeconfig file once per process: it is parsed again only when its mtime or size change.
+
+    :param filename: The path of the kubeconfig file.
+    :return: A copy of the parsed file, which the caller may modify.
+    """
+
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    signature = (getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size)
+    with _KUBECONFIGS_LOCK:
+        cached = _KUBECONFIGS.get(path, None)
+    if cached is None or cached[0] != signature:
+        with open(path, "r") as stream:
+            cached = (signature, yaml.load(stream, Loader=YAML_LOADER))
+        with _KUBECONFIGS_LOCK:
+            _KUBECONFIGS[path] = cached
+    return copy.deepcopy(cached[1])
+
 
 class K8sConfig(object):
     def __init__(
-        self, kubeconfig=None, api_host=None, auth=None, cert=None, namespace=None, pull_secret=None, token=None, version=None
+        self,
+        kubeconfig=None,
+        api_host=None,
+        auth=None,
+        cert=None,
+        namespace=None,
+        pull_secret=None,
+        token=None,
+        version=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=False,
+        keep_alive=True,
+        qps=None,
+        burst=None,
+        max_retries=DEFAULT_MAX_RETRIES,
+        lazy_models=False,
     ):
         """
         Pulls configuration from a kubeconfig file, if present, otherwise accepts user-defined parameters.
@@ -48,6 +97,14 @@ class K8sConfig(object):
         :param pull_secret: The password to use when pulling images from the container repository.
         :param token: An authentication token. Mutually exclusive with 'auth'.
         :param version: The version of the API to target. Defaults to 'v1'.
+        :param pool_connections: The number of per-host HTTP connection pools to cache. Defaults to 10.
+        :param pool_maxsize: The maximum number of connections kept open to the API server. Defaults to 10.
+        :param pool_block: Whether to wait for a free connection when all of them are in use. Defaults to False.
+        :param keep_alive: Whether to reuse connections across API calls. Defaults to True.
+        :param qps: The number of API calls per second sent on average. Unlimited by default.
+        :param burst: The number of API calls sent at once, above 'qps'. Defaults to 'qps'.
+        :param max_retries: The number of times an API call throttled (429), failed (5xx) or cut is sent again.
+        :param lazy_models: Whether the objects listed build their metadata, spec and status when first read.
         """
 
         super(K8sConfig, self).__init__()
@@ -65,11 +122,20 @@ class K8sConfig(object):
         self.token = None
         self.version = None
 
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self._session = None
+        self._async_session = None
+        self._session_lock = threading.Lock()
+        self.rate_limiter = RateLimiter(qps=qps, burst=burst)
+        self.retry_policy = RetryPolicy(max_retries=max_retries)
+        self.lazy_models = lazy_models
+
         self._init_with_defaults()
 
-        if kubeconfig is None:
-            self._init_with_defaults()
-        else:
+        if kubeconfig is not None:
             self._read_config(filename=kubeconfig)
 
         # Default fallback host.
@@ -135,6 +201,90 @@ class K8sConfig(object):
             self.version = version
         return
 
+    # ------------------------------------------------------------------------------------- http session
+
+    @property
+    def session(self):
+        """
+        The pool of keep-alive connections shared by every K8sObject using this config.
+        """
+        ssl_context = self.ssl_context
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = HttpSession(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        pool_block=self.pool_block,
+                        keep_alive=self.keep_alive,
+                        ssl_context=ssl_context,
+                    )
+        if self._session.ssl_context is not ssl_context:
+            with self._session_lock:
+                self._session.use_ssl_context(ssl_context)
+        return self._session
+
+    @property
+    def async_session(self):
+        """
+        The pool of keep-alive connections shared by every AsyncK8sObject using this config.
+        """
+        from kubernetes_py.utils.AsyncHttpRequest import AsyncHttpSession
+
+        ssl_context = self.ssl_context
+        if self._async_session is None:
+            with self._session_lock:
+                if self._async_session is None:
+                    self._async_session = AsyncHttpSession(
+                        pool_maxsize=self.pool_maxsize, keep_alive=self.keep_alive, ssl_context=ssl_context
+                    )
+        if self._async_session.ssl_context is not ssl_context:
+            with self._session_lock:
+                self._async_session.use_ssl_context(ssl_context)
+        return self._async_session
+
+    @property
+    def ssl_context(self):
+        """
+        The SSL context built in memory from the TLS credentials of this config. It is built once,
+        and only rebuilt when the host, certificate authority or client certificate change.
+        """
+        return ssl_context_for(
+            host=self.api_host,
+            ca_cert=self.ca_cert,
+            ca_cert_data=self.ca_cert_data,
+            cert=self.cert,
+            cert_data=self.cert_data,
+        )
+
+    @property
+    def rate_limit_stats(self):
+        """
+        The number of API calls sent, how many of them waited on the rate limiter and for how long in total,
+        and the number of retries.
+        """
+        stats = self.rate_limiter.stats()
+        stats["retries"] = self.retry_policy.retries
+        return stats
+
+    @property
+    def pool_stats(self):
+        if self._session is None:
+            return {"requests": 0, "hits": 0, "misses": 0}
+        return self._session.stats()
+
+    def __deepcopy__(self, memo):
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        for k, v in self.__dict__.items():
+            if k == "_session_lock":
+                clone._session_lock = threading.Lock()
+            elif k in ("_session", "_async_session"):
+                setattr(clone, k, v)
+            else:
+                setattr(clone, k, copy.deepcopy(v, memo))
+        return clone
+
     def _init_with_defaults(self):
         # Try to initialize using the environment variable.
         kubeconfig = os.getenv(KUBECONFIG_ENV_VAR, None)
@@ -174,8 +324,7 @@ class K8sConfig(object):
         if not isfile(filename):
             raise IOError("K8sConfig: kubeconfig: [ {0} ] doesn't exist.".format(filename))
         try:
-            with open(filename, "r") as stream:
-                dotconf = yaml.safe_load(stream)
+            dotconf = load_kubeconfig(filename)
         except YAMLError as err:
             raise SyntaxError("K8sConfig: kubeconfig: [ {0} ] is not a valid YAML file: {1}".format(filename, err))
 
@@ -29,9 +29,9 @@ class K8sConfigMap(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sConfigMap, self).list(labels=labels)
-        cm = list(map(lambda x: ConfigMap(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sConfigMap, self).list(labels=labels, fields=fields)
+        cm = list(map(lambda x: self._as_model(ConfigMap, x), ls))
         if pattern is not None:
             cm = list(filter(lambda x: pattern in x.name, cm))
         k8s = []
@@ -40,10 +40,16 @@ class K8sConfigMap(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sConfigMap, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(ConfigMap, item)
+            if pattern is None or pattern in x.name:
+                yield K8sConfigMap(config=self.config, name=x.name).from_model(m=x)
+
     # -------------------------------------------------------------------------------------  get
 
     def get(self):
-        self.model = ConfigMap(self.get_model())
+        self.model = self._as_model(ConfigMap, self.get_model(), lazy=False)
         return self
 
     # -------------------------------------------------------------------------------------  add
@@ -9,7 +9,7 @@
 import time
 
 from kubernetes_py.K8sContainer import K8sContainer
-from kubernetes_py.K8sExceptions import CronJobAlreadyRunningException, CronJobRunException, TimedOutException
+from kubernetes_py.K8sExceptions import CronJobAlreadyRunningException, CronJobRunException
 from kubernetes_py.K8sObject import K8sObject
 from kubernetes_py.K8sPod import K8sPod
 from kubernetes_py.K8sVolume import K8sVolume
@@ -48,9 +48,9 @@ class K8sCronJob(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sCronJob, self).list(labels=labels)
-        jobs = list(map(lambda x: CronJob(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sCronJob, self).list(labels=labels, fields=fields)
+        jobs = list(map(lambda x: self._as_model(CronJob, x), ls))
         if pattern is not None:
             jobs = list(filter(lambda x: pattern in x.name, jobs))
         k8s = []
@@ -59,10 +59,16 @@ class K8sCronJob(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sCronJob, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(CronJob, item)
+            if pattern is None or pattern in x.name:
+                yield K8sCronJob(config=self.config, name=x.name).from_model(m=x)
+
     # -------------------------------------------------------------------------------------  get
 
     def get(self):
-        self.model = CronJob(self.get_model())
+        self.model = self._as_model(CronJob, self.get_model(), lazy=False)
         return self
 
     # -------------------------------------------------------------------------------------  add
@@ -338,11 +344,9 @@ class K8sCronJob(K8sObject):
 
         try:
             pod.create()
-            start_time = time.time()
-            while pod.phase not in ["Succeeded", "Failed"]:
-                pod.get()
-                time.sleep(2)
-                self._check_timeout(start_time)
+            timeout = None if self.POD_RUN_WAIT_TIMEOUT_SECONDS == -1 else self.POD_RUN_WAIT_TIMEOUT_SECONDS
+            message = "Timed out running one-off CronJob: [ {} ]".format(self.name)
+            pod._wait_for(lambda: pod.phase in ["Succeeded", "Failed"], timeout=timeout, message=message)
 
         except Exception as err:
             raise CronJobRunException("K8sCronJob.run() failed: {}".format(err))
@@ -351,10 +355,3 @@ class K8sCronJob(K8sObject):
             pod.delete()
             self.suspend = False
             self.update()
-
-    def _check_timeout(self, start_time=None):
-        if self.POD_RUN_WAIT_TIMEOUT_SECONDS == -1:
-            return
-        elapsed_time = time.time() - start_time
-        if elapsed_time >= self.POD_RUN_WAIT_TIMEOUT_SECONDS:  # timeout
-            raise TimedOutException("Timed out running one-off CronJob: [ {} ]".format(self.name))
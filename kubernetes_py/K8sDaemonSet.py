@@ -36,9 +36,9 @@ class K8sDaemonSet(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sDaemonSet, self).list(labels=labels)
-        daemons = list(map(lambda x: DaemonSet(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sDaemonSet, self).list(labels=labels, fields=fields)
+        daemons = list(map(lambda x: self._as_model(DaemonSet, x), ls))
         if pattern is not None:
             daemons = list(filter(lambda x: pattern in x.name, daemons))
         k8s = []
@@ -47,10 +47,16 @@ class K8sDaemonSet(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sDaemonSet, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(DaemonSet, item)
+            if pattern is None or pattern in x.name:
+                yield K8sDaemonSet(config=self.config, name=x.name).from_model(m=x)
+
     # -------------------------------------------------------------------------------------  get
 
     def get(self):
-        self.model = DaemonSet(self.get_model())
+        self.model = self._as_model(DaemonSet, self.get_model(), lazy=False)
         return self
 
     # -------------------------------------------------------------------------------------  add
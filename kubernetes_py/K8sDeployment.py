@@ -11,16 +11,19 @@ import time
 from kubernetes_py.K8sConfig import K8sConfig
 from kubernetes_py.K8sContainer import K8sContainer
 from kubernetes_py.K8sExceptions import BadRequestException
-from kubernetes_py.K8sExceptions import TimedOutException, NotFoundException
+from kubernetes_py.K8sExceptions import NotFoundException
+from kubernetes_py.K8sInformer import K8sInformer
 from kubernetes_py.K8sObject import K8sObject
 from kubernetes_py.K8sVolume import K8sVolume
 from kubernetes_py.K8sPod import K8sPod
 from kubernetes_py.K8sReplicaSet import K8sReplicaSet
 from kubernetes_py.models.v1beta1.Deployment import Deployment
+from kubernetes_py.models.v1beta1.ReplicaSet import ReplicaSet
 from kubernetes_py.models.v1beta1.DeploymentRollback import DeploymentRollback
 from kubernetes_py.models.v1beta1.RollbackConfig import RollbackConfig
 from kubernetes_py.models.v1beta1.LabelSelector import LabelSelector
 from kubernetes_py.utils import is_valid_list
+from kubernetes_py.utils.Selectors import Selector
 
 
 class K8sDeployment(K8sObject):
@@ -65,9 +68,9 @@ class K8sDeployment(K8sObject):
             self._wait_for_desired_replicas()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sDeployment, self).list(labels=labels)
-        deploys = list(map(lambda d: Deployment(d), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sDeployment, self).list(labels=labels, fields=fields)
+        deploys = list(map(lambda d: self._as_model(Deployment, d), ls))
         if pattern is not None:
             deploys = list(filter(lambda dep: pattern in dep.name, deploys))
         k8s = list()
@@ -76,10 +79,27 @@ class K8sDeployment(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sDeployment, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Deployment, item)
+            if pattern is None or pattern in x.name:
+                yield K8sDeployment(config=self.config, name=x.name).from_model(m=x)
+
     def delete(self, cascade=False):
         # delete cascade on top level
         super(K8sDeployment, self).delete(cascade)
         if cascade:
+            informer = K8sInformer.lookup(config=self.config, obj_type="ReplicaSet", namespace=self.config.namespace)
+            if informer is not None and self.uid is not None:
+                # the replicasets owned by this deployment, each deleting the pods it owns.
+                for x in [self._as_model(ReplicaSet, x) for x in informer.by_index("owner", self.uid)]:
+                    rset = K8sReplicaSet(config=self.config, name=x.name).from_model(m=x)
+                    try:
+                        rset.delete(cascade=cascade)
+                    except NotFoundException:
+                        pass
+                return self
+
             rsets = K8sReplicaSet(config=self.config, name="yo").list(pattern=self.name)
             # delete cascade on replicasets
             for rset in rsets:
@@ -99,11 +119,8 @@ class K8sDeployment(K8sObject):
     # -------------------------------------------------------------------------------------  wait
 
     def _wait_for_desired_replicas(self):
-        start_time = time.time()
-        while not self._has_desired_replicas():
-            time.sleep(0.5)
-            self.get()
-            self._check_timeout(start_time)
+        message = "Timed out scaling Deployment: [ {} ] to replica count: [ {} ]".format(self.name, self.desired_replicas)
+        self._wait_for(self._has_desired_replicas, timeout=self.SCALE_WAIT_TIMEOUT_SECONDS, message=message)
 
     def _has_desired_replicas(self):
         if (
@@ -114,13 +131,6 @@ class K8sDeployment(K8sObject):
             return True
         return False
 
-    def _check_timeout(self, start_time=None):
-        elapsed_time = time.time() - start_time
-        if elapsed_time >= self.SCALE_WAIT_TIMEOUT_SECONDS:  # timeout
-            raise TimedOutException(
-                "Timed out scaling Deployment: [ {} ] to replica count: [ {} ]".format(self.name, self.desired_replicas)
-            )
-
     # -------------------------------------------------------------------------------------  add
 
     def add_container(self, container=None):
@@ -148,7 +158,7 @@ class K8sDeployment(K8sObject):
     # -------------------------------------------------------------------------------------  get
 
     def get(self):
-        self.model = Deployment(self.get_model())
+        self.model = self._as_model(Deployment, self.get_model(), lazy=False)
         return self
 
     # ------------------------------------------------------------------------------------- namespace
@@ -319,6 +329,12 @@ class K8sDeployment(K8sObject):
         if not is_valid_list(v, K8sVolume):
             self.model.spec.template.spec.volumes = v
 
+    # -------------------------------------------------------------------------------------  get pods
+
+    def get_pods(self):
+        pods = K8sPod.get_by_labels(config=self.config, labels=Selector.from_model(self.selector))
+        return pods
+
     # -------------------------------------------------------------------------------------  get by name
 
     @staticmethod
@@ -21,9 +21,9 @@ class K8sEvent(K8sObject):
     def update(self):
         raise NotImplementedError("K8sEvent: cannot update events this way.")
 
-    def list(self, pattern=None, reverse=True):
-        ls = super(K8sEvent, self).list()
-        events = list(map(lambda x: Event(x), ls))
+    def list(self, pattern=None, reverse=True, fields=None):
+        ls = super(K8sEvent, self).list(fields=fields)
+        events = list(map(lambda x: self._as_model(Event, x), ls))
         if pattern is not None:
             events = list(filter(lambda x: pattern in x.name, events))
         k8s = []
@@ -34,12 +34,19 @@ class K8sEvent(K8sObject):
         k8s.sort(key=lambda x: x.last_timestamp, reverse=reverse)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sEvent, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Event, item)
+            if pattern is None or pattern in x.name:
+                j = K8sEvent(config=self.config, name=x.name)
+                j.model = x
+                yield j
+
     # ------------------------------------------------------------------------------------- warnings
 
-    def warnings(self, pattern=None, reverse=True):
-        ls = self.list(pattern, reverse)
-        w = filter(lambda x: x.type == "Warning", ls)
-        return w
+    def warnings(self, pattern=None, reverse=True, fields=None):
+        fields = dict(fields or {}, type="Warning")
+        return self.list(pattern, reverse, fields=fields)
 
     # ------------------------------------------------------------------------------------- type
 
@@ -65,3 +65,8 @@ class CronJobAlreadyRunningException(Exception):
 class CronJobRunException(Exception):
     def __init__(self, *args, **kwargs):
         super(CronJobRunException, self).__init__(*args, **kwargs)
+
+
+class WatchException(Exception):
+    def __init__(self, *args, **kwargs):
+        super(WatchException, self).__init__(*args, **kwargs)
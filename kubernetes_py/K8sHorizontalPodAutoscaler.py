@@ -34,9 +34,9 @@ class K8sHorizontalPodAutoscaler(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sHorizontalPodAutoscaler, self).list(labels=labels)
-        hpas = list(map(lambda x: HorizontalPodAutoscaler(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sHorizontalPodAutoscaler, self).list(labels=labels, fields=fields)
+        hpas = list(map(lambda x: self._as_model(HorizontalPodAutoscaler, x), ls))
         if pattern is not None:
             hpas = list(filter(lambda x: pattern in x.name, hpas))
         k8s = []
@@ -45,10 +45,16 @@ class K8sHorizontalPodAutoscaler(K8sObject):
             k8s.append(z)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sHorizontalPodAutoscaler, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(HorizontalPodAutoscaler, item)
+            if pattern is None or pattern in x.name:
+                yield K8sHorizontalPodAutoscaler(config=self.config, name=x.name).from_model(m=x)
+
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = HorizontalPodAutoscaler(self.get_model())
+        self.model = self._as_model(HorizontalPodAutoscaler, self.get_model(), lazy=False)
         return self
 
     # ------------------------------------------------------------------------------------- cpu_percent
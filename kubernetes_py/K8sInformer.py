@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+import logging
+import threading
+import weakref
+
+from kubernetes_py.K8sConfig import K8sConfig
+from kubernetes_py.K8sObject import K8sObject
+from kubernetes_py.utils.Indexer import Indexer
+from kubernetes_py.utils.Selectors import Selector
+
+
+class K8sInformer(object):
+    """
+    Keeps a local, always up-to-date copy of every object of a type, from one LIST followed by a WATCH.
+
+    The objects are held raw in an Indexer, indexed by namespace, label, node name and owner UID, so that
+    lookups are answered locally in O(matches) rather than by listing from the API server. Informers
+    are shared: K8sInformer.shared() returns the same informer for a given config and object type, and
+    lookups made by K8sPod, K8sNode, K8sReplicationController and K8sDeployment use it once it is synced.
+
+        informer = K8sInformer.shared(config=cfg, obj_type='Pod').start()
+        informer.wait_for_sync()
+        pods = K8sPod.get_by_labels(config=cfg, labels={'app': 'redis'})  # answered from the cache
+    """
+
+    WATCH_TIMEOUT_SECONDS = 300
+    RETRY_SECONDS = 1
+
+    # session -> (obj_type, namespace) -> informer.
+    _registry = weakref.WeakKeyDictionary()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, config=None, obj_type=None, namespace=None, indexers=None):
+        """
+        :param config: A K8sConfig object.
+        :param obj_type: The type of objects to keep, e.g. 'Pod'.
+        :param namespace: The namespace to keep objects of. Objects of all namespaces are kept if None.
+        :param indexers: A dict of index name to index function. Defaults to namespace, label, nodeName and owner.
+        """
+
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError("K8sInformer: config: [ {0} ] must be of type K8sConfig.".format(config))
+        if config is None:
+            config = K8sConfig()
+
+        self.config = config
+        self.obj_type = obj_type
+        self.namespace = namespace
+        self.store = Indexer(indexers=indexers)
+
+        # a copy of the config, so the informer can span all namespaces without touching the caller's.
+        cfg = copy.deepcopy(config)
+        cfg.namespace = namespace
+        self._obj = K8sObject(config=cfg, obj_type=obj_type, name="informer")
+
+        self._handlers = list()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.resource_version = None
+
+    # ------------------------------------------------------------------------------------- registry
+
+    @classmethod
+    def _informers(cls, config=None):
+        # configs copied from one another share their connections, hence their informers. They are keyed on
+        # the session itself, not its id, which a new session may be given once this one is collected.
+        informers = cls._registry.get(config.session, None)
+        if informers is None:
+            informers = cls._registry[config.session] = dict()
+        return informers
+
+    @classmethod
+    def shared(cls, config=None, obj_type=None, namespace=None, indexers=None):
+        """
+        Returns the informer shared by every user of this config for this object type, creating it if needed.
+        """
+
+        if config is None:
+            config = K8sConfig()
+        with cls._registry_lock:
+            informers = cls._informers(config)
+            informer = informers.get((obj_type, namespace), None)
+            if informer is None:
+                informer = cls(config=config, obj_type=obj_type, namespace=namespace, indexers=indexers)
+                informers[(obj_type, namespace)] = informer
+        return informer
+
+    @classmethod
+    def lookup(cls, config=None, obj_type=None, namespace=None):
+        """
+        Returns a running and synced shared informer able to answer for objects of this type
+        in 'namespace' (an informer spanning all namespaces, or one for that namespace), or None.
+        """
+
+        if config is None or not cls._registry:
+            return None
+        informers = cls._registry.get(config.session, None) or dict()
+        for ns in (None, namespace):
+            informer = informers.get((obj_type, ns), None)
+            if informer is not None and informer.is_running and informer.has_synced:
+                return informer
+        return None
+
+    # ------------------------------------------------------------------------------------- lifecycle
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="K8sInformer-{0}".format(self.obj_type))
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops watching. The watch thread exits on the next event, or when its current watch ends.
+        """
+
+        self._stopped.set()
+        self._synced.clear()
+        with self._registry_lock:
+            informers = self._registry.get(self.config.session, None) or dict()
+            if informers.get((self.obj_type, self.namespace), None) is self:
+                informers.pop((self.obj_type, self.namespace))
+        return self
+
+    def wait_for_sync(self, timeout=None):
+        """
+        Blocks until the initial LIST is in the store.
+
+        :return: True if synced, False if timed out.
+        """
+
+        return self._synced.wait(timeout)
+
+    @property
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stopped.is_set()
+
+    @property
+    def has_synced(self):
+        return self._synced.is_set()
+
+    def add_handler(self, handler=None):
+        """
+        Registers a callable receiving each WatchEvent, after it has been applied to the store.
+        """
+
+        if not callable(handler):
+            raise SyntaxError("K8sInformer: handler: [ {0} ] must be callable.".format(handler))
+        self._handlers.append(handler)
+        return self
+
+    # ------------------------------------------------------------------------------------- list & watch
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                if not self._synced.is_set():
+                    self._list()
+                self._watch()
+            except Exception as err:
+                logging.warning("K8sInformer: {0}: {1}".format(self.obj_type, err))
+                self._synced.clear()
+                self._stopped.wait(self.RETRY_SECONDS)
+
+    def _list(self):
+        state = self._obj.request(method="GET")
+        items = self._obj._list_result(state)
+        self.resource_version = state.get("data", dict()).get("metadata", dict()).get("resourceVersion", None)
+        self.store.replace(items)
+        self._synced.set()
+
+    def _watch(self):
+        events = self._obj.watch(
+            resource_version=self.resource_version,
+            timeout=self.WATCH_TIMEOUT_SECONDS,
+            bookmarks=True,
+            known=self.store.list(),
+        )
+        try:
+            for event in events:
+                if self._stopped.is_set():
+                    break
+                self.resource_version = event.resource_version or self.resource_version
+                if event.type == "BOOKMARK":
+                    continue
+                self.store.apply(event.type, event.raw)
+                for handler in self._handlers:
+                    handler(event)
+        finally:
+            events.close()
+
+    # ------------------------------------------------------------------------------------- queries
+
+    def by_index(self, index_name=None, value=None):
+        return self.store.by_index(index_name, value)
+
+    def by_indexes(self, **criteria):
+        return self.store.by_indexes(**criteria)
+
+    def list(self, namespace=None, labels=None):
+        """
+        :param namespace: The namespace of the objects, any if None.
+        :param labels: A dict of labels the objects must all have, or a Selector (or selector string).
+        :return: The raw objects matching.
+        """
+
+        selector = None
+        if labels is not None and not isinstance(labels, dict):
+            selector = Selector.coerce(labels)
+            labels = selector.equalities
+        label = None
+        if labels:
+            label = ["{0}={1}".format(k, v) for k, v in labels.items()]
+        items = self.store.by_indexes(namespace=namespace, label=label)
+        # the equalities were answered by the label index, the other requirements are matched here.
+        if selector is not None and len(selector) > len(labels):
+            items = selector.filter(items)
+        return items
@@ -51,9 +51,9 @@ class K8sJob(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sJob, self).list(labels=labels)
-        jobs = list(map(lambda x: Job(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sJob, self).list(labels=labels, fields=fields)
+        jobs = list(map(lambda x: self._as_model(Job, x), ls))
         if pattern is not None:
             jobs = list(filter(lambda x: pattern in x.name, jobs))
         k8s = []
@@ -62,10 +62,16 @@ class K8sJob(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sJob, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Job, item)
+            if pattern is None or pattern in x.name:
+                yield K8sJob(config=self.config, name=x.name).from_model(m=x)
+
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = Job(self.get_model())
+        self.model = self._as_model(Job, self.get_model(), lazy=False)
         return self
 
     # -------------------------------------------------------------------------------------  add
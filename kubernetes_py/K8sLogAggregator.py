@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import heapq
+import tempfile
+import threading
+import time
+
+from six.moves import queue
+
+from kubernetes_py.K8sConfig import K8sConfig
+from kubernetes_py.K8sExceptions import NotFoundException
+from kubernetes_py.K8sPod import K8sPod
+
+# the size a spooled log grows to in memory before it is moved to a temporary file.
+SPOOL_MAX_SIZE = 64 * 1024
+
+
+class LogLine(object):
+    """
+    A line of the log of a container, tagged with the pod and container it was read from.
+    """
+
+    __slots__ = ("timestamp", "pod", "container", "message")
+
+    def __init__(self, timestamp=None, pod=None, container=None, message=None):
+        self.timestamp = timestamp
+        self.pod = pod
+        self.container = container
+        self.message = message
+
+    def __str__(self):
+        source = self.pod if self.container is None else "{0}/{1}".format(self.pod, self.container)
+        if self.timestamp is None:
+            return "{0} {1}".format(source, self.message)
+        return "{0} {1} {2}".format(self.timestamp, source, self.message)
+
+    def __repr__(self):
+        return "LogLine({0!r}, {1!r}, {2!r}, {3!r})".format(self.timestamp, self.pod, self.container, self.message)
+
+    def __eq__(self, other):
+        return isinstance(other, LogLine) and tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __iter__(self):
+        return iter((self.timestamp, self.pod, self.container, self.message))
+
+
+def _split(line=None):
+    """
+    :return: The (timestamp, message) of a line read with timestamps=True, or (None, line) if it has none.
+    """
+
+    if line[:1].isdigit():
+        i = line.find(" ")
+        if i > 0 and line[i - 1] == "Z":
+            return line[:i], line[i + 1 :]
+        if i < 0 and line[-1:] == "Z":
+            return line, ""
+    return None, line
+
+
+def _sort_key(timestamp=None):
+    # the kubelet trims the trailing zeros of the nanoseconds: they are put back, so the keys sort as strings.
+    if len(timestamp) > 20 and timestamp[19] == ".":
+        return timestamp[:20] + timestamp[20:-1].ljust(9, "0")
+    return timestamp[:19] + ".000000000"
+
+
+class K8sLogAggregator(object):
+    """
+    Reads the logs of many pods at once and merges their lines in timestamp order, each tagged with the pod
+    and container it comes from.
+
+    The logs are read by at most 'max_workers' threads at a time, each spooling the lines of one container
+    to a temporary file, and the spooled logs are then merged with a heap: memory holds one line per
+    container, however long the logs. Following the logs keeps one connection per container open instead,
+    and lines are held back 'reorder_seconds' at most to be put in order with those of the other containers.
+
+        aggregator = K8sLogAggregator.from_owner(K8sDeployment.get_by_name(config=cfg, name='redis')[0])
+        aggregator.write(sys.stdout, since_seconds=600)
+    """
+
+    def __init__(self, pods=None, container=None, max_workers=10):
+        """
+        :param pods: The K8sPod objects whose logs are read.
+        :param container: The container whose log is read in each pod. Every container of the pod if None.
+        :param max_workers: The number of logs read at the same time, at most. The connections beyond the
+            pool_maxsize of the config are closed after use.
+        """
+
+        if not isinstance(pods, (list, tuple)) or not all(isinstance(x, K8sPod) for x in pods):
+            raise SyntaxError("K8sLogAggregator: pods: [ {0} ] is invalid.".format(pods))
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+            raise SyntaxError("K8sLogAggregator: max_workers: [ {0} ] is invalid.".format(max_workers))
+
+        self.pods = list(pods)
+        self.container = container
+        self.max_workers = max_workers
+        self.errors = list()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------------------------- sources
+
+    @classmethod
+    def from_labels(cls, config=None, labels=None, **kwargs):
+        """
+        The aggregator of the pods matching 'labels', a dict or a Selector, as K8sPod.get_by_labels() finds them.
+        """
+
+        if config is None:
+            config = K8sConfig()
+        return cls(pods=K8sPod.get_by_labels(config=config, labels=labels), **kwargs)
+
+    @classmethod
+    def from_owner(cls, owner=None, **kwargs):
+        """
+        The aggregator of the pods of a K8sDeployment or a K8sReplicationController.
+        """
+
+        if not hasattr(owner, "get_pods"):
+            raise SyntaxError("K8sLogAggregator: owner: [ {0} ] is invalid.".format(owner))
+        return cls(pods=owner.get_pods(), **kwargs)
+
+    # ------------------------------------------------------------------------------------- streams
+
+    def streams(self):
+        """
+        :return: The list of (pod, container) whose logs are read.
+        """
+
+        streams = list()
+        for pod in self.pods:
+            names = [self.container]
+            if self.container is None and pod.model.spec is not None and pod.model.spec.containers:
+                names = [x.name for x in pod.model.spec.containers]
+            streams.extend((pod, name) for name in names)
+        return streams
+
+    def _failed(self, pod=None, container=None, err=None):
+        with self._lock:
+            self.errors.append((pod.name, container, err))
+
+    def _read(self, pod=None, container=None, params=None, stopped=None, opened=None):
+        """
+        :param stopped: An Event set once the lines are no longer wanted.
+        :param opened: The list the open log streams are added to, so that they can be closed from another thread.
+        :return: A generator of the (timestamp, message) of the lines of a container.
+        """
+
+        try:
+            lines = pod.stream_log(container=container, timestamps=True, **params)
+        except (NotFoundException, IOError) as err:
+            self._failed(pod, container, err)
+            return
+        if opened is not None:
+            with self._lock:
+                opened.append(lines)
+        try:
+            if stopped is not None and stopped.is_set():
+                return
+            for line in lines:
+                yield _split(line)
+                if stopped is not None and stopped.is_set():
+                    break
+        except Exception as err:
+            if stopped is not None and stopped.is_set():
+                # the stream was shut down, as its lines are no longer wanted.
+                return
+            if not isinstance(err, IOError):
+                raise
+            # the lines read so far are kept.
+            self._failed(pod, container, err)
+        finally:
+            if hasattr(lines, "close"):
+                lines.close()
+
+    # ------------------------------------------------------------------------------------- lines
+
+    def lines(
+        self,
+        follow=False,
+        tail_lines=None,
+        since_seconds=None,
+        since_time=None,
+        limit_bytes=None,
+        previous=False,
+        timeout=None,
+        reorder_seconds=1.0,
+    ):
+        """
+        Reads the logs and merges their lines in timestamp order. The logs that could not be read are
+        skipped, and listed in 'errors' as (pod name, container, exception).
+
+        :param follow: Whether to keep reading the lines written from now on. Needs one worker per container.
+        :param reorder_seconds: How long, when following, a line is held back to be put in order.
+        :return: A generator of LogLine.
+
+        The other parameters are those of K8sPod.stream_log(), applied to each container.
+        """
+
+        params = dict(
+            tail_lines=tail_lines,
+            since_seconds=since_seconds,
+            since_time=since_time,
+            limit_bytes=limit_bytes,
+            previous=previous,
+            timeout=timeout,
+        )
+        streams = self.streams()
+        if streams:
+            # the parameters are checked once, before any request is sent.
+            log_params = dict((k, v) for k, v in params.items() if k != "timeout")
+            streams[0][0]._log_params(follow=follow, **log_params)
+        if not isinstance(reorder_seconds, (int, float)) or reorder_seconds < 0:
+            raise SyntaxError("K8sLogAggregator: reorder_seconds: [ {0} ] is invalid.".format(reorder_seconds))
+
+        self.errors = list()
+        if follow:
+            if len(streams) > self.max_workers:
+                raise SyntaxError(
+                    "K8sLogAggregator: following [ {0} ] logs needs as many workers, max_workers is: [ {1} ]".format(
+                        len(streams), self.max_workers
+                    )
+                )
+            return self._follow(streams, params, reorder_seconds)
+        return self._merge(streams, params)
+
+    def write(self, out=None, **kwargs):
+        """
+        Writes the merged lines, one at a time, to 'out': a callable receiving each LogLine, or a file
+        receiving each line as text.
+
+        :param kwargs: The parameters of lines().
+        :return: The number of lines written.
+        """
+
+        if callable(out):
+            emit = out
+        elif hasattr(out, "write"):
+            flush = getattr(out, "flush", None) if kwargs.get("follow", False) else None
+
+            def emit(line):
+                out.write("{0}\n".format(line))
+                if flush is not None:
+                    flush()
+
+        else:
+            raise SyntaxError("K8sLogAggregator.write(): out: [ {0} ] is invalid.".format(out))
+
+        count = 0
+        lines = self.lines(**kwargs)
+        try:
+            for line in lines:
+                emit(line)
+                count += 1
+        finally:
+            lines.close()
+        return count
+
+    # ------------------------------------------------------------------------------------- merge
+
+    def _spool(self, pod=None, container=None, params=None):
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode="w+b")
+        for timestamp, message in self._read(pod, container, params):
+            spool.write(u"{0} {1}\n".format(timestamp or "-", message).encode("utf-8"))
+        spool.seek(0)
+        return spool
+
+    def _spooled(self, spool=None, index=None, pod=None, container=None):
+        key = ""
+        try:
+            for raw in spool:
+                timestamp, message = raw.decode("utf-8")[:-1].split(" ", 1)
+                if timestamp == "-":
+                    # a line without a timestamp stays with the line before it.
+                    timestamp = None
+                else:
+                    key = _sort_key(timestamp)
+                yield key, index, LogLine(timestamp, pod.name, container, message)
+        finally:
+            spool.close()
+
+    def _merge(self, streams=None, params=None):
+        spools = [None] * len(streams)
+        jobs = queue.Queue()
+        for i in range(len(streams)):
+            jobs.put(i)
+
+        def work():
+            while True:
+                try:
+                    i = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                spools[i] = self._spool(streams[i][0], streams[i][1], params)
+
+        workers = list()
+        for _ in range(min(self.max_workers, len(streams))):
+            workers.append(threading.Thread(target=work, name="K8sLogAggregator"))
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        merged = heapq.merge(*[self._spooled(spools[i], i, *streams[i]) for i in range(len(streams)) if spools[i]])
+        try:
+            for _, _, line in merged:
+                yield line
+        finally:
+            for spool in spools:
+                if spool is not None:
+                    spool.close()
+
+    # ------------------------------------------------------------------------------------- follow
+
+    def _follow(self, streams=None, params=None, reorder_seconds=None):
+        arrived = queue.Queue()
+        stopped = threading.Event()
+        opened = list()
+        params = dict(params, follow=True)
+
+        def work(i, pod, container):
+            key = ""
+            try:
+                for timestamp, message in self._read(pod, container, params, stopped, opened):
+                    if timestamp is not None:
+                        key = _sort_key(timestamp)
+                    arrived.put((key, i, LogLine(timestamp, pod.name, container, message)))
+            finally:
+                arrived.put(None)
+
+        for i, (pod, container) in enumerate(streams):
+            worker = threading.Thread(target=work, args=(i, pod, container), name="K8sLogAggregator")
+            worker.daemon = True
+            worker.start()
+
+        heap = list()
+        running = len(streams)
+        seq = 0
+        try:
+            while running or heap:
+                # the oldest line is let out once it has waited reorder_seconds, or once every stream has ended.
+                while heap and (not running or heap[0][3] + reorder_seconds <= time.time()):
+                    yield heapq.heappop(heap)[4]
+                if not running:
+                    break
+                wait = heap[0][3] + reorder_seconds - time.time() if heap else None
+                try:
+                    item = arrived.get(timeout=wait) if wait is None or wait > 0 else arrived.get_nowait()
+                except queue.Empty:
+                    continue
+                if item is None:
+                    running -= 1
+                    continue
+                key, i, line = item
+                seq += 1
+                heapq.heappush(heap, (key, i, seq, time.time(), line))
+        finally:
+            # the workers stop at their next line, and those waiting on a quiet log once its stream is shut down.
+            with self._lock:
+                stopped.set()
+                streams = list(opened)
+            for lines in streams:
+                if hasattr(lines, "close"):
+                    lines.close()
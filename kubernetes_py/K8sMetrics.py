@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+
+from kubernetes_py.K8sConfig import K8sConfig
+from kubernetes_py.K8sExceptions import BadRequestException, NotFoundException, UnauthorizedException
+from kubernetes_py.K8sInformer import K8sInformer
+from kubernetes_py.K8sObject import K8sObject
+from kubernetes_py.models.unversioned.BaseUrls import BaseUrls
+from kubernetes_py.utils import HttpRequest
+from kubernetes_py.utils.Quantity import parse_quantity
+
+# the ways pod usage is summed up.
+GROUPS = ["pod", "namespace", "node", "deployment", "replicaset", "replicationcontroller"]
+
+
+def _usage(containers=None):
+    """
+    :return: The (nanocores, bytes) used by a list of containers, or by a node.
+    """
+
+    cpu = memory = 0
+    for container in containers:
+        usage = container.get("usage", None) or dict()
+        cpu += parse_quantity(usage.get("cpu", 0), -9)
+        memory += parse_quantity(usage.get("memory", 0), 0)
+    return cpu, memory
+
+
+def _total(cpu=None, memory=None, pods=None):
+    # the nanocores are summed first, then rounded up to millicores once.
+    total = {"cpu": -(-cpu // 1000000), "memory": memory}
+    if pods is not None:
+        total["pods"] = pods
+    return total
+
+
+def _controller(obj=None, kind=None):
+    for owner in obj.get("metadata", {}).get("ownerReferences", None) or []:
+        if owner.get("controller", False) and owner.get("kind", None) == kind:
+            return owner.get("name", None)
+    return None
+
+
+class K8sMetrics(object):
+    """
+    The cpu and memory used by pods and nodes, as the metrics API (metrics-server) reports them.
+
+    The metrics of all the pods of a namespace, or of the cluster, are listed in one request, rather than
+    one per pod as K8sPod.get_metrics() does, and summed up per namespace, node, or controller. Cpu is
+    given in millicores and memory in bytes.
+
+        metrics = K8sMetrics(config=cfg)
+        metrics.usage_by(group='deployment', all_namespaces=True)
+        # {('default', 'redis'): {'cpu': 250, 'memory': 268435456, 'pods': 3}, ...}
+    """
+
+    def __init__(self, config=None):
+        """
+        :param config: A K8sConfig object. Its namespace is the one listed, unless all namespaces are asked for.
+        """
+
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError("K8sMetrics: config: [ {0} ] must be of type K8sConfig.".format(config))
+        if config is None:
+            config = K8sConfig()
+        self.config = config
+
+    # ------------------------------------------------------------------------------------- list
+
+    def _namespace(self, all_namespaces=False):
+        return None if all_namespaces else self.config.namespace
+
+    def _list(self, obj_type=None, labels=None, all_namespaces=False):
+        namespace = self._namespace(all_namespaces)
+        informer = K8sInformer.lookup(config=self.config, obj_type=obj_type, namespace=namespace)
+        if informer is not None:
+            return informer.list(namespace=namespace, labels=labels)
+        config = self.config
+        if namespace != config.namespace:
+            config = copy.deepcopy(config)
+            config.namespace = namespace
+        return K8sObject(config=config, obj_type=obj_type, name="metrics").list(labels=labels)
+
+    def _metrics(self, object_type=None, labels=None, namespace=None):
+        """
+        :param object_type: 'PodMetrics' or 'NodeMetrics'.
+        :return: The raw metrics listed, in one request.
+        """
+
+        config = self.config
+        url = BaseUrls.url(object_type=object_type, namespace=namespace, api=config.version)
+        try:
+            r = HttpRequest(
+                method="GET",
+                host=config.api_host,
+                url=url,
+                auth=config.auth,
+                cert=config.cert,
+                cert_data=config.cert_data,
+                ca_cert=config.ca_cert,
+                ca_cert_data=config.ca_cert_data,
+                data=K8sObject._selector_params(labels=labels),
+                token=config.token,
+                session=config.session,
+                rate_limiter=config.rate_limiter,
+                retry_policy=config.retry_policy,
+            )
+            state = r.send()
+        except IOError as err:
+            raise BadRequestException("K8sMetrics: IOError: {0}".format(err))
+        return self._metrics_result(object_type, state)
+
+    @staticmethod
+    def _metrics_result(object_type=None, state=None):
+        if not state.get("status"):
+            raise Exception("K8sMetrics: Could not fetch list of objects of type: [ {0} ]".format(object_type))
+        if not state.get("success"):
+            status = state.get("status", "")
+            state_data = state.get("data", dict())
+            reason = state_data.get("message", state_data) if isinstance(state_data, dict) else state_data
+            message = "K8sMetrics: LIST {0} failed : HTTP {1} : {2}".format(object_type, status, reason)
+            if int(status) == 401:
+                raise UnauthorizedException(message)
+            if int(status) == 404:
+                # the metrics API is served by metrics-server, which may not be installed.
+                raise NotFoundException(message)
+            raise BadRequestException(message)
+        items = state.get("data", dict()).get("items", list())
+        return items if items is not None else list()
+
+    def pod_metrics(self, labels=None, all_namespaces=False):
+        """
+        :param labels: A dict of labels the pods must all have, or a Selector (or selector string).
+        :param all_namespaces: Whether the pods of all namespaces are listed, rather than those of the config's.
+        :return: The raw PodMetrics.
+        """
+
+        return self._metrics(object_type="PodMetrics", labels=labels, namespace=self._namespace(all_namespaces))
+
+    def node_metrics(self, labels=None):
+        """
+        :param labels: A dict of labels the nodes must all have, or a Selector (or selector string).
+        :return: The raw NodeMetrics.
+        """
+
+        return self._metrics(object_type="NodeMetrics", labels=labels)
+
+    # ------------------------------------------------------------------------------------- usage
+
+    def node_usage(self, labels=None):
+        """
+        :return: A dict of node name to the {'cpu', 'memory'} it uses, as its kubelet reports it.
+        """
+
+        usage = dict()
+        for item in self.node_metrics(labels=labels):
+            usage[item["metadata"]["name"]] = _total(*_usage([item]))
+        return usage
+
+    def pod_usage(self, labels=None, all_namespaces=False):
+        """
+        :return: A dict of (namespace, pod name) to the {'cpu', 'memory'} used by its containers.
+        """
+
+        return self.usage_by(group="pod", labels=labels, all_namespaces=all_namespaces)
+
+    def usage_by(self, group=None, labels=None, all_namespaces=False):
+        """
+        Sums up the usage of pods. The metrics are listed in one request, and the pods, and the replicasets
+        for 'deployment', in one more each, unless a synced K8sInformer holds them.
+
+        :param group: One of GROUPS: 'namespace', 'node', 'deployment', 'replicaset', 'replicationcontroller' or 'pod'.
+        :param labels: A dict of labels the pods must all have, or a Selector (or selector string).
+        :param all_namespaces: Whether the pods of all namespaces are summed up, rather than those of the config's.
+        :return: A dict of the namespace, the node name, or the (namespace, name) of the pod or controller, to
+            the {'cpu', 'memory', 'pods'} used. Pods with no such controller, or node, are left out.
+        """
+
+        if group not in GROUPS:
+            raise SyntaxError("K8sMetrics: group: [ {0} ] must be in: [ {1} ]".format(group, ", ".join(GROUPS)))
+
+        keys = None
+        if group not in ("pod", "namespace"):
+            keys = self._pod_keys(group=group, labels=labels, all_namespaces=all_namespaces)
+
+        sums = dict()
+        for item in self.pod_metrics(labels=labels, all_namespaces=all_namespaces):
+            metadata = item["metadata"]
+            pod = (metadata.get("namespace", None), metadata["name"])
+            if group == "pod":
+                key = pod
+            elif group == "namespace":
+                key = pod[0]
+            else:
+                key = keys.get(pod, None)
+                if key is None:
+                    continue
+            cpu, memory = _usage(item.get("containers", None) or [])
+            total = sums.get(key, None)
+            if total is None:
+                sums[key] = [cpu, memory, 1]
+            else:
+                total[0] += cpu
+                total[1] += memory
+                total[2] += 1
+
+        if group == "pod":
+            return dict((k, _total(v[0], v[1])) for k, v in sums.items())
+        return dict((k, _total(*v)) for k, v in sums.items())
+
+    def _pod_keys(self, group=None, labels=None, all_namespaces=False):
+        """
+        :return: A dict of (namespace, pod name) to the key its usage is summed up under.
+        """
+
+        deployments = dict()
+        if group == "deployment":
+            for rs in self._list(obj_type="ReplicaSet", all_namespaces=all_namespaces):
+                metadata = rs["metadata"]
+                name = _controller(rs, "Deployment")
+                if name is not None:
+                    deployments[(metadata.get("namespace", None), metadata["name"])] = name
+
+        keys = dict()
+        for pod in self._list(obj_type="Pod", labels=labels, all_namespaces=all_namespaces):
+            metadata = pod["metadata"]
+            namespace = metadata.get("namespace", None)
+            if group == "node":
+                key = (pod.get("spec", None) or dict()).get("nodeName", None)
+            elif group == "replicationcontroller":
+                key = _controller(pod, "ReplicationController")
+            else:
+                key = _controller(pod, "ReplicaSet")
+                if group == "deployment" and key is not None:
+                    key = deployments.get((namespace, key), None)
+            if key is not None:
+                keys[(namespace, metadata["name"])] = key if group == "node" else (namespace, key)
+        return keys
@@ -26,9 +26,9 @@ class K8sNamespace(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sNamespace, self).list(labels=labels)
-        names = list(map(lambda x: Namespace(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sNamespace, self).list(labels=labels, fields=fields)
+        names = list(map(lambda x: self._as_model(Namespace, x), ls))
         if pattern is not None:
             names = list(filter(lambda x: pattern in x.name, names))
         k8s = []
@@ -37,10 +37,16 @@ class K8sNamespace(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sNamespace, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Namespace, item)
+            if pattern is None or pattern in x.name:
+                yield K8sNamespace(config=self.config, name=x.name).from_model(m=x)
+
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = Namespace(self.get_model())
+        self.model = self._as_model(Namespace, self.get_model(), lazy=False)
         return self
 
     def get_annotation(self, k=None):
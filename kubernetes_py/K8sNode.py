@@ -6,15 +6,17 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+import copy
 import json
 import time
 
 from kubernetes_py.K8sExceptions import DrainNodeException, TimedOutException, NotFoundException
-from kubernetes_py.K8sNamespace import K8sNamespace
+from kubernetes_py.K8sInformer import K8sInformer
 from kubernetes_py.K8sObject import K8sObject
 from kubernetes_py.K8sPod import K8sPod
 from kubernetes_py.K8sConfig import K8sConfig
 from kubernetes_py.models.v1.Node import Node
+from kubernetes_py.models.v1.Pod import Pod
 from kubernetes_py.models.v1.NodeCondition import NodeCondition
 from kubernetes_py.utils import is_valid_string, is_valid_list
 from kubernetes_py.models.v1.Taint import Taint
@@ -39,9 +41,9 @@ class K8sNode(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sNode, self).list(labels=labels)
-        nodes = list(map(lambda x: Node(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sNode, self).list(labels=labels, fields=fields)
+        nodes = list(map(lambda x: self._as_model(Node, x), ls))
         if pattern is not None:
             nodes = list(filter(lambda x: pattern in x.name, nodes))
         k8s = []
@@ -50,10 +52,16 @@ class K8sNode(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sNode, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Node, item)
+            if pattern is None or pattern in x.name:
+                yield K8sNode(config=self.config, name=x.name).from_model(m=x)
+
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = Node(self.get_model())
+        self.model = self._as_model(Node, self.get_model(), lazy=False)
         return self
 
     def get_annotation(self, k=None):
@@ -234,14 +242,29 @@ class K8sNode(K8sObject):
         :return: A list of K8sPods.
         """
 
+        informer = K8sInformer.lookup(config=self.config, obj_type="Pod")
+        if informer is not None:
+            return self._as_pods(informer.by_index("nodeName", self.name))
+
+        # a single cluster-wide list, filtered by the server.
+        cfg = copy.deepcopy(self.config)
+        cfg.namespace = None
+        items = K8sObject(config=cfg, obj_type="Pod", name="yo").list(fields={"spec.nodeName": self.name})
+        return self._as_pods(items)
+
+    def _as_pods(self, items=None):
+        """
+        Builds K8sPods from raw pods of any namespace, each with a config for its namespace.
+        """
+
+        configs = dict()
         pods = []
-        namespaces = K8sNamespace(config=self.config, name="yo").list()
-        for ns in namespaces:
-            cfg = self.config
-            cfg.namespace = ns.name
-            p = K8sPod(config=cfg, name="yo").list()
-            filtered = filter(lambda x: x.node_name == self.name, p)
-            pods += filtered
+        for x in map(lambda item: self._as_model(Pod, item), items):
+            ns = x.metadata.namespace
+            if ns not in configs:
+                configs[ns] = copy.deepcopy(self.config)
+                configs[ns].namespace = ns
+            pods.append(K8sPod(config=configs[ns], name=x.name).from_model(m=x))
         return pods
 
     def _is_daemonset(self, pod=None):
@@ -7,6 +7,7 @@
 #
 
 import json
+import logging
 import time
 from dateutil import parser
 
@@ -15,8 +16,10 @@ import yaml
 from kubernetes_py.K8sConfig import K8sConfig
 from kubernetes_py.K8sExceptions import *
 from kubernetes_py.models.unversioned.BaseUrls import BaseUrls
+from kubernetes_py.models.unversioned.WatchEvent import WatchEvent
 from kubernetes_py.models.v1.DeleteOptions import DeleteOptions
-from kubernetes_py.utils import HttpRequest, is_valid_dict, str_to_class
+from kubernetes_py.utils import HttpRequest, build_trusted, is_valid_dict, str_to_class
+from kubernetes_py.utils.Selectors import Selector
 
 VALID_K8s_OBJS = [
     "ComponentStatus",
@@ -48,6 +51,12 @@ VALID_K8s_OBJS = [
 class K8sObject(object):
 
     DELETE_TIMEOUT_SECONDS = 60
+    WATCH_CONNECT_TIMEOUT_SECONDS = 10
+    WATCH_MAX_RETRIES = 5
+    WATCH_IDLE_SECONDS = 0.2
+    WAIT_POLL_MIN_SECONDS = 0.1
+    WAIT_POLL_MAX_SECONDS = 2
+    LIST_PAGE_SIZE = 500
 
     def __init__(self, config=None, obj_type=None, name=None):
         super(K8sObject, self).__init__()
@@ -67,8 +76,7 @@ class K8sObject(object):
         self.name = name
 
         try:
-            urls = BaseUrls(api=self.config.version, namespace=self.config.namespace)
-            self.base_url = urls.get_base_url(object_type=obj_type)
+            self.base_url = BaseUrls.url(object_type=obj_type, namespace=self.config.namespace, api=self.config.version)
         except Exception as err:
             raise Exception("Could not set BaseUrl for type: [ {0} ]".format(obj_type))
 
@@ -234,6 +242,9 @@ class K8sObject(object):
         token=None,
         ca_cert=None,
         ca_cert_data=None,
+        stream=False,
+        text=False,
+        timeout=None,
     ):
 
         host = self.config.api_host if host is None else host
@@ -245,68 +256,69 @@ class K8sObject(object):
         ca_cert = self.config.ca_cert if ca_cert is None else ca_cert
         ca_cert_data = self.config.ca_cert_data if ca_cert_data is None else ca_cert_data
 
-        r = HttpRequest(
-            method=method,
-            host=host,
-            url=url,
-            auth=auth,
-            cert=cert,
-            cert_data=cert_data,
-            ca_cert=ca_cert,
-            ca_cert_data=ca_cert_data,
-            data=data,
-            token=token,
-        )
-
         try:
+            r = HttpRequest(
+                method=method,
+                host=host,
+                url=url,
+                auth=auth,
+                cert=cert,
+                cert_data=cert_data,
+                ca_cert=ca_cert,
+                ca_cert_data=ca_cert_data,
+                data=data,
+                token=token,
+                session=self.config.session,
+                stream=stream,
+                text=text,
+                timeout=timeout,
+                rate_limiter=self.config.rate_limiter,
+                retry_policy=self.config.retry_policy,
+            )
             return r.send()
         except IOError as err:
             raise BadRequestException("K8sObject: IOError: {0}".format(err))
 
-    def list(self, labels=None):
-        if labels is not None and isinstance(labels, dict):
-            filter_list = list()
-            for k, v in labels.items():
-                filter_list.append("{0}={1}".format(k, v))
-            if len(filter_list) > 1:
-                data = {"labelSelector": ",".join(filter_list)}
-            else:
-                data = {"labelSelector": filter_list[0]}
+    def list(self, labels=None, fields=None):
+        """
+        :param labels: A dict of labels the objects must all have, or a Selector (or selector string).
+        :param fields: A dict of fields the objects must all have, e.g. {'spec.nodeName': 'node-1'}.
+        :return: The raw objects.
+        """
+
+        state = self.request(method="GET", data=self._selector_params(labels=labels, fields=fields))
+        return self._list_result(state)
+
+    def list_iter(self, labels=None, fields=None, limit=None):
+        """
+        Lists the objects one page at a time, following the 'continue' token the server returns with each page,
+        so that only one page of objects is held in memory at once.
+
+        :param labels: A dict of labels the objects must all have, or a Selector (or selector string).
+        :param fields: A dict of fields the objects must all have.
+        :param limit: The number of objects per page. Defaults to LIST_PAGE_SIZE.
+        :return: A generator of the raw objects.
+        """
+
+        if limit is None:
+            limit = self.LIST_PAGE_SIZE
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise SyntaxError("K8sObject.list_iter(): limit: [ {0} ] is invalid.".format(limit))
+
+        data = self._selector_params(labels=labels, fields=fields) or dict()
+        data["limit"] = limit
+        while True:
             state = self.request(method="GET", data=data)
-        else:
-            state = self.request(method="GET")
-        if not state.get("status"):
-            raise Exception("K8sObject: Could not fetch list of objects of type: [ {0} ]".format(self.obj_type))
-        if not state.get("success"):
-            status = state.get("status", "")
-            state_data = state.get("data", dict())
-            reason = state_data["message"] if "message" in state_data else state_data
-            message = "K8sObject: LIST failed : HTTP {0} : {1}".format(status, reason)
-            if int(status) == 401:
-                raise UnauthorizedException(message)
-            if int(status) == 409:
-                raise AlreadyExistsException(message)
-            if int(status) == 422:
-                raise UnprocessableEntityException(message)
-            raise BadRequestException(message)
-        items = state.get("data", dict()).get("items", list())
-        return items if items is not None else list()
+            for item in self._list_result(state):
+                yield item
+            token = (state.get("data", None) or dict()).get("metadata", dict()).get("continue", None)
+            if not token:
+                return
+            data["continue"] = token
 
     def get_model(self):
-        if self.name is None:
-            raise SyntaxError("K8sObject: name: [ {0} ] must be set to fetch the object.".format(self.name))
-
-        url = "{base}/{name}".format(base=self.base_url, name=self.name)
-        state = self.request(method="GET", url=url)
-
-        if not state.get("success"):
-            status = state.get("status", "")
-            reason = state.get("data", dict()).get("message", None)
-            message = "K8sObject: GET [ {0}:{1} ] failed: HTTP {2} : {3} ".format(self.obj_type, self.name, status, reason)
-            raise NotFoundException(message)
-
-        model = state.get("data")
-        return model
+        state = self.request(method="GET", url=self._object_url("fetch"))
+        return self._get_result(state)
 
     def get_with_params(self, data=None):
         if not is_valid_dict(data):
@@ -319,32 +331,39 @@ class K8sObject(object):
         return items
 
     def get_exportable(self):
-        if self.name is None:
-            raise SyntaxError("K8sObject: name: [ {0} ] must be set to fetch the object.".format(self.name))
-
-        url = "{base}/{name}?export=true".format(base=self.base_url, name=self.name)
+        url = "{0}?export=true".format(self._object_url("fetch"))
         state = self.request(method="GET", url=url)
+        return self._get_result(state)
 
-        if not state.get("success"):
-            status = state.get("status", "")
-            reason = state.get("data", dict()).get("message", None)
-            message = "K8sObject: GET [ {0}:{1} ] failed: HTTP {2} : {3} ".format(self.obj_type, self.name, status, reason)
-            raise NotFoundException(message)
+    def _as_model(self, model_class=None, item=None, lazy=True):
+        """
+        Builds the model of an object sent by the API server. Its values are trusted rather than validated.
 
-        data = state.get("data")
-        return data
+        :param model_class: The model class of the object.
+        :param item: The object, as returned by the API server.
+        :param lazy: Whether the model may be built lazily, if the config asks for it.
+        :return: The model of 'item'.
+        """
+
+        if lazy and self.config.lazy_models:
+            return model_class.lazy(item, trusted=True)
+        return build_trusted(model_class, item)
+
+    @property
+    def _model_class(self):
+        # the class of self.model, rather than the one of its lazy flavour.
+        return getattr(self.model, "_model_class", None) or type(self.model)
 
     def from_model(self, m=None):
         if m is not None:
-            if isinstance(m, type(self.model)):
+            if isinstance(m, self._model_class):
                 self.model = m
             else:
-                raise SyntaxError("Wrong data structure. We need an object of type [ {} ].".format(type(self.model)))
+                raise SyntaxError("Wrong data structure. We need an object of type [ {} ].".format(self._model_class))
         return self
 
     def create(self):
-        if self.name is None:
-            raise SyntaxError("K8sObject: name: [ {0} ] must be set to CREATE the object.".format(self.name))
+        self._check_name("CREATE")
 
         # HTTP 500 : resourceVersion may not be set on objects to be created
         if self.model.metadata.resource_version is not None:
@@ -353,78 +372,360 @@ class K8sObject(object):
         url = "{base}".format(base=self.base_url)
         post_data = self.serialize()
         state = self.request(method="POST", url=url, data=post_data)
+        self._create_result(state, post_data)
+        return self
+
+    def update(self):
+        url = self._object_url("UPDATE")
+        self.model.metadata.strip(self.model.kind)  # strip server-generated metadata before posting updates
+        state = self.request(method="PUT", url=url, data=self.serialize())
+        self._update_result(state, "UPDATE")
+        return self
+
+    def patch(self):
+        url = self._object_url("PATCH")
+        self.model.metadata.strip(self.model.kind)  # strip server-generated metadata before posting updates
+        state = self.request(method="PATCH", url=url, data=self.serialize())
+        self._update_result(state, "PATCH")
+        return self
+
+    def delete(self, cascade=False):
+        url = self._object_url("DELETE")
+        state = self.request(method="DELETE", url=url, data=self._delete_options(cascade))
+        self._delete_result(state)
+
+        if state.get("success"):
+            message = "Timed out on DELETE object: [ {0} ]".format(self.name)
+            self._wait_for(predicate=None, timeout=self.DELETE_TIMEOUT_SECONDS, message=message)
+
+        return self
+
+    def server_version(self):
+        url = "/version"
+        state = self.request(method="GET", url=url)
+        return self._server_version_result(state)
+
+    # ------------------------------------------------------------------------------------- wait
+
+    def _wait_for(self, predicate=None, timeout=None, message=None):
+        """
+        Blocks until predicate() is true, keeping self.model up to date with the changes made to this object.
+        With no predicate, blocks until the object is deleted, leaving self.model as it is.
+
+        The object is fetched once, then followed through a watch on its name. If the server can't be
+        watched, the object is polled instead, at intervals growing from WAIT_POLL_MIN_SECONDS to
+        WAIT_POLL_MAX_SECONDS.
+
+        :param predicate: A callable without arguments, checking self.model.
+        :param timeout: The number of seconds after which to raise a TimedOutException. Waits forever if None.
+        :param message: The message of the TimedOutException.
+        :return: self
+        """
+
+        deadline = None if timeout is None else time.time() + timeout
+        try:
+            current = self._fetch()
+        except NotFoundException:
+            if predicate is None:
+                return self
+            raise
+        if predicate is not None:
+            self.model = current
+            if predicate():
+                return self
+
+        remaining = None if deadline is None else max(deadline - time.time(), 0.001)
+        events = self.watch(
+            fields={"metadata.name": self.name},
+            resource_version=current.metadata.resource_version,
+            timeout=remaining,
+            known=[current.serialize()],
+        )
+        try:
+            for event in events:
+                if event.type == "DELETED":
+                    if predicate is None:
+                        return self
+                    raise NotFoundException("K8sObject: [ {0}:{1} ] was deleted.".format(self.obj_type, self.name))
+                if predicate is not None:
+                    self.model = event.object
+                    if predicate():
+                        return self
+        except (WatchException, BadRequestException) as err:
+            logging.debug("K8sObject: can't watch [ {0} ], polling instead: {1}".format(self.obj_type, err))
+            return self._poll_for(predicate, deadline, message)
+        finally:
+            events.close()
+
+        raise TimedOutException(message)
+
+    def _poll_for(self, predicate=None, deadline=None, message=None):
+        interval = self.WAIT_POLL_MIN_SECONDS
+        while True:
+            try:
+                current = self._fetch()
+            except NotFoundException:
+                if predicate is None:
+                    return self
+                raise
+            if predicate is not None:
+                self.model = current
+                if predicate():
+                    return self
+            if deadline is not None and time.time() + interval > deadline:
+                raise TimedOutException(message)
+            time.sleep(interval)
+            interval = min(interval * 2, self.WAIT_POLL_MAX_SECONDS)
+
+    def _fetch(self):
+        """
+        :return: A model of this object, as the API server has it now.
+        """
+
+        return self._as_model(self._model_class, self.get_model(), lazy=False)
+
+    # ------------------------------------------------------------------------------------- watch
+
+    def watch(self, labels=None, fields=None, resource_version=None, timeout=None, bookmarks=False, known=None):
+        """
+        Streams the changes made to objects of this type, as WatchEvents whose object is a model
+        of this type (Pod, Deployment, ...).
+
+        Without a resource_version, the objects that already exist come first, as ADDED events.
+        The watch resumes from the last resourceVersion seen whenever the connection drops or the server
+        ends it. If that version is too old to resume from (HTTP 410 Gone), the objects are listed again,
+        and the differences with what was last seen are replayed as ADDED, MODIFIED and DELETED events.
+
+        :param labels: A dict of labels the objects must have.
+        :param fields: A dict of field selectors (e.g. {'spec.nodeName': 'node-1'}).
+        :param resource_version: The resourceVersion to start watching from.
+        :param timeout: The number of seconds after which to stop watching. Watches forever if None.
+        :param bookmarks: Whether to also yield BOOKMARK events.
+        :param known: The raw objects already known at resource_version, so that a relist also
+                      reports those deleted in the meantime.
+        :return: A generator of WatchEvent.
+        """
+
+        cls = self._model_class
+        objects, known = known, dict()
+        for raw in objects or []:
+            self._remember(known, "ADDED", raw)
+        deadline = None if timeout is None else time.time() + timeout
+        failures = 0
+
+        while deadline is None or time.time() < deadline:
+            remaining = None if deadline is None else max(int(deadline - time.time()), 1)
+            try:
+                state = self.request(
+                    method="GET",
+                    data=self._watch_params(labels, fields, resource_version, remaining),
+                    stream=True,
+                    timeout=None if remaining is None else (self.WATCH_CONNECT_TIMEOUT_SECONDS, remaining + 1),
+                )
+                if state.get("status") == 410:
+                    events, resource_version = self._relist(cls, known, labels, fields)
+                    for event in events:
+                        yield event
+                    continue
+                self._watch_result(state)
+
+                lines = state.get("data")
+                received = False
+                try:
+                    for line in lines:
+                        received = True
+                        failures = 0
+                        event = build_trusted(WatchEvent, line, cls)
+                        if event.type == "ERROR":
+                            if event.object.get("code", None) != 410:
+                                message = event.object.get("message", event.object)
+                                raise WatchException("K8sObject: WATCH failed : {0}".format(message))
+                            # the version we resume from is too old: relist, then watch from the list version.
+                            events, resource_version = self._relist(cls, known, labels, fields)
+                            for e in events:
+                                yield e
+                            break
+                        resource_version = event.resource_version or resource_version
+                        if event.type == "BOOKMARK":
+                            if bookmarks:
+                                yield event
+                            continue
+                        self._remember(known, event.type, event.raw)
+                        yield event
+                finally:
+                    lines.close()
+
+                if not received:
+                    time.sleep(self.WATCH_IDLE_SECONDS)
+
+            except (IOError, BadRequestException) as err:
+                # dropped connection, or an unreachable server: resume from the last version seen.
+                failures += 1
+                if failures > self.WATCH_MAX_RETRIES:
+                    raise BadRequestException("K8sObject: WATCH failed : {0}".format(err))
+                if deadline is None or time.time() < deadline:
+                    time.sleep(min(self.WATCH_IDLE_SECONDS * 2 ** (failures - 1), 5))
+
+    @staticmethod
+    def _watch_params(labels=None, fields=None, resource_version=None, timeout=None):
+        data = {"watch": "true", "allowWatchBookmarks": "true"}
+        if resource_version is not None:
+            data["resourceVersion"] = resource_version
+        if timeout is not None:
+            data["timeoutSeconds"] = timeout
+        data.update(K8sObject._selector_params(labels=labels, fields=fields) or dict())
+        return data
 
+    @staticmethod
+    def _selector_params(labels=None, fields=None):
+        data = dict()
+        data.update(K8sObject._list_params(labels=labels) or dict())
+        data.update(K8sObject._field_params(fields=fields) or dict())
+        return data or None
+
+    @staticmethod
+    def _field_params(fields=None):
+        if fields is not None and isinstance(fields, dict) and len(fields):
+            return {"fieldSelector": ",".join("{0}={1}".format(k, v) for k, v in fields.items())}
+        return None
+
+    def _watch_result(self, state=None):
         if not state.get("success"):
             status = state.get("status", "")
             state_data = state.get("data", dict())
-            reason = state_data["message"] if "message" in state_data else state_data
-            message = "K8sObject: CREATE failed : HTTP {0} : {1} : {2}".format(status, reason, post_data)
+            reason = state_data.get("message", state_data) if isinstance(state_data, dict) else state_data
+            message = "K8sObject: WATCH failed : HTTP {0} : {1}".format(status, reason)
             if int(status) == 401:
                 raise UnauthorizedException(message)
             if int(status) == 404:
                 raise NotFoundException(message)
-            if int(status) == 409:
-                raise AlreadyExistsException(message)
-            if int(status) == 422:
-                raise UnprocessableEntityException(message)
+            if int(status) < 500 and int(status) != 429:
+                raise WatchException(message)
             raise BadRequestException(message)
-        return self
 
-    def update(self):
+    @staticmethod
+    def _remember(known=None, event_type=None, raw=None):
+        meta = raw.get("metadata", {})
+        key = (meta.get("namespace", None), meta.get("name", None))
+        if event_type == "DELETED":
+            known.pop(key, None)
+        else:
+            known[key] = raw
+
+    def _relist(self, cls=None, known=None, labels=None, fields=None):
+        """
+        Lists the objects again, and replays the differences with what was last seen as events.
+
+        :return: A tuple of (events, the resourceVersion of the list to resume watching from).
+        """
+
+        state = self.request(method="GET", data=self._selector_params(labels=labels, fields=fields))
+        items = self._list_result(state)
+        version = state.get("data", dict()).get("metadata", dict()).get("resourceVersion", None)
+
+        seen = dict()
+        for raw in items:
+            meta = raw.get("metadata", {})
+            seen[(meta.get("namespace", None), meta.get("name", None))] = raw
+
+        events = []
+        for key, raw in seen.items():
+            if key not in known:
+                events.append(build_trusted(WatchEvent, {"type": "ADDED", "object": raw}, cls))
+            elif known[key].get("metadata", {}).get("resourceVersion") != raw["metadata"].get("resourceVersion"):
+                events.append(build_trusted(WatchEvent, {"type": "MODIFIED", "object": raw}, cls))
+        for key, raw in known.items():
+            if key not in seen:
+                events.append(build_trusted(WatchEvent, {"type": "DELETED", "object": raw}, cls))
+
+        known.clear()
+        known.update(seen)
+        return events, version
+
+    # ------------------------------------------------------------------------------------- response checks
+
+    def _check_name(self, action=None):
         if self.name is None:
-            raise SyntaxError("K8sObject: name: [ {0} ] must be set to UPDATE the object.".format(self.name))
+            raise SyntaxError("K8sObject: name: [ {0} ] must be set to {1} the object.".format(self.name, action))
+
+    def _object_url(self, action=None):
+        self._check_name(action)
+        return "{base}/{name}".format(base=self.base_url, name=self.name)
+
+    @staticmethod
+    def _list_params(labels=None):
+        if labels is not None and not isinstance(labels, dict):
+            selector = str(Selector.coerce(labels))
+            return {"labelSelector": selector} if selector else None
+        if labels is not None and isinstance(labels, dict) and len(labels):
+            filter_list = list()
+            for k, v in labels.items():
+                filter_list.append("{0}={1}".format(k, v))
+            return {"labelSelector": ",".join(filter_list)}
+        return None
 
-        self.model.metadata.strip(self.model.kind)  # strip server-generated metadata before posting updates
+    @staticmethod
+    def _delete_options(cascade=False):
+        delete_opts = DeleteOptions()
+        delete_opts.orphan_dependents = not cascade
+        return delete_opts.serialize()
 
-        url = "{base}/{name}".format(base=self.base_url, name=self.name)
-        post_data = self.serialize()
-        state = self.request(method="PUT", url=url, data=post_data)
+    def _list_result(self, state=None):
+        if not state.get("status"):
+            raise Exception("K8sObject: Could not fetch list of objects of type: [ {0} ]".format(self.obj_type))
+        if not state.get("success"):
+            status = state.get("status", "")
+            state_data = state.get("data", dict())
+            reason = state_data["message"] if "message" in state_data else state_data
+            message = "K8sObject: LIST failed : HTTP {0} : {1}".format(status, reason)
+            if int(status) == 401:
+                raise UnauthorizedException(message)
+            if int(status) == 409:
+                raise AlreadyExistsException(message)
+            if int(status) == 422:
+                raise UnprocessableEntityException(message)
+            raise BadRequestException(message)
+        items = state.get("data", dict()).get("items", list())
+        return items if items is not None else list()
 
+    def _get_result(self, state=None):
         if not state.get("success"):
             status = state.get("status", "")
             reason = state.get("data", dict()).get("message", None)
-            message = "K8sObject: UPDATE failed: HTTP {0} : {1}".format(status, reason)
+            message = "K8sObject: GET [ {0}:{1} ] failed: HTTP {2} : {3} ".format(self.obj_type, self.name, status, reason)
+            raise NotFoundException(message)
+        return state.get("data")
+
+    def _create_result(self, state=None, post_data=None):
+        if not state.get("success"):
+            status = state.get("status", "")
+            state_data = state.get("data", dict())
+            reason = state_data["message"] if "message" in state_data else state_data
+            message = "K8sObject: CREATE failed : HTTP {0} : {1} : {2}".format(status, reason, post_data)
+            if int(status) == 401:
+                raise UnauthorizedException(message)
             if int(status) == 404:
                 raise NotFoundException(message)
+            if int(status) == 409:
+                raise AlreadyExistsException(message)
             if int(status) == 422:
                 raise UnprocessableEntityException(message)
             raise BadRequestException(message)
+        return state.get("data")
 
-        return self
-
-    def patch(self):
-        if self.name is None:
-            raise SyntaxError("K8sObject: name: [ {0} ] must be set to PATCH the object.".format(self.name))
-
-        self.model.metadata.strip(self.model.kind)  # strip server-generated metadata before posting updates
-
-        url = "{base}/{name}".format(base=self.base_url, name=self.name)
-        post_data = self.serialize()
-        state = self.request(method="PATCH", url=url, data=post_data)
-
+    def _update_result(self, state=None, action="UPDATE"):
         if not state.get("success"):
             status = state.get("status", "")
             reason = state.get("data", dict()).get("message", None)
-            message = "K8sObject: PATCH failed: HTTP {0} : {1}".format(status, reason)
+            message = "K8sObject: {0} failed: HTTP {1} : {2}".format(action, status, reason)
             if int(status) == 404:
                 raise NotFoundException(message)
             if int(status) == 422:
                 raise UnprocessableEntityException(message)
             raise BadRequestException(message)
+        return state.get("data")
 
-        return self
-
-    def delete(self, cascade=False):
-        if self.name is None:
-            raise SyntaxError("K8sObject: name: [ {0} ] must be set to DELETE the object.".format(self.name))
-
-        url = "{base}/{name}".format(base=self.base_url, name=self.name)
-
-        delete_opts = DeleteOptions()
-        delete_opts.orphan_dependents = not cascade
-
-        state = self.request(method="DELETE", url=url, data=delete_opts.serialize())
-
+    def _delete_result(self, state=None):
         if not state.get("success"):
             status = state.get("status", "")
             reason = state.get("data", dict()).get("message", None)
@@ -432,26 +733,10 @@ class K8sObject(object):
             if int(status) == 404:
                 raise NotFoundException(message)
             raise BadRequestException(message)
+        return state.get("data")
 
-        if state.get("success"):
-            start_time = time.time()
-            try:
-                while True:
-                    time.sleep(0.2)
-                    self.get_model()
-                    elapsed_time = time.time() - start_time
-                    if elapsed_time >= self.DELETE_TIMEOUT_SECONDS:
-                        raise TimedOutException("Timed out on DELETE object: [ {0} ]".format(self.name))
-            except NotFoundException:
-                pass
-
-        return self
-
-    def server_version(self):
-        url = "/version"
-
-        state = self.request(method="GET", url=url)
-
+    @staticmethod
+    def _server_version_result(state=None):
         if not state.get("success"):
             status = state.get("status", "")
             data = state.get("data", dict())
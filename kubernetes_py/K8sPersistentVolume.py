@@ -40,12 +40,12 @@ class K8sPersistentVolume(K8sObject):
         return self
 
     def get(self):
-        self.model = PersistentVolume(self.get_model())
+        self.model = self._as_model(PersistentVolume, self.get_model(), lazy=False)
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sPersistentVolume, self).list(labels=labels)
-        vols = list(map(lambda x: PersistentVolume(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sPersistentVolume, self).list(labels=labels, fields=fields)
+        vols = list(map(lambda x: self._as_model(PersistentVolume, x), ls))
         if pattern is not None:
             vols = list(filter(lambda x: pattern in x.name, vols))
         k8s = []
@@ -55,6 +55,13 @@ class K8sPersistentVolume(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sPersistentVolume, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(PersistentVolume, item)
+            if pattern is None or pattern in x.name:
+                _types = list(filter(lambda z: z in PersistentVolumeSpec.VOLUME_TYPES_TO_SOURCE_MAP, dir(x.spec)))
+                yield K8sPersistentVolume(config=self.config, name=x.name, type=_types[0]).from_model(m=x)
+
     # ------------------------------------------------------------------------------------- wait
 
     def _wait_for_available(self):
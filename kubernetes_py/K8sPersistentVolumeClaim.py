@@ -6,9 +6,6 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
-import time
-
-from kubernetes_py.K8sExceptions import TimedOutException
 from kubernetes_py.K8sObject import K8sObject
 from kubernetes_py.models.v1.PersistentVolumeClaim import PersistentVolumeClaim
 from kubernetes_py.models.v1.ResourceRequirements import ResourceRequirements
@@ -30,12 +27,12 @@ class K8sPersistentVolumeClaim(K8sObject):
         return self
 
     def get(self):
-        self.model = PersistentVolumeClaim(self.get_model())
+        self.model = self._as_model(PersistentVolumeClaim, self.get_model(), lazy=False)
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sPersistentVolumeClaim, self).list(labels=labels)
-        claims = list(map(lambda x: PersistentVolumeClaim(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sPersistentVolumeClaim, self).list(labels=labels, fields=fields)
+        claims = list(map(lambda x: self._as_model(PersistentVolumeClaim, x), ls))
         if pattern is not None:
             claims = list(filter(lambda x: pattern in x.name, claims))
         k8s = []
@@ -44,19 +41,17 @@ class K8sPersistentVolumeClaim(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sPersistentVolumeClaim, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(PersistentVolumeClaim, item)
+            if pattern is None or pattern in x.name:
+                yield K8sPersistentVolumeClaim(config=self.config, name=x.name).from_model(m=x)
+
     # ------------------------------------------------------------------------------------- wait
 
     def _wait_for_available(self):
-        start_time = time.time()
-        while not self.model.status.phase == "Bound":
-            time.sleep(0.5)
-            self.get()
-            self._check_timeout(start_time)
-
-    def _check_timeout(self, start_time=None):
-        elapsed_time = time.time() - start_time
-        if elapsed_time >= READY_WAIT_TIMEOUT_SECONDS:  # timeout
-            raise TimedOutException("Timed out waiting on readiness of PersistentVolumeClaim: [ {} ]".format(self.name))
+        message = "Timed out waiting on readiness of PersistentVolumeClaim: [ {} ]".format(self.name)
+        self._wait_for(lambda: self.model.status.phase == "Bound", timeout=READY_WAIT_TIMEOUT_SECONDS, message=message)
 
     # ------------------------------------------------------------------------------------- accessModes
 
@@ -36,7 +36,7 @@ class K8sPetSet(K8sObject):
     # -------------------------------------------------------------------------------------  override
 
     def get(self):
-        self.model = PetSet(self.get_model())
+        self.model = self._as_model(PetSet, self.get_model(), lazy=False)
         return self
 
     def create(self):
@@ -49,9 +49,9 @@ class K8sPetSet(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None):
-        ls = super(K8sPetSet, self).list()
-        pets = list(map(lambda x: PetSet(x), ls))
+    def list(self, pattern=None, fields=None):
+        ls = super(K8sPetSet, self).list(fields=fields)
+        pets = list(map(lambda x: self._as_model(PetSet, x), ls))
         if pattern is not None:
             pets = list(filter(lambda x: pattern in x.name, pets))
         k8s = []
@@ -60,3 +60,11 @@ class K8sPetSet(K8sObject):
             j.model = x
             k8s.append(j)
         return k8s
+
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sPetSet, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(PetSet, item)
+            if pattern is None or pattern in x.name:
+                j = K8sPetSet(config=self.config, name=x.name)
+                j.model = x
+                yield j
@@ -6,18 +6,22 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
-import time
+import datetime
+
+from dateutil import tz
 
 from kubernetes_py import K8sConfig
 from kubernetes_py.K8sContainer import K8sContainer
-from kubernetes_py.K8sExceptions import NotFoundException, TimedOutException
+from kubernetes_py.K8sExceptions import NotFoundException
+from kubernetes_py.K8sInformer import K8sInformer
 from kubernetes_py.K8sObject import K8sObject
 from kubernetes_py.models.v1.Pod import Pod
 from kubernetes_py.models.v1.PodStatus import PodStatus
 from kubernetes_py.models.v1.Probe import Probe
-from kubernetes_py.utils import is_valid_dict, is_valid_string, is_valid_list
+from kubernetes_py.utils import is_valid_date_time, is_valid_dict, is_valid_string, is_valid_list
 from kubernetes_py.models.v1.Toleration import Toleration
 from kubernetes_py.models.unversioned.BaseUrls import BaseUrls
+from kubernetes_py.utils.Selectors import Selector
 
 
 class K8sPod(K8sObject):
@@ -43,9 +47,9 @@ class K8sPod(K8sObject):
         self._wait_for_readiness()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sPod, self).list(labels=labels)
-        pods = list(map(lambda pod: Pod(pod), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sPod, self).list(labels=labels, fields=fields)
+        pods = list(map(lambda pod: self._as_model(Pod, pod), ls))
         if pattern is not None:
             pods = list(filter(lambda pod: pattern in pod.name, pods))
         k8s = list()
@@ -54,15 +58,17 @@ class K8sPod(K8sObject):
             k8s.append(p)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sPod, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Pod, item)
+            if pattern is None or pattern in x.name:
+                yield K8sPod(config=self.config, name=x.name).from_model(m=x)
+
     # -------------------------------------------------------------------------------------  wait
 
     def _wait_for_readiness(self):
-        start_time = time.time()
-        while not self.is_ready():
-            time.sleep(0.2)
-            elapsed_time = time.time() - start_time
-            if elapsed_time >= self.POD_READY_TIMEOUT_SECONDS:
-                raise TimedOutException("Timed out on Pod readiness: [ {0} ]".format(self.name))
+        message = "Timed out on Pod readiness: [ {0} ]".format(self.name)
+        self._wait_for(self._is_ready_status, timeout=self.POD_READY_TIMEOUT_SECONDS, message=message)
 
     # -------------------------------------------------------------------------------------  add
 
@@ -118,16 +124,20 @@ class K8sPod(K8sObject):
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = Pod(self.get_model())
+        self.model = self._as_model(Pod, self.get_model(), lazy=False)
         return self
 
     # ------------------------------------------------------------------------------------- polling readiness
 
     def is_ready(self):
         self.get()
-        if self.status is not None and isinstance(self.status, PodStatus):
-            pod_phase = self.status.phase
-            conditions = self.status.conditions
+        return self._is_ready_status()
+
+    def _is_ready_status(self):
+        status = self.model.status
+        if status is not None and isinstance(status, PodStatus):
+            pod_phase = status.phase
+            conditions = status.conditions
             conditions_ok = 0
             for cond in conditions:
                 if cond.status == "True":
@@ -139,36 +149,123 @@ class K8sPod(K8sObject):
     # ------------------------------------------------------------------------------------- logs
 
     def get_log(self, container=None):
+        lines = list(self.stream_log(container=container))
+        return lines if lines else ""
+
+    def stream_log(
+        self,
+        container=None,
+        follow=False,
+        tail_lines=None,
+        since_seconds=None,
+        since_time=None,
+        limit_bytes=None,
+        timestamps=False,
+        previous=False,
+        timeout=None,
+    ):
+        """
+        Reads the log of the pod one line at a time, as the lines arrive: only the line being read is held
+        in memory, however long the log.
+
+        :param container: The container whose log is read. Required when the pod has several.
+        :param follow: Whether to keep reading the lines written from now on, until the container stops.
+        :param tail_lines: The number of lines read from the end of the log.
+        :param since_seconds: Only the lines written in the last 'since_seconds' seconds are read.
+        :param since_time: Only the lines written since this datetime, or RFC 3339 timestamp, are read.
+        :param limit_bytes: The number of bytes read, at most.
+        :param timestamps: Whether each line starts with the RFC 3339 timestamp it was written at.
+        :param previous: Whether to read the log of the previous instance of the container, after a restart.
+        :param timeout: The seconds to wait for the server, as for requests: a number or a (connect, read) tuple.
+        :return: A generator of the lines, without their line ending. Closing it closes the connection.
+        """
+
+        params = self._log_params(
+            container=container,
+            follow=follow,
+            tail_lines=tail_lines,
+            since_seconds=since_seconds,
+            since_time=since_time,
+            limit_bytes=limit_bytes,
+            timestamps=timestamps,
+            previous=previous,
+        )
+        state = self.request(method="GET", url=self._log_url(), data=params, stream=True, text=True, timeout=timeout)
+        self._check_pod_result(state)
+        return state.get("data") or iter([])
+
+    def _log_params(
+        self,
+        container=None,
+        follow=False,
+        tail_lines=None,
+        since_seconds=None,
+        since_time=None,
+        limit_bytes=None,
+        timestamps=False,
+        previous=False,
+    ):
+        params = dict()
+        if container:
+            params["container"] = container
+        for name, key, value, minimum in (
+            ("tail_lines", "tailLines", tail_lines, 0),
+            ("since_seconds", "sinceSeconds", since_seconds, 1),
+            ("limit_bytes", "limitBytes", limit_bytes, 1),
+        ):
+            if value is None:
+                continue
+            if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+                raise SyntaxError("K8sPod.stream_log(): {0}: [ {1} ] is invalid.".format(name, value))
+            params[key] = value
+        if since_time is not None:
+            if since_seconds is not None:
+                raise SyntaxError("K8sPod.stream_log(): since_seconds and since_time are mutually exclusive.")
+            if isinstance(since_time, datetime.datetime):
+                if since_time.tzinfo is not None:
+                    since_time = since_time.astimezone(tz.tzutc()).replace(tzinfo=None)
+                since_time = since_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+            if not isinstance(since_time, str) or not is_valid_date_time(since_time):
+                raise SyntaxError("K8sPod.stream_log(): since_time: [ {0} ] is invalid.".format(since_time))
+            params["sinceTime"] = since_time
+        for key, value in (("follow", follow), ("timestamps", timestamps), ("previous", previous)):
+            if value:
+                params[key] = "true"
+        return params
+
+    def _log_url(self, container=None):
         url = "{base}/{name}/log".format(base=self.base_url, name=self.name)
         if container:
             url = "{url}?container={container}".format(url=url, container=container)
+        return url
 
-        state = self.request(method="GET", url=url)
-        if not state.get("success"):
-            status = state.get("status", "")
-            reason = state.get("data", dict()).get("message", None)
-            message = "K8sPod: GET [ {0}:{1} ] failed: HTTP {2} : {3} ".format(self.obj_type, self.name, status, reason)
-            raise NotFoundException(message)
-
+    def _log_result(self, state=None):
+        self._check_pod_result(state)
         if "data" in state and state.get("data") is not None:
             logs = state.get("data").splitlines()
             return logs
         return ""
 
-    # ------------------------------------------------------------------------------------- metrics
-
-    def get_metrics(self):
-        bu = BaseUrls(api=self.config.version, namespace=self.config.namespace)
-        base_url = bu.get_base_url(object_type="PodMetrics")
-        url = "{base}/{name}".format(base=base_url, name=self.name)
-
-        state = self.request(method="GET", url=url)
+    def _check_pod_result(self, state=None):
         if not state.get("success"):
             status = state.get("status", "")
-            reason = state.get("data", dict()).get("message", None)
+            data = state.get("data", None)
+            reason = data.get("message", None) if isinstance(data, dict) else data
             message = "K8sPod: GET [ {0}:{1} ] failed: HTTP {2} : {3} ".format(self.obj_type, self.name, status, reason)
             raise NotFoundException(message)
 
+    # ------------------------------------------------------------------------------------- metrics
+
+    def get_metrics(self):
+        state = self.request(method="GET", url=self._metrics_url())
+        return self._metrics_result(state)
+
+    def _metrics_url(self):
+        base_url = BaseUrls.url(object_type="PodMetrics", namespace=self.config.namespace, api=self.config.version)
+        return "{base}/{name}".format(base=base_url, name=self.name)
+
+    def _metrics_result(self, state=None):
+        self._check_pod_result(state)
         if "data" in state and state.get("data") is not None:
             return state.get("data")
         return ""
@@ -453,10 +550,16 @@ class K8sPod(K8sObject):
     def get_by_labels(config=None, labels=None):
         if config is None:
             config = K8sConfig()
-        if not is_valid_dict(labels):
+        if not is_valid_dict(labels) and not isinstance(labels, Selector):
             raise SyntaxError("K8sPod.get_by_labels(): labels: [ {} ] is invalid.".format(labels))
 
-        pods = K8sPod(config=config, name="whatever").list(labels=labels)
+        reader = K8sPod(config=config, name="whatever")
+        informer = K8sInformer.lookup(config=config, obj_type="Pod", namespace=config.namespace)
+        if informer is not None:
+            models = [reader._as_model(Pod, x) for x in informer.list(namespace=config.namespace, labels=labels)]
+            return [K8sPod(config=config, name=x.name).from_model(m=x) for x in models]
+
+        pods = reader.list(labels=labels)
 
         return pods
 
@@ -468,14 +571,10 @@ class K8sPod(K8sObject):
             raise SyntaxError("K8sPod.get_by_pod_ip(): ip: [ {0} ] is invalid.".format(ip))
 
         found = None
-        pods = K8sPod(config=config, name="throwaway").list(labels=labels)
+        pods = K8sPod(config=config, name="throwaway").list(labels=labels, fields={"status.podIP": ip})
 
         for pod in pods:
-            try:
-                assert isinstance(pod, K8sPod)
-                if pod.pod_ip == ip:
-                    found = pod
-                    break
-            except NotFoundException:
-                pass
+            if pod.pod_ip == ip:
+                found = pod
+                break
         return found
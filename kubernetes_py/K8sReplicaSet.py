@@ -7,8 +7,10 @@
 #
 
 from kubernetes_py.K8sExceptions import NotFoundException
+from kubernetes_py.K8sInformer import K8sInformer
 from kubernetes_py.K8sObject import K8sObject
 from kubernetes_py.K8sPod import K8sPod
+from kubernetes_py.models.v1.Pod import Pod
 from kubernetes_py.models.v1beta1.ReplicaSet import ReplicaSet
 
 
@@ -27,12 +29,12 @@ class K8sReplicaSet(K8sObject):
     # -------------------------------------------------------------------------------------  override
 
     def get(self):
-        self.model = ReplicaSet(self.get_model())
+        self.model = self._as_model(ReplicaSet, self.get_model(), lazy=False)
         return self
 
-    def list(self, pattern=None, reverse=True, labels=None):
-        ls = super(K8sReplicaSet, self).list(labels=labels)
-        rsets = list(map(lambda x: ReplicaSet(x), ls))
+    def list(self, pattern=None, reverse=True, labels=None, fields=None):
+        ls = super(K8sReplicaSet, self).list(labels=labels, fields=fields)
+        rsets = list(map(lambda x: self._as_model(ReplicaSet, x), ls))
         if pattern is not None:
             rsets = list(filter(lambda x: pattern in x.name, rsets))
         k8s = []
@@ -42,10 +44,18 @@ class K8sReplicaSet(K8sObject):
         k8s.sort(key=lambda x: x.creation_timestamp, reverse=reverse)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sReplicaSet, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(ReplicaSet, item)
+            if pattern is None or pattern in x.name:
+                yield K8sReplicaSet(config=self.config, name=x.name).from_model(m=x)
+
     def delete(self, cascade=False):
         super(K8sReplicaSet, self).delete(cascade)
         if cascade:
-            pods = K8sPod(config=self.config, name="yo").list(pattern=self.name)
+            pods = self._owned_pods()
+            if pods is None:
+                pods = K8sPod(config=self.config, name="yo").list(pattern=self.name)
             for pod in pods:
                 try:
                     pod.delete(cascade)
@@ -53,6 +63,18 @@ class K8sReplicaSet(K8sObject):
                     pass
         return self
 
+    def _owned_pods(self):
+        """
+        The pods owned by this ReplicaSet, from a running Pod informer; None if there is none.
+        """
+
+        informer = K8sInformer.lookup(config=self.config, obj_type="Pod", namespace=self.config.namespace)
+        if informer is None or self.uid is None:
+            return None
+        items = informer.by_index("owner", self.uid)
+        models = [self._as_model(Pod, x) for x in items]
+        return [K8sPod(config=self.config, name=x.name).from_model(m=x) for x in models]
+
     # -------------------------------------------------------------------------------------  revision
 
     @property
@@ -59,9 +59,9 @@ class K8sReplicationController(K8sObject):
             self._wait_for_desired_replicas()
         return self
 
-    def list(self, pattern=None):
-        ls = super(K8sReplicationController, self).list()
-        rcs = list(map(lambda x: ReplicationController(x), ls))
+    def list(self, pattern=None, fields=None):
+        ls = super(K8sReplicationController, self).list(fields=fields)
+        rcs = list(map(lambda x: self._as_model(ReplicationController, x), ls))
         if pattern is not None:
             rcs = list(filter(lambda x: pattern in x.name, rcs))
         k8s = []
@@ -71,6 +71,14 @@ class K8sReplicationController(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sReplicationController, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(ReplicationController, item)
+            if pattern is None or pattern in x.name:
+                j = K8sReplicationController(config=self.config, name=x.name)
+                j.model = x
+                yield j
+
     # -------------------------------------------------------------------------------------  add
 
     def add_pod_annotation(self, k=None, v=None):
@@ -138,7 +146,7 @@ class K8sReplicationController(K8sObject):
     # -------------------------------------------------------------------------------------  get
 
     def get(self):
-        self.model = ReplicationController(self.get_model())
+        self.model = self._as_model(ReplicationController, self.get_model(), lazy=False)
         return self
 
     def get_pod_annotation(self, k=None):
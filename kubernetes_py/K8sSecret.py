@@ -20,7 +20,7 @@ class K8sSecret(K8sObject):
     # -------------------------------------------------------------------------------------  override
 
     def get(self):
-        self.model = Secret(self.get_model())
+        self.model = self._as_model(Secret, self.get_model(), lazy=False)
         return self
 
     def create(self):
@@ -33,9 +33,9 @@ class K8sSecret(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sSecret, self).list(labels=labels)
-        secrets = list(map(lambda x: Secret(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sSecret, self).list(labels=labels, fields=fields)
+        secrets = list(map(lambda x: self._as_model(Secret, x), ls))
         if pattern is not None:
             secrets = list(filter(lambda x: pattern in x.name, secrets))
         k8s = []
@@ -44,6 +44,12 @@ class K8sSecret(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sSecret, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Secret, item)
+            if pattern is None or pattern in x.name:
+                yield K8sSecret(config=self.config, name=x.name).from_model(m=x)
+
     # -------------------------------------------------------------------------------------  image pull secrets
 
     @staticmethod
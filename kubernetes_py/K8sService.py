@@ -26,9 +26,9 @@ class K8sService(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sService, self).list(labels=labels)
-        svcs = list(map(lambda x: Service(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sService, self).list(labels=labels, fields=fields)
+        svcs = list(map(lambda x: self._as_model(Service, x), ls))
         if pattern is not None:
             svcs = list(filter(lambda x: pattern in x.name, svcs))
         k8s = []
@@ -37,6 +37,12 @@ class K8sService(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sService, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(Service, item)
+            if pattern is None or pattern in x.name:
+                yield K8sService(config=self.config, name=x.name).from_model(m=x)
+
     # ------------------------------------------------------------------------------------- add
 
     def add_annotation(self, k=None, v=None):
@@ -60,7 +66,7 @@ class K8sService(K8sObject):
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = Service(self.get_model())
+        self.model = self._as_model(Service, self.get_model(), lazy=False)
         return self
 
     def get_annotation(self, k=None):
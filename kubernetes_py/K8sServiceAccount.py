@@ -20,7 +20,7 @@ class K8sServiceAccount(K8sObject):
     # -------------------------------------------------------------------------------------  override
 
     def get(self):
-        self.model = ServiceAccount(self.get_model())
+        self.model = self._as_model(ServiceAccount, self.get_model(), lazy=False)
         return self
 
     def create(self):
@@ -33,9 +33,9 @@ class K8sServiceAccount(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sServiceAccount, self).list(labels=labels)
-        accts = list(map(lambda x: ServiceAccount(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sServiceAccount, self).list(labels=labels, fields=fields)
+        accts = list(map(lambda x: self._as_model(ServiceAccount, x), ls))
         if pattern is not None:
             accts = list(filter(lambda x: pattern in x.name, accts))
         k8s = []
@@ -44,6 +44,12 @@ class K8sServiceAccount(K8sObject):
             k8s.append(j)
         return k8s
 
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sServiceAccount, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(ServiceAccount, item)
+            if pattern is None or pattern in x.name:
+                yield K8sServiceAccount(config=self.config, name=x.name).from_model(m=x)
+
     # ------------------------------------------------------------------------------------- add
 
     def add_api_token(self):
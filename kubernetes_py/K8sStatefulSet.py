@@ -21,7 +21,7 @@ class K8sStatefulSet(K8sObject):
     # -------------------------------------------------------------------------------------  override
 
     def get(self):
-        self.model = StatefulSet(self.get_model())
+        self.model = self._as_model(StatefulSet, self.get_model(), lazy=False)
         return self
 
     def create(self):
@@ -34,9 +34,9 @@ class K8sStatefulSet(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sStatefulSet, self).list(labels=labels)
-        ssets = list(map(lambda x: StatefulSet(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sStatefulSet, self).list(labels=labels, fields=fields)
+        ssets = list(map(lambda x: self._as_model(StatefulSet, x), ls))
         if pattern is not None:
             ssets = list(filter(lambda x: pattern in x.name, ssets))
         k8s = []
@@ -44,3 +44,9 @@ class K8sStatefulSet(K8sObject):
             j = K8sStatefulSet(config=self.config, name=x.name).from_model(m=x)
             k8s.append(j)
         return k8s
+
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sStatefulSet, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(StatefulSet, item)
+            if pattern is None or pattern in x.name:
+                yield K8sStatefulSet(config=self.config, name=x.name).from_model(m=x)
@@ -18,7 +18,7 @@ class K8sStorageClass(K8sObject):
     # -------------------------------------------------------------------------------------  override
 
     def get(self):
-        self.model = StorageClass(self.get_model())
+        self.model = self._as_model(StorageClass, self.get_model(), lazy=False)
         return self
 
     def create(self):
@@ -31,9 +31,9 @@ class K8sStorageClass(K8sObject):
         self.get()
         return self
 
-    def list(self, pattern=None, labels=None):
-        ls = super(K8sStorageClass, self).list(labels=labels)
-        sclasses = list(map(lambda x: StorageClass(x), ls))
+    def list(self, pattern=None, labels=None, fields=None):
+        ls = super(K8sStorageClass, self).list(labels=labels, fields=fields)
+        sclasses = list(map(lambda x: self._as_model(StorageClass, x), ls))
         if pattern is not None:
             sclasses = list(filter(lambda x: pattern in x.name, sclasses))
         k8s = []
@@ -41,3 +41,9 @@ class K8sStorageClass(K8sObject):
             j = K8sStorageClass(config=self.config, name=x.name).from_model(m=x)
             k8s.append(j)
         return k8s
+
+    def list_iter(self, pattern=None, labels=None, fields=None, limit=None):
+        for item in super(K8sStorageClass, self).list_iter(labels=labels, fields=fields, limit=limit):
+            x = self._as_model(StorageClass, item)
+            if pattern is None or pattern in x.name:
+                yield K8sStorageClass(config=self.config, name=x.name).from_model(m=x)
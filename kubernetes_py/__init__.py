@@ -6,29 +6,81 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
-from kubernetes_py.K8sComponentStatus import K8sComponentStatus
-from kubernetes_py.K8sConfig import K8sConfig
-from kubernetes_py.K8sContainer import K8sContainer
-from kubernetes_py.K8sCronJob import K8sCronJob
-from kubernetes_py.K8sDaemonSet import K8sDaemonSet
-from kubernetes_py.K8sDeployment import K8sDeployment
+import importlib
+import sys
+import types
+
 from kubernetes_py.K8sExceptions import *
-from kubernetes_py.K8sHorizontalPodAutoscaler import K8sHorizontalPodAutoscaler
-from kubernetes_py.K8sJob import K8sJob
-from kubernetes_py.K8sNamespace import K8sNamespace
-from kubernetes_py.K8sNode import K8sNode
-from kubernetes_py.K8sObject import K8sObject
-from kubernetes_py.K8sPersistentVolume import K8sPersistentVolume
-from kubernetes_py.K8sPersistentVolumeClaim import K8sPersistentVolumeClaim
-from kubernetes_py.K8sPetSet import K8sPetSet
-from kubernetes_py.K8sPod import K8sPod
-
-# from kubernetes_py.K8sReplicaSet import K8sReplicaSet  # should not be used directly
-from kubernetes_py.K8sReplicationController import K8sReplicationController
-from kubernetes_py.K8sSecret import K8sSecret
-from kubernetes_py.K8sService import K8sService
-from kubernetes_py.K8sServiceAccount import K8sServiceAccount
-from kubernetes_py.K8sStatefulSet import K8sStatefulSet
-from kubernetes_py.K8sStorageClass import K8sStorageClass
-from kubernetes_py.K8sVolume import K8sVolume
-from kubernetes_py.K8sVolumeMount import K8sVolumeMount
+
+# the public names, each imported from its module on first access: 'import kubernetes_py' alone loads
+# neither the K8s* classes, nor the models, nor yaml, dateutil or requests.
+# K8sReplicaSet should not be used directly, and is left out.
+_LAZY = {
+    "K8sCapacity": "kubernetes_py.K8sCapacity",
+    "K8sComponentStatus": "kubernetes_py.K8sComponentStatus",
+    "K8sConfig": "kubernetes_py.K8sConfig",
+    "K8sContainer": "kubernetes_py.K8sContainer",
+    "K8sCronJob": "kubernetes_py.K8sCronJob",
+    "K8sDaemonSet": "kubernetes_py.K8sDaemonSet",
+    "K8sDeployment": "kubernetes_py.K8sDeployment",
+    "K8sHorizontalPodAutoscaler": "kubernetes_py.K8sHorizontalPodAutoscaler",
+    "K8sInformer": "kubernetes_py.K8sInformer",
+    "K8sJob": "kubernetes_py.K8sJob",
+    "K8sLogAggregator": "kubernetes_py.K8sLogAggregator",
+    "K8sMetrics": "kubernetes_py.K8sMetrics",
+    "K8sNamespace": "kubernetes_py.K8sNamespace",
+    "K8sNode": "kubernetes_py.K8sNode",
+    "K8sObject": "kubernetes_py.K8sObject",
+    "K8sPersistentVolume": "kubernetes_py.K8sPersistentVolume",
+    "K8sPersistentVolumeClaim": "kubernetes_py.K8sPersistentVolumeClaim",
+    "K8sPetSet": "kubernetes_py.K8sPetSet",
+    "K8sPod": "kubernetes_py.K8sPod",
+    "K8sReplicationController": "kubernetes_py.K8sReplicationController",
+    "K8sSecret": "kubernetes_py.K8sSecret",
+    "K8sService": "kubernetes_py.K8sService",
+    "K8sServiceAccount": "kubernetes_py.K8sServiceAccount",
+    "K8sStatefulSet": "kubernetes_py.K8sStatefulSet",
+    "K8sStorageClass": "kubernetes_py.K8sStorageClass",
+    "K8sVolume": "kubernetes_py.K8sVolume",
+    "K8sVolumeMount": "kubernetes_py.K8sVolumeMount",
+    "AsyncK8sDeployment": "kubernetes_py.AsyncK8sDeployment",
+    "AsyncK8sObject": "kubernetes_py.AsyncK8sObject",
+    "AsyncK8sPod": "kubernetes_py.AsyncK8sPod",
+    "AsyncK8sReplicationController": "kubernetes_py.AsyncK8sReplicationController",
+}
+
+__all__ = sorted(_LAZY) + sorted(x for x in globals() if x.endswith("Exception"))
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name, value):
+        # importing kubernetes_py.K8sPod binds the module to kubernetes_py.K8sPod: the class is kept there instead.
+        if name in _LAZY and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super(_Package, self).__setattr__(name, value)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        setattr(sys.modules[__name__], name, value)
+        return value
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module("{0}.{1}".format(__name__, name))
+        except ImportError as err:
+            if getattr(err, "name", None) != "{0}.{1}".format(__name__, name):
+                raise
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if sys.version_info >= (3, 7):
+    sys.modules[__name__].__class__ = _Package
+else:
+    # module-level __getattr__ needs python 3.7: older versions import everything up front.
+    for _name in _LAZY:
+        __getattr__(_name)
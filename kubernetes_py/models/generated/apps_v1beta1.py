@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/swagger-v1.10.json: do not edit.
+
+from kubernetes_py.models.generated import core_v1
+from kubernetes_py.models.generated import meta_v1
+
+
+class RollingUpdateStatefulSetStrategy(object):
+    """
+    io.k8s.api.apps.v1beta1.RollingUpdateStatefulSetStrategy: RollingUpdateStatefulSetStrategy is used to communicate
+    parameter for RollingUpdateStatefulSetStrategyType.
+    """
+
+    __slots__ = ("partition",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.partition = get("partition")
+
+    def serialize(self):
+        data = {}
+        v = self.partition
+        if v is not None:
+            data["partition"] = v
+        return data
+
+
+class StatefulSet(object):
+    """
+    io.k8s.api.apps.v1beta1.StatefulSet: DEPRECATED - This group version of StatefulSet is deprecated by
+    apps/v1beta2/StatefulSet.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else StatefulSetSpec(v)
+        v = get("status")
+        self.status = None if v is None else StatefulSetStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class StatefulSetCondition(object):
+    """
+    io.k8s.api.apps.v1beta1.StatefulSetCondition: StatefulSetCondition describes the state of a statefulset at a certain
+    point.
+    """
+
+    __slots__ = ("last_transition_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_transition_time = get("lastTransitionTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class StatefulSetList(object):
+    """
+    io.k8s.api.apps.v1beta1.StatefulSetList: StatefulSetList is a collection of StatefulSets.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [StatefulSet(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class StatefulSetSpec(object):
+    """
+    io.k8s.api.apps.v1beta1.StatefulSetSpec: A StatefulSetSpec is the specification of a StatefulSet.
+    """
+
+    __slots__ = (
+        "pod_management_policy",
+        "replicas",
+        "revision_history_limit",
+        "selector",
+        "service_name",
+        "template",
+        "update_strategy",
+        "volume_claim_templates",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.pod_management_policy = get("podManagementPolicy")
+        self.replicas = get("replicas")
+        self.revision_history_limit = get("revisionHistoryLimit")
+        v = get("selector")
+        self.selector = None if v is None else meta_v1.LabelSelector(v)
+        self.service_name = get("serviceName")
+        v = get("template")
+        self.template = None if v is None else core_v1.PodTemplateSpec(v)
+        v = get("updateStrategy")
+        self.update_strategy = None if v is None else StatefulSetUpdateStrategy(v)
+        v = get("volumeClaimTemplates")
+        self.volume_claim_templates = None if v is None else [core_v1.PersistentVolumeClaim(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.pod_management_policy
+        if v is not None:
+            data["podManagementPolicy"] = v
+        v = self.replicas
+        if v is not None:
+            data["replicas"] = v
+        v = self.revision_history_limit
+        if v is not None:
+            data["revisionHistoryLimit"] = v
+        v = self.selector
+        if v is not None:
+            data["selector"] = v.serialize()
+        v = self.service_name
+        if v is not None:
+            data["serviceName"] = v
+        v = self.template
+        if v is not None:
+            data["template"] = v.serialize()
+        v = self.update_strategy
+        if v is not None:
+            data["updateStrategy"] = v.serialize()
+        v = self.volume_claim_templates
+        if v is not None:
+            data["volumeClaimTemplates"] = [x.serialize() for x in v]
+        return data
+
+
+class StatefulSetStatus(object):
+    """
+    io.k8s.api.apps.v1beta1.StatefulSetStatus: StatefulSetStatus represents the current state of a StatefulSet.
+    """
+
+    __slots__ = (
+        "collision_count",
+        "conditions",
+        "current_replicas",
+        "current_revision",
+        "observed_generation",
+        "ready_replicas",
+        "replicas",
+        "update_revision",
+        "updated_replicas",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.collision_count = get("collisionCount")
+        v = get("conditions")
+        self.conditions = None if v is None else [StatefulSetCondition(x) for x in v]
+        self.current_replicas = get("currentReplicas")
+        self.current_revision = get("currentRevision")
+        self.observed_generation = get("observedGeneration")
+        self.ready_replicas = get("readyReplicas")
+        self.replicas = get("replicas")
+        self.update_revision = get("updateRevision")
+        self.updated_replicas = get("updatedReplicas")
+
+    def serialize(self):
+        data = {}
+        v = self.collision_count
+        if v is not None:
+            data["collisionCount"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.current_replicas
+        if v is not None:
+            data["currentReplicas"] = v
+        v = self.current_revision
+        if v is not None:
+            data["currentRevision"] = v
+        v = self.observed_generation
+        if v is not None:
+            data["observedGeneration"] = v
+        v = self.ready_replicas
+        if v is not None:
+            data["readyReplicas"] = v
+        v = self.replicas
+        if v is not None:
+            data["replicas"] = v
+        v = self.update_revision
+        if v is not None:
+            data["updateRevision"] = v
+        v = self.updated_replicas
+        if v is not None:
+            data["updatedReplicas"] = v
+        return data
+
+
+class StatefulSetUpdateStrategy(object):
+    """
+    io.k8s.api.apps.v1beta1.StatefulSetUpdateStrategy: StatefulSetUpdateStrategy indicates the strategy that the
+    StatefulSet controller will use to perform updates.
+    """
+
+    __slots__ = ("rolling_update", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("rollingUpdate")
+        self.rolling_update = None if v is None else RollingUpdateStatefulSetStrategy(v)
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.rolling_update
+        if v is not None:
+            data["rollingUpdate"] = v.serialize()
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/swagger-v1.10.json: do not edit.
+
+from kubernetes_py.models.generated import meta_v1
+
+
+class CrossVersionObjectReference(object):
+    """
+    io.k8s.api.autoscaling.v1.CrossVersionObjectReference: CrossVersionObjectReference contains enough information to
+    let you identify the referred resource.
+    """
+
+    __slots__ = ("api_version", "kind", "name")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        self.name = get("name")
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        return data
+
+
+class HorizontalPodAutoscaler(object):
+    """
+    io.k8s.api.autoscaling.v1.HorizontalPodAutoscaler: configuration of a horizontal pod autoscaler.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else HorizontalPodAutoscalerSpec(v)
+        v = get("status")
+        self.status = None if v is None else HorizontalPodAutoscalerStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class HorizontalPodAutoscalerList(object):
+    """
+    io.k8s.api.autoscaling.v1.HorizontalPodAutoscalerList: list of horizontal pod autoscaler objects.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [HorizontalPodAutoscaler(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class HorizontalPodAutoscalerSpec(object):
+    """
+    io.k8s.api.autoscaling.v1.HorizontalPodAutoscalerSpec: specification of a horizontal pod autoscaler.
+    """
+
+    __slots__ = ("max_replicas", "min_replicas", "scale_target_ref", "target_cpu_utilization_percentage")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.max_replicas = get("maxReplicas")
+        self.min_replicas = get("minReplicas")
+        v = get("scaleTargetRef")
+        self.scale_target_ref = None if v is None else CrossVersionObjectReference(v)
+        self.target_cpu_utilization_percentage = get("targetCPUUtilizationPercentage")
+
+    def serialize(self):
+        data = {}
+        v = self.max_replicas
+        if v is not None:
+            data["maxReplicas"] = v
+        v = self.min_replicas
+        if v is not None:
+            data["minReplicas"] = v
+        v = self.scale_target_ref
+        if v is not None:
+            data["scaleTargetRef"] = v.serialize()
+        v = self.target_cpu_utilization_percentage
+        if v is not None:
+            data["targetCPUUtilizationPercentage"] = v
+        return data
+
+
+class HorizontalPodAutoscalerStatus(object):
+    """
+    io.k8s.api.autoscaling.v1.HorizontalPodAutoscalerStatus: current status of a horizontal pod autoscaler
+    """
+
+    __slots__ = (
+        "current_cpu_utilization_percentage",
+        "current_replicas",
+        "desired_replicas",
+        "last_scale_time",
+        "observed_generation",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.current_cpu_utilization_percentage = get("currentCPUUtilizationPercentage")
+        self.current_replicas = get("currentReplicas")
+        self.desired_replicas = get("desiredReplicas")
+        self.last_scale_time = get("lastScaleTime")
+        self.observed_generation = get("observedGeneration")
+
+    def serialize(self):
+        data = {}
+        v = self.current_cpu_utilization_percentage
+        if v is not None:
+            data["currentCPUUtilizationPercentage"] = v
+        v = self.current_replicas
+        if v is not None:
+            data["currentReplicas"] = v
+        v = self.desired_replicas
+        if v is not None:
+            data["desiredReplicas"] = v
+        v = self.last_scale_time
+        if v is not None:
+            data["lastScaleTime"] = v
+        v = self.observed_generation
+        if v is not None:
+            data["observedGeneration"] = v
+        return data
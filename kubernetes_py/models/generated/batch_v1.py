@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/swagger-v1.10.json: do not edit.
+
+from kubernetes_py.models.generated import core_v1
+from kubernetes_py.models.generated import meta_v1
+
+
+class Job(object):
+    """
+    io.k8s.api.batch.v1.Job: Job represents the configuration of a single job.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else JobSpec(v)
+        v = get("status")
+        self.status = None if v is None else JobStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class JobCondition(object):
+    """
+    io.k8s.api.batch.v1.JobCondition: JobCondition describes current state of a job.
+    """
+
+    __slots__ = ("last_probe_time", "last_transition_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_probe_time = get("lastProbeTime")
+        self.last_transition_time = get("lastTransitionTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_probe_time
+        if v is not None:
+            data["lastProbeTime"] = v
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class JobList(object):
+    """
+    io.k8s.api.batch.v1.JobList: JobList is a collection of jobs.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [Job(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class JobSpec(object):
+    """
+    io.k8s.api.batch.v1.JobSpec: JobSpec describes how the job execution will look like.
+    """
+
+    __slots__ = (
+        "active_deadline_seconds",
+        "backoff_limit",
+        "completions",
+        "manual_selector",
+        "parallelism",
+        "selector",
+        "template",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.active_deadline_seconds = get("activeDeadlineSeconds")
+        self.backoff_limit = get("backoffLimit")
+        self.completions = get("completions")
+        self.manual_selector = get("manualSelector")
+        self.parallelism = get("parallelism")
+        v = get("selector")
+        self.selector = None if v is None else meta_v1.LabelSelector(v)
+        v = get("template")
+        self.template = None if v is None else core_v1.PodTemplateSpec(v)
+
+    def serialize(self):
+        data = {}
+        v = self.active_deadline_seconds
+        if v is not None:
+            data["activeDeadlineSeconds"] = v
+        v = self.backoff_limit
+        if v is not None:
+            data["backoffLimit"] = v
+        v = self.completions
+        if v is not None:
+            data["completions"] = v
+        v = self.manual_selector
+        if v is not None:
+            data["manualSelector"] = v
+        v = self.parallelism
+        if v is not None:
+            data["parallelism"] = v
+        v = self.selector
+        if v is not None:
+            data["selector"] = v.serialize()
+        v = self.template
+        if v is not None:
+            data["template"] = v.serialize()
+        return data
+
+
+class JobStatus(object):
+    """
+    io.k8s.api.batch.v1.JobStatus: JobStatus represents the current state of a Job.
+    """
+
+    __slots__ = ("active", "completion_time", "conditions", "failed", "start_time", "succeeded")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.active = get("active")
+        self.completion_time = get("completionTime")
+        v = get("conditions")
+        self.conditions = None if v is None else [JobCondition(x) for x in v]
+        self.failed = get("failed")
+        self.start_time = get("startTime")
+        self.succeeded = get("succeeded")
+
+    def serialize(self):
+        data = {}
+        v = self.active
+        if v is not None:
+            data["active"] = v
+        v = self.completion_time
+        if v is not None:
+            data["completionTime"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.failed
+        if v is not None:
+            data["failed"] = v
+        v = self.start_time
+        if v is not None:
+            data["startTime"] = v
+        v = self.succeeded
+        if v is not None:
+            data["succeeded"] = v
+        return data
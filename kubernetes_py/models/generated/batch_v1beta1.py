@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/swagger-v1.10.json: do not edit.
+
+from kubernetes_py.models.generated import batch_v1
+from kubernetes_py.models.generated import core_v1
+from kubernetes_py.models.generated import meta_v1
+
+
+class CronJob(object):
+    """
+    io.k8s.api.batch.v1beta1.CronJob: CronJob represents the configuration of a single cron job.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else CronJobSpec(v)
+        v = get("status")
+        self.status = None if v is None else CronJobStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class CronJobList(object):
+    """
+    io.k8s.api.batch.v1beta1.CronJobList: CronJobList is a collection of cron jobs.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [CronJob(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class CronJobSpec(object):
+    """
+    io.k8s.api.batch.v1beta1.CronJobSpec: CronJobSpec describes how the job execution will look like and when it will
+    actually run.
+    """
+
+    __slots__ = (
+        "concurrency_policy",
+        "failed_jobs_history_limit",
+        "job_template",
+        "schedule",
+        "starting_deadline_seconds",
+        "successful_jobs_history_limit",
+        "suspend",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.concurrency_policy = get("concurrencyPolicy")
+        self.failed_jobs_history_limit = get("failedJobsHistoryLimit")
+        v = get("jobTemplate")
+        self.job_template = None if v is None else JobTemplateSpec(v)
+        self.schedule = get("schedule")
+        self.starting_deadline_seconds = get("startingDeadlineSeconds")
+        self.successful_jobs_history_limit = get("successfulJobsHistoryLimit")
+        self.suspend = get("suspend")
+
+    def serialize(self):
+        data = {}
+        v = self.concurrency_policy
+        if v is not None:
+            data["concurrencyPolicy"] = v
+        v = self.failed_jobs_history_limit
+        if v is not None:
+            data["failedJobsHistoryLimit"] = v
+        v = self.job_template
+        if v is not None:
+            data["jobTemplate"] = v.serialize()
+        v = self.schedule
+        if v is not None:
+            data["schedule"] = v
+        v = self.starting_deadline_seconds
+        if v is not None:
+            data["startingDeadlineSeconds"] = v
+        v = self.successful_jobs_history_limit
+        if v is not None:
+            data["successfulJobsHistoryLimit"] = v
+        v = self.suspend
+        if v is not None:
+            data["suspend"] = v
+        return data
+
+
+class CronJobStatus(object):
+    """
+    io.k8s.api.batch.v1beta1.CronJobStatus: CronJobStatus represents the current state of a cron job.
+    """
+
+    __slots__ = ("active", "last_schedule_time")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("active")
+        self.active = None if v is None else [core_v1.ObjectReference(x) for x in v]
+        self.last_schedule_time = get("lastScheduleTime")
+
+    def serialize(self):
+        data = {}
+        v = self.active
+        if v is not None:
+            data["active"] = [x.serialize() for x in v]
+        v = self.last_schedule_time
+        if v is not None:
+            data["lastScheduleTime"] = v
+        return data
+
+
+class JobTemplateSpec(object):
+    """
+    io.k8s.api.batch.v1beta1.JobTemplateSpec: JobTemplateSpec describes the data a Job should have when created from a
+    template
+    """
+
+    __slots__ = ("metadata", "spec")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else batch_v1.JobSpec(v)
+
+    def serialize(self):
+        data = {}
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        return data
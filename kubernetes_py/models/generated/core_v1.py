@@ -0,0 +1,6092 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/swagger-v1.10.json: do not edit.
+
+from kubernetes_py.models.generated import meta_v1
+
+
+class AWSElasticBlockStoreVolumeSource(object):
+    """
+    io.k8s.api.core.v1.AWSElasticBlockStoreVolumeSource: Represents a Persistent Disk resource in AWS.
+    """
+
+    __slots__ = ("fs_type", "partition", "read_only", "volume_id")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.partition = get("partition")
+        self.read_only = get("readOnly")
+        self.volume_id = get("volumeID")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.partition
+        if v is not None:
+            data["partition"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.volume_id
+        if v is not None:
+            data["volumeID"] = v
+        return data
+
+
+class Affinity(object):
+    """
+    io.k8s.api.core.v1.Affinity: Affinity is a group of affinity scheduling rules.
+    """
+
+    __slots__ = ("node_affinity", "pod_affinity", "pod_anti_affinity")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("nodeAffinity")
+        self.node_affinity = None if v is None else NodeAffinity(v)
+        v = get("podAffinity")
+        self.pod_affinity = None if v is None else PodAffinity(v)
+        v = get("podAntiAffinity")
+        self.pod_anti_affinity = None if v is None else PodAntiAffinity(v)
+
+    def serialize(self):
+        data = {}
+        v = self.node_affinity
+        if v is not None:
+            data["nodeAffinity"] = v.serialize()
+        v = self.pod_affinity
+        if v is not None:
+            data["podAffinity"] = v.serialize()
+        v = self.pod_anti_affinity
+        if v is not None:
+            data["podAntiAffinity"] = v.serialize()
+        return data
+
+
+class AttachedVolume(object):
+    """
+    io.k8s.api.core.v1.AttachedVolume: AttachedVolume describes a volume attached to a node
+    """
+
+    __slots__ = ("device_path", "name")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.device_path = get("devicePath")
+        self.name = get("name")
+
+    def serialize(self):
+        data = {}
+        v = self.device_path
+        if v is not None:
+            data["devicePath"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        return data
+
+
+class AzureDiskVolumeSource(object):
+    """
+    io.k8s.api.core.v1.AzureDiskVolumeSource: AzureDisk represents an Azure Data Disk mount on the host and bind mount
+    to the pod.
+    """
+
+    __slots__ = ("caching_mode", "disk_name", "disk_uri", "fs_type", "kind", "read_only")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.caching_mode = get("cachingMode")
+        self.disk_name = get("diskName")
+        self.disk_uri = get("diskURI")
+        self.fs_type = get("fsType")
+        self.kind = get("kind")
+        self.read_only = get("readOnly")
+
+    def serialize(self):
+        data = {}
+        v = self.caching_mode
+        if v is not None:
+            data["cachingMode"] = v
+        v = self.disk_name
+        if v is not None:
+            data["diskName"] = v
+        v = self.disk_uri
+        if v is not None:
+            data["diskURI"] = v
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        return data
+
+
+class AzureFilePersistentVolumeSource(object):
+    """
+    io.k8s.api.core.v1.AzureFilePersistentVolumeSource: AzureFile represents an Azure File Service mount on the host and
+    bind mount to the pod.
+    """
+
+    __slots__ = ("read_only", "secret_name", "secret_namespace", "share_name")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.read_only = get("readOnly")
+        self.secret_name = get("secretName")
+        self.secret_namespace = get("secretNamespace")
+        self.share_name = get("shareName")
+
+    def serialize(self):
+        data = {}
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_name
+        if v is not None:
+            data["secretName"] = v
+        v = self.secret_namespace
+        if v is not None:
+            data["secretNamespace"] = v
+        v = self.share_name
+        if v is not None:
+            data["shareName"] = v
+        return data
+
+
+class AzureFileVolumeSource(object):
+    """
+    io.k8s.api.core.v1.AzureFileVolumeSource: AzureFile represents an Azure File Service mount on the host and bind
+    mount to the pod.
+    """
+
+    __slots__ = ("read_only", "secret_name", "share_name")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.read_only = get("readOnly")
+        self.secret_name = get("secretName")
+        self.share_name = get("shareName")
+
+    def serialize(self):
+        data = {}
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_name
+        if v is not None:
+            data["secretName"] = v
+        v = self.share_name
+        if v is not None:
+            data["shareName"] = v
+        return data
+
+
+class CSIPersistentVolumeSource(object):
+    """
+    io.k8s.api.core.v1.CSIPersistentVolumeSource: Represents storage that is managed by an external CSI volume driver
+    (Beta feature)
+    """
+
+    __slots__ = (
+        "controller_publish_secret_ref",
+        "driver",
+        "fs_type",
+        "node_publish_secret_ref",
+        "node_stage_secret_ref",
+        "read_only",
+        "volume_attributes",
+        "volume_handle",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("controllerPublishSecretRef")
+        self.controller_publish_secret_ref = None if v is None else SecretReference(v)
+        self.driver = get("driver")
+        self.fs_type = get("fsType")
+        v = get("nodePublishSecretRef")
+        self.node_publish_secret_ref = None if v is None else SecretReference(v)
+        v = get("nodeStageSecretRef")
+        self.node_stage_secret_ref = None if v is None else SecretReference(v)
+        self.read_only = get("readOnly")
+        v = get("volumeAttributes")
+        self.volume_attributes = None if v is None else dict(v)
+        self.volume_handle = get("volumeHandle")
+
+    def serialize(self):
+        data = {}
+        v = self.controller_publish_secret_ref
+        if v is not None:
+            data["controllerPublishSecretRef"] = v.serialize()
+        v = self.driver
+        if v is not None:
+            data["driver"] = v
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.node_publish_secret_ref
+        if v is not None:
+            data["nodePublishSecretRef"] = v.serialize()
+        v = self.node_stage_secret_ref
+        if v is not None:
+            data["nodeStageSecretRef"] = v.serialize()
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.volume_attributes
+        if v is not None:
+            data["volumeAttributes"] = v
+        v = self.volume_handle
+        if v is not None:
+            data["volumeHandle"] = v
+        return data
+
+
+class Capabilities(object):
+    """
+    io.k8s.api.core.v1.Capabilities: Adds and removes POSIX capabilities from running containers.
+    """
+
+    __slots__ = ("add", "drop")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("add")
+        self.add = None if v is None else list(v)
+        v = get("drop")
+        self.drop = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.add
+        if v is not None:
+            data["add"] = v
+        v = self.drop
+        if v is not None:
+            data["drop"] = v
+        return data
+
+
+class CephFSPersistentVolumeSource(object):
+    """
+    io.k8s.api.core.v1.CephFSPersistentVolumeSource: Represents a Ceph Filesystem mount that lasts the lifetime of a pod
+    Cephfs volumes do not support ownership management or SELinux relabeling.
+    """
+
+    __slots__ = ("monitors", "path", "read_only", "secret_file", "secret_ref", "user")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("monitors")
+        self.monitors = None if v is None else list(v)
+        self.path = get("path")
+        self.read_only = get("readOnly")
+        self.secret_file = get("secretFile")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else SecretReference(v)
+        self.user = get("user")
+
+    def serialize(self):
+        data = {}
+        v = self.monitors
+        if v is not None:
+            data["monitors"] = v
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_file
+        if v is not None:
+            data["secretFile"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.user
+        if v is not None:
+            data["user"] = v
+        return data
+
+
+class CephFSVolumeSource(object):
+    """
+    io.k8s.api.core.v1.CephFSVolumeSource: Represents a Ceph Filesystem mount that lasts the lifetime of a pod Cephfs
+    volumes do not support ownership management or SELinux relabeling.
+    """
+
+    __slots__ = ("monitors", "path", "read_only", "secret_file", "secret_ref", "user")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("monitors")
+        self.monitors = None if v is None else list(v)
+        self.path = get("path")
+        self.read_only = get("readOnly")
+        self.secret_file = get("secretFile")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else LocalObjectReference(v)
+        self.user = get("user")
+
+    def serialize(self):
+        data = {}
+        v = self.monitors
+        if v is not None:
+            data["monitors"] = v
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_file
+        if v is not None:
+            data["secretFile"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.user
+        if v is not None:
+            data["user"] = v
+        return data
+
+
+class CinderVolumeSource(object):
+    """
+    io.k8s.api.core.v1.CinderVolumeSource: Represents a cinder volume resource in Openstack.
+    """
+
+    __slots__ = ("fs_type", "read_only", "volume_id")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.read_only = get("readOnly")
+        self.volume_id = get("volumeID")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.volume_id
+        if v is not None:
+            data["volumeID"] = v
+        return data
+
+
+class ClientIPConfig(object):
+    """
+    io.k8s.api.core.v1.ClientIPConfig: ClientIPConfig represents the configurations of Client IP based session affinity.
+    """
+
+    __slots__ = ("timeout_seconds",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.timeout_seconds = get("timeoutSeconds")
+
+    def serialize(self):
+        data = {}
+        v = self.timeout_seconds
+        if v is not None:
+            data["timeoutSeconds"] = v
+        return data
+
+
+class ComponentCondition(object):
+    """
+    io.k8s.api.core.v1.ComponentCondition: Information about the condition of a component.
+    """
+
+    __slots__ = ("error", "message", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.error = get("error")
+        self.message = get("message")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.error
+        if v is not None:
+            data["error"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class ComponentStatus(object):
+    """
+    io.k8s.api.core.v1.ComponentStatus: ComponentStatus (and ComponentStatusList) holds the cluster validation info.
+    """
+
+    __slots__ = ("api_version", "conditions", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("conditions")
+        self.conditions = None if v is None else [ComponentCondition(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class ComponentStatusList(object):
+    """
+    io.k8s.api.core.v1.ComponentStatusList: Status of all the conditions for the component as a list of ComponentStatus
+    objects.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [ComponentStatus(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class ConfigMap(object):
+    """
+    io.k8s.api.core.v1.ConfigMap: ConfigMap holds configuration data for pods to consume.
+    """
+
+    __slots__ = ("api_version", "binary_data", "data", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("binaryData")
+        self.binary_data = None if v is None else dict(v)
+        v = get("data")
+        self.data = None if v is None else dict(v)
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.binary_data
+        if v is not None:
+            data["binaryData"] = v
+        v = self.data
+        if v is not None:
+            data["data"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class ConfigMapEnvSource(object):
+    """
+    io.k8s.api.core.v1.ConfigMapEnvSource: ConfigMapEnvSource selects a ConfigMap to populate the environment variables
+    with.
+    """
+
+    __slots__ = ("name", "optional")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+        self.optional = get("optional")
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.optional
+        if v is not None:
+            data["optional"] = v
+        return data
+
+
+class ConfigMapKeySelector(object):
+    """
+    io.k8s.api.core.v1.ConfigMapKeySelector: Selects a key from a ConfigMap.
+    """
+
+    __slots__ = ("key", "name", "optional")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.key = get("key")
+        self.name = get("name")
+        self.optional = get("optional")
+
+    def serialize(self):
+        data = {}
+        v = self.key
+        if v is not None:
+            data["key"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.optional
+        if v is not None:
+            data["optional"] = v
+        return data
+
+
+class ConfigMapList(object):
+    """
+    io.k8s.api.core.v1.ConfigMapList: ConfigMapList is a resource containing a list of ConfigMap objects.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [ConfigMap(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class ConfigMapProjection(object):
+    """
+    io.k8s.api.core.v1.ConfigMapProjection: Adapts a ConfigMap into a projected volume.
+    """
+
+    __slots__ = ("items", "name", "optional")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("items")
+        self.items = None if v is None else [KeyToPath(x) for x in v]
+        self.name = get("name")
+        self.optional = get("optional")
+
+    def serialize(self):
+        data = {}
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.optional
+        if v is not None:
+            data["optional"] = v
+        return data
+
+
+class ConfigMapVolumeSource(object):
+    """
+    io.k8s.api.core.v1.ConfigMapVolumeSource: Adapts a ConfigMap into a volume.
+    """
+
+    __slots__ = ("default_mode", "items", "name", "optional")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.default_mode = get("defaultMode")
+        v = get("items")
+        self.items = None if v is None else [KeyToPath(x) for x in v]
+        self.name = get("name")
+        self.optional = get("optional")
+
+    def serialize(self):
+        data = {}
+        v = self.default_mode
+        if v is not None:
+            data["defaultMode"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.optional
+        if v is not None:
+            data["optional"] = v
+        return data
+
+
+class Container(object):
+    """
+    io.k8s.api.core.v1.Container: A single application container that you want to run within a pod.
+    """
+
+    __slots__ = (
+        "args",
+        "command",
+        "env",
+        "env_from",
+        "image",
+        "image_pull_policy",
+        "lifecycle",
+        "liveness_probe",
+        "name",
+        "ports",
+        "readiness_probe",
+        "resources",
+        "security_context",
+        "stdin",
+        "stdin_once",
+        "termination_message_path",
+        "termination_message_policy",
+        "tty",
+        "volume_devices",
+        "volume_mounts",
+        "working_dir",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("args")
+        self.args = None if v is None else list(v)
+        v = get("command")
+        self.command = None if v is None else list(v)
+        v = get("env")
+        self.env = None if v is None else [EnvVar(x) for x in v]
+        v = get("envFrom")
+        self.env_from = None if v is None else [EnvFromSource(x) for x in v]
+        self.image = get("image")
+        self.image_pull_policy = get("imagePullPolicy")
+        v = get("lifecycle")
+        self.lifecycle = None if v is None else Lifecycle(v)
+        v = get("livenessProbe")
+        self.liveness_probe = None if v is None else Probe(v)
+        self.name = get("name")
+        v = get("ports")
+        self.ports = None if v is None else [ContainerPort(x) for x in v]
+        v = get("readinessProbe")
+        self.readiness_probe = None if v is None else Probe(v)
+        v = get("resources")
+        self.resources = None if v is None else ResourceRequirements(v)
+        v = get("securityContext")
+        self.security_context = None if v is None else SecurityContext(v)
+        self.stdin = get("stdin")
+        self.stdin_once = get("stdinOnce")
+        self.termination_message_path = get("terminationMessagePath")
+        self.termination_message_policy = get("terminationMessagePolicy")
+        self.tty = get("tty")
+        v = get("volumeDevices")
+        self.volume_devices = None if v is None else [VolumeDevice(x) for x in v]
+        v = get("volumeMounts")
+        self.volume_mounts = None if v is None else [VolumeMount(x) for x in v]
+        self.working_dir = get("workingDir")
+
+    def serialize(self):
+        data = {}
+        v = self.args
+        if v is not None:
+            data["args"] = v
+        v = self.command
+        if v is not None:
+            data["command"] = v
+        v = self.env
+        if v is not None:
+            data["env"] = [x.serialize() for x in v]
+        v = self.env_from
+        if v is not None:
+            data["envFrom"] = [x.serialize() for x in v]
+        v = self.image
+        if v is not None:
+            data["image"] = v
+        v = self.image_pull_policy
+        if v is not None:
+            data["imagePullPolicy"] = v
+        v = self.lifecycle
+        if v is not None:
+            data["lifecycle"] = v.serialize()
+        v = self.liveness_probe
+        if v is not None:
+            data["livenessProbe"] = v.serialize()
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.ports
+        if v is not None:
+            data["ports"] = [x.serialize() for x in v]
+        v = self.readiness_probe
+        if v is not None:
+            data["readinessProbe"] = v.serialize()
+        v = self.resources
+        if v is not None:
+            data["resources"] = v.serialize()
+        v = self.security_context
+        if v is not None:
+            data["securityContext"] = v.serialize()
+        v = self.stdin
+        if v is not None:
+            data["stdin"] = v
+        v = self.stdin_once
+        if v is not None:
+            data["stdinOnce"] = v
+        v = self.termination_message_path
+        if v is not None:
+            data["terminationMessagePath"] = v
+        v = self.termination_message_policy
+        if v is not None:
+            data["terminationMessagePolicy"] = v
+        v = self.tty
+        if v is not None:
+            data["tty"] = v
+        v = self.volume_devices
+        if v is not None:
+            data["volumeDevices"] = [x.serialize() for x in v]
+        v = self.volume_mounts
+        if v is not None:
+            data["volumeMounts"] = [x.serialize() for x in v]
+        v = self.working_dir
+        if v is not None:
+            data["workingDir"] = v
+        return data
+
+
+class ContainerImage(object):
+    """
+    io.k8s.api.core.v1.ContainerImage: Describe a container image
+    """
+
+    __slots__ = ("names", "size_bytes")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("names")
+        self.names = None if v is None else list(v)
+        self.size_bytes = get("sizeBytes")
+
+    def serialize(self):
+        data = {}
+        v = self.names
+        if v is not None:
+            data["names"] = v
+        v = self.size_bytes
+        if v is not None:
+            data["sizeBytes"] = v
+        return data
+
+
+class ContainerPort(object):
+    """
+    io.k8s.api.core.v1.ContainerPort: ContainerPort represents a network port in a single container.
+    """
+
+    __slots__ = ("container_port", "host_ip", "host_port", "name", "protocol")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.container_port = get("containerPort")
+        self.host_ip = get("hostIP")
+        self.host_port = get("hostPort")
+        self.name = get("name")
+        self.protocol = get("protocol")
+
+    def serialize(self):
+        data = {}
+        v = self.container_port
+        if v is not None:
+            data["containerPort"] = v
+        v = self.host_ip
+        if v is not None:
+            data["hostIP"] = v
+        v = self.host_port
+        if v is not None:
+            data["hostPort"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.protocol
+        if v is not None:
+            data["protocol"] = v
+        return data
+
+
+class ContainerState(object):
+    """
+    io.k8s.api.core.v1.ContainerState: ContainerState holds a possible state of container.
+    """
+
+    __slots__ = ("running", "terminated", "waiting")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("running")
+        self.running = None if v is None else ContainerStateRunning(v)
+        v = get("terminated")
+        self.terminated = None if v is None else ContainerStateTerminated(v)
+        v = get("waiting")
+        self.waiting = None if v is None else ContainerStateWaiting(v)
+
+    def serialize(self):
+        data = {}
+        v = self.running
+        if v is not None:
+            data["running"] = v.serialize()
+        v = self.terminated
+        if v is not None:
+            data["terminated"] = v.serialize()
+        v = self.waiting
+        if v is not None:
+            data["waiting"] = v.serialize()
+        return data
+
+
+class ContainerStateRunning(object):
+    """
+    io.k8s.api.core.v1.ContainerStateRunning: ContainerStateRunning is a running state of a container.
+    """
+
+    __slots__ = ("started_at",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.started_at = get("startedAt")
+
+    def serialize(self):
+        data = {}
+        v = self.started_at
+        if v is not None:
+            data["startedAt"] = v
+        return data
+
+
+class ContainerStateTerminated(object):
+    """
+    io.k8s.api.core.v1.ContainerStateTerminated: ContainerStateTerminated is a terminated state of a container.
+    """
+
+    __slots__ = ("container_id", "exit_code", "finished_at", "message", "reason", "signal", "started_at")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.container_id = get("containerID")
+        self.exit_code = get("exitCode")
+        self.finished_at = get("finishedAt")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.signal = get("signal")
+        self.started_at = get("startedAt")
+
+    def serialize(self):
+        data = {}
+        v = self.container_id
+        if v is not None:
+            data["containerID"] = v
+        v = self.exit_code
+        if v is not None:
+            data["exitCode"] = v
+        v = self.finished_at
+        if v is not None:
+            data["finishedAt"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.signal
+        if v is not None:
+            data["signal"] = v
+        v = self.started_at
+        if v is not None:
+            data["startedAt"] = v
+        return data
+
+
+class ContainerStateWaiting(object):
+    """
+    io.k8s.api.core.v1.ContainerStateWaiting: ContainerStateWaiting is a waiting state of a container.
+    """
+
+    __slots__ = ("message", "reason")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.message = get("message")
+        self.reason = get("reason")
+
+    def serialize(self):
+        data = {}
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        return data
+
+
+class ContainerStatus(object):
+    """
+    io.k8s.api.core.v1.ContainerStatus: ContainerStatus contains details for the current status of this container.
+    """
+
+    __slots__ = ("container_id", "image", "image_id", "last_state", "name", "ready", "restart_count", "state")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.container_id = get("containerID")
+        self.image = get("image")
+        self.image_id = get("imageID")
+        v = get("lastState")
+        self.last_state = None if v is None else ContainerState(v)
+        self.name = get("name")
+        self.ready = get("ready")
+        self.restart_count = get("restartCount")
+        v = get("state")
+        self.state = None if v is None else ContainerState(v)
+
+    def serialize(self):
+        data = {}
+        v = self.container_id
+        if v is not None:
+            data["containerID"] = v
+        v = self.image
+        if v is not None:
+            data["image"] = v
+        v = self.image_id
+        if v is not None:
+            data["imageID"] = v
+        v = self.last_state
+        if v is not None:
+            data["lastState"] = v.serialize()
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.ready
+        if v is not None:
+            data["ready"] = v
+        v = self.restart_count
+        if v is not None:
+            data["restartCount"] = v
+        v = self.state
+        if v is not None:
+            data["state"] = v.serialize()
+        return data
+
+
+class DaemonEndpoint(object):
+    """
+    io.k8s.api.core.v1.DaemonEndpoint: DaemonEndpoint contains information about a single Daemon endpoint.
+    """
+
+    __slots__ = ("port",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.port = get("Port")
+
+    def serialize(self):
+        data = {}
+        v = self.port
+        if v is not None:
+            data["Port"] = v
+        return data
+
+
+class DownwardAPIProjection(object):
+    """
+    io.k8s.api.core.v1.DownwardAPIProjection: Represents downward API info for projecting into a projected volume.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("items")
+        self.items = None if v is None else [DownwardAPIVolumeFile(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        return data
+
+
+class DownwardAPIVolumeFile(object):
+    """
+    io.k8s.api.core.v1.DownwardAPIVolumeFile: DownwardAPIVolumeFile represents information to create the file containing
+    the pod field
+    """
+
+    __slots__ = ("field_ref", "mode", "path", "resource_field_ref")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("fieldRef")
+        self.field_ref = None if v is None else ObjectFieldSelector(v)
+        self.mode = get("mode")
+        self.path = get("path")
+        v = get("resourceFieldRef")
+        self.resource_field_ref = None if v is None else ResourceFieldSelector(v)
+
+    def serialize(self):
+        data = {}
+        v = self.field_ref
+        if v is not None:
+            data["fieldRef"] = v.serialize()
+        v = self.mode
+        if v is not None:
+            data["mode"] = v
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        v = self.resource_field_ref
+        if v is not None:
+            data["resourceFieldRef"] = v.serialize()
+        return data
+
+
+class DownwardAPIVolumeSource(object):
+    """
+    io.k8s.api.core.v1.DownwardAPIVolumeSource: DownwardAPIVolumeSource represents a volume containing downward API
+    info.
+    """
+
+    __slots__ = ("default_mode", "items")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.default_mode = get("defaultMode")
+        v = get("items")
+        self.items = None if v is None else [DownwardAPIVolumeFile(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.default_mode
+        if v is not None:
+            data["defaultMode"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        return data
+
+
+class EmptyDirVolumeSource(object):
+    """
+    io.k8s.api.core.v1.EmptyDirVolumeSource: Represents an empty directory for a pod.
+    """
+
+    __slots__ = ("medium", "size_limit")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.medium = get("medium")
+        self.size_limit = get("sizeLimit")
+
+    def serialize(self):
+        data = {}
+        v = self.medium
+        if v is not None:
+            data["medium"] = v
+        v = self.size_limit
+        if v is not None:
+            data["sizeLimit"] = v
+        return data
+
+
+class EnvFromSource(object):
+    """
+    io.k8s.api.core.v1.EnvFromSource: EnvFromSource represents the source of a set of ConfigMaps
+    """
+
+    __slots__ = ("config_map_ref", "prefix", "secret_ref")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("configMapRef")
+        self.config_map_ref = None if v is None else ConfigMapEnvSource(v)
+        self.prefix = get("prefix")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else SecretEnvSource(v)
+
+    def serialize(self):
+        data = {}
+        v = self.config_map_ref
+        if v is not None:
+            data["configMapRef"] = v.serialize()
+        v = self.prefix
+        if v is not None:
+            data["prefix"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        return data
+
+
+class EnvVar(object):
+    """
+    io.k8s.api.core.v1.EnvVar: EnvVar represents an environment variable present in a Container.
+    """
+
+    __slots__ = ("name", "value", "value_from")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+        self.value = get("value")
+        v = get("valueFrom")
+        self.value_from = None if v is None else EnvVarSource(v)
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.value
+        if v is not None:
+            data["value"] = v
+        v = self.value_from
+        if v is not None:
+            data["valueFrom"] = v.serialize()
+        return data
+
+
+class EnvVarSource(object):
+    """
+    io.k8s.api.core.v1.EnvVarSource: EnvVarSource represents a source for the value of an EnvVar.
+    """
+
+    __slots__ = ("config_map_key_ref", "field_ref", "resource_field_ref", "secret_key_ref")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("configMapKeyRef")
+        self.config_map_key_ref = None if v is None else ConfigMapKeySelector(v)
+        v = get("fieldRef")
+        self.field_ref = None if v is None else ObjectFieldSelector(v)
+        v = get("resourceFieldRef")
+        self.resource_field_ref = None if v is None else ResourceFieldSelector(v)
+        v = get("secretKeyRef")
+        self.secret_key_ref = None if v is None else SecretKeySelector(v)
+
+    def serialize(self):
+        data = {}
+        v = self.config_map_key_ref
+        if v is not None:
+            data["configMapKeyRef"] = v.serialize()
+        v = self.field_ref
+        if v is not None:
+            data["fieldRef"] = v.serialize()
+        v = self.resource_field_ref
+        if v is not None:
+            data["resourceFieldRef"] = v.serialize()
+        v = self.secret_key_ref
+        if v is not None:
+            data["secretKeyRef"] = v.serialize()
+        return data
+
+
+class Event(object):
+    """
+    io.k8s.api.core.v1.Event: Event is a report of an event somewhere in the cluster.
+    """
+
+    __slots__ = (
+        "action",
+        "api_version",
+        "count",
+        "event_time",
+        "first_timestamp",
+        "involved_object",
+        "kind",
+        "last_timestamp",
+        "message",
+        "metadata",
+        "reason",
+        "related",
+        "reporting_component",
+        "reporting_instance",
+        "series",
+        "source",
+        "type",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.action = get("action")
+        self.api_version = get("apiVersion")
+        self.count = get("count")
+        self.event_time = get("eventTime")
+        self.first_timestamp = get("firstTimestamp")
+        v = get("involvedObject")
+        self.involved_object = None if v is None else ObjectReference(v)
+        self.kind = get("kind")
+        self.last_timestamp = get("lastTimestamp")
+        self.message = get("message")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        self.reason = get("reason")
+        v = get("related")
+        self.related = None if v is None else ObjectReference(v)
+        self.reporting_component = get("reportingComponent")
+        self.reporting_instance = get("reportingInstance")
+        v = get("series")
+        self.series = None if v is None else EventSeries(v)
+        v = get("source")
+        self.source = None if v is None else EventSource(v)
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.action
+        if v is not None:
+            data["action"] = v
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.count
+        if v is not None:
+            data["count"] = v
+        v = self.event_time
+        if v is not None:
+            data["eventTime"] = v
+        v = self.first_timestamp
+        if v is not None:
+            data["firstTimestamp"] = v
+        v = self.involved_object
+        if v is not None:
+            data["involvedObject"] = v.serialize()
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.last_timestamp
+        if v is not None:
+            data["lastTimestamp"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.related
+        if v is not None:
+            data["related"] = v.serialize()
+        v = self.reporting_component
+        if v is not None:
+            data["reportingComponent"] = v
+        v = self.reporting_instance
+        if v is not None:
+            data["reportingInstance"] = v
+        v = self.series
+        if v is not None:
+            data["series"] = v.serialize()
+        v = self.source
+        if v is not None:
+            data["source"] = v.serialize()
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class EventList(object):
+    """
+    io.k8s.api.core.v1.EventList: EventList is a list of events.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [Event(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class EventSeries(object):
+    """
+    io.k8s.api.core.v1.EventSeries: EventSeries contain information on series of events, i.e.
+    """
+
+    __slots__ = ("count", "last_observed_time", "state")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.count = get("count")
+        self.last_observed_time = get("lastObservedTime")
+        self.state = get("state")
+
+    def serialize(self):
+        data = {}
+        v = self.count
+        if v is not None:
+            data["count"] = v
+        v = self.last_observed_time
+        if v is not None:
+            data["lastObservedTime"] = v
+        v = self.state
+        if v is not None:
+            data["state"] = v
+        return data
+
+
+class EventSource(object):
+    """
+    io.k8s.api.core.v1.EventSource: EventSource contains information for an event.
+    """
+
+    __slots__ = ("component", "host")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.component = get("component")
+        self.host = get("host")
+
+    def serialize(self):
+        data = {}
+        v = self.component
+        if v is not None:
+            data["component"] = v
+        v = self.host
+        if v is not None:
+            data["host"] = v
+        return data
+
+
+class ExecAction(object):
+    """
+    io.k8s.api.core.v1.ExecAction: ExecAction describes a "run in container" action.
+    """
+
+    __slots__ = ("command",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("command")
+        self.command = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.command
+        if v is not None:
+            data["command"] = v
+        return data
+
+
+class FCVolumeSource(object):
+    """
+    io.k8s.api.core.v1.FCVolumeSource: Represents a Fibre Channel volume.
+    """
+
+    __slots__ = ("fs_type", "lun", "read_only", "target_wwns", "wwids")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.lun = get("lun")
+        self.read_only = get("readOnly")
+        v = get("targetWWNs")
+        self.target_wwns = None if v is None else list(v)
+        v = get("wwids")
+        self.wwids = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.lun
+        if v is not None:
+            data["lun"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.target_wwns
+        if v is not None:
+            data["targetWWNs"] = v
+        v = self.wwids
+        if v is not None:
+            data["wwids"] = v
+        return data
+
+
+class FlexPersistentVolumeSource(object):
+    """
+    io.k8s.api.core.v1.FlexPersistentVolumeSource: FlexPersistentVolumeSource represents a generic persistent volume
+    resource that is provisioned/attached using an exec based plugin.
+    """
+
+    __slots__ = ("driver", "fs_type", "options", "read_only", "secret_ref")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.driver = get("driver")
+        self.fs_type = get("fsType")
+        v = get("options")
+        self.options = None if v is None else dict(v)
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else SecretReference(v)
+
+    def serialize(self):
+        data = {}
+        v = self.driver
+        if v is not None:
+            data["driver"] = v
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.options
+        if v is not None:
+            data["options"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        return data
+
+
+class FlexVolumeSource(object):
+    """
+    io.k8s.api.core.v1.FlexVolumeSource: FlexVolume represents a generic volume resource that is provisioned/attached
+    using an exec based plugin.
+    """
+
+    __slots__ = ("driver", "fs_type", "options", "read_only", "secret_ref")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.driver = get("driver")
+        self.fs_type = get("fsType")
+        v = get("options")
+        self.options = None if v is None else dict(v)
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else LocalObjectReference(v)
+
+    def serialize(self):
+        data = {}
+        v = self.driver
+        if v is not None:
+            data["driver"] = v
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.options
+        if v is not None:
+            data["options"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        return data
+
+
+class FlockerVolumeSource(object):
+    """
+    io.k8s.api.core.v1.FlockerVolumeSource: Represents a Flocker volume mounted by the Flocker agent.
+    """
+
+    __slots__ = ("dataset_name", "dataset_uuid")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.dataset_name = get("datasetName")
+        self.dataset_uuid = get("datasetUUID")
+
+    def serialize(self):
+        data = {}
+        v = self.dataset_name
+        if v is not None:
+            data["datasetName"] = v
+        v = self.dataset_uuid
+        if v is not None:
+            data["datasetUUID"] = v
+        return data
+
+
+class GCEPersistentDiskVolumeSource(object):
+    """
+    io.k8s.api.core.v1.GCEPersistentDiskVolumeSource: Represents a Persistent Disk resource in Google Compute Engine.
+    """
+
+    __slots__ = ("fs_type", "partition", "pd_name", "read_only")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.partition = get("partition")
+        self.pd_name = get("pdName")
+        self.read_only = get("readOnly")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.partition
+        if v is not None:
+            data["partition"] = v
+        v = self.pd_name
+        if v is not None:
+            data["pdName"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        return data
+
+
+class GitRepoVolumeSource(object):
+    """
+    io.k8s.api.core.v1.GitRepoVolumeSource: Represents a volume that is populated with the contents of a git repository.
+    """
+
+    __slots__ = ("directory", "repository", "revision")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.directory = get("directory")
+        self.repository = get("repository")
+        self.revision = get("revision")
+
+    def serialize(self):
+        data = {}
+        v = self.directory
+        if v is not None:
+            data["directory"] = v
+        v = self.repository
+        if v is not None:
+            data["repository"] = v
+        v = self.revision
+        if v is not None:
+            data["revision"] = v
+        return data
+
+
+class GlusterfsVolumeSource(object):
+    """
+    io.k8s.api.core.v1.GlusterfsVolumeSource: Represents a Glusterfs mount that lasts the lifetime of a pod.
+    """
+
+    __slots__ = ("endpoints", "path", "read_only")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.endpoints = get("endpoints")
+        self.path = get("path")
+        self.read_only = get("readOnly")
+
+    def serialize(self):
+        data = {}
+        v = self.endpoints
+        if v is not None:
+            data["endpoints"] = v
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        return data
+
+
+class HTTPGetAction(object):
+    """
+    io.k8s.api.core.v1.HTTPGetAction: HTTPGetAction describes an action based on HTTP Get requests.
+    """
+
+    __slots__ = ("host", "http_headers", "path", "port", "scheme")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.host = get("host")
+        v = get("httpHeaders")
+        self.http_headers = None if v is None else [HTTPHeader(x) for x in v]
+        self.path = get("path")
+        self.port = get("port")
+        self.scheme = get("scheme")
+
+    def serialize(self):
+        data = {}
+        v = self.host
+        if v is not None:
+            data["host"] = v
+        v = self.http_headers
+        if v is not None:
+            data["httpHeaders"] = [x.serialize() for x in v]
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        v = self.port
+        if v is not None:
+            data["port"] = v
+        v = self.scheme
+        if v is not None:
+            data["scheme"] = v
+        return data
+
+
+class HTTPHeader(object):
+    """
+    io.k8s.api.core.v1.HTTPHeader: HTTPHeader describes a custom header to be used in HTTP probes
+    """
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+        self.value = get("value")
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.value
+        if v is not None:
+            data["value"] = v
+        return data
+
+
+class Handler(object):
+    """
+    io.k8s.api.core.v1.Handler: Handler defines a specific action that should be taken
+    """
+
+    __slots__ = ("exec", "http_get", "tcp_socket")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("exec")
+        self.exec = None if v is None else ExecAction(v)
+        v = get("httpGet")
+        self.http_get = None if v is None else HTTPGetAction(v)
+        v = get("tcpSocket")
+        self.tcp_socket = None if v is None else TCPSocketAction(v)
+
+    def serialize(self):
+        data = {}
+        v = self.exec
+        if v is not None:
+            data["exec"] = v.serialize()
+        v = self.http_get
+        if v is not None:
+            data["httpGet"] = v.serialize()
+        v = self.tcp_socket
+        if v is not None:
+            data["tcpSocket"] = v.serialize()
+        return data
+
+
+class HostAlias(object):
+    """
+    io.k8s.api.core.v1.HostAlias: HostAlias holds the mapping between IP and hostnames that will be injected as an entry
+    in the pod's hosts file.
+    """
+
+    __slots__ = ("hostnames", "ip")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("hostnames")
+        self.hostnames = None if v is None else list(v)
+        self.ip = get("ip")
+
+    def serialize(self):
+        data = {}
+        v = self.hostnames
+        if v is not None:
+            data["hostnames"] = v
+        v = self.ip
+        if v is not None:
+            data["ip"] = v
+        return data
+
+
+class HostPathVolumeSource(object):
+    """
+    io.k8s.api.core.v1.HostPathVolumeSource: Represents a host path mapped into a pod.
+    """
+
+    __slots__ = ("path", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.path = get("path")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class ISCSIPersistentVolumeSource(object):
+    """
+    io.k8s.api.core.v1.ISCSIPersistentVolumeSource: ISCSIPersistentVolumeSource represents an ISCSI disk.
+    """
+
+    __slots__ = (
+        "chap_auth_discovery",
+        "chap_auth_session",
+        "fs_type",
+        "initiator_name",
+        "iqn",
+        "iscsi_interface",
+        "lun",
+        "portals",
+        "read_only",
+        "secret_ref",
+        "target_portal",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.chap_auth_discovery = get("chapAuthDiscovery")
+        self.chap_auth_session = get("chapAuthSession")
+        self.fs_type = get("fsType")
+        self.initiator_name = get("initiatorName")
+        self.iqn = get("iqn")
+        self.iscsi_interface = get("iscsiInterface")
+        self.lun = get("lun")
+        v = get("portals")
+        self.portals = None if v is None else list(v)
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else SecretReference(v)
+        self.target_portal = get("targetPortal")
+
+    def serialize(self):
+        data = {}
+        v = self.chap_auth_discovery
+        if v is not None:
+            data["chapAuthDiscovery"] = v
+        v = self.chap_auth_session
+        if v is not None:
+            data["chapAuthSession"] = v
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.initiator_name
+        if v is not None:
+            data["initiatorName"] = v
+        v = self.iqn
+        if v is not None:
+            data["iqn"] = v
+        v = self.iscsi_interface
+        if v is not None:
+            data["iscsiInterface"] = v
+        v = self.lun
+        if v is not None:
+            data["lun"] = v
+        v = self.portals
+        if v is not None:
+            data["portals"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.target_portal
+        if v is not None:
+            data["targetPortal"] = v
+        return data
+
+
+class ISCSIVolumeSource(object):
+    """
+    io.k8s.api.core.v1.ISCSIVolumeSource: Represents an ISCSI disk.
+    """
+
+    __slots__ = (
+        "chap_auth_discovery",
+        "chap_auth_session",
+        "fs_type",
+        "initiator_name",
+        "iqn",
+        "iscsi_interface",
+        "lun",
+        "portals",
+        "read_only",
+        "secret_ref",
+        "target_portal",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.chap_auth_discovery = get("chapAuthDiscovery")
+        self.chap_auth_session = get("chapAuthSession")
+        self.fs_type = get("fsType")
+        self.initiator_name = get("initiatorName")
+        self.iqn = get("iqn")
+        self.iscsi_interface = get("iscsiInterface")
+        self.lun = get("lun")
+        v = get("portals")
+        self.portals = None if v is None else list(v)
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else LocalObjectReference(v)
+        self.target_portal = get("targetPortal")
+
+    def serialize(self):
+        data = {}
+        v = self.chap_auth_discovery
+        if v is not None:
+            data["chapAuthDiscovery"] = v
+        v = self.chap_auth_session
+        if v is not None:
+            data["chapAuthSession"] = v
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.initiator_name
+        if v is not None:
+            data["initiatorName"] = v
+        v = self.iqn
+        if v is not None:
+            data["iqn"] = v
+        v = self.iscsi_interface
+        if v is not None:
+            data["iscsiInterface"] = v
+        v = self.lun
+        if v is not None:
+            data["lun"] = v
+        v = self.portals
+        if v is not None:
+            data["portals"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.target_portal
+        if v is not None:
+            data["targetPortal"] = v
+        return data
+
+
+class KeyToPath(object):
+    """
+    io.k8s.api.core.v1.KeyToPath: Maps a string key to a path within a volume.
+    """
+
+    __slots__ = ("key", "mode", "path")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.key = get("key")
+        self.mode = get("mode")
+        self.path = get("path")
+
+    def serialize(self):
+        data = {}
+        v = self.key
+        if v is not None:
+            data["key"] = v
+        v = self.mode
+        if v is not None:
+            data["mode"] = v
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        return data
+
+
+class Lifecycle(object):
+    """
+    io.k8s.api.core.v1.Lifecycle: Lifecycle describes actions that the management system should take in response to
+    container lifecycle events.
+    """
+
+    __slots__ = ("post_start", "pre_stop")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("postStart")
+        self.post_start = None if v is None else Handler(v)
+        v = get("preStop")
+        self.pre_stop = None if v is None else Handler(v)
+
+    def serialize(self):
+        data = {}
+        v = self.post_start
+        if v is not None:
+            data["postStart"] = v.serialize()
+        v = self.pre_stop
+        if v is not None:
+            data["preStop"] = v.serialize()
+        return data
+
+
+class LoadBalancerIngress(object):
+    """
+    io.k8s.api.core.v1.LoadBalancerIngress: LoadBalancerIngress represents the status of a load-balancer ingress point:
+    traffic intended for the service should be sent to an ingress point.
+    """
+
+    __slots__ = ("hostname", "ip")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.hostname = get("hostname")
+        self.ip = get("ip")
+
+    def serialize(self):
+        data = {}
+        v = self.hostname
+        if v is not None:
+            data["hostname"] = v
+        v = self.ip
+        if v is not None:
+            data["ip"] = v
+        return data
+
+
+class LoadBalancerStatus(object):
+    """
+    io.k8s.api.core.v1.LoadBalancerStatus: LoadBalancerStatus represents the status of a load-balancer.
+    """
+
+    __slots__ = ("ingress",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("ingress")
+        self.ingress = None if v is None else [LoadBalancerIngress(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.ingress
+        if v is not None:
+            data["ingress"] = [x.serialize() for x in v]
+        return data
+
+
+class LocalObjectReference(object):
+    """
+    io.k8s.api.core.v1.LocalObjectReference: LocalObjectReference contains enough information to let you locate the
+    referenced object inside the same namespace.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        return data
+
+
+class LocalVolumeSource(object):
+    """
+    io.k8s.api.core.v1.LocalVolumeSource: Local represents directly-attached storage with node affinity
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.path = get("path")
+
+    def serialize(self):
+        data = {}
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        return data
+
+
+class NFSVolumeSource(object):
+    """
+    io.k8s.api.core.v1.NFSVolumeSource: Represents an NFS mount that lasts the lifetime of a pod.
+    """
+
+    __slots__ = ("path", "read_only", "server")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.path = get("path")
+        self.read_only = get("readOnly")
+        self.server = get("server")
+
+    def serialize(self):
+        data = {}
+        v = self.path
+        if v is not None:
+            data["path"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.server
+        if v is not None:
+            data["server"] = v
+        return data
+
+
+class Namespace(object):
+    """
+    io.k8s.api.core.v1.Namespace: Namespace provides a scope for Names.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else NamespaceSpec(v)
+        v = get("status")
+        self.status = None if v is None else NamespaceStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class NamespaceList(object):
+    """
+    io.k8s.api.core.v1.NamespaceList: NamespaceList is a list of Namespaces.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [Namespace(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class NamespaceSpec(object):
+    """
+    io.k8s.api.core.v1.NamespaceSpec: NamespaceSpec describes the attributes on a Namespace.
+    """
+
+    __slots__ = ("finalizers",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("finalizers")
+        self.finalizers = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.finalizers
+        if v is not None:
+            data["finalizers"] = v
+        return data
+
+
+class NamespaceStatus(object):
+    """
+    io.k8s.api.core.v1.NamespaceStatus: NamespaceStatus is information about the current status of a Namespace.
+    """
+
+    __slots__ = ("phase",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.phase = get("phase")
+
+    def serialize(self):
+        data = {}
+        v = self.phase
+        if v is not None:
+            data["phase"] = v
+        return data
+
+
+class Node(object):
+    """
+    io.k8s.api.core.v1.Node: Node is a worker node in Kubernetes.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else NodeSpec(v)
+        v = get("status")
+        self.status = None if v is None else NodeStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class NodeAddress(object):
+    """
+    io.k8s.api.core.v1.NodeAddress: NodeAddress contains information for the node's address.
+    """
+
+    __slots__ = ("address", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.address = get("address")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.address
+        if v is not None:
+            data["address"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class NodeAffinity(object):
+    """
+    io.k8s.api.core.v1.NodeAffinity: Node affinity is a group of node affinity scheduling rules.
+    """
+
+    __slots__ = (
+        "preferred_during_scheduling_ignored_during_execution",
+        "required_during_scheduling_ignored_during_execution",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("preferredDuringSchedulingIgnoredDuringExecution")
+        self.preferred_during_scheduling_ignored_during_execution = (
+            None if v is None else [PreferredSchedulingTerm(x) for x in v]
+        )
+        v = get("requiredDuringSchedulingIgnoredDuringExecution")
+        self.required_during_scheduling_ignored_during_execution = None if v is None else NodeSelector(v)
+
+    def serialize(self):
+        data = {}
+        v = self.preferred_during_scheduling_ignored_during_execution
+        if v is not None:
+            data["preferredDuringSchedulingIgnoredDuringExecution"] = [x.serialize() for x in v]
+        v = self.required_during_scheduling_ignored_during_execution
+        if v is not None:
+            data["requiredDuringSchedulingIgnoredDuringExecution"] = v.serialize()
+        return data
+
+
+class NodeCondition(object):
+    """
+    io.k8s.api.core.v1.NodeCondition: NodeCondition contains condition information for a node.
+    """
+
+    __slots__ = ("last_heartbeat_time", "last_transition_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_heartbeat_time = get("lastHeartbeatTime")
+        self.last_transition_time = get("lastTransitionTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_heartbeat_time
+        if v is not None:
+            data["lastHeartbeatTime"] = v
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class NodeConfigSource(object):
+    """
+    io.k8s.api.core.v1.NodeConfigSource: NodeConfigSource specifies a source of node configuration.
+    """
+
+    __slots__ = ("api_version", "config_map_ref", "kind")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("configMapRef")
+        self.config_map_ref = None if v is None else ObjectReference(v)
+        self.kind = get("kind")
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.config_map_ref
+        if v is not None:
+            data["configMapRef"] = v.serialize()
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        return data
+
+
+class NodeDaemonEndpoints(object):
+    """
+    io.k8s.api.core.v1.NodeDaemonEndpoints: NodeDaemonEndpoints lists ports opened by daemons running on the Node.
+    """
+
+    __slots__ = ("kubelet_endpoint",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("kubeletEndpoint")
+        self.kubelet_endpoint = None if v is None else DaemonEndpoint(v)
+
+    def serialize(self):
+        data = {}
+        v = self.kubelet_endpoint
+        if v is not None:
+            data["kubeletEndpoint"] = v.serialize()
+        return data
+
+
+class NodeList(object):
+    """
+    io.k8s.api.core.v1.NodeList: NodeList is the whole list of all Nodes which have been registered with master.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [Node(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class NodeSelector(object):
+    """
+    io.k8s.api.core.v1.NodeSelector: A node selector represents the union of the results of one or more label queries
+    over a set of nodes; that is, it represents the OR of the selectors represented by the node selector terms.
+    """
+
+    __slots__ = ("node_selector_terms",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("nodeSelectorTerms")
+        self.node_selector_terms = None if v is None else [NodeSelectorTerm(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.node_selector_terms
+        if v is not None:
+            data["nodeSelectorTerms"] = [x.serialize() for x in v]
+        return data
+
+
+class NodeSelectorRequirement(object):
+    """
+    io.k8s.api.core.v1.NodeSelectorRequirement: A node selector requirement is a selector that contains values, a key,
+    and an operator that relates the key and values.
+    """
+
+    __slots__ = ("key", "operator", "values")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.key = get("key")
+        self.operator = get("operator")
+        v = get("values")
+        self.values = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.key
+        if v is not None:
+            data["key"] = v
+        v = self.operator
+        if v is not None:
+            data["operator"] = v
+        v = self.values
+        if v is not None:
+            data["values"] = v
+        return data
+
+
+class NodeSelectorTerm(object):
+    """
+    io.k8s.api.core.v1.NodeSelectorTerm: A null or empty node selector term matches no objects.
+    """
+
+    __slots__ = ("match_expressions",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("matchExpressions")
+        self.match_expressions = None if v is None else [NodeSelectorRequirement(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.match_expressions
+        if v is not None:
+            data["matchExpressions"] = [x.serialize() for x in v]
+        return data
+
+
+class NodeSpec(object):
+    """
+    io.k8s.api.core.v1.NodeSpec: NodeSpec describes the attributes that a node is created with.
+    """
+
+    __slots__ = ("config_source", "external_id", "pod_cidr", "provider_id", "taints", "unschedulable")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("configSource")
+        self.config_source = None if v is None else NodeConfigSource(v)
+        self.external_id = get("externalID")
+        self.pod_cidr = get("podCIDR")
+        self.provider_id = get("providerID")
+        v = get("taints")
+        self.taints = None if v is None else [Taint(x) for x in v]
+        self.unschedulable = get("unschedulable")
+
+    def serialize(self):
+        data = {}
+        v = self.config_source
+        if v is not None:
+            data["configSource"] = v.serialize()
+        v = self.external_id
+        if v is not None:
+            data["externalID"] = v
+        v = self.pod_cidr
+        if v is not None:
+            data["podCIDR"] = v
+        v = self.provider_id
+        if v is not None:
+            data["providerID"] = v
+        v = self.taints
+        if v is not None:
+            data["taints"] = [x.serialize() for x in v]
+        v = self.unschedulable
+        if v is not None:
+            data["unschedulable"] = v
+        return data
+
+
+class NodeStatus(object):
+    """
+    io.k8s.api.core.v1.NodeStatus: NodeStatus is information about the current status of a node.
+    """
+
+    __slots__ = (
+        "addresses",
+        "allocatable",
+        "capacity",
+        "conditions",
+        "daemon_endpoints",
+        "images",
+        "node_info",
+        "phase",
+        "volumes_attached",
+        "volumes_in_use",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("addresses")
+        self.addresses = None if v is None else [NodeAddress(x) for x in v]
+        v = get("allocatable")
+        self.allocatable = None if v is None else dict(v)
+        v = get("capacity")
+        self.capacity = None if v is None else dict(v)
+        v = get("conditions")
+        self.conditions = None if v is None else [NodeCondition(x) for x in v]
+        v = get("daemonEndpoints")
+        self.daemon_endpoints = None if v is None else NodeDaemonEndpoints(v)
+        v = get("images")
+        self.images = None if v is None else [ContainerImage(x) for x in v]
+        v = get("nodeInfo")
+        self.node_info = None if v is None else NodeSystemInfo(v)
+        self.phase = get("phase")
+        v = get("volumesAttached")
+        self.volumes_attached = None if v is None else [AttachedVolume(x) for x in v]
+        v = get("volumesInUse")
+        self.volumes_in_use = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.addresses
+        if v is not None:
+            data["addresses"] = [x.serialize() for x in v]
+        v = self.allocatable
+        if v is not None:
+            data["allocatable"] = v
+        v = self.capacity
+        if v is not None:
+            data["capacity"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.daemon_endpoints
+        if v is not None:
+            data["daemonEndpoints"] = v.serialize()
+        v = self.images
+        if v is not None:
+            data["images"] = [x.serialize() for x in v]
+        v = self.node_info
+        if v is not None:
+            data["nodeInfo"] = v.serialize()
+        v = self.phase
+        if v is not None:
+            data["phase"] = v
+        v = self.volumes_attached
+        if v is not None:
+            data["volumesAttached"] = [x.serialize() for x in v]
+        v = self.volumes_in_use
+        if v is not None:
+            data["volumesInUse"] = v
+        return data
+
+
+class NodeSystemInfo(object):
+    """
+    io.k8s.api.core.v1.NodeSystemInfo: NodeSystemInfo is a set of ids/uuids to uniquely identify the node.
+    """
+
+    __slots__ = (
+        "architecture",
+        "boot_id",
+        "container_runtime_version",
+        "kernel_version",
+        "kube_proxy_version",
+        "kubelet_version",
+        "machine_id",
+        "operating_system",
+        "os_image",
+        "system_uuid",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.architecture = get("architecture")
+        self.boot_id = get("bootID")
+        self.container_runtime_version = get("containerRuntimeVersion")
+        self.kernel_version = get("kernelVersion")
+        self.kube_proxy_version = get("kubeProxyVersion")
+        self.kubelet_version = get("kubeletVersion")
+        self.machine_id = get("machineID")
+        self.operating_system = get("operatingSystem")
+        self.os_image = get("osImage")
+        self.system_uuid = get("systemUUID")
+
+    def serialize(self):
+        data = {}
+        v = self.architecture
+        if v is not None:
+            data["architecture"] = v
+        v = self.boot_id
+        if v is not None:
+            data["bootID"] = v
+        v = self.container_runtime_version
+        if v is not None:
+            data["containerRuntimeVersion"] = v
+        v = self.kernel_version
+        if v is not None:
+            data["kernelVersion"] = v
+        v = self.kube_proxy_version
+        if v is not None:
+            data["kubeProxyVersion"] = v
+        v = self.kubelet_version
+        if v is not None:
+            data["kubeletVersion"] = v
+        v = self.machine_id
+        if v is not None:
+            data["machineID"] = v
+        v = self.operating_system
+        if v is not None:
+            data["operatingSystem"] = v
+        v = self.os_image
+        if v is not None:
+            data["osImage"] = v
+        v = self.system_uuid
+        if v is not None:
+            data["systemUUID"] = v
+        return data
+
+
+class ObjectFieldSelector(object):
+    """
+    io.k8s.api.core.v1.ObjectFieldSelector: ObjectFieldSelector selects an APIVersioned field of an object.
+    """
+
+    __slots__ = ("api_version", "field_path")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.field_path = get("fieldPath")
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.field_path
+        if v is not None:
+            data["fieldPath"] = v
+        return data
+
+
+class ObjectReference(object):
+    """
+    io.k8s.api.core.v1.ObjectReference: ObjectReference contains enough information to let you inspect or modify the
+    referred object.
+    """
+
+    __slots__ = ("api_version", "field_path", "kind", "name", "namespace", "resource_version", "uid")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.field_path = get("fieldPath")
+        self.kind = get("kind")
+        self.name = get("name")
+        self.namespace = get("namespace")
+        self.resource_version = get("resourceVersion")
+        self.uid = get("uid")
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.field_path
+        if v is not None:
+            data["fieldPath"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.namespace
+        if v is not None:
+            data["namespace"] = v
+        v = self.resource_version
+        if v is not None:
+            data["resourceVersion"] = v
+        v = self.uid
+        if v is not None:
+            data["uid"] = v
+        return data
+
+
+class PersistentVolume(object):
+    """
+    io.k8s.api.core.v1.PersistentVolume: PersistentVolume (PV) is a storage resource provisioned by an administrator.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else PersistentVolumeSpec(v)
+        v = get("status")
+        self.status = None if v is None else PersistentVolumeStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class PersistentVolumeClaim(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeClaim: PersistentVolumeClaim is a user's request for and claim to a persistent
+    volume
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else PersistentVolumeClaimSpec(v)
+        v = get("status")
+        self.status = None if v is None else PersistentVolumeClaimStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class PersistentVolumeClaimCondition(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeClaimCondition: PersistentVolumeClaimCondition contails details about state of
+    pvc
+    """
+
+    __slots__ = ("last_probe_time", "last_transition_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_probe_time = get("lastProbeTime")
+        self.last_transition_time = get("lastTransitionTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_probe_time
+        if v is not None:
+            data["lastProbeTime"] = v
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class PersistentVolumeClaimList(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeClaimList: PersistentVolumeClaimList is a list of PersistentVolumeClaim items.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [PersistentVolumeClaim(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class PersistentVolumeClaimSpec(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeClaimSpec: PersistentVolumeClaimSpec describes the common attributes of storage
+    devices and allows a Source for provider-specific attributes
+    """
+
+    __slots__ = ("access_modes", "resources", "selector", "storage_class_name", "volume_mode", "volume_name")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("accessModes")
+        self.access_modes = None if v is None else list(v)
+        v = get("resources")
+        self.resources = None if v is None else ResourceRequirements(v)
+        v = get("selector")
+        self.selector = None if v is None else meta_v1.LabelSelector(v)
+        self.storage_class_name = get("storageClassName")
+        self.volume_mode = get("volumeMode")
+        self.volume_name = get("volumeName")
+
+    def serialize(self):
+        data = {}
+        v = self.access_modes
+        if v is not None:
+            data["accessModes"] = v
+        v = self.resources
+        if v is not None:
+            data["resources"] = v.serialize()
+        v = self.selector
+        if v is not None:
+            data["selector"] = v.serialize()
+        v = self.storage_class_name
+        if v is not None:
+            data["storageClassName"] = v
+        v = self.volume_mode
+        if v is not None:
+            data["volumeMode"] = v
+        v = self.volume_name
+        if v is not None:
+            data["volumeName"] = v
+        return data
+
+
+class PersistentVolumeClaimStatus(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeClaimStatus: PersistentVolumeClaimStatus is the current status of a persistent
+    volume claim.
+    """
+
+    __slots__ = ("access_modes", "capacity", "conditions", "phase")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("accessModes")
+        self.access_modes = None if v is None else list(v)
+        v = get("capacity")
+        self.capacity = None if v is None else dict(v)
+        v = get("conditions")
+        self.conditions = None if v is None else [PersistentVolumeClaimCondition(x) for x in v]
+        self.phase = get("phase")
+
+    def serialize(self):
+        data = {}
+        v = self.access_modes
+        if v is not None:
+            data["accessModes"] = v
+        v = self.capacity
+        if v is not None:
+            data["capacity"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.phase
+        if v is not None:
+            data["phase"] = v
+        return data
+
+
+class PersistentVolumeClaimVolumeSource(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeClaimVolumeSource: PersistentVolumeClaimVolumeSource references the user's PVC in
+    the same namespace.
+    """
+
+    __slots__ = ("claim_name", "read_only")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.claim_name = get("claimName")
+        self.read_only = get("readOnly")
+
+    def serialize(self):
+        data = {}
+        v = self.claim_name
+        if v is not None:
+            data["claimName"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        return data
+
+
+class PersistentVolumeList(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeList: PersistentVolumeList is a list of PersistentVolume items.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [PersistentVolume(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class PersistentVolumeSpec(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeSpec: PersistentVolumeSpec is the specification of a persistent volume.
+    """
+
+    __slots__ = (
+        "access_modes",
+        "aws_elastic_block_store",
+        "azure_disk",
+        "azure_file",
+        "capacity",
+        "cephfs",
+        "cinder",
+        "claim_ref",
+        "csi",
+        "fc",
+        "flex_volume",
+        "flocker",
+        "gce_persistent_disk",
+        "glusterfs",
+        "host_path",
+        "iscsi",
+        "local",
+        "mount_options",
+        "nfs",
+        "node_affinity",
+        "persistent_volume_reclaim_policy",
+        "photon_persistent_disk",
+        "portworx_volume",
+        "quobyte",
+        "rbd",
+        "scale_io",
+        "storage_class_name",
+        "storageos",
+        "volume_mode",
+        "vsphere_volume",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("accessModes")
+        self.access_modes = None if v is None else list(v)
+        v = get("awsElasticBlockStore")
+        self.aws_elastic_block_store = None if v is None else AWSElasticBlockStoreVolumeSource(v)
+        v = get("azureDisk")
+        self.azure_disk = None if v is None else AzureDiskVolumeSource(v)
+        v = get("azureFile")
+        self.azure_file = None if v is None else AzureFilePersistentVolumeSource(v)
+        v = get("capacity")
+        self.capacity = None if v is None else dict(v)
+        v = get("cephfs")
+        self.cephfs = None if v is None else CephFSPersistentVolumeSource(v)
+        v = get("cinder")
+        self.cinder = None if v is None else CinderVolumeSource(v)
+        v = get("claimRef")
+        self.claim_ref = None if v is None else ObjectReference(v)
+        v = get("csi")
+        self.csi = None if v is None else CSIPersistentVolumeSource(v)
+        v = get("fc")
+        self.fc = None if v is None else FCVolumeSource(v)
+        v = get("flexVolume")
+        self.flex_volume = None if v is None else FlexPersistentVolumeSource(v)
+        v = get("flocker")
+        self.flocker = None if v is None else FlockerVolumeSource(v)
+        v = get("gcePersistentDisk")
+        self.gce_persistent_disk = None if v is None else GCEPersistentDiskVolumeSource(v)
+        v = get("glusterfs")
+        self.glusterfs = None if v is None else GlusterfsVolumeSource(v)
+        v = get("hostPath")
+        self.host_path = None if v is None else HostPathVolumeSource(v)
+        v = get("iscsi")
+        self.iscsi = None if v is None else ISCSIPersistentVolumeSource(v)
+        v = get("local")
+        self.local = None if v is None else LocalVolumeSource(v)
+        v = get("mountOptions")
+        self.mount_options = None if v is None else list(v)
+        v = get("nfs")
+        self.nfs = None if v is None else NFSVolumeSource(v)
+        v = get("nodeAffinity")
+        self.node_affinity = None if v is None else VolumeNodeAffinity(v)
+        self.persistent_volume_reclaim_policy = get("persistentVolumeReclaimPolicy")
+        v = get("photonPersistentDisk")
+        self.photon_persistent_disk = None if v is None else PhotonPersistentDiskVolumeSource(v)
+        v = get("portworxVolume")
+        self.portworx_volume = None if v is None else PortworxVolumeSource(v)
+        v = get("quobyte")
+        self.quobyte = None if v is None else QuobyteVolumeSource(v)
+        v = get("rbd")
+        self.rbd = None if v is None else RBDPersistentVolumeSource(v)
+        v = get("scaleIO")
+        self.scale_io = None if v is None else ScaleIOPersistentVolumeSource(v)
+        self.storage_class_name = get("storageClassName")
+        v = get("storageos")
+        self.storageos = None if v is None else StorageOSPersistentVolumeSource(v)
+        self.volume_mode = get("volumeMode")
+        v = get("vsphereVolume")
+        self.vsphere_volume = None if v is None else VsphereVirtualDiskVolumeSource(v)
+
+    def serialize(self):
+        data = {}
+        v = self.access_modes
+        if v is not None:
+            data["accessModes"] = v
+        v = self.aws_elastic_block_store
+        if v is not None:
+            data["awsElasticBlockStore"] = v.serialize()
+        v = self.azure_disk
+        if v is not None:
+            data["azureDisk"] = v.serialize()
+        v = self.azure_file
+        if v is not None:
+            data["azureFile"] = v.serialize()
+        v = self.capacity
+        if v is not None:
+            data["capacity"] = v
+        v = self.cephfs
+        if v is not None:
+            data["cephfs"] = v.serialize()
+        v = self.cinder
+        if v is not None:
+            data["cinder"] = v.serialize()
+        v = self.claim_ref
+        if v is not None:
+            data["claimRef"] = v.serialize()
+        v = self.csi
+        if v is not None:
+            data["csi"] = v.serialize()
+        v = self.fc
+        if v is not None:
+            data["fc"] = v.serialize()
+        v = self.flex_volume
+        if v is not None:
+            data["flexVolume"] = v.serialize()
+        v = self.flocker
+        if v is not None:
+            data["flocker"] = v.serialize()
+        v = self.gce_persistent_disk
+        if v is not None:
+            data["gcePersistentDisk"] = v.serialize()
+        v = self.glusterfs
+        if v is not None:
+            data["glusterfs"] = v.serialize()
+        v = self.host_path
+        if v is not None:
+            data["hostPath"] = v.serialize()
+        v = self.iscsi
+        if v is not None:
+            data["iscsi"] = v.serialize()
+        v = self.local
+        if v is not None:
+            data["local"] = v.serialize()
+        v = self.mount_options
+        if v is not None:
+            data["mountOptions"] = v
+        v = self.nfs
+        if v is not None:
+            data["nfs"] = v.serialize()
+        v = self.node_affinity
+        if v is not None:
+            data["nodeAffinity"] = v.serialize()
+        v = self.persistent_volume_reclaim_policy
+        if v is not None:
+            data["persistentVolumeReclaimPolicy"] = v
+        v = self.photon_persistent_disk
+        if v is not None:
+            data["photonPersistentDisk"] = v.serialize()
+        v = self.portworx_volume
+        if v is not None:
+            data["portworxVolume"] = v.serialize()
+        v = self.quobyte
+        if v is not None:
+            data["quobyte"] = v.serialize()
+        v = self.rbd
+        if v is not None:
+            data["rbd"] = v.serialize()
+        v = self.scale_io
+        if v is not None:
+            data["scaleIO"] = v.serialize()
+        v = self.storage_class_name
+        if v is not None:
+            data["storageClassName"] = v
+        v = self.storageos
+        if v is not None:
+            data["storageos"] = v.serialize()
+        v = self.volume_mode
+        if v is not None:
+            data["volumeMode"] = v
+        v = self.vsphere_volume
+        if v is not None:
+            data["vsphereVolume"] = v.serialize()
+        return data
+
+
+class PersistentVolumeStatus(object):
+    """
+    io.k8s.api.core.v1.PersistentVolumeStatus: PersistentVolumeStatus is the current status of a persistent volume.
+    """
+
+    __slots__ = ("message", "phase", "reason")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.message = get("message")
+        self.phase = get("phase")
+        self.reason = get("reason")
+
+    def serialize(self):
+        data = {}
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.phase
+        if v is not None:
+            data["phase"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        return data
+
+
+class PhotonPersistentDiskVolumeSource(object):
+    """
+    io.k8s.api.core.v1.PhotonPersistentDiskVolumeSource: Represents a Photon Controller persistent disk resource.
+    """
+
+    __slots__ = ("fs_type", "pd_id")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.pd_id = get("pdID")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.pd_id
+        if v is not None:
+            data["pdID"] = v
+        return data
+
+
+class Pod(object):
+    """
+    io.k8s.api.core.v1.Pod: Pod is a collection of containers that can run on a host.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else PodSpec(v)
+        v = get("status")
+        self.status = None if v is None else PodStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class PodAffinity(object):
+    """
+    io.k8s.api.core.v1.PodAffinity: Pod affinity is a group of inter pod affinity scheduling rules.
+    """
+
+    __slots__ = (
+        "preferred_during_scheduling_ignored_during_execution",
+        "required_during_scheduling_ignored_during_execution",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("preferredDuringSchedulingIgnoredDuringExecution")
+        self.preferred_during_scheduling_ignored_during_execution = (
+            None if v is None else [WeightedPodAffinityTerm(x) for x in v]
+        )
+        v = get("requiredDuringSchedulingIgnoredDuringExecution")
+        self.required_during_scheduling_ignored_during_execution = (
+            None if v is None else [PodAffinityTerm(x) for x in v]
+        )
+
+    def serialize(self):
+        data = {}
+        v = self.preferred_during_scheduling_ignored_during_execution
+        if v is not None:
+            data["preferredDuringSchedulingIgnoredDuringExecution"] = [x.serialize() for x in v]
+        v = self.required_during_scheduling_ignored_during_execution
+        if v is not None:
+            data["requiredDuringSchedulingIgnoredDuringExecution"] = [x.serialize() for x in v]
+        return data
+
+
+class PodAffinityTerm(object):
+    """
+    io.k8s.api.core.v1.PodAffinityTerm: Defines a set of pods (namely those matching the labelSelector relative to the
+    given namespace(s)) that this pod should be co-located (affinity) or not co-located (anti-affinity) with, where
+    co-located is defined as running on a node whose value of the label with key <topologyKey> matches that of any node
+    on which a pod of the set of pods is running
+    """
+
+    __slots__ = ("label_selector", "namespaces", "topology_key")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("labelSelector")
+        self.label_selector = None if v is None else meta_v1.LabelSelector(v)
+        v = get("namespaces")
+        self.namespaces = None if v is None else list(v)
+        self.topology_key = get("topologyKey")
+
+    def serialize(self):
+        data = {}
+        v = self.label_selector
+        if v is not None:
+            data["labelSelector"] = v.serialize()
+        v = self.namespaces
+        if v is not None:
+            data["namespaces"] = v
+        v = self.topology_key
+        if v is not None:
+            data["topologyKey"] = v
+        return data
+
+
+class PodAntiAffinity(object):
+    """
+    io.k8s.api.core.v1.PodAntiAffinity: Pod anti affinity is a group of inter pod anti affinity scheduling rules.
+    """
+
+    __slots__ = (
+        "preferred_during_scheduling_ignored_during_execution",
+        "required_during_scheduling_ignored_during_execution",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("preferredDuringSchedulingIgnoredDuringExecution")
+        self.preferred_during_scheduling_ignored_during_execution = (
+            None if v is None else [WeightedPodAffinityTerm(x) for x in v]
+        )
+        v = get("requiredDuringSchedulingIgnoredDuringExecution")
+        self.required_during_scheduling_ignored_during_execution = (
+            None if v is None else [PodAffinityTerm(x) for x in v]
+        )
+
+    def serialize(self):
+        data = {}
+        v = self.preferred_during_scheduling_ignored_during_execution
+        if v is not None:
+            data["preferredDuringSchedulingIgnoredDuringExecution"] = [x.serialize() for x in v]
+        v = self.required_during_scheduling_ignored_during_execution
+        if v is not None:
+            data["requiredDuringSchedulingIgnoredDuringExecution"] = [x.serialize() for x in v]
+        return data
+
+
+class PodCondition(object):
+    """
+    io.k8s.api.core.v1.PodCondition: PodCondition contains details for the current condition of this pod.
+    """
+
+    __slots__ = ("last_probe_time", "last_transition_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_probe_time = get("lastProbeTime")
+        self.last_transition_time = get("lastTransitionTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_probe_time
+        if v is not None:
+            data["lastProbeTime"] = v
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class PodDNSConfig(object):
+    """
+    io.k8s.api.core.v1.PodDNSConfig: PodDNSConfig defines the DNS parameters of a pod in addition to those generated
+    from DNSPolicy.
+    """
+
+    __slots__ = ("nameservers", "options", "searches")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("nameservers")
+        self.nameservers = None if v is None else list(v)
+        v = get("options")
+        self.options = None if v is None else [PodDNSConfigOption(x) for x in v]
+        v = get("searches")
+        self.searches = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.nameservers
+        if v is not None:
+            data["nameservers"] = v
+        v = self.options
+        if v is not None:
+            data["options"] = [x.serialize() for x in v]
+        v = self.searches
+        if v is not None:
+            data["searches"] = v
+        return data
+
+
+class PodDNSConfigOption(object):
+    """
+    io.k8s.api.core.v1.PodDNSConfigOption: PodDNSConfigOption defines DNS resolver options of a pod.
+    """
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+        self.value = get("value")
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.value
+        if v is not None:
+            data["value"] = v
+        return data
+
+
+class PodList(object):
+    """
+    io.k8s.api.core.v1.PodList: PodList is a list of Pods.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [Pod(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class PodSecurityContext(object):
+    """
+    io.k8s.api.core.v1.PodSecurityContext: PodSecurityContext holds pod-level security attributes and common container
+    settings.
+    """
+
+    __slots__ = (
+        "fs_group",
+        "run_as_group",
+        "run_as_non_root",
+        "run_as_user",
+        "se_linux_options",
+        "supplemental_groups",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_group = get("fsGroup")
+        self.run_as_group = get("runAsGroup")
+        self.run_as_non_root = get("runAsNonRoot")
+        self.run_as_user = get("runAsUser")
+        v = get("seLinuxOptions")
+        self.se_linux_options = None if v is None else SELinuxOptions(v)
+        v = get("supplementalGroups")
+        self.supplemental_groups = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.fs_group
+        if v is not None:
+            data["fsGroup"] = v
+        v = self.run_as_group
+        if v is not None:
+            data["runAsGroup"] = v
+        v = self.run_as_non_root
+        if v is not None:
+            data["runAsNonRoot"] = v
+        v = self.run_as_user
+        if v is not None:
+            data["runAsUser"] = v
+        v = self.se_linux_options
+        if v is not None:
+            data["seLinuxOptions"] = v.serialize()
+        v = self.supplemental_groups
+        if v is not None:
+            data["supplementalGroups"] = v
+        return data
+
+
+class PodSpec(object):
+    """
+    io.k8s.api.core.v1.PodSpec: PodSpec is a description of a pod.
+    """
+
+    __slots__ = (
+        "active_deadline_seconds",
+        "affinity",
+        "automount_service_account_token",
+        "containers",
+        "dns_config",
+        "dns_policy",
+        "host_aliases",
+        "host_ipc",
+        "host_network",
+        "host_pid",
+        "hostname",
+        "image_pull_secrets",
+        "init_containers",
+        "node_name",
+        "node_selector",
+        "priority",
+        "priority_class_name",
+        "restart_policy",
+        "scheduler_name",
+        "security_context",
+        "service_account",
+        "service_account_name",
+        "share_process_namespace",
+        "subdomain",
+        "termination_grace_period_seconds",
+        "tolerations",
+        "volumes",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.active_deadline_seconds = get("activeDeadlineSeconds")
+        v = get("affinity")
+        self.affinity = None if v is None else Affinity(v)
+        self.automount_service_account_token = get("automountServiceAccountToken")
+        v = get("containers")
+        self.containers = None if v is None else [Container(x) for x in v]
+        v = get("dnsConfig")
+        self.dns_config = None if v is None else PodDNSConfig(v)
+        self.dns_policy = get("dnsPolicy")
+        v = get("hostAliases")
+        self.host_aliases = None if v is None else [HostAlias(x) for x in v]
+        self.host_ipc = get("hostIPC")
+        self.host_network = get("hostNetwork")
+        self.host_pid = get("hostPID")
+        self.hostname = get("hostname")
+        v = get("imagePullSecrets")
+        self.image_pull_secrets = None if v is None else [LocalObjectReference(x) for x in v]
+        v = get("initContainers")
+        self.init_containers = None if v is None else [Container(x) for x in v]
+        self.node_name = get("nodeName")
+        v = get("nodeSelector")
+        self.node_selector = None if v is None else dict(v)
+        self.priority = get("priority")
+        self.priority_class_name = get("priorityClassName")
+        self.restart_policy = get("restartPolicy")
+        self.scheduler_name = get("schedulerName")
+        v = get("securityContext")
+        self.security_context = None if v is None else PodSecurityContext(v)
+        self.service_account = get("serviceAccount")
+        self.service_account_name = get("serviceAccountName")
+        self.share_process_namespace = get("shareProcessNamespace")
+        self.subdomain = get("subdomain")
+        self.termination_grace_period_seconds = get("terminationGracePeriodSeconds")
+        v = get("tolerations")
+        self.tolerations = None if v is None else [Toleration(x) for x in v]
+        v = get("volumes")
+        self.volumes = None if v is None else [Volume(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.active_deadline_seconds
+        if v is not None:
+            data["activeDeadlineSeconds"] = v
+        v = self.affinity
+        if v is not None:
+            data["affinity"] = v.serialize()
+        v = self.automount_service_account_token
+        if v is not None:
+            data["automountServiceAccountToken"] = v
+        v = self.containers
+        if v is not None:
+            data["containers"] = [x.serialize() for x in v]
+        v = self.dns_config
+        if v is not None:
+            data["dnsConfig"] = v.serialize()
+        v = self.dns_policy
+        if v is not None:
+            data["dnsPolicy"] = v
+        v = self.host_aliases
+        if v is not None:
+            data["hostAliases"] = [x.serialize() for x in v]
+        v = self.host_ipc
+        if v is not None:
+            data["hostIPC"] = v
+        v = self.host_network
+        if v is not None:
+            data["hostNetwork"] = v
+        v = self.host_pid
+        if v is not None:
+            data["hostPID"] = v
+        v = self.hostname
+        if v is not None:
+            data["hostname"] = v
+        v = self.image_pull_secrets
+        if v is not None:
+            data["imagePullSecrets"] = [x.serialize() for x in v]
+        v = self.init_containers
+        if v is not None:
+            data["initContainers"] = [x.serialize() for x in v]
+        v = self.node_name
+        if v is not None:
+            data["nodeName"] = v
+        v = self.node_selector
+        if v is not None:
+            data["nodeSelector"] = v
+        v = self.priority
+        if v is not None:
+            data["priority"] = v
+        v = self.priority_class_name
+        if v is not None:
+            data["priorityClassName"] = v
+        v = self.restart_policy
+        if v is not None:
+            data["restartPolicy"] = v
+        v = self.scheduler_name
+        if v is not None:
+            data["schedulerName"] = v
+        v = self.security_context
+        if v is not None:
+            data["securityContext"] = v.serialize()
+        v = self.service_account
+        if v is not None:
+            data["serviceAccount"] = v
+        v = self.service_account_name
+        if v is not None:
+            data["serviceAccountName"] = v
+        v = self.share_process_namespace
+        if v is not None:
+            data["shareProcessNamespace"] = v
+        v = self.subdomain
+        if v is not None:
+            data["subdomain"] = v
+        v = self.termination_grace_period_seconds
+        if v is not None:
+            data["terminationGracePeriodSeconds"] = v
+        v = self.tolerations
+        if v is not None:
+            data["tolerations"] = [x.serialize() for x in v]
+        v = self.volumes
+        if v is not None:
+            data["volumes"] = [x.serialize() for x in v]
+        return data
+
+
+class PodStatus(object):
+    """
+    io.k8s.api.core.v1.PodStatus: PodStatus represents information about the status of a pod.
+    """
+
+    __slots__ = (
+        "conditions",
+        "container_statuses",
+        "host_ip",
+        "init_container_statuses",
+        "message",
+        "nominated_node_name",
+        "phase",
+        "pod_ip",
+        "qos_class",
+        "reason",
+        "start_time",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("conditions")
+        self.conditions = None if v is None else [PodCondition(x) for x in v]
+        v = get("containerStatuses")
+        self.container_statuses = None if v is None else [ContainerStatus(x) for x in v]
+        self.host_ip = get("hostIP")
+        v = get("initContainerStatuses")
+        self.init_container_statuses = None if v is None else [ContainerStatus(x) for x in v]
+        self.message = get("message")
+        self.nominated_node_name = get("nominatedNodeName")
+        self.phase = get("phase")
+        self.pod_ip = get("podIP")
+        self.qos_class = get("qosClass")
+        self.reason = get("reason")
+        self.start_time = get("startTime")
+
+    def serialize(self):
+        data = {}
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.container_statuses
+        if v is not None:
+            data["containerStatuses"] = [x.serialize() for x in v]
+        v = self.host_ip
+        if v is not None:
+            data["hostIP"] = v
+        v = self.init_container_statuses
+        if v is not None:
+            data["initContainerStatuses"] = [x.serialize() for x in v]
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.nominated_node_name
+        if v is not None:
+            data["nominatedNodeName"] = v
+        v = self.phase
+        if v is not None:
+            data["phase"] = v
+        v = self.pod_ip
+        if v is not None:
+            data["podIP"] = v
+        v = self.qos_class
+        if v is not None:
+            data["qosClass"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.start_time
+        if v is not None:
+            data["startTime"] = v
+        return data
+
+
+class PodTemplateSpec(object):
+    """
+    io.k8s.api.core.v1.PodTemplateSpec: PodTemplateSpec describes the data a pod should have when created from a
+    template
+    """
+
+    __slots__ = ("metadata", "spec")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else PodSpec(v)
+
+    def serialize(self):
+        data = {}
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        return data
+
+
+class PortworxVolumeSource(object):
+    """
+    io.k8s.api.core.v1.PortworxVolumeSource: PortworxVolumeSource represents a Portworx volume resource.
+    """
+
+    __slots__ = ("fs_type", "read_only", "volume_id")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.read_only = get("readOnly")
+        self.volume_id = get("volumeID")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.volume_id
+        if v is not None:
+            data["volumeID"] = v
+        return data
+
+
+class PreferredSchedulingTerm(object):
+    """
+    io.k8s.api.core.v1.PreferredSchedulingTerm: An empty preferred scheduling term matches all objects with implicit
+    weight 0 (i.e.
+    """
+
+    __slots__ = ("preference", "weight")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("preference")
+        self.preference = None if v is None else NodeSelectorTerm(v)
+        self.weight = get("weight")
+
+    def serialize(self):
+        data = {}
+        v = self.preference
+        if v is not None:
+            data["preference"] = v.serialize()
+        v = self.weight
+        if v is not None:
+            data["weight"] = v
+        return data
+
+
+class Probe(object):
+    """
+    io.k8s.api.core.v1.Probe: Probe describes a health check to be performed against a container to determine whether it
+    is alive or ready to receive traffic.
+    """
+
+    __slots__ = (
+        "exec",
+        "failure_threshold",
+        "http_get",
+        "initial_delay_seconds",
+        "period_seconds",
+        "success_threshold",
+        "tcp_socket",
+        "timeout_seconds",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("exec")
+        self.exec = None if v is None else ExecAction(v)
+        self.failure_threshold = get("failureThreshold")
+        v = get("httpGet")
+        self.http_get = None if v is None else HTTPGetAction(v)
+        self.initial_delay_seconds = get("initialDelaySeconds")
+        self.period_seconds = get("periodSeconds")
+        self.success_threshold = get("successThreshold")
+        v = get("tcpSocket")
+        self.tcp_socket = None if v is None else TCPSocketAction(v)
+        self.timeout_seconds = get("timeoutSeconds")
+
+    def serialize(self):
+        data = {}
+        v = self.exec
+        if v is not None:
+            data["exec"] = v.serialize()
+        v = self.failure_threshold
+        if v is not None:
+            data["failureThreshold"] = v
+        v = self.http_get
+        if v is not None:
+            data["httpGet"] = v.serialize()
+        v = self.initial_delay_seconds
+        if v is not None:
+            data["initialDelaySeconds"] = v
+        v = self.period_seconds
+        if v is not None:
+            data["periodSeconds"] = v
+        v = self.success_threshold
+        if v is not None:
+            data["successThreshold"] = v
+        v = self.tcp_socket
+        if v is not None:
+            data["tcpSocket"] = v.serialize()
+        v = self.timeout_seconds
+        if v is not None:
+            data["timeoutSeconds"] = v
+        return data
+
+
+class ProjectedVolumeSource(object):
+    """
+    io.k8s.api.core.v1.ProjectedVolumeSource: Represents a projected volume source
+    """
+
+    __slots__ = ("default_mode", "sources")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.default_mode = get("defaultMode")
+        v = get("sources")
+        self.sources = None if v is None else [VolumeProjection(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.default_mode
+        if v is not None:
+            data["defaultMode"] = v
+        v = self.sources
+        if v is not None:
+            data["sources"] = [x.serialize() for x in v]
+        return data
+
+
+class QuobyteVolumeSource(object):
+    """
+    io.k8s.api.core.v1.QuobyteVolumeSource: Represents a Quobyte mount that lasts the lifetime of a pod.
+    """
+
+    __slots__ = ("group", "read_only", "registry", "user", "volume")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.group = get("group")
+        self.read_only = get("readOnly")
+        self.registry = get("registry")
+        self.user = get("user")
+        self.volume = get("volume")
+
+    def serialize(self):
+        data = {}
+        v = self.group
+        if v is not None:
+            data["group"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.registry
+        if v is not None:
+            data["registry"] = v
+        v = self.user
+        if v is not None:
+            data["user"] = v
+        v = self.volume
+        if v is not None:
+            data["volume"] = v
+        return data
+
+
+class RBDPersistentVolumeSource(object):
+    """
+    io.k8s.api.core.v1.RBDPersistentVolumeSource: Represents a Rados Block Device mount that lasts the lifetime of a
+    pod.
+    """
+
+    __slots__ = ("fs_type", "image", "keyring", "monitors", "pool", "read_only", "secret_ref", "user")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.image = get("image")
+        self.keyring = get("keyring")
+        v = get("monitors")
+        self.monitors = None if v is None else list(v)
+        self.pool = get("pool")
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else SecretReference(v)
+        self.user = get("user")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.image
+        if v is not None:
+            data["image"] = v
+        v = self.keyring
+        if v is not None:
+            data["keyring"] = v
+        v = self.monitors
+        if v is not None:
+            data["monitors"] = v
+        v = self.pool
+        if v is not None:
+            data["pool"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.user
+        if v is not None:
+            data["user"] = v
+        return data
+
+
+class RBDVolumeSource(object):
+    """
+    io.k8s.api.core.v1.RBDVolumeSource: Represents a Rados Block Device mount that lasts the lifetime of a pod.
+    """
+
+    __slots__ = ("fs_type", "image", "keyring", "monitors", "pool", "read_only", "secret_ref", "user")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.image = get("image")
+        self.keyring = get("keyring")
+        v = get("monitors")
+        self.monitors = None if v is None else list(v)
+        self.pool = get("pool")
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else LocalObjectReference(v)
+        self.user = get("user")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.image
+        if v is not None:
+            data["image"] = v
+        v = self.keyring
+        if v is not None:
+            data["keyring"] = v
+        v = self.monitors
+        if v is not None:
+            data["monitors"] = v
+        v = self.pool
+        if v is not None:
+            data["pool"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.user
+        if v is not None:
+            data["user"] = v
+        return data
+
+
+class ReplicationController(object):
+    """
+    io.k8s.api.core.v1.ReplicationController: ReplicationController represents the configuration of a replication
+    controller.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else ReplicationControllerSpec(v)
+        v = get("status")
+        self.status = None if v is None else ReplicationControllerStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class ReplicationControllerCondition(object):
+    """
+    io.k8s.api.core.v1.ReplicationControllerCondition: ReplicationControllerCondition describes the state of a
+    replication controller at a certain point.
+    """
+
+    __slots__ = ("last_transition_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_transition_time = get("lastTransitionTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class ReplicationControllerList(object):
+    """
+    io.k8s.api.core.v1.ReplicationControllerList: ReplicationControllerList is a collection of replication controllers.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [ReplicationController(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class ReplicationControllerSpec(object):
+    """
+    io.k8s.api.core.v1.ReplicationControllerSpec: ReplicationControllerSpec is the specification of a replication
+    controller.
+    """
+
+    __slots__ = ("min_ready_seconds", "replicas", "selector", "template")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.min_ready_seconds = get("minReadySeconds")
+        self.replicas = get("replicas")
+        v = get("selector")
+        self.selector = None if v is None else dict(v)
+        v = get("template")
+        self.template = None if v is None else PodTemplateSpec(v)
+
+    def serialize(self):
+        data = {}
+        v = self.min_ready_seconds
+        if v is not None:
+            data["minReadySeconds"] = v
+        v = self.replicas
+        if v is not None:
+            data["replicas"] = v
+        v = self.selector
+        if v is not None:
+            data["selector"] = v
+        v = self.template
+        if v is not None:
+            data["template"] = v.serialize()
+        return data
+
+
+class ReplicationControllerStatus(object):
+    """
+    io.k8s.api.core.v1.ReplicationControllerStatus: ReplicationControllerStatus represents the current status of a
+    replication controller.
+    """
+
+    __slots__ = (
+        "available_replicas",
+        "conditions",
+        "fully_labeled_replicas",
+        "observed_generation",
+        "ready_replicas",
+        "replicas",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.available_replicas = get("availableReplicas")
+        v = get("conditions")
+        self.conditions = None if v is None else [ReplicationControllerCondition(x) for x in v]
+        self.fully_labeled_replicas = get("fullyLabeledReplicas")
+        self.observed_generation = get("observedGeneration")
+        self.ready_replicas = get("readyReplicas")
+        self.replicas = get("replicas")
+
+    def serialize(self):
+        data = {}
+        v = self.available_replicas
+        if v is not None:
+            data["availableReplicas"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.fully_labeled_replicas
+        if v is not None:
+            data["fullyLabeledReplicas"] = v
+        v = self.observed_generation
+        if v is not None:
+            data["observedGeneration"] = v
+        v = self.ready_replicas
+        if v is not None:
+            data["readyReplicas"] = v
+        v = self.replicas
+        if v is not None:
+            data["replicas"] = v
+        return data
+
+
+class ResourceFieldSelector(object):
+    """
+    io.k8s.api.core.v1.ResourceFieldSelector: ResourceFieldSelector represents container resources (cpu, memory) and
+    their output format
+    """
+
+    __slots__ = ("container_name", "divisor", "resource")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.container_name = get("containerName")
+        self.divisor = get("divisor")
+        self.resource = get("resource")
+
+    def serialize(self):
+        data = {}
+        v = self.container_name
+        if v is not None:
+            data["containerName"] = v
+        v = self.divisor
+        if v is not None:
+            data["divisor"] = v
+        v = self.resource
+        if v is not None:
+            data["resource"] = v
+        return data
+
+
+class ResourceRequirements(object):
+    """
+    io.k8s.api.core.v1.ResourceRequirements: ResourceRequirements describes the compute resource requirements.
+    """
+
+    __slots__ = ("limits", "requests")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("limits")
+        self.limits = None if v is None else dict(v)
+        v = get("requests")
+        self.requests = None if v is None else dict(v)
+
+    def serialize(self):
+        data = {}
+        v = self.limits
+        if v is not None:
+            data["limits"] = v
+        v = self.requests
+        if v is not None:
+            data["requests"] = v
+        return data
+
+
+class SELinuxOptions(object):
+    """
+    io.k8s.api.core.v1.SELinuxOptions: SELinuxOptions are the labels to be applied to the container
+    """
+
+    __slots__ = ("level", "role", "type", "user")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.level = get("level")
+        self.role = get("role")
+        self.type = get("type")
+        self.user = get("user")
+
+    def serialize(self):
+        data = {}
+        v = self.level
+        if v is not None:
+            data["level"] = v
+        v = self.role
+        if v is not None:
+            data["role"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        v = self.user
+        if v is not None:
+            data["user"] = v
+        return data
+
+
+class ScaleIOPersistentVolumeSource(object):
+    """
+    io.k8s.api.core.v1.ScaleIOPersistentVolumeSource: ScaleIOPersistentVolumeSource represents a persistent ScaleIO
+    volume
+    """
+
+    __slots__ = (
+        "fs_type",
+        "gateway",
+        "protection_domain",
+        "read_only",
+        "secret_ref",
+        "ssl_enabled",
+        "storage_mode",
+        "storage_pool",
+        "system",
+        "volume_name",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.gateway = get("gateway")
+        self.protection_domain = get("protectionDomain")
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else SecretReference(v)
+        self.ssl_enabled = get("sslEnabled")
+        self.storage_mode = get("storageMode")
+        self.storage_pool = get("storagePool")
+        self.system = get("system")
+        self.volume_name = get("volumeName")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.gateway
+        if v is not None:
+            data["gateway"] = v
+        v = self.protection_domain
+        if v is not None:
+            data["protectionDomain"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.ssl_enabled
+        if v is not None:
+            data["sslEnabled"] = v
+        v = self.storage_mode
+        if v is not None:
+            data["storageMode"] = v
+        v = self.storage_pool
+        if v is not None:
+            data["storagePool"] = v
+        v = self.system
+        if v is not None:
+            data["system"] = v
+        v = self.volume_name
+        if v is not None:
+            data["volumeName"] = v
+        return data
+
+
+class ScaleIOVolumeSource(object):
+    """
+    io.k8s.api.core.v1.ScaleIOVolumeSource: ScaleIOVolumeSource represents a persistent ScaleIO volume
+    """
+
+    __slots__ = (
+        "fs_type",
+        "gateway",
+        "protection_domain",
+        "read_only",
+        "secret_ref",
+        "ssl_enabled",
+        "storage_mode",
+        "storage_pool",
+        "system",
+        "volume_name",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.gateway = get("gateway")
+        self.protection_domain = get("protectionDomain")
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else LocalObjectReference(v)
+        self.ssl_enabled = get("sslEnabled")
+        self.storage_mode = get("storageMode")
+        self.storage_pool = get("storagePool")
+        self.system = get("system")
+        self.volume_name = get("volumeName")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.gateway
+        if v is not None:
+            data["gateway"] = v
+        v = self.protection_domain
+        if v is not None:
+            data["protectionDomain"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.ssl_enabled
+        if v is not None:
+            data["sslEnabled"] = v
+        v = self.storage_mode
+        if v is not None:
+            data["storageMode"] = v
+        v = self.storage_pool
+        if v is not None:
+            data["storagePool"] = v
+        v = self.system
+        if v is not None:
+            data["system"] = v
+        v = self.volume_name
+        if v is not None:
+            data["volumeName"] = v
+        return data
+
+
+class Secret(object):
+    """
+    io.k8s.api.core.v1.Secret: Secret holds secret data of a certain type.
+    """
+
+    __slots__ = ("api_version", "data", "kind", "metadata", "string_data", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("data")
+        self.data = None if v is None else dict(v)
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("stringData")
+        self.string_data = None if v is None else dict(v)
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.data
+        if v is not None:
+            data["data"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.string_data
+        if v is not None:
+            data["stringData"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class SecretEnvSource(object):
+    """
+    io.k8s.api.core.v1.SecretEnvSource: SecretEnvSource selects a Secret to populate the environment variables with.
+    """
+
+    __slots__ = ("name", "optional")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+        self.optional = get("optional")
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.optional
+        if v is not None:
+            data["optional"] = v
+        return data
+
+
+class SecretKeySelector(object):
+    """
+    io.k8s.api.core.v1.SecretKeySelector: SecretKeySelector selects a key of a Secret.
+    """
+
+    __slots__ = ("key", "name", "optional")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.key = get("key")
+        self.name = get("name")
+        self.optional = get("optional")
+
+    def serialize(self):
+        data = {}
+        v = self.key
+        if v is not None:
+            data["key"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.optional
+        if v is not None:
+            data["optional"] = v
+        return data
+
+
+class SecretList(object):
+    """
+    io.k8s.api.core.v1.SecretList: SecretList is a list of Secret.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [Secret(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class SecretProjection(object):
+    """
+    io.k8s.api.core.v1.SecretProjection: Adapts a secret into a projected volume.
+    """
+
+    __slots__ = ("items", "name", "optional")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("items")
+        self.items = None if v is None else [KeyToPath(x) for x in v]
+        self.name = get("name")
+        self.optional = get("optional")
+
+    def serialize(self):
+        data = {}
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.optional
+        if v is not None:
+            data["optional"] = v
+        return data
+
+
+class SecretReference(object):
+    """
+    io.k8s.api.core.v1.SecretReference: SecretReference represents a Secret Reference.
+    """
+
+    __slots__ = ("name", "namespace")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+        self.namespace = get("namespace")
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.namespace
+        if v is not None:
+            data["namespace"] = v
+        return data
+
+
+class SecretVolumeSource(object):
+    """
+    io.k8s.api.core.v1.SecretVolumeSource: Adapts a Secret into a volume.
+    """
+
+    __slots__ = ("default_mode", "items", "optional", "secret_name")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.default_mode = get("defaultMode")
+        v = get("items")
+        self.items = None if v is None else [KeyToPath(x) for x in v]
+        self.optional = get("optional")
+        self.secret_name = get("secretName")
+
+    def serialize(self):
+        data = {}
+        v = self.default_mode
+        if v is not None:
+            data["defaultMode"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.optional
+        if v is not None:
+            data["optional"] = v
+        v = self.secret_name
+        if v is not None:
+            data["secretName"] = v
+        return data
+
+
+class SecurityContext(object):
+    """
+    io.k8s.api.core.v1.SecurityContext: SecurityContext holds security configuration that will be applied to a
+    container.
+    """
+
+    __slots__ = (
+        "allow_privilege_escalation",
+        "capabilities",
+        "privileged",
+        "read_only_root_filesystem",
+        "run_as_group",
+        "run_as_non_root",
+        "run_as_user",
+        "se_linux_options",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.allow_privilege_escalation = get("allowPrivilegeEscalation")
+        v = get("capabilities")
+        self.capabilities = None if v is None else Capabilities(v)
+        self.privileged = get("privileged")
+        self.read_only_root_filesystem = get("readOnlyRootFilesystem")
+        self.run_as_group = get("runAsGroup")
+        self.run_as_non_root = get("runAsNonRoot")
+        self.run_as_user = get("runAsUser")
+        v = get("seLinuxOptions")
+        self.se_linux_options = None if v is None else SELinuxOptions(v)
+
+    def serialize(self):
+        data = {}
+        v = self.allow_privilege_escalation
+        if v is not None:
+            data["allowPrivilegeEscalation"] = v
+        v = self.capabilities
+        if v is not None:
+            data["capabilities"] = v.serialize()
+        v = self.privileged
+        if v is not None:
+            data["privileged"] = v
+        v = self.read_only_root_filesystem
+        if v is not None:
+            data["readOnlyRootFilesystem"] = v
+        v = self.run_as_group
+        if v is not None:
+            data["runAsGroup"] = v
+        v = self.run_as_non_root
+        if v is not None:
+            data["runAsNonRoot"] = v
+        v = self.run_as_user
+        if v is not None:
+            data["runAsUser"] = v
+        v = self.se_linux_options
+        if v is not None:
+            data["seLinuxOptions"] = v.serialize()
+        return data
+
+
+class Service(object):
+    """
+    io.k8s.api.core.v1.Service: Service is a named abstraction of software service (for example, mysql) consisting of
+    local port (for example 3306) that the proxy listens on, and the selector that determines which pods will answer
+    requests sent through the proxy.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else ServiceSpec(v)
+        v = get("status")
+        self.status = None if v is None else ServiceStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class ServiceAccount(object):
+    """
+    io.k8s.api.core.v1.ServiceAccount: ServiceAccount binds together: * a name, understood by users, and perhaps by
+    peripheral systems, for an identity * a principal that can be authenticated and authorized * a set of secrets
+    """
+
+    __slots__ = ("api_version", "automount_service_account_token", "image_pull_secrets", "kind", "metadata", "secrets")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.automount_service_account_token = get("automountServiceAccountToken")
+        v = get("imagePullSecrets")
+        self.image_pull_secrets = None if v is None else [LocalObjectReference(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("secrets")
+        self.secrets = None if v is None else [ObjectReference(x) for x in v]
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.automount_service_account_token
+        if v is not None:
+            data["automountServiceAccountToken"] = v
+        v = self.image_pull_secrets
+        if v is not None:
+            data["imagePullSecrets"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.secrets
+        if v is not None:
+            data["secrets"] = [x.serialize() for x in v]
+        return data
+
+
+class ServiceAccountList(object):
+    """
+    io.k8s.api.core.v1.ServiceAccountList: ServiceAccountList is a list of ServiceAccount objects
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [ServiceAccount(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class ServiceList(object):
+    """
+    io.k8s.api.core.v1.ServiceList: ServiceList holds a list of services.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [Service(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class ServicePort(object):
+    """
+    io.k8s.api.core.v1.ServicePort: ServicePort contains information on service's port.
+    """
+
+    __slots__ = ("name", "node_port", "port", "protocol", "target_port")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+        self.node_port = get("nodePort")
+        self.port = get("port")
+        self.protocol = get("protocol")
+        self.target_port = get("targetPort")
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.node_port
+        if v is not None:
+            data["nodePort"] = v
+        v = self.port
+        if v is not None:
+            data["port"] = v
+        v = self.protocol
+        if v is not None:
+            data["protocol"] = v
+        v = self.target_port
+        if v is not None:
+            data["targetPort"] = v
+        return data
+
+
+class ServiceSpec(object):
+    """
+    io.k8s.api.core.v1.ServiceSpec: ServiceSpec describes the attributes that a user creates on a service.
+    """
+
+    __slots__ = (
+        "cluster_ip",
+        "external_ips",
+        "external_name",
+        "external_traffic_policy",
+        "health_check_node_port",
+        "load_balancer_ip",
+        "load_balancer_source_ranges",
+        "ports",
+        "publish_not_ready_addresses",
+        "selector",
+        "session_affinity",
+        "session_affinity_config",
+        "type",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.cluster_ip = get("clusterIP")
+        v = get("externalIPs")
+        self.external_ips = None if v is None else list(v)
+        self.external_name = get("externalName")
+        self.external_traffic_policy = get("externalTrafficPolicy")
+        self.health_check_node_port = get("healthCheckNodePort")
+        self.load_balancer_ip = get("loadBalancerIP")
+        v = get("loadBalancerSourceRanges")
+        self.load_balancer_source_ranges = None if v is None else list(v)
+        v = get("ports")
+        self.ports = None if v is None else [ServicePort(x) for x in v]
+        self.publish_not_ready_addresses = get("publishNotReadyAddresses")
+        v = get("selector")
+        self.selector = None if v is None else dict(v)
+        self.session_affinity = get("sessionAffinity")
+        v = get("sessionAffinityConfig")
+        self.session_affinity_config = None if v is None else SessionAffinityConfig(v)
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.cluster_ip
+        if v is not None:
+            data["clusterIP"] = v
+        v = self.external_ips
+        if v is not None:
+            data["externalIPs"] = v
+        v = self.external_name
+        if v is not None:
+            data["externalName"] = v
+        v = self.external_traffic_policy
+        if v is not None:
+            data["externalTrafficPolicy"] = v
+        v = self.health_check_node_port
+        if v is not None:
+            data["healthCheckNodePort"] = v
+        v = self.load_balancer_ip
+        if v is not None:
+            data["loadBalancerIP"] = v
+        v = self.load_balancer_source_ranges
+        if v is not None:
+            data["loadBalancerSourceRanges"] = v
+        v = self.ports
+        if v is not None:
+            data["ports"] = [x.serialize() for x in v]
+        v = self.publish_not_ready_addresses
+        if v is not None:
+            data["publishNotReadyAddresses"] = v
+        v = self.selector
+        if v is not None:
+            data["selector"] = v
+        v = self.session_affinity
+        if v is not None:
+            data["sessionAffinity"] = v
+        v = self.session_affinity_config
+        if v is not None:
+            data["sessionAffinityConfig"] = v.serialize()
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class ServiceStatus(object):
+    """
+    io.k8s.api.core.v1.ServiceStatus: ServiceStatus represents the current status of a service.
+    """
+
+    __slots__ = ("load_balancer",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("loadBalancer")
+        self.load_balancer = None if v is None else LoadBalancerStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.load_balancer
+        if v is not None:
+            data["loadBalancer"] = v.serialize()
+        return data
+
+
+class SessionAffinityConfig(object):
+    """
+    io.k8s.api.core.v1.SessionAffinityConfig: SessionAffinityConfig represents the configurations of session affinity.
+    """
+
+    __slots__ = ("client_ip",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("clientIP")
+        self.client_ip = None if v is None else ClientIPConfig(v)
+
+    def serialize(self):
+        data = {}
+        v = self.client_ip
+        if v is not None:
+            data["clientIP"] = v.serialize()
+        return data
+
+
+class StorageOSPersistentVolumeSource(object):
+    """
+    io.k8s.api.core.v1.StorageOSPersistentVolumeSource: Represents a StorageOS persistent volume resource.
+    """
+
+    __slots__ = ("fs_type", "read_only", "secret_ref", "volume_name", "volume_namespace")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else ObjectReference(v)
+        self.volume_name = get("volumeName")
+        self.volume_namespace = get("volumeNamespace")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.volume_name
+        if v is not None:
+            data["volumeName"] = v
+        v = self.volume_namespace
+        if v is not None:
+            data["volumeNamespace"] = v
+        return data
+
+
+class StorageOSVolumeSource(object):
+    """
+    io.k8s.api.core.v1.StorageOSVolumeSource: Represents a StorageOS persistent volume resource.
+    """
+
+    __slots__ = ("fs_type", "read_only", "secret_ref", "volume_name", "volume_namespace")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.read_only = get("readOnly")
+        v = get("secretRef")
+        self.secret_ref = None if v is None else LocalObjectReference(v)
+        self.volume_name = get("volumeName")
+        self.volume_namespace = get("volumeNamespace")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.secret_ref
+        if v is not None:
+            data["secretRef"] = v.serialize()
+        v = self.volume_name
+        if v is not None:
+            data["volumeName"] = v
+        v = self.volume_namespace
+        if v is not None:
+            data["volumeNamespace"] = v
+        return data
+
+
+class TCPSocketAction(object):
+    """
+    io.k8s.api.core.v1.TCPSocketAction: TCPSocketAction describes an action based on opening a socket
+    """
+
+    __slots__ = ("host", "port")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.host = get("host")
+        self.port = get("port")
+
+    def serialize(self):
+        data = {}
+        v = self.host
+        if v is not None:
+            data["host"] = v
+        v = self.port
+        if v is not None:
+            data["port"] = v
+        return data
+
+
+class Taint(object):
+    """
+    io.k8s.api.core.v1.Taint: The node this Taint is attached to has the "effect" on any pod that does not tolerate the
+    Taint.
+    """
+
+    __slots__ = ("effect", "key", "time_added", "value")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.effect = get("effect")
+        self.key = get("key")
+        self.time_added = get("timeAdded")
+        self.value = get("value")
+
+    def serialize(self):
+        data = {}
+        v = self.effect
+        if v is not None:
+            data["effect"] = v
+        v = self.key
+        if v is not None:
+            data["key"] = v
+        v = self.time_added
+        if v is not None:
+            data["timeAdded"] = v
+        v = self.value
+        if v is not None:
+            data["value"] = v
+        return data
+
+
+class Toleration(object):
+    """
+    io.k8s.api.core.v1.Toleration: The pod this Toleration is attached to tolerates any taint that matches the triple
+    <key,value,effect> using the matching operator <operator>.
+    """
+
+    __slots__ = ("effect", "key", "operator", "toleration_seconds", "value")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.effect = get("effect")
+        self.key = get("key")
+        self.operator = get("operator")
+        self.toleration_seconds = get("tolerationSeconds")
+        self.value = get("value")
+
+    def serialize(self):
+        data = {}
+        v = self.effect
+        if v is not None:
+            data["effect"] = v
+        v = self.key
+        if v is not None:
+            data["key"] = v
+        v = self.operator
+        if v is not None:
+            data["operator"] = v
+        v = self.toleration_seconds
+        if v is not None:
+            data["tolerationSeconds"] = v
+        v = self.value
+        if v is not None:
+            data["value"] = v
+        return data
+
+
+class Volume(object):
+    """
+    io.k8s.api.core.v1.Volume: Volume represents a named volume in a pod that may be accessed by any container in the
+    pod.
+    """
+
+    __slots__ = (
+        "aws_elastic_block_store",
+        "azure_disk",
+        "azure_file",
+        "cephfs",
+        "cinder",
+        "config_map",
+        "downward_api",
+        "empty_dir",
+        "fc",
+        "flex_volume",
+        "flocker",
+        "gce_persistent_disk",
+        "git_repo",
+        "glusterfs",
+        "host_path",
+        "iscsi",
+        "name",
+        "nfs",
+        "persistent_volume_claim",
+        "photon_persistent_disk",
+        "portworx_volume",
+        "projected",
+        "quobyte",
+        "rbd",
+        "scale_io",
+        "secret",
+        "storageos",
+        "vsphere_volume",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("awsElasticBlockStore")
+        self.aws_elastic_block_store = None if v is None else AWSElasticBlockStoreVolumeSource(v)
+        v = get("azureDisk")
+        self.azure_disk = None if v is None else AzureDiskVolumeSource(v)
+        v = get("azureFile")
+        self.azure_file = None if v is None else AzureFileVolumeSource(v)
+        v = get("cephfs")
+        self.cephfs = None if v is None else CephFSVolumeSource(v)
+        v = get("cinder")
+        self.cinder = None if v is None else CinderVolumeSource(v)
+        v = get("configMap")
+        self.config_map = None if v is None else ConfigMapVolumeSource(v)
+        v = get("downwardAPI")
+        self.downward_api = None if v is None else DownwardAPIVolumeSource(v)
+        v = get("emptyDir")
+        self.empty_dir = None if v is None else EmptyDirVolumeSource(v)
+        v = get("fc")
+        self.fc = None if v is None else FCVolumeSource(v)
+        v = get("flexVolume")
+        self.flex_volume = None if v is None else FlexVolumeSource(v)
+        v = get("flocker")
+        self.flocker = None if v is None else FlockerVolumeSource(v)
+        v = get("gcePersistentDisk")
+        self.gce_persistent_disk = None if v is None else GCEPersistentDiskVolumeSource(v)
+        v = get("gitRepo")
+        self.git_repo = None if v is None else GitRepoVolumeSource(v)
+        v = get("glusterfs")
+        self.glusterfs = None if v is None else GlusterfsVolumeSource(v)
+        v = get("hostPath")
+        self.host_path = None if v is None else HostPathVolumeSource(v)
+        v = get("iscsi")
+        self.iscsi = None if v is None else ISCSIVolumeSource(v)
+        self.name = get("name")
+        v = get("nfs")
+        self.nfs = None if v is None else NFSVolumeSource(v)
+        v = get("persistentVolumeClaim")
+        self.persistent_volume_claim = None if v is None else PersistentVolumeClaimVolumeSource(v)
+        v = get("photonPersistentDisk")
+        self.photon_persistent_disk = None if v is None else PhotonPersistentDiskVolumeSource(v)
+        v = get("portworxVolume")
+        self.portworx_volume = None if v is None else PortworxVolumeSource(v)
+        v = get("projected")
+        self.projected = None if v is None else ProjectedVolumeSource(v)
+        v = get("quobyte")
+        self.quobyte = None if v is None else QuobyteVolumeSource(v)
+        v = get("rbd")
+        self.rbd = None if v is None else RBDVolumeSource(v)
+        v = get("scaleIO")
+        self.scale_io = None if v is None else ScaleIOVolumeSource(v)
+        v = get("secret")
+        self.secret = None if v is None else SecretVolumeSource(v)
+        v = get("storageos")
+        self.storageos = None if v is None else StorageOSVolumeSource(v)
+        v = get("vsphereVolume")
+        self.vsphere_volume = None if v is None else VsphereVirtualDiskVolumeSource(v)
+
+    def serialize(self):
+        data = {}
+        v = self.aws_elastic_block_store
+        if v is not None:
+            data["awsElasticBlockStore"] = v.serialize()
+        v = self.azure_disk
+        if v is not None:
+            data["azureDisk"] = v.serialize()
+        v = self.azure_file
+        if v is not None:
+            data["azureFile"] = v.serialize()
+        v = self.cephfs
+        if v is not None:
+            data["cephfs"] = v.serialize()
+        v = self.cinder
+        if v is not None:
+            data["cinder"] = v.serialize()
+        v = self.config_map
+        if v is not None:
+            data["configMap"] = v.serialize()
+        v = self.downward_api
+        if v is not None:
+            data["downwardAPI"] = v.serialize()
+        v = self.empty_dir
+        if v is not None:
+            data["emptyDir"] = v.serialize()
+        v = self.fc
+        if v is not None:
+            data["fc"] = v.serialize()
+        v = self.flex_volume
+        if v is not None:
+            data["flexVolume"] = v.serialize()
+        v = self.flocker
+        if v is not None:
+            data["flocker"] = v.serialize()
+        v = self.gce_persistent_disk
+        if v is not None:
+            data["gcePersistentDisk"] = v.serialize()
+        v = self.git_repo
+        if v is not None:
+            data["gitRepo"] = v.serialize()
+        v = self.glusterfs
+        if v is not None:
+            data["glusterfs"] = v.serialize()
+        v = self.host_path
+        if v is not None:
+            data["hostPath"] = v.serialize()
+        v = self.iscsi
+        if v is not None:
+            data["iscsi"] = v.serialize()
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.nfs
+        if v is not None:
+            data["nfs"] = v.serialize()
+        v = self.persistent_volume_claim
+        if v is not None:
+            data["persistentVolumeClaim"] = v.serialize()
+        v = self.photon_persistent_disk
+        if v is not None:
+            data["photonPersistentDisk"] = v.serialize()
+        v = self.portworx_volume
+        if v is not None:
+            data["portworxVolume"] = v.serialize()
+        v = self.projected
+        if v is not None:
+            data["projected"] = v.serialize()
+        v = self.quobyte
+        if v is not None:
+            data["quobyte"] = v.serialize()
+        v = self.rbd
+        if v is not None:
+            data["rbd"] = v.serialize()
+        v = self.scale_io
+        if v is not None:
+            data["scaleIO"] = v.serialize()
+        v = self.secret
+        if v is not None:
+            data["secret"] = v.serialize()
+        v = self.storageos
+        if v is not None:
+            data["storageos"] = v.serialize()
+        v = self.vsphere_volume
+        if v is not None:
+            data["vsphereVolume"] = v.serialize()
+        return data
+
+
+class VolumeDevice(object):
+    """
+    io.k8s.api.core.v1.VolumeDevice: volumeDevice describes a mapping of a raw block device within a container.
+    """
+
+    __slots__ = ("device_path", "name")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.device_path = get("devicePath")
+        self.name = get("name")
+
+    def serialize(self):
+        data = {}
+        v = self.device_path
+        if v is not None:
+            data["devicePath"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        return data
+
+
+class VolumeMount(object):
+    """
+    io.k8s.api.core.v1.VolumeMount: VolumeMount describes a mounting of a Volume within a container.
+    """
+
+    __slots__ = ("mount_path", "mount_propagation", "name", "read_only", "sub_path")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.mount_path = get("mountPath")
+        self.mount_propagation = get("mountPropagation")
+        self.name = get("name")
+        self.read_only = get("readOnly")
+        self.sub_path = get("subPath")
+
+    def serialize(self):
+        data = {}
+        v = self.mount_path
+        if v is not None:
+            data["mountPath"] = v
+        v = self.mount_propagation
+        if v is not None:
+            data["mountPropagation"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.read_only
+        if v is not None:
+            data["readOnly"] = v
+        v = self.sub_path
+        if v is not None:
+            data["subPath"] = v
+        return data
+
+
+class VolumeNodeAffinity(object):
+    """
+    io.k8s.api.core.v1.VolumeNodeAffinity: VolumeNodeAffinity defines constraints that limit what nodes this volume can
+    be accessed from.
+    """
+
+    __slots__ = ("required",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("required")
+        self.required = None if v is None else NodeSelector(v)
+
+    def serialize(self):
+        data = {}
+        v = self.required
+        if v is not None:
+            data["required"] = v.serialize()
+        return data
+
+
+class VolumeProjection(object):
+    """
+    io.k8s.api.core.v1.VolumeProjection: Projection that may be projected along with other supported volume types
+    """
+
+    __slots__ = ("config_map", "downward_api", "secret")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("configMap")
+        self.config_map = None if v is None else ConfigMapProjection(v)
+        v = get("downwardAPI")
+        self.downward_api = None if v is None else DownwardAPIProjection(v)
+        v = get("secret")
+        self.secret = None if v is None else SecretProjection(v)
+
+    def serialize(self):
+        data = {}
+        v = self.config_map
+        if v is not None:
+            data["configMap"] = v.serialize()
+        v = self.downward_api
+        if v is not None:
+            data["downwardAPI"] = v.serialize()
+        v = self.secret
+        if v is not None:
+            data["secret"] = v.serialize()
+        return data
+
+
+class VsphereVirtualDiskVolumeSource(object):
+    """
+    io.k8s.api.core.v1.VsphereVirtualDiskVolumeSource: Represents a vSphere volume resource.
+    """
+
+    __slots__ = ("fs_type", "storage_policy_id", "storage_policy_name", "volume_path")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.fs_type = get("fsType")
+        self.storage_policy_id = get("storagePolicyID")
+        self.storage_policy_name = get("storagePolicyName")
+        self.volume_path = get("volumePath")
+
+    def serialize(self):
+        data = {}
+        v = self.fs_type
+        if v is not None:
+            data["fsType"] = v
+        v = self.storage_policy_id
+        if v is not None:
+            data["storagePolicyID"] = v
+        v = self.storage_policy_name
+        if v is not None:
+            data["storagePolicyName"] = v
+        v = self.volume_path
+        if v is not None:
+            data["volumePath"] = v
+        return data
+
+
+class WeightedPodAffinityTerm(object):
+    """
+    io.k8s.api.core.v1.WeightedPodAffinityTerm: The weights of all of the matched WeightedPodAffinityTerm fields are
+    added per-node to find the most preferred node(s)
+    """
+
+    __slots__ = ("pod_affinity_term", "weight")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("podAffinityTerm")
+        self.pod_affinity_term = None if v is None else PodAffinityTerm(v)
+        self.weight = get("weight")
+
+    def serialize(self):
+        data = {}
+        v = self.pod_affinity_term
+        if v is not None:
+            data["podAffinityTerm"] = v.serialize()
+        v = self.weight
+        if v is not None:
+            data["weight"] = v
+        return data
@@ -0,0 +1,831 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/swagger-v1.10.json: do not edit.
+
+from kubernetes_py.models.generated import core_v1
+from kubernetes_py.models.generated import meta_v1
+
+
+class DaemonSet(object):
+    """
+    io.k8s.api.extensions.v1beta1.DaemonSet: DEPRECATED - This group version of DaemonSet is deprecated by
+    apps/v1beta2/DaemonSet.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else DaemonSetSpec(v)
+        v = get("status")
+        self.status = None if v is None else DaemonSetStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class DaemonSetCondition(object):
+    """
+    io.k8s.api.extensions.v1beta1.DaemonSetCondition: DaemonSetCondition describes the state of a DaemonSet at a certain
+    point.
+    """
+
+    __slots__ = ("last_transition_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_transition_time = get("lastTransitionTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class DaemonSetList(object):
+    """
+    io.k8s.api.extensions.v1beta1.DaemonSetList: DaemonSetList is a collection of daemon sets.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [DaemonSet(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class DaemonSetSpec(object):
+    """
+    io.k8s.api.extensions.v1beta1.DaemonSetSpec: DaemonSetSpec is the specification of a daemon set.
+    """
+
+    __slots__ = (
+        "min_ready_seconds",
+        "revision_history_limit",
+        "selector",
+        "template",
+        "template_generation",
+        "update_strategy",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.min_ready_seconds = get("minReadySeconds")
+        self.revision_history_limit = get("revisionHistoryLimit")
+        v = get("selector")
+        self.selector = None if v is None else meta_v1.LabelSelector(v)
+        v = get("template")
+        self.template = None if v is None else core_v1.PodTemplateSpec(v)
+        self.template_generation = get("templateGeneration")
+        v = get("updateStrategy")
+        self.update_strategy = None if v is None else DaemonSetUpdateStrategy(v)
+
+    def serialize(self):
+        data = {}
+        v = self.min_ready_seconds
+        if v is not None:
+            data["minReadySeconds"] = v
+        v = self.revision_history_limit
+        if v is not None:
+            data["revisionHistoryLimit"] = v
+        v = self.selector
+        if v is not None:
+            data["selector"] = v.serialize()
+        v = self.template
+        if v is not None:
+            data["template"] = v.serialize()
+        v = self.template_generation
+        if v is not None:
+            data["templateGeneration"] = v
+        v = self.update_strategy
+        if v is not None:
+            data["updateStrategy"] = v.serialize()
+        return data
+
+
+class DaemonSetStatus(object):
+    """
+    io.k8s.api.extensions.v1beta1.DaemonSetStatus: DaemonSetStatus represents the current status of a daemon set.
+    """
+
+    __slots__ = (
+        "collision_count",
+        "conditions",
+        "current_number_scheduled",
+        "desired_number_scheduled",
+        "number_available",
+        "number_misscheduled",
+        "number_ready",
+        "number_unavailable",
+        "observed_generation",
+        "updated_number_scheduled",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.collision_count = get("collisionCount")
+        v = get("conditions")
+        self.conditions = None if v is None else [DaemonSetCondition(x) for x in v]
+        self.current_number_scheduled = get("currentNumberScheduled")
+        self.desired_number_scheduled = get("desiredNumberScheduled")
+        self.number_available = get("numberAvailable")
+        self.number_misscheduled = get("numberMisscheduled")
+        self.number_ready = get("numberReady")
+        self.number_unavailable = get("numberUnavailable")
+        self.observed_generation = get("observedGeneration")
+        self.updated_number_scheduled = get("updatedNumberScheduled")
+
+    def serialize(self):
+        data = {}
+        v = self.collision_count
+        if v is not None:
+            data["collisionCount"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.current_number_scheduled
+        if v is not None:
+            data["currentNumberScheduled"] = v
+        v = self.desired_number_scheduled
+        if v is not None:
+            data["desiredNumberScheduled"] = v
+        v = self.number_available
+        if v is not None:
+            data["numberAvailable"] = v
+        v = self.number_misscheduled
+        if v is not None:
+            data["numberMisscheduled"] = v
+        v = self.number_ready
+        if v is not None:
+            data["numberReady"] = v
+        v = self.number_unavailable
+        if v is not None:
+            data["numberUnavailable"] = v
+        v = self.observed_generation
+        if v is not None:
+            data["observedGeneration"] = v
+        v = self.updated_number_scheduled
+        if v is not None:
+            data["updatedNumberScheduled"] = v
+        return data
+
+
+class DaemonSetUpdateStrategy(object):
+    """
+    io.k8s.api.extensions.v1beta1.DaemonSetUpdateStrategy:
+    """
+
+    __slots__ = ("rolling_update", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("rollingUpdate")
+        self.rolling_update = None if v is None else RollingUpdateDaemonSet(v)
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.rolling_update
+        if v is not None:
+            data["rollingUpdate"] = v.serialize()
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class Deployment(object):
+    """
+    io.k8s.api.extensions.v1beta1.Deployment: DEPRECATED - This group version of Deployment is deprecated by
+    apps/v1beta2/Deployment.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else DeploymentSpec(v)
+        v = get("status")
+        self.status = None if v is None else DeploymentStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class DeploymentCondition(object):
+    """
+    io.k8s.api.extensions.v1beta1.DeploymentCondition: DeploymentCondition describes the state of a deployment at a
+    certain point.
+    """
+
+    __slots__ = ("last_transition_time", "last_update_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_transition_time = get("lastTransitionTime")
+        self.last_update_time = get("lastUpdateTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.last_update_time
+        if v is not None:
+            data["lastUpdateTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class DeploymentList(object):
+    """
+    io.k8s.api.extensions.v1beta1.DeploymentList: DeploymentList is a list of Deployments.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [Deployment(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class DeploymentSpec(object):
+    """
+    io.k8s.api.extensions.v1beta1.DeploymentSpec: DeploymentSpec is the specification of the desired behavior of the
+    Deployment.
+    """
+
+    __slots__ = (
+        "min_ready_seconds",
+        "paused",
+        "progress_deadline_seconds",
+        "replicas",
+        "revision_history_limit",
+        "rollback_to",
+        "selector",
+        "strategy",
+        "template",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.min_ready_seconds = get("minReadySeconds")
+        self.paused = get("paused")
+        self.progress_deadline_seconds = get("progressDeadlineSeconds")
+        self.replicas = get("replicas")
+        self.revision_history_limit = get("revisionHistoryLimit")
+        v = get("rollbackTo")
+        self.rollback_to = None if v is None else RollbackConfig(v)
+        v = get("selector")
+        self.selector = None if v is None else meta_v1.LabelSelector(v)
+        v = get("strategy")
+        self.strategy = None if v is None else DeploymentStrategy(v)
+        v = get("template")
+        self.template = None if v is None else core_v1.PodTemplateSpec(v)
+
+    def serialize(self):
+        data = {}
+        v = self.min_ready_seconds
+        if v is not None:
+            data["minReadySeconds"] = v
+        v = self.paused
+        if v is not None:
+            data["paused"] = v
+        v = self.progress_deadline_seconds
+        if v is not None:
+            data["progressDeadlineSeconds"] = v
+        v = self.replicas
+        if v is not None:
+            data["replicas"] = v
+        v = self.revision_history_limit
+        if v is not None:
+            data["revisionHistoryLimit"] = v
+        v = self.rollback_to
+        if v is not None:
+            data["rollbackTo"] = v.serialize()
+        v = self.selector
+        if v is not None:
+            data["selector"] = v.serialize()
+        v = self.strategy
+        if v is not None:
+            data["strategy"] = v.serialize()
+        v = self.template
+        if v is not None:
+            data["template"] = v.serialize()
+        return data
+
+
+class DeploymentStatus(object):
+    """
+    io.k8s.api.extensions.v1beta1.DeploymentStatus: DeploymentStatus is the most recently observed status of the
+    Deployment.
+    """
+
+    __slots__ = (
+        "available_replicas",
+        "collision_count",
+        "conditions",
+        "observed_generation",
+        "ready_replicas",
+        "replicas",
+        "unavailable_replicas",
+        "updated_replicas",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.available_replicas = get("availableReplicas")
+        self.collision_count = get("collisionCount")
+        v = get("conditions")
+        self.conditions = None if v is None else [DeploymentCondition(x) for x in v]
+        self.observed_generation = get("observedGeneration")
+        self.ready_replicas = get("readyReplicas")
+        self.replicas = get("replicas")
+        self.unavailable_replicas = get("unavailableReplicas")
+        self.updated_replicas = get("updatedReplicas")
+
+    def serialize(self):
+        data = {}
+        v = self.available_replicas
+        if v is not None:
+            data["availableReplicas"] = v
+        v = self.collision_count
+        if v is not None:
+            data["collisionCount"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.observed_generation
+        if v is not None:
+            data["observedGeneration"] = v
+        v = self.ready_replicas
+        if v is not None:
+            data["readyReplicas"] = v
+        v = self.replicas
+        if v is not None:
+            data["replicas"] = v
+        v = self.unavailable_replicas
+        if v is not None:
+            data["unavailableReplicas"] = v
+        v = self.updated_replicas
+        if v is not None:
+            data["updatedReplicas"] = v
+        return data
+
+
+class DeploymentStrategy(object):
+    """
+    io.k8s.api.extensions.v1beta1.DeploymentStrategy: DeploymentStrategy describes how to replace existing pods with new
+    ones.
+    """
+
+    __slots__ = ("rolling_update", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("rollingUpdate")
+        self.rolling_update = None if v is None else RollingUpdateDeployment(v)
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.rolling_update
+        if v is not None:
+            data["rollingUpdate"] = v.serialize()
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class ReplicaSet(object):
+    """
+    io.k8s.api.extensions.v1beta1.ReplicaSet: DEPRECATED - This group version of ReplicaSet is deprecated by
+    apps/v1beta2/ReplicaSet.
+    """
+
+    __slots__ = ("api_version", "kind", "metadata", "spec", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("spec")
+        self.spec = None if v is None else ReplicaSetSpec(v)
+        v = get("status")
+        self.status = None if v is None else ReplicaSetStatus(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.spec
+        if v is not None:
+            data["spec"] = v.serialize()
+        v = self.status
+        if v is not None:
+            data["status"] = v.serialize()
+        return data
+
+
+class ReplicaSetCondition(object):
+    """
+    io.k8s.api.extensions.v1beta1.ReplicaSetCondition: ReplicaSetCondition describes the state of a replica set at a
+    certain point.
+    """
+
+    __slots__ = ("last_transition_time", "message", "reason", "status", "type")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.last_transition_time = get("lastTransitionTime")
+        self.message = get("message")
+        self.reason = get("reason")
+        self.status = get("status")
+        self.type = get("type")
+
+    def serialize(self):
+        data = {}
+        v = self.last_transition_time
+        if v is not None:
+            data["lastTransitionTime"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        v = self.type
+        if v is not None:
+            data["type"] = v
+        return data
+
+
+class ReplicaSetList(object):
+    """
+    io.k8s.api.extensions.v1beta1.ReplicaSetList: ReplicaSetList is a collection of ReplicaSets.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [ReplicaSet(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
+
+
+class ReplicaSetSpec(object):
+    """
+    io.k8s.api.extensions.v1beta1.ReplicaSetSpec: ReplicaSetSpec is the specification of a ReplicaSet.
+    """
+
+    __slots__ = ("min_ready_seconds", "replicas", "selector", "template")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.min_ready_seconds = get("minReadySeconds")
+        self.replicas = get("replicas")
+        v = get("selector")
+        self.selector = None if v is None else meta_v1.LabelSelector(v)
+        v = get("template")
+        self.template = None if v is None else core_v1.PodTemplateSpec(v)
+
+    def serialize(self):
+        data = {}
+        v = self.min_ready_seconds
+        if v is not None:
+            data["minReadySeconds"] = v
+        v = self.replicas
+        if v is not None:
+            data["replicas"] = v
+        v = self.selector
+        if v is not None:
+            data["selector"] = v.serialize()
+        v = self.template
+        if v is not None:
+            data["template"] = v.serialize()
+        return data
+
+
+class ReplicaSetStatus(object):
+    """
+    io.k8s.api.extensions.v1beta1.ReplicaSetStatus: ReplicaSetStatus represents the current status of a ReplicaSet.
+    """
+
+    __slots__ = (
+        "available_replicas",
+        "conditions",
+        "fully_labeled_replicas",
+        "observed_generation",
+        "ready_replicas",
+        "replicas",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.available_replicas = get("availableReplicas")
+        v = get("conditions")
+        self.conditions = None if v is None else [ReplicaSetCondition(x) for x in v]
+        self.fully_labeled_replicas = get("fullyLabeledReplicas")
+        self.observed_generation = get("observedGeneration")
+        self.ready_replicas = get("readyReplicas")
+        self.replicas = get("replicas")
+
+    def serialize(self):
+        data = {}
+        v = self.available_replicas
+        if v is not None:
+            data["availableReplicas"] = v
+        v = self.conditions
+        if v is not None:
+            data["conditions"] = [x.serialize() for x in v]
+        v = self.fully_labeled_replicas
+        if v is not None:
+            data["fullyLabeledReplicas"] = v
+        v = self.observed_generation
+        if v is not None:
+            data["observedGeneration"] = v
+        v = self.ready_replicas
+        if v is not None:
+            data["readyReplicas"] = v
+        v = self.replicas
+        if v is not None:
+            data["replicas"] = v
+        return data
+
+
+class RollbackConfig(object):
+    """
+    io.k8s.api.extensions.v1beta1.RollbackConfig: DEPRECATED.
+    """
+
+    __slots__ = ("revision",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.revision = get("revision")
+
+    def serialize(self):
+        data = {}
+        v = self.revision
+        if v is not None:
+            data["revision"] = v
+        return data
+
+
+class RollingUpdateDaemonSet(object):
+    """
+    io.k8s.api.extensions.v1beta1.RollingUpdateDaemonSet: Spec to control the desired behavior of daemon set rolling
+    update.
+    """
+
+    __slots__ = ("max_unavailable",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.max_unavailable = get("maxUnavailable")
+
+    def serialize(self):
+        data = {}
+        v = self.max_unavailable
+        if v is not None:
+            data["maxUnavailable"] = v
+        return data
+
+
+class RollingUpdateDeployment(object):
+    """
+    io.k8s.api.extensions.v1beta1.RollingUpdateDeployment: Spec to control the desired behavior of rolling update.
+    """
+
+    __slots__ = ("max_surge", "max_unavailable")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.max_surge = get("maxSurge")
+        self.max_unavailable = get("maxUnavailable")
+
+    def serialize(self):
+        data = {}
+        v = self.max_surge
+        if v is not None:
+            data["maxSurge"] = v
+        v = self.max_unavailable
+        if v is not None:
+            data["maxUnavailable"] = v
+        return data
@@ -0,0 +1,426 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/swagger-v1.10.json: do not edit.
+
+
+class Initializer(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.Initializer: Initializer is information about an initializer that has not yet
+    completed.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.name = get("name")
+
+    def serialize(self):
+        data = {}
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        return data
+
+
+class Initializers(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.Initializers: Initializers tracks the progress of initialization.
+    """
+
+    __slots__ = ("pending", "result")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("pending")
+        self.pending = None if v is None else [Initializer(x) for x in v]
+        v = get("result")
+        self.result = None if v is None else Status(v)
+
+    def serialize(self):
+        data = {}
+        v = self.pending
+        if v is not None:
+            data["pending"] = [x.serialize() for x in v]
+        v = self.result
+        if v is not None:
+            data["result"] = v.serialize()
+        return data
+
+
+class LabelSelector(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.LabelSelector: A label selector is a label query over a set of resources.
+    """
+
+    __slots__ = ("match_expressions", "match_labels")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("matchExpressions")
+        self.match_expressions = None if v is None else [LabelSelectorRequirement(x) for x in v]
+        v = get("matchLabels")
+        self.match_labels = None if v is None else dict(v)
+
+    def serialize(self):
+        data = {}
+        v = self.match_expressions
+        if v is not None:
+            data["matchExpressions"] = [x.serialize() for x in v]
+        v = self.match_labels
+        if v is not None:
+            data["matchLabels"] = v
+        return data
+
+
+class LabelSelectorRequirement(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.LabelSelectorRequirement: A label selector requirement is a selector that
+    contains values, a key, and an operator that relates the key and values.
+    """
+
+    __slots__ = ("key", "operator", "values")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.key = get("key")
+        self.operator = get("operator")
+        v = get("values")
+        self.values = None if v is None else list(v)
+
+    def serialize(self):
+        data = {}
+        v = self.key
+        if v is not None:
+            data["key"] = v
+        v = self.operator
+        if v is not None:
+            data["operator"] = v
+        v = self.values
+        if v is not None:
+            data["values"] = v
+        return data
+
+
+class ListMeta(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.ListMeta: ListMeta describes metadata that synthetic resources must have,
+    including lists and various status objects.
+    """
+
+    __slots__ = ("continue_", "resource_version", "self_link")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.continue_ = get("continue")
+        self.resource_version = get("resourceVersion")
+        self.self_link = get("selfLink")
+
+    def serialize(self):
+        data = {}
+        v = self.continue_
+        if v is not None:
+            data["continue"] = v
+        v = self.resource_version
+        if v is not None:
+            data["resourceVersion"] = v
+        v = self.self_link
+        if v is not None:
+            data["selfLink"] = v
+        return data
+
+
+class ObjectMeta(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta: ObjectMeta is metadata that all persisted resources must have,
+    which includes all objects users must create.
+    """
+
+    __slots__ = (
+        "annotations",
+        "cluster_name",
+        "creation_timestamp",
+        "deletion_grace_period_seconds",
+        "deletion_timestamp",
+        "finalizers",
+        "generate_name",
+        "generation",
+        "initializers",
+        "labels",
+        "name",
+        "namespace",
+        "owner_references",
+        "resource_version",
+        "self_link",
+        "uid",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("annotations")
+        self.annotations = None if v is None else dict(v)
+        self.cluster_name = get("clusterName")
+        self.creation_timestamp = get("creationTimestamp")
+        self.deletion_grace_period_seconds = get("deletionGracePeriodSeconds")
+        self.deletion_timestamp = get("deletionTimestamp")
+        v = get("finalizers")
+        self.finalizers = None if v is None else list(v)
+        self.generate_name = get("generateName")
+        self.generation = get("generation")
+        v = get("initializers")
+        self.initializers = None if v is None else Initializers(v)
+        v = get("labels")
+        self.labels = None if v is None else dict(v)
+        self.name = get("name")
+        self.namespace = get("namespace")
+        v = get("ownerReferences")
+        self.owner_references = None if v is None else [OwnerReference(x) for x in v]
+        self.resource_version = get("resourceVersion")
+        self.self_link = get("selfLink")
+        self.uid = get("uid")
+
+    def serialize(self):
+        data = {}
+        v = self.annotations
+        if v is not None:
+            data["annotations"] = v
+        v = self.cluster_name
+        if v is not None:
+            data["clusterName"] = v
+        v = self.creation_timestamp
+        if v is not None:
+            data["creationTimestamp"] = v
+        v = self.deletion_grace_period_seconds
+        if v is not None:
+            data["deletionGracePeriodSeconds"] = v
+        v = self.deletion_timestamp
+        if v is not None:
+            data["deletionTimestamp"] = v
+        v = self.finalizers
+        if v is not None:
+            data["finalizers"] = v
+        v = self.generate_name
+        if v is not None:
+            data["generateName"] = v
+        v = self.generation
+        if v is not None:
+            data["generation"] = v
+        v = self.initializers
+        if v is not None:
+            data["initializers"] = v.serialize()
+        v = self.labels
+        if v is not None:
+            data["labels"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.namespace
+        if v is not None:
+            data["namespace"] = v
+        v = self.owner_references
+        if v is not None:
+            data["ownerReferences"] = [x.serialize() for x in v]
+        v = self.resource_version
+        if v is not None:
+            data["resourceVersion"] = v
+        v = self.self_link
+        if v is not None:
+            data["selfLink"] = v
+        v = self.uid
+        if v is not None:
+            data["uid"] = v
+        return data
+
+
+class OwnerReference(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference: OwnerReference contains enough information to let you identify
+    an owning object.
+    """
+
+    __slots__ = ("api_version", "block_owner_deletion", "controller", "kind", "name", "uid")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.block_owner_deletion = get("blockOwnerDeletion")
+        self.controller = get("controller")
+        self.kind = get("kind")
+        self.name = get("name")
+        self.uid = get("uid")
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.block_owner_deletion
+        if v is not None:
+            data["blockOwnerDeletion"] = v
+        v = self.controller
+        if v is not None:
+            data["controller"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.uid
+        if v is not None:
+            data["uid"] = v
+        return data
+
+
+class Status(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.Status: Status is a return value for calls that don't return other objects.
+    """
+
+    __slots__ = ("api_version", "code", "details", "kind", "message", "metadata", "reason", "status")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        self.code = get("code")
+        v = get("details")
+        self.details = None if v is None else StatusDetails(v)
+        self.kind = get("kind")
+        self.message = get("message")
+        v = get("metadata")
+        self.metadata = None if v is None else ListMeta(v)
+        self.reason = get("reason")
+        self.status = get("status")
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.code
+        if v is not None:
+            data["code"] = v
+        v = self.details
+        if v is not None:
+            data["details"] = v.serialize()
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        v = self.status
+        if v is not None:
+            data["status"] = v
+        return data
+
+
+class StatusCause(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.StatusCause: StatusCause provides more information about an api.Status failure,
+    including cases when multiple errors are encountered.
+    """
+
+    __slots__ = ("field", "message", "reason")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.field = get("field")
+        self.message = get("message")
+        self.reason = get("reason")
+
+    def serialize(self):
+        data = {}
+        v = self.field
+        if v is not None:
+            data["field"] = v
+        v = self.message
+        if v is not None:
+            data["message"] = v
+        v = self.reason
+        if v is not None:
+            data["reason"] = v
+        return data
+
+
+class StatusDetails(object):
+    """
+    io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails: StatusDetails is a set of additional properties that MAY be set
+    by the server to provide additional information about a response.
+    """
+
+    __slots__ = ("causes", "group", "kind", "name", "retry_after_seconds", "uid")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        v = get("causes")
+        self.causes = None if v is None else [StatusCause(x) for x in v]
+        self.group = get("group")
+        self.kind = get("kind")
+        self.name = get("name")
+        self.retry_after_seconds = get("retryAfterSeconds")
+        self.uid = get("uid")
+
+    def serialize(self):
+        data = {}
+        v = self.causes
+        if v is not None:
+            data["causes"] = [x.serialize() for x in v]
+        v = self.group
+        if v is not None:
+            data["group"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.name
+        if v is not None:
+            data["name"] = v
+        v = self.retry_after_seconds
+        if v is not None:
+            data["retryAfterSeconds"] = v
+        v = self.uid
+        if v is not None:
+            data["uid"] = v
+        return data
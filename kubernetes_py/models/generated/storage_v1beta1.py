@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+# Generated by codegen/generate.py from codegen/swagger-v1.10.json: do not edit.
+
+from kubernetes_py.models.generated import meta_v1
+
+
+class StorageClass(object):
+    """
+    io.k8s.api.storage.v1beta1.StorageClass: StorageClass describes the parameters for a class of storage for which
+    PersistentVolumes can be dynamically provisioned.
+    """
+
+    __slots__ = (
+        "allow_volume_expansion",
+        "api_version",
+        "kind",
+        "metadata",
+        "mount_options",
+        "parameters",
+        "provisioner",
+        "reclaim_policy",
+        "volume_binding_mode",
+    )
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.allow_volume_expansion = get("allowVolumeExpansion")
+        self.api_version = get("apiVersion")
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ObjectMeta(v)
+        v = get("mountOptions")
+        self.mount_options = None if v is None else list(v)
+        v = get("parameters")
+        self.parameters = None if v is None else dict(v)
+        self.provisioner = get("provisioner")
+        self.reclaim_policy = get("reclaimPolicy")
+        self.volume_binding_mode = get("volumeBindingMode")
+
+    def serialize(self):
+        data = {}
+        v = self.allow_volume_expansion
+        if v is not None:
+            data["allowVolumeExpansion"] = v
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        v = self.mount_options
+        if v is not None:
+            data["mountOptions"] = v
+        v = self.parameters
+        if v is not None:
+            data["parameters"] = v
+        v = self.provisioner
+        if v is not None:
+            data["provisioner"] = v
+        v = self.reclaim_policy
+        if v is not None:
+            data["reclaimPolicy"] = v
+        v = self.volume_binding_mode
+        if v is not None:
+            data["volumeBindingMode"] = v
+        return data
+
+
+class StorageClassList(object):
+    """
+    io.k8s.api.storage.v1beta1.StorageClassList: StorageClassList is a collection of storage classes.
+    """
+
+    __slots__ = ("api_version", "items", "kind", "metadata")
+
+    def __init__(self, model=None):
+        self._build_with_model({} if model is None else model)
+
+    def _build_with_model(self, model=None):
+        get = model.get
+        self.api_version = get("apiVersion")
+        v = get("items")
+        self.items = None if v is None else [StorageClass(x) for x in v]
+        self.kind = get("kind")
+        v = get("metadata")
+        self.metadata = None if v is None else meta_v1.ListMeta(v)
+
+    def serialize(self):
+        data = {}
+        v = self.api_version
+        if v is not None:
+            data["apiVersion"] = v
+        v = self.items
+        if v is not None:
+            data["items"] = [x.serialize() for x in v]
+        v = self.kind
+        if v is not None:
+            data["kind"] = v
+        v = self.metadata
+        if v is not None:
+            data["metadata"] = v.serialize()
+        return data
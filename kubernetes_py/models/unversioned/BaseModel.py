@@ -7,10 +7,15 @@
 #
 
 from kubernetes_py.models.v1.ObjectMeta import ObjectMeta
-from kubernetes_py.utils import is_valid_string
+from kubernetes_py.utils import build_trusted, filter_model, is_valid_string
+
+# the fields each built on their own the first time they are read.
+LAZY_FIELDS = {"_metadata": "metadata", "_spec": "spec", "_status": "status"}
 
 
 class BaseModel(object):
+    __slots__ = ("_api_version", "_kind", "_metadata", "_spec", "_status")
+
     def __init__(self, model=None):
         super(BaseModel, self).__init__()
 
@@ -23,6 +28,34 @@ class BaseModel(object):
         if model is not None:
             self.build_with_model(model)
 
+    @classmethod
+    def lazy(cls, model=None, trusted=False):
+        """
+        Builds a model keeping 'model' as it is: its metadata, spec and status are only built
+        the first time they are read, and the other fields the first time any of them is read.
+
+        A lazy model serializes back to 'model' as long as it was not modified, and shares the dicts of 'model'.
+
+        :param model: A dict as returned by the API server.
+        :param trusted: Whether to build the fields without validating them, see utils.build_trusted().
+        """
+
+        if not isinstance(model, dict):
+            raise SyntaxError("{0}: model: [ {1} ] is invalid.".format(cls.__name__, model))
+        if cls not in _LAZY_CLASSES:
+            attrs = {
+                "__module__": cls.__module__,
+                "__slots__": ("_raw", "_trusted", "_others"),
+                "_model_class": cls,
+                "_model_slots": _slot_names(cls),
+                "_field_classes": {},
+            }
+            _LAZY_CLASSES[cls] = type(cls.__name__, (LazyModel, cls), attrs)
+        obj = _LAZY_CLASSES[cls].__new__(_LAZY_CLASSES[cls])
+        obj._raw = filter_model(model)
+        obj._trusted = trusted
+        return obj
+
     def build_with_model(self, model=None):
         if "apiVersion" in model:
             self.api_version = model["apiVersion"]
@@ -117,3 +150,97 @@ class BaseModel(object):
         if self.metadata is not None:
             data["metadata"] = self.metadata.serialize()
         return data
+
+
+# ------------------------------------------------------------------------------------- lazy
+
+_LAZY_CLASSES = {}
+
+
+def _slot_names(cls=None):
+    names = []
+    for c in reversed(cls.__mro__):
+        names.extend(c.__dict__.get("__slots__", ()))
+    return tuple(names)
+
+
+class LazyModel(object):
+    """
+    The behaviour of the models returned by BaseModel.lazy(), mixed into a subclass of each model class.
+    """
+
+    __slots__ = ()
+
+    # the model class extended, its attributes, and the class each of its fields is built with.
+    _model_class = None
+    _model_slots = None
+    _field_classes = None
+
+    def __getattr__(self, attr):
+        # only called for the attributes not set yet.
+        if not attr.startswith("_") or attr.startswith("__") or attr in ("_raw", "_trusted", "_others"):
+            raise AttributeError("{0} has no attribute: [ {1} ]".format(type(self).__name__, attr))
+        raw = self._raw
+        key = LAZY_FIELDS.get(attr, None)
+        if key is not None and key in raw:
+            setattr(self, attr, self._build_field(key))
+        elif not self._is_built("_others"):
+            self._build_others()
+        return object.__getattribute__(self, attr)
+
+    def _is_built(self, attr=None):
+        try:
+            object.__getattribute__(self, attr)
+            return True
+        except AttributeError:
+            return False
+
+    def _build(self, model_class=None, model=None):
+        if self._trusted:
+            return build_trusted(model_class, model)
+        return model_class(model)
+
+    def _build_field(self, key=None):
+        classes = self._field_classes
+        if key in classes:
+            return self._build(classes[key], self._raw[key])
+        value = getattr(self._build(self._model_class, {key: self._raw[key]}), "_" + key)
+        if hasattr(value, "serialize"):
+            classes[key] = type(value)
+        return value
+
+    def _build_others(self):
+        raw = self._raw
+        others = dict((k, v) for k, v in raw.items() if k not in LAZY_FIELDS.values())
+        built = self._build(self._model_class, others)
+        for attr in self._model_slots:
+            if self._is_built(attr) or (attr in LAZY_FIELDS and LAZY_FIELDS[attr] in raw):
+                continue
+            try:
+                setattr(self, attr, getattr(built, attr))
+            except AttributeError:
+                pass
+        self._others = True
+
+    def serialize(self):
+        raw = self._raw
+        if self._is_built("_others"):
+            # a field outside of metadata, spec and status was read: compare the whole model.
+            data = super(LazyModel, self).serialize()
+            if data == self._build(self._model_class, raw).serialize():
+                return dict(raw)
+            return data
+
+        data = dict(raw)
+        for attr, key in LAZY_FIELDS.items():
+            if not self._is_built(attr):
+                continue
+            value = object.__getattribute__(self, attr)
+            if key not in raw:
+                if value is not None:
+                    data[key] = value.serialize()
+            else:
+                serialized = value.serialize()
+                if serialized != self._build_field(key).serialize():
+                    data[key] = serialized
+        return data
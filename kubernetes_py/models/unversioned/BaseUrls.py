@@ -11,6 +11,8 @@ class BaseUrls(object):
     """
     Wrapper around a map of URL endpoints for each K8sObject type.
 
+    The URLs are built from a table of (prefix, namespaced, resource) templates, one table per set of API
+    versions, built once and kept. A URL is then the concatenation of its template and of the namespace.
     """
 
     default_api_version = "v1"
@@ -20,60 +22,109 @@ class BaseUrls(object):
     default_extensions_version = "v1beta1"
     default_cron_version = "v1beta1"
 
+    _tables = {}
+
     def __init__(self, namespace="default", api=None, apps=None, autoscaling=None, extensions=None, batch=None, cron=None):
+        table = self.templates(api, apps, autoscaling, extensions, batch, cron)
+        self.urls = dict((x, self._url(table[x], namespace)) for x in table)
+
+    @classmethod
+    def templates(cls, api=None, apps=None, autoscaling=None, extensions=None, batch=None, cron=None):
+        """
+        :return: A dict of object type to its (prefix, namespaced, resource) template, or None.
+        """
+
+        key = (api, apps, autoscaling, extensions, batch, cron)
+        table = cls._tables.get(key, None)
+        if table is None:
+            table = cls._build_templates(*key)
+            cls._tables[key] = table
+        return table
 
+    @classmethod
+    def _build_templates(cls, api=None, apps=None, autoscaling=None, extensions=None, batch=None, cron=None):
         if api is None:
-            api = self.default_api_version
+            api = cls.default_api_version
         if apps is None:
-            apps = self.default_apps_version
+            apps = cls.default_apps_version
         if autoscaling is None:
-            autoscaling = self.default_autoscaling_version
+            autoscaling = cls.default_autoscaling_version
         if batch is None:
-            batch = self.default_batch_version
+            batch = cls.default_batch_version
         if extensions is None:
-            extensions = self.default_extensions_version
+            extensions = cls.default_extensions_version
         if cron is None:
-            cron = self.default_cron_version
+            cron = cls.default_cron_version
 
-        self.urls = dict()
+        core = "/api/{0}".format(api)
+        table = dict()
 
         # api
-        self.urls["ComponentStatus"] = "/api/{0}/componentstatuses".format(api)
-        self.urls["ConfigMap"] = "/api/{0}/namespaces/{1}/configmaps".format(api, namespace)
-        self.urls["Event"] = "/api/{0}/events".format(api)
-        self.urls["Namespace"] = "/api/{0}/namespaces".format(api)
-        self.urls["Node"] = "/api/{0}/nodes".format(api)
-        self.urls["Pod"] = "/api/{0}/namespaces/{1}/pods".format(api, namespace)
-        self.urls["PodMetrics"] = "/apis/metrics.k8s.io/v1beta1/namespaces/{0}/pods".format(namespace)
-        self.urls["PersistentVolume"] = "/api/{0}/persistentvolumes".format(api)
-        self.urls["PersistentVolumeClaim"] = "/api/{0}/namespaces/{1}/persistentvolumeclaims".format(api, namespace)
-        self.urls["ReplicationController"] = "/api/{0}/namespaces/{1}/replicationcontrollers".format(api, namespace)
-        self.urls["Service"] = "/api/{0}/namespaces/{1}/services".format(api, namespace)
-        self.urls["ServiceAccount"] = "/api/{0}/namespaces/{1}/serviceaccounts".format(api, namespace)
-        self.urls["Secret"] = "/api/{0}/namespaces/{1}/secrets".format(api, namespace)
-        self.urls["StorageClass"] = "/apis/storage.k8s.io/v1beta1/storageclasses"
+        table["ComponentStatus"] = (core, False, "/componentstatuses")
+        table["ConfigMap"] = (core, True, "/configmaps")
+        table["Event"] = (core, False, "/events")
+        table["Namespace"] = (core, False, "/namespaces")
+        table["Node"] = (core, False, "/nodes")
+        table["NodeMetrics"] = ("/apis/metrics.k8s.io/v1beta1", False, "/nodes")
+        table["Pod"] = (core, True, "/pods")
+        table["PodMetrics"] = ("/apis/metrics.k8s.io/v1beta1", True, "/pods")
+        table["PersistentVolume"] = (core, False, "/persistentvolumes")
+        table["PersistentVolumeClaim"] = (core, True, "/persistentvolumeclaims")
+        table["ReplicationController"] = (core, True, "/replicationcontrollers")
+        table["Service"] = (core, True, "/services")
+        table["ServiceAccount"] = (core, True, "/serviceaccounts")
+        table["Secret"] = (core, True, "/secrets")
+        table["StorageClass"] = ("/apis/storage.k8s.io/v1beta1", False, "/storageclasses")
 
         # autoscaling
-        self.urls["HorizontalPodAutoscaler"] = "/apis/autoscaling/{0}/namespaces/{1}/horizontalpodautoscalers".format(
-            autoscaling, namespace
+        table["HorizontalPodAutoscaler"] = (
+            "/apis/autoscaling/{0}".format(autoscaling),
+            True,
+            "/horizontalpodautoscalers",
         )
 
         # apps
-        self.urls["PetSet"] = "/apis/apps/v1alpha1/namespaces/{}/petsets".format(namespace)
-        self.urls["StatefulSet"] = "/apis/apps/v1beta1/namespaces/{}/statefulsets".format(namespace)
+        table["PetSet"] = ("/apis/apps/v1alpha1", True, "/petsets")
+        table["StatefulSet"] = ("/apis/apps/v1beta1", True, "/statefulsets")
 
         # batch
-        self.urls["Job"] = "/apis/batch/{0}/namespaces/{1}/jobs".format(batch, namespace)
-        self.urls["ScheduledJob"] = "/apis/batch/{0}/namespaces/{1}/scheduledjobs".format(cron, namespace)
-        self.urls["CronJob"] = "/apis/batch/{0}/namespaces/{1}/cronjobs".format(cron, namespace)
+        table["Job"] = ("/apis/batch/{0}".format(batch), True, "/jobs")
+        table["ScheduledJob"] = ("/apis/batch/{0}".format(cron), True, "/scheduledjobs")
+        table["CronJob"] = ("/apis/batch/{0}".format(cron), True, "/cronjobs")
 
         # extensions
-        self.urls["DaemonSet"] = "/apis/extensions/{0}/namespaces/{1}/daemonsets".format(extensions, namespace)
-        self.urls["Deployment"] = "/apis/extensions/{0}/namespaces/{1}/deployments".format(extensions, namespace)
-        self.urls["ReplicaSet"] = "/apis/extensions/{0}/namespaces/{1}/replicasets".format(extensions, namespace)
+        table["DaemonSet"] = ("/apis/extensions/{0}".format(extensions), True, "/daemonsets")
+        table["Deployment"] = ("/apis/extensions/{0}".format(extensions), True, "/deployments")
+        table["ReplicaSet"] = ("/apis/extensions/{0}".format(extensions), True, "/replicasets")
 
         # other
-        self.urls["Volume"] = None
+        table["Volume"] = None
+
+        return table
+
+    @staticmethod
+    def _url(template=None, namespace=None):
+        if template is None:
+            return None
+        prefix, namespaced, resource = template
+        # without a namespace, namespaced types are reached across all namespaces.
+        if namespaced and namespace is not None:
+            return prefix + "/namespaces/" + namespace + resource
+        return prefix + resource
+
+    @classmethod
+    def url(cls, object_type=None, namespace="default", api=None, **versions):
+        """
+        The URL of 'object_type', as get_base_url() returns it, without building the URLs of the other types.
+
+        :param versions: The other API versions, as for BaseUrls().
+        """
+
+        table = cls.templates(api, **versions)
+        if object_type not in table:
+            types = ", ".join(table.keys())
+            raise SyntaxError("BaseUrls: object_type: [ {0} ] must be in: [ {1} ]".format(object_type, types))
+        return cls._url(table[object_type], namespace)
 
     def get_base_url(self, object_type=None):
         if object_type is None or object_type not in self.urls.keys():
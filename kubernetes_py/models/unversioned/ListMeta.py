@@ -14,6 +14,8 @@ class ListMeta(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_unversioned_listmeta
     """
 
+    __slots__ = ("_name", "_self_link", "_resource_version")
+
     def __init__(self, model=None):
         super(ListMeta, self).__init__()
 
@@ -11,6 +11,8 @@ from kubernetes_py.utils import is_valid_string
 
 
 class ListModel(object):
+    __slots__ = ("_api_version", "_kind", "_metadata", "_items")
+
     def __init__(self):
         super(ListModel, self).__init__()
 
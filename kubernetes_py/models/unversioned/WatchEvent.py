@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes_py.utils import is_valid_string
+
+
+class WatchEvent(object):
+    """
+    https://kubernetes.io/docs/reference/generated/kubernetes-api/v1.10/#watchevent-v1-meta
+
+    The object of ADDED, MODIFIED, DELETED and BOOKMARK events is built with 'cls', the model class of
+    the watched kind (Pod, Deployment, ...). The object of an ERROR event is left as a Status dict.
+    """
+
+    __slots__ = ("_type", "_object", "_raw")
+
+    VALID_TYPES = ["ADDED", "MODIFIED", "DELETED", "BOOKMARK", "ERROR"]
+
+    def __init__(self, model=None, cls=None):
+        super(WatchEvent, self).__init__()
+
+        self._type = None
+        self._object = None
+        self._raw = None
+
+        if model is not None:
+            self._build_with_model(model, cls)
+
+    def _build_with_model(self, model=None, cls=None):
+        if "type" in model:
+            self.type = model["type"]
+        if "object" in model:
+            self._raw = model["object"]
+            if cls is not None and self.type != "ERROR":
+                self.object = cls(model["object"])
+            else:
+                self.object = model["object"]
+
+    def __repr__(self):
+        return "WatchEvent({0}, {1})".format(self.type, self.name)
+
+    # ------------------------------------------------------------------------------------- type
+
+    @property
+    def type(self):
+        return self._type
+
+    @type.setter
+    def type(self, t=None):
+        if not is_valid_string(t) or t not in self.VALID_TYPES:
+            raise SyntaxError("WatchEvent: type: [ {0} ] is invalid.".format(t))
+        self._type = t
+
+    # ------------------------------------------------------------------------------------- object
+
+    @property
+    def object(self):
+        return self._object
+
+    @object.setter
+    def object(self, o=None):
+        if o is None:
+            raise SyntaxError("WatchEvent: object: [ {0} ] is invalid.".format(o))
+        self._object = o
+
+    # ------------------------------------------------------------------------------------- raw
+
+    @property
+    def raw(self):
+        return self._raw
+
+    # ------------------------------------------------------------------------------------- helpers
+
+    @property
+    def name(self):
+        if isinstance(self._raw, dict):
+            return self._raw.get("metadata", {}).get("name", None)
+        return None
+
+    @property
+    def resource_version(self):
+        if isinstance(self._raw, dict):
+            return self._raw.get("metadata", {}).get("resourceVersion", None)
+        return None
+
+    # ------------------------------------------------------------------------------------- serialize
+
+    def serialize(self):
+        data = {}
+        if self.type is not None:
+            data["type"] = self.type
+        if self.object is not None:
+            data["object"] = self.object.serialize() if hasattr(self.object, "serialize") else self.object
+        return data
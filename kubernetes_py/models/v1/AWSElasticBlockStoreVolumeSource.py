@@ -16,6 +16,8 @@ class AWSElasticBlockStoreVolumeSource(object):
     An AWS EBS disk with the specified volume-id must exist before mounting to a container.
     """
 
+    __slots__ = ("_fs_type", "_partition", "_read_only", "_volume_id")
+
     def __init__(self, model=None):
         super(AWSElasticBlockStoreVolumeSource, self).__init__()
 
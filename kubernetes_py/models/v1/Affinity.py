@@ -16,6 +16,8 @@ class Affinity(object):
     https://kubernetes.io/docs/concepts/configuration/assign-pod-node/#affinity-and-anti-affinity
     """
 
+    __slots__ = ("_node_affinity", "_pod_affinity", "_pod_anti_affinity")
+
     def __init__(self, model=None):
         super(Affinity, self).__init__()
 
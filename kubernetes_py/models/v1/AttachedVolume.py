@@ -13,6 +13,8 @@ class AttachedVolume(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_attachedvolume
     """
 
+    __slots__ = ("_name", "_device_path")
+
     def __init__(self, model=None):
         super(AttachedVolume, self).__init__()
 
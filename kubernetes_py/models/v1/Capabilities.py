@@ -14,6 +14,8 @@ class Capabilities(object):
     https://kubernetes.io/docs/api-reference/v1.5/#capabilities-v1-core
     """
 
+    __slots__ = ("_add", "_drop")
+
     def __init__(self, model=None):
         super(Capabilities, self).__init__()
 
@@ -13,6 +13,8 @@ class ComponentCondition(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_componentcondition
     """
 
+    __slots__ = ("_type", "_status", "_message", "_error")
+
     VALID_TYPE = ["Healthy"]
     VALID_STATUS = ["True", "False", "Unknown"]
 
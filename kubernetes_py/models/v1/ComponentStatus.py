@@ -17,6 +17,8 @@ class ComponentStatus(BaseModel):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_componentstatus
     """
 
+    __slots__ = ("_conditions",)
+
     def __init__(self, model=None):
         super(ComponentStatus, self).__init__(model=model)
 
@@ -17,6 +17,8 @@ class ComponentStatusList(ListModel):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_componentstatuslist
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(ComponentStatusList, self).__init__()
 
@@ -16,6 +16,8 @@ class ConfigMap(BaseModel):
     https://kubernetes.io/docs/api-reference/v1.8/#configmap-v1-core
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, model=None):
         super(ConfigMap, self).__init__()
 
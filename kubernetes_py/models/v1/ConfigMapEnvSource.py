@@ -18,6 +18,8 @@ class ConfigMapEnvSource(object):
     The contents of the target ConfigMap's Data field will represent the key-value pairs as environment variables.
     """
 
+    __slots__ = ("_name", "_optional")
+
     def __init__(self, model=None):
         super(ConfigMapEnvSource, self).__init__()
 
@@ -14,6 +14,8 @@ class ConfigMapKeySelector(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_configmapkeyselector
     """
 
+    __slots__ = ("_name", "_key")
+
     def __init__(self, model=None):
         super(ConfigMapKeySelector, self).__init__()
 
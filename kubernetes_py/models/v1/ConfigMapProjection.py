@@ -21,6 +21,8 @@ class ConfigMapProjection(object):
     Note that this is identical to a configmap volume source without the default mode.
     """
 
+    __slots__ = ("_items", "_name", "_optional")
+
     def __init__(self, model=None):
         super(ConfigMapProjection, self).__init__()
 
@@ -6,6 +6,8 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+from six import string_types
+
 from kubernetes_py.utils import is_valid_string, filter_model
 from kubernetes_py.models.v1.KeyToPath import KeyToPath
 
@@ -19,6 +21,8 @@ class ConfigMapVolumeSource(object):
     ConfigMap volumes support ownership management and SELinux relabeling.
     """
 
+    __slots__ = ("_default_mode", "_items", "_name", "_optional")
+
     def __init__(self, model=None):
         super(ConfigMapVolumeSource, self).__init__()
 
@@ -49,7 +53,7 @@ class ConfigMapVolumeSource(object):
 
     @default_mode.setter
     def default_mode(self, mode=None):
-        if is_valid_string(mode):
+        if isinstance(mode, string_types):
             try:
                 mode = int(mode)
             except ValueError:
@@ -104,7 +108,7 @@ class ConfigMapVolumeSource(object):
         data = {}
 
         if self.default_mode is not None:
-            data["defaultMode "] = self.default_mode
+            data["defaultMode"] = self.default_mode
         if self.items is not None:
             tmp_items = list()
             for i in self.items:
@@ -20,6 +20,23 @@ class Container(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_container
     """
 
+    __slots__ = (
+        "_args",
+        "_command",
+        "_env",
+        "_image",
+        "_image_pull_policy",
+        "_liveness_probe",
+        "_name",
+        "_ports",
+        "_readiness_probe",
+        "_resources",
+        "_security_context",
+        "_volume_mounts",
+        "_working_dir",
+        "termination_message_path",
+    )
+
     VALID_PULL_POLICIES = ["Always", "Never", "IfNotPresent"]
 
     def __init__(self, model=None):
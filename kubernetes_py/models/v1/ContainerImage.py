@@ -13,6 +13,8 @@ class ContainerImage(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_containerimage
     """
 
+    __slots__ = ("_names", "_size_bytes")
+
     def __init__(self, model=None):
         super(ContainerImage, self).__init__()
 
@@ -14,6 +14,8 @@ class ContainerPort(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_containerport
     """
 
+    __slots__ = ("_name", "_host_port", "_container_port", "_protocol", "_host_ip")
+
     VALID_PROTOCOLS = ["TCP", "UDP"]
 
     def __init__(self, model=None):
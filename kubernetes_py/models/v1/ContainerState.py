@@ -17,6 +17,8 @@ class ContainerState(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_containerstate
     """
 
+    __slots__ = ("_waiting", "_running", "_terminated")
+
     def __init__(self, model=None):
         super(ContainerState, self).__init__()
 
@@ -14,6 +14,8 @@ class ContainerStateRunning(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_containerstaterunning
     """
 
+    __slots__ = ("_started_at",)
+
     def __init__(self, model=None):
         super(ContainerStateRunning, self).__init__()
 
@@ -14,6 +14,8 @@ class ContainerStateTerminated(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_containerstateterminated
     """
 
+    __slots__ = ("_exit_code", "_signal", "_reason", "_message", "_started_at", "_finished_at", "_container_id")
+
     def __init__(self, model=None):
         super(ContainerStateTerminated, self).__init__()
 
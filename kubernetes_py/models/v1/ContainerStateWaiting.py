@@ -14,6 +14,8 @@ class ContainerStateWaiting(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_containerstatewaiting
     """
 
+    __slots__ = ("_reason", "_message")
+
     def __init__(self, model=None):
         super(ContainerStateWaiting, self).__init__()
 
@@ -15,6 +15,8 @@ class ContainerStatus(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_containerstatus
     """
 
+    __slots__ = ("_name", "_state", "_last_state", "_ready", "_restart_count", "_image", "_image_id", "_container_id")
+
     def __init__(self, model=None):
         super(ContainerStatus, self).__init__()
 
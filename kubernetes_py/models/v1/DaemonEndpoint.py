@@ -13,6 +13,8 @@ class DaemonEndpoint(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_daemonendpoint
     """
 
+    __slots__ = ("_port",)
+
     def __init__(self, model=None):
         super(DaemonEndpoint, self).__init__()
 
@@ -17,6 +17,8 @@ class DeleteOptions(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_deleteoptions
     """
 
+    __slots__ = ("_kind", "_api_version", "_grace_period_seconds", "_orphan_dependents")
+
     def __init__(self):
         super(DeleteOptions, self).__init__()
 
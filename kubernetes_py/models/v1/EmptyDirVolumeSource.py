@@ -14,6 +14,8 @@ class EmptyDirVolumeSource(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_emptydirvolumesource
     """
 
+    __slots__ = ("_medium",)
+
     VALID_MEDIA = ["", "Memory"]
 
     def __init__(self, model=None):
@@ -15,6 +15,8 @@ class EnvVar(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_envvar
     """
 
+    __slots__ = ("_name", "_value", "_value_from")
+
     def __init__(self, model=None):
         super(EnvVar, self).__init__()
 
@@ -17,6 +17,8 @@ class EnvVarSource(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_envvarsource
     """
 
+    __slots__ = ("_field_ref", "_resource_field_ref", "_config_map_key_ref", "_secret_key_ref")
+
     def __init__(self, model=None):
         super(EnvVarSource, self).__init__()
 
@@ -17,6 +17,17 @@ class Event(BaseModel):
     https://kubernetes.io/docs/api-reference/v1.5/#event-v1
     """
 
+    __slots__ = (
+        "_count",
+        "_first_timestamp",
+        "_involved_object",
+        "_last_timestamp",
+        "_message",
+        "_reason",
+        "_source",
+        "_type",
+    )
+
     def __init__(self, model=None):
         super(Event, self).__init__(model=model)
 
@@ -14,6 +14,8 @@ class EventSource(object):
     https://kubernetes.io/docs/api-reference/v1.5/#eventsource-v1
     """
 
+    __slots__ = ("_component", "_host")
+
     def __init__(self, model=None):
         super(EventSource, self).__init__()
 
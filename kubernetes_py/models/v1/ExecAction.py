@@ -14,6 +14,8 @@ class ExecAction(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_execaction
     """
 
+    __slots__ = ("_command",)
+
     def __init__(self, model=None):
         super(ExecAction, self).__init__()
 
@@ -16,6 +16,8 @@ class GCEPersistentDiskVolumeSource(object):
     A GCE PD of the given name must exist before mounting to a container.
     """
 
+    __slots__ = ("_pd_name", "_fs_type", "_partition", "_read_only")
+
     def __init__(self, model=None):
         super(GCEPersistentDiskVolumeSource, self).__init__()
 
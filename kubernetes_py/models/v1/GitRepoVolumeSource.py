@@ -14,6 +14,8 @@ class GitRepoVolumeSource(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_gitrepovolumesource
     """
 
+    __slots__ = ("_repository", "_revision", "_directory")
+
     def __init__(self, model=None):
         super(GitRepoVolumeSource, self).__init__()
 
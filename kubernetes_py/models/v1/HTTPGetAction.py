@@ -10,6 +10,8 @@ from kubernetes_py.utils import is_valid_list, is_valid_dict, is_valid_string
 
 
 class HTTPGetAction(object):
+    __slots__ = ("_http_headers", "_scheme", "_host", "_path", "_port")
+
 
     VALID_SCHEMES = ["HTTP", "HTTPS"]
 
@@ -18,6 +18,8 @@ class HorizontalPodAutoscaler(BaseModel):
     https://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_horizontalpodautoscaler
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(HorizontalPodAutoscaler, self).__init__()
 
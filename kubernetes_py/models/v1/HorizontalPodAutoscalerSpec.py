@@ -14,6 +14,8 @@ class HorizontalPodAutoscalerSpec(object):
     https://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_horizontalpodautoscalerspec
     """
 
+    __slots__ = ("_scale_target_ref", "_min_replicas", "_max_replicas", "_cpu_utilization")
+
     def __init__(self, model=None):
         super(HorizontalPodAutoscalerSpec, self).__init__()
 
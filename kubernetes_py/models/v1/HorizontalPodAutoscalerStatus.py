@@ -14,6 +14,14 @@ class HorizontalPodAutoscalerStatus(object):
     https://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_horizontalpodautoscalerstatus
     """
 
+    __slots__ = (
+        "_observed_generation",
+        "_last_scale_time",
+        "_current_replicas",
+        "_desired_replicas",
+        "_current_cpu_utilization_percentage",
+    )
+
     def __init__(self, model=None):
         super(HorizontalPodAutoscalerStatus, self).__init__()
 
@@ -14,6 +14,8 @@ class HostPathVolumeSource(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_hostpathvolumesource
     """
 
+    __slots__ = ("_path",)
+
     def __init__(self, model=None):
         super(HostPathVolumeSource, self).__init__()
 
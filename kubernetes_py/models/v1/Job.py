@@ -17,6 +17,8 @@ class Job(BaseModel):
     http://kubernetes.io/docs/api-reference/batch/v1/definitions/#_v1_job
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(Job, self).__init__()
 
@@ -14,6 +14,8 @@ class JobCondition(object):
     http://kubernetes.io/docs/api-reference/batch/v1/definitions/#_v1_jobcondition
     """
 
+    __slots__ = ("_type", "_status", "_last_probe_time", "_last_transition_time", "_reason", "_message")
+
     def __init__(self, model=None):
         super(JobCondition, self).__init__()
 
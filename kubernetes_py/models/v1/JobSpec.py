@@ -15,6 +15,15 @@ class JobSpec(object):
     http://kubernetes.io/docs/api-reference/batch/v1/definitions/#_v1_jobspec
     """
 
+    __slots__ = (
+        "_parallelism",
+        "_completions",
+        "_active_deadline_seconds",
+        "_selector",
+        "_manual_selector",
+        "_template",
+    )
+
     VALID_RESTART_POLICIES = ["OnFailure", "Never"]
 
     def __init__(self, model=None):
@@ -27,7 +36,6 @@ class JobSpec(object):
         self._manual_selector = None
         self._template = PodTemplateSpec()
 
-        self.template.spec.VALID_RESTART_POLICIES = JobSpec.VALID_RESTART_POLICIES
         if self.template.spec.restart_policy not in JobSpec.VALID_RESTART_POLICIES:
             self.template.spec.restart_policy = "OnFailure"
 
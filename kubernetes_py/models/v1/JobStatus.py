@@ -15,6 +15,8 @@ class JobStatus(object):
     http://kubernetes.io/docs/api-reference/batch/v1/definitions/#_v1_jobstatus
     """
 
+    __slots__ = ("_conditions", "_start_time", "_completion_time", "_active", "_succeeded", "_failed")
+
     def __init__(self, model=None):
         super(JobStatus, self).__init__()
 
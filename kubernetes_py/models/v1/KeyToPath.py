@@ -8,6 +8,8 @@
 
 import re
 
+from six import string_types
+
 from kubernetes_py.utils import is_valid_string, filter_model
 
 
@@ -16,6 +18,8 @@ class KeyToPath(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_keytopath
     """
 
+    __slots__ = ("_key", "_path", "_mode")
+
     def __init__(self, model=None):
         super(KeyToPath, self).__init__()
 
@@ -71,7 +75,7 @@ class KeyToPath(object):
 
     @mode.setter
     def mode(self, mode=None):
-        if is_valid_string(mode):
+        if isinstance(mode, string_types):
             try:
                 mode = int(mode)
             except ValueError:
@@ -14,6 +14,8 @@ class LoadBalancerIngress(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_loadbalanceringress
     """
 
+    __slots__ = ("_ip", "_hostname")
+
     def __init__(self, model=None):
         super(LoadBalancerIngress, self).__init__()
 
@@ -15,6 +15,8 @@ class LoadBalancerStatus(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_loadbalancerstatus
     """
 
+    __slots__ = ("_ingress",)
+
     def __init__(self, model=None):
         super(LoadBalancerStatus, self).__init__()
         self._ingress = None
@@ -10,6 +10,8 @@ from kubernetes_py.utils import is_valid_string
 
 
 class LocalObjectReference(object):
+    __slots__ = ("_name",)
+
     def __init__(self, model=None):
         super(LocalObjectReference, self).__init__()
 
@@ -14,6 +14,8 @@ class NFSVolumeSource(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_nfsvolumesource
     """
 
+    __slots__ = ("_server", "_path", "_read_only")
+
     def __init__(self, model=None):
         super(NFSVolumeSource, self).__init__()
 
@@ -17,6 +17,8 @@ class Namespace(BaseModel):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_namespace
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(Namespace, self).__init__()
 
@@ -12,6 +12,8 @@ class NamespaceSpec(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_namespacespec
     """
 
+    __slots__ = ("_finalizers",)
+
     def __init__(self, model=None):
         super(NamespaceSpec, self).__init__()
 
@@ -12,6 +12,8 @@ class NamespaceStatus(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_namespacestatus
     """
 
+    __slots__ = ("_phase",)
+
     def __init__(self, model=None):
         super(NamespaceStatus, self).__init__()
 
@@ -22,7 +24,7 @@ class NamespaceStatus(object):
 
     def _build_with_model(self, model=None):
         if "phase" in model:
-            self.finalizers = model["phase"]
+            self.phase = model["phase"]
 
     # --------------------------------------------------------------------------------- finalizers
 
@@ -18,6 +18,8 @@ class Node(BaseModel):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_node
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(Node, self).__init__()
 
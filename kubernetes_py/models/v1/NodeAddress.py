@@ -13,6 +13,8 @@ class NodeAddress(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_nodeaddress
     """
 
+    __slots__ = ("_type", "_address")
+
     def __init__(self, model=None):
         super(NodeAddress, self).__init__()
 
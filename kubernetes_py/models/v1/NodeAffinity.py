@@ -16,6 +16,11 @@ class NodeAffinity(object):
     https://kubernetes.io/docs/api-reference/v1.6/#nodeaffinity-v1-core
     """
 
+    __slots__ = (
+        "_preferred_during_scheduling_ignored_during_execution",
+        "_required_during_scheduling_ignored_during_execution",
+    )
+
     def __init__(self, model=None):
         super(NodeAffinity, self).__init__()
 
@@ -13,6 +13,8 @@ class NodeCondition(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_nodecondition
     """
 
+    __slots__ = ("_condition_type", "_status", "_last_heartbeat_time", "_last_transition_time", "_reason", "_message")
+
     def __init__(self, model=None):
         super(NodeCondition, self).__init__()
 
@@ -14,6 +14,8 @@ class NodeDaemonEndpoints(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_nodedaemonendpoints
     """
 
+    __slots__ = ("_kubelet_endpoint",)
+
     def __init__(self, model=None):
         super(NodeDaemonEndpoints, self).__init__()
 
@@ -17,6 +17,8 @@ class NodeList(ListModel):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_nodelist
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(NodeList, self).__init__()
 
@@ -15,6 +15,8 @@ class NodeSelector(object):
     https://kubernetes.io/docs/api-reference/v1.6/#nodeselector-v1-core
     """
 
+    __slots__ = ("_node_selector_terms",)
+
     def __init__(self, model=None):
         super(NodeSelector, self).__init__()
 
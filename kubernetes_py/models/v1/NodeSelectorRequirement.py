@@ -14,6 +14,8 @@ class NodeSelectorRequirement(object):
     https://kubernetes.io/docs/api-reference/v1.6/#nodeselectorrequirement-v1-core
     """
 
+    __slots__ = ("_key", "_operator", "_values")
+
     VALID_OPERATORS = ["In", "NotIn", "Exists", "DoesNotExist", "Gt", "Lt"]
 
     def __init__(self, model=None):
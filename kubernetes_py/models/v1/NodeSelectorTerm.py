@@ -15,6 +15,8 @@ class NodeSelectorTerm(object):
     https://kubernetes.io/docs/api-reference/v1.6/#nodeselectorterm-v1-core
     """
 
+    __slots__ = ("_match_expressions",)
+
     def __init__(self, model=None):
         super(NodeSelectorTerm, self).__init__()
 
@@ -15,6 +15,8 @@ class NodeSpec(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_nodespec
     """
 
+    __slots__ = ("_pod_cidr", "_external_id", "_provider_id", "_taints", "_unschedulable")
+
     def __init__(self, model=None):
         super(NodeSpec, self).__init__()
 
@@ -12,6 +12,7 @@ from kubernetes_py.models.v1.NodeCondition import NodeCondition
 from kubernetes_py.models.v1.NodeDaemonEndpoints import NodeDaemonEndpoints
 from kubernetes_py.models.v1.NodeSystemInfo import NodeSystemInfo
 from kubernetes_py.utils import filter_model
+from kubernetes_py.utils.Quantity import to_quantities, to_strings
 
 
 class NodeStatus(object):
@@ -19,6 +20,19 @@ class NodeStatus(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_nodestatus
     """
 
+    __slots__ = (
+        "_capacity",
+        "_allocatable",
+        "_phase",
+        "_conditions",
+        "_addresses",
+        "_daemon_endpoints",
+        "_node_info",
+        "_images",
+        "_volumes_in_use",
+        "_volumes_attached",
+    )
+
     def __init__(self, model=None):
         super(NodeStatus, self).__init__()
 
@@ -97,7 +111,15 @@ class NodeStatus(object):
     def capacity(self, v):
         if not isinstance(v, dict):
             raise SyntaxError("NodeStatus: capacity: [ {0} ] is invalid.".format(v))
-        self._capacity = v
+        self._capacity = to_strings(v)
+
+    @property
+    def capacity_quantities(self):
+        """
+        The capacity as Quantity objects: {'cpu': Quantity('4'), 'memory': Quantity('16Gi')}.
+        """
+
+        return to_quantities(self._capacity)
 
     # ------------------------------------------------------------------------------------- allocatable
 
@@ -109,7 +131,15 @@ class NodeStatus(object):
     def allocatable(self, v):
         if not isinstance(v, dict):
             raise SyntaxError("NodeStatus: allocatable: [ {0} ] is invalid.".format(v))
-        self._allocatable = v
+        self._allocatable = to_strings(v)
+
+    @property
+    def allocatable_quantities(self):
+        """
+        The allocatable as Quantity objects: {'cpu': Quantity('4'), 'memory': Quantity('16Gi')}.
+        """
+
+        return to_quantities(self._allocatable)
 
     # ------------------------------------------------------------------------------------- phase
 
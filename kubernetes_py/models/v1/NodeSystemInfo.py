@@ -13,6 +13,19 @@ class NodeSystemInfo(object):
     https://kubernetes.io/docs/api-reference/v1/definitions/#_v1_nodesysteminfo
     """
 
+    __slots__ = (
+        "_machine_id",
+        "_system_uuid",
+        "_boot_id",
+        "_kernel_version",
+        "_os_image",
+        "_container_runtime_version",
+        "_kubelet_version",
+        "_kube_proxy_version",
+        "_operating_system",
+        "_architecture",
+    )
+
     def __init__(self, model=None):
         super(NodeSystemInfo, self).__init__()
 
@@ -14,6 +14,8 @@ class ObjectFieldSelector(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_objectfieldselector
     """
 
+    __slots__ = ("_api_version", "_field_path")
+
     def __init__(self, model=None):
         super(ObjectFieldSelector, self).__init__()
 
@@ -15,6 +15,24 @@ class ObjectMeta(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_objectmeta
     """
 
+    __slots__ = (
+        "_name",
+        "_generate_name",
+        "_namespace",
+        "_self_link",
+        "_uid",
+        "_resource_version",
+        "_generation",
+        "_creation_timestamp",
+        "_deletion_timestamp",
+        "_deletion_grace_period_seconds",
+        "_labels",
+        "_annotations",
+        "_owner_references",
+        "_finalizers",
+        "_cluster_name",
+    )
+
     def __init__(self, model=None):
         super(ObjectMeta, self).__init__()
 
@@ -305,7 +323,7 @@ class ObjectMeta(object):
         if self.annotations:
             data["annotations"] = self.annotations
         if self.owner_references:
-            data["ownerReferences"] = self.owner_references
+            data["ownerReferences"] = [x.serialize() for x in self.owner_references]
         if self.finalizers:
             data["finalizers"] = self.finalizers
         if self.cluster_name:
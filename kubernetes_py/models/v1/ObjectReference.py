@@ -14,6 +14,8 @@ class ObjectReference(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_objectreference
     """
 
+    __slots__ = ("_kind", "_namespace", "_name", "_uid", "_api_version", "_resource_version", "_field_path")
+
     def __init__(self, model=None):
         super(ObjectReference, self).__init__()
 
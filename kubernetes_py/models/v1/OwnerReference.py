@@ -10,6 +10,8 @@ from kubernetes_py.utils import filter_model, is_valid_string
 
 
 class OwnerReference(object):
+    __slots__ = ("_api_version", "_kind", "_name", "_uid", "_controller")
+
     def __init__(self, model=None):
         super(OwnerReference, self).__init__()
 
@@ -29,7 +31,7 @@ class OwnerReference(object):
         if "kind" in model:
             self.kind = model["kind"]
         if "name" in model:
-            self.model = model["name"]
+            self.name = model["name"]
         if "uid" in model:
             self.uid = model["uid"]
         if "controller" in model:
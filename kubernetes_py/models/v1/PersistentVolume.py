@@ -17,6 +17,8 @@ class PersistentVolume(BaseModel):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_persistentvolume
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(PersistentVolume, self).__init__()
 
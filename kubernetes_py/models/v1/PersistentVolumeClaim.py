@@ -17,6 +17,8 @@ class PersistentVolumeClaim(BaseModel):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_persistentvolumeclaim
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(PersistentVolumeClaim, self).__init__()
 
@@ -17,6 +17,8 @@ class PersistentVolumeClaimSpec(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_persistentvolumeclaimspec
     """
 
+    __slots__ = ("_access_modes", "_selector", "_resources", "_volume_name", "_storage_class_name")
+
     VALID_RESOURCES = ["storage"]
 
     def __init__(self, model=None):
@@ -15,6 +15,8 @@ class PersistentVolumeClaimStatus(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_persistentvolumeclaimstatus
     """
 
+    __slots__ = ("_phase", "_access_modes", "_capacity")
+
     def __init__(self, model=None):
         super(PersistentVolumeClaimStatus, self).__init__()
 
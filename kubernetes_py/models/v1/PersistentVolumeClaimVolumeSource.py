@@ -14,6 +14,8 @@ class PersistentVolumeClaimVolumeSource(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_persistentvolumeclaimvolumesource
     """
 
+    __slots__ = ("_claim_name", "_read_only")
+
     def __init__(self, model=None):
         super(PersistentVolumeClaimVolumeSource, self).__init__()
 
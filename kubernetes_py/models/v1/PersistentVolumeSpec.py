@@ -23,6 +23,23 @@ class PersistentVolumeSpec(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_persistentvolumespec
     """
 
+    __slots__ = (
+        "_awsElasticBlockStore",
+        "_emptyDir",
+        "_gcePersistentDisk",
+        "_gitRepo",
+        "_hostPath",
+        "_name",
+        "_nfs",
+        "_persistentVolumeClaim",
+        "_secret",
+        "_capacity",
+        "_access_modes",
+        "_claim_ref",
+        "_reclaim_policy",
+        "_storage_class_name",
+    )
+
     VALID_CAPACITY_PARAMS = ["storage"]
     VALID_ACCESS_MODES = ["ReadWriteOnce", "ReadOnlyMany", "ReadWriteMany"]
     VALID_RECLAIM_POLICIES = ["Retain", "Recycle", "Delete"]
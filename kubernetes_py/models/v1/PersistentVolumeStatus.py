@@ -14,6 +14,8 @@ class PersistentVolumeStatus(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_persistentvolumestatus
     """
 
+    __slots__ = ("_phase", "_message", "_reason")
+
     def __init__(self, model=None):
         super(PersistentVolumeStatus, self).__init__()
 
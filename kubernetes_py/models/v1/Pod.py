@@ -18,6 +18,8 @@ class Pod(BaseModel):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_pod
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(Pod, self).__init__()
 
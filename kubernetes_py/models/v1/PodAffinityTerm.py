@@ -11,6 +11,8 @@ from kubernetes_py.utils import is_valid_string, is_valid_list, convert
 
 
 class PodAffinityTerm(object):
+    __slots__ = ("_label_selector", "_namespaces", "_topology_key")
+
     def __init__(self, model=None):
         super(PodAffinityTerm, self).__init__()
 
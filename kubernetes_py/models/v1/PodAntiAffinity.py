@@ -17,6 +17,11 @@ class PodAntiAffinity(object):
     https://github.com/kubernetes_py/community/blob/master/contributors/design-proposals/podaffinity.md
     """
 
+    __slots__ = (
+        "_preferred_during_scheduling_ignored_during_execution",
+        "_required_during_scheduling_ignored_during_execution",
+    )
+
     def __init__(self, model=None):
         super(PodAntiAffinity, self).__init__()
 
@@ -14,6 +14,8 @@ class PodCondition(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_podcondition
     """
 
+    __slots__ = ("_last_probe_time", "_last_transition_time", "_message", "_reason", "_status", "_type")
+
     def __init__(self, model=None):
         super(PodCondition, self).__init__()
 
@@ -14,6 +14,8 @@ class PodSecurityContext(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_podsecuritycontext
     """
 
+    __slots__ = ("_fs_group", "_run_as_non_root", "_run_as_user", "_supplemental_groups")
+
     def __init__(self, model=None):
         super(PodSecurityContext, self).__init__()
 
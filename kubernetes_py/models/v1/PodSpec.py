@@ -19,6 +19,29 @@ class PodSpec(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_podspec
     """
 
+    __slots__ = (
+        "_active_deadline_seconds",
+        "_affinity",
+        "_containers",
+        "_automount_service_account_token",
+        "_dns_policy",
+        "_host_ipc",
+        "_host_network",
+        "_host_pid",
+        "_hostname",
+        "_image_pull_secrets",
+        "_node_name",
+        "_node_selector",
+        "_restart_policy",
+        "_security_context",
+        "_service_account",
+        "_service_account_name",
+        "_subdomain",
+        "_termination_grace_period_seconds",
+        "_tolerations",
+        "_volumes",
+    )
+
     VALID_DNS_POLICIES = ["ClusterFirst", "ClusterFirstWithHostNet", "Default", "None"]
     VALID_RESTART_POLICIES = ["Always", "OnFailure", "Never"]
 
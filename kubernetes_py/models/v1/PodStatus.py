@@ -16,6 +16,17 @@ class PodStatus(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_podstatus
     """
 
+    __slots__ = (
+        "_conditions",
+        "_container_statuses",
+        "_phase",
+        "_message",
+        "_reason",
+        "_host_ip",
+        "_pod_ip",
+        "_start_time",
+    )
+
     def __init__(self, model=None):
         super(PodStatus, self).__init__()
 
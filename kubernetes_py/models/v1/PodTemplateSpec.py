@@ -15,6 +15,8 @@ class PodTemplateSpec(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_podtemplatespec
     """
 
+    __slots__ = ("_metadata", "_spec")
+
     def __init__(self, model=None):
         super(PodTemplateSpec, self).__init__()
 
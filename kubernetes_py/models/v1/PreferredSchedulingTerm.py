@@ -14,6 +14,8 @@ class PreferredSchedulingTerm(object):
     https://kubernetes.io/docs/api-reference/v1.6/#preferredschedulingterm-v1-core
     """
 
+    __slots__ = ("_weight", "_preference")
+
     def __init__(self, model=None):
         super(PreferredSchedulingTerm, self).__init__()
 
@@ -17,6 +17,17 @@ class Probe(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_probe
     """
 
+    __slots__ = (
+        "_exec_action",
+        "_http_get_action",
+        "_tcp_socket_action",
+        "_initial_delay_seconds",
+        "_timeout_seconds",
+        "_period_seconds",
+        "_success_threshold",
+        "_failure_threshold",
+    )
+
     VALID_HANDLERS = ["exec", "httpGet", "tcpSocket"]
 
     def __init__(self, model=None):
@@ -17,6 +17,8 @@ class ReplicationController(BaseModel):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_replicationcontroller
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(ReplicationController, self).__init__()
 
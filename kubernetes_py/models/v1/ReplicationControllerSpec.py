@@ -15,6 +15,8 @@ class ReplicationControllerSpec(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_replicationcontrollerspec
     """
 
+    __slots__ = ("_replicas", "_selector", "_template")
+
     def __init__(self, model=None):
         super(ReplicationControllerSpec, self).__init__()
 
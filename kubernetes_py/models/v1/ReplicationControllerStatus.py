@@ -12,6 +12,8 @@ class ReplicationControllerStatus(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_replicationcontrollerstatus
     """
 
+    __slots__ = ("_replicas", "_fully_labeled_replicas", "_ready_replicas", "_observed_generation")
+
     def __init__(self, model=None):
         super(ReplicationControllerStatus, self).__init__()
 
@@ -14,6 +14,8 @@ class ResourceFieldSelector(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_resourcefieldselector
     """
 
+    __slots__ = ("_container_name", "_resource", "_divisor")
+
     def __init__(self, model=None):
         super(ResourceFieldSelector, self).__init__()
 
@@ -7,6 +7,7 @@
 #
 
 from kubernetes_py.utils import filter_model
+from kubernetes_py.utils.Quantity import to_quantities, to_strings
 
 
 class ResourceRequirements(object):
@@ -14,6 +15,8 @@ class ResourceRequirements(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_resourcerequirements
     """
 
+    __slots__ = ("_limits", "_requests")
+
     VALID_RESOURCES = ["cpu", "memory", "storage", "ephemeral-storage"]
 
     def __init__(self, model=None):
@@ -39,7 +42,7 @@ class ResourceRequirements(object):
         for x in data:
             if x not in self.VALID_RESOURCES:
                 data.pop(x)
-        return data
+        return to_strings(data)
 
     # ------------------------------------------------------------------------------------- limits
 
@@ -51,7 +54,15 @@ class ResourceRequirements(object):
     def limits(self, limits=None):
         self._limits = self._filter(limits)
 
-    # ------------------------------------------------------------------------------------- limits
+    @property
+    def limit_quantities(self):
+        """
+        The limits as Quantity objects: {'cpu': Quantity('500m')}. 'limits' holds them as strings.
+        """
+
+        return to_quantities(self._limits)
+
+    # ------------------------------------------------------------------------------------- requests
 
     @property
     def requests(self):
@@ -61,6 +72,14 @@ class ResourceRequirements(object):
     def requests(self, requests=None):
         self._requests = self._filter(requests)
 
+    @property
+    def request_quantities(self):
+        """
+        The requests as Quantity objects: {'memory': Quantity('1536Mi')}. 'requests' holds them as strings.
+        """
+
+        return to_quantities(self._requests)
+
     # ------------------------------------------------------------------------------------- serialize
 
     def serialize(self):
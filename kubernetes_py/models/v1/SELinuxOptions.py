@@ -14,6 +14,8 @@ class SELinuxOptions(object):
     https://kubernetes.io/docs/api-reference/v1.6/#selinuxoptions-v1-core
     """
 
+    __slots__ = ("_level", "_role", "_type", "_user")
+
     def __init__(self, model=None):
         super(SELinuxOptions, self).__init__()
 
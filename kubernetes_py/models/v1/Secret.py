@@ -20,6 +20,8 @@ class Secret(BaseModel):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_secret
     """
 
+    __slots__ = ("_data", "_string_data", "_type")
+
     K8s_ANNOTATION_SERVICE_ACCOUNT_NAME = "kubernetes.io/service-account.name"
     K8s_ANNOTATION_SERVICE_ACCOUNT_UID = "kubernetes.io/service-account.uid"
     K8s_TYPE_DOCKER_CONFIG = "kubernetes.io/dockerconfigjson"
@@ -131,7 +133,7 @@ class Secret(BaseModel):
             d[k] = base64.b64decode(v)
             if isinstance(d[k], bytes):
                 d[k] = d[k].decode()
-            elif is_valid_string(d[k]):
+            elif isinstance(d[k], string_types):
                 d[k] = d[k].decode()
         return d
 
@@ -237,7 +239,7 @@ class Secret(BaseModel):
         if self.data is not None:
             d = {}
             for k, v in self.data.items():
-                if is_valid_string(v):
+                if isinstance(v, string_types):
                     v = bytearray(source=v, encoding="UTF-8")
                 d[k] = base64.b64encode(v)
                 if isinstance(d[k], bytes):
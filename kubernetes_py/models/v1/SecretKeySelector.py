@@ -14,6 +14,8 @@ class SecretKeySelector(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_secretkeyselector
     """
 
+    __slots__ = ("_name", "_key")
+
     def __init__(self, model=None):
         super(SecretKeySelector, self).__init__()
 
@@ -16,6 +16,8 @@ class SecretVolumeSource(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_secretvolumesource
     """
 
+    __slots__ = ("_secret_name", "_items", "_default_mode")
+
     def __init__(self, model=None):
         super(SecretVolumeSource, self).__init__()
 
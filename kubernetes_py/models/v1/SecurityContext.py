@@ -16,6 +16,15 @@ class SecurityContext(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_securitycontext
     """
 
+    __slots__ = (
+        "_capabilities",
+        "_privileged",
+        "_read_only_root_filesystem",
+        "_run_as_non_root",
+        "_run_as_user",
+        "_se_linux_options",
+    )
+
     def __init__(self, model=None):
         super(SecurityContext, self).__init__()
 
@@ -19,6 +19,8 @@ class Service(BaseModel):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_service
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(Service, self).__init__()
 
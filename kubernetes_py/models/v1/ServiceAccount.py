@@ -17,6 +17,8 @@ class ServiceAccount(BaseModel):
     http://kubernetes.io/docs/user-guide/service-accounts/
     """
 
+    __slots__ = ("_secrets", "_image_pull_secrets")
+
     def __init__(self, model=None):
         super(ServiceAccount, self).__init__()
 
@@ -10,6 +10,8 @@ from kubernetes_py.utils import is_valid_string
 
 
 class ServicePort(object):
+    __slots__ = ("_name", "_protocol", "_port", "_target_port", "_node_port")
+
 
     VALID_PROTOCOLS = ["TCP", "UDP"]
 
@@ -15,6 +15,18 @@ class ServiceSpec(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_servicespec
     """
 
+    __slots__ = (
+        "_cluster_ip",
+        "_external_ips",
+        "_external_name",
+        "_load_balancer_ip",
+        "_load_balancer_source_ranges",
+        "_ports",
+        "_selector",
+        "_session_affinity",
+        "_type",
+    )
+
     VALID_TYPES = ["ExternalName", "ClusterIP", "NodePort", "LoadBalancer"]
     VALID_SESSION_AFFINITIES = ["ClientIP", "None"]
 
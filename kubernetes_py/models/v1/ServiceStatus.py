@@ -10,6 +10,8 @@ from kubernetes_py.models.v1.LoadBalancerStatus import LoadBalancerStatus
 
 
 class ServiceStatus(object):
+    __slots__ = ("_load_balancer",)
+
     def __init__(self, model=None):
         super(ServiceStatus, self).__init__()
 
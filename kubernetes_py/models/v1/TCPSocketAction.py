@@ -8,6 +8,8 @@
 
 
 class TCPSocketAction(object):
+    __slots__ = ("_port",)
+
     def __init__(self, model=None):
         super(TCPSocketAction, self).__init__()
 
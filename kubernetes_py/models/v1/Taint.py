@@ -14,6 +14,8 @@ class Taint(object):
     https://kubernetes.io/docs/api-reference/v1.6/#taint-v1-core
     """
 
+    __slots__ = ("_effect", "_key", "_time_added", "_value")
+
     VALID_TAINT_EFFECTS = ["NoSchedule", "PreferNoSchedule", "NoExecute"]
 
     def __init__(self, model=None):
@@ -14,6 +14,8 @@ class Toleration(object):
     https://kubernetes.io/docs/api-reference/v1.6/#toleration-v1-core
     """
 
+    __slots__ = ("_effect", "_key", "_operator", "_toleration_seconds", "_value")
+
     def __init__(self, model=None):
         super(Toleration, self).__init__()
 
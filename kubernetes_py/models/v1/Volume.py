@@ -23,6 +23,19 @@ class Volume(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_volume
     """
 
+    __slots__ = (
+        "_awsElasticBlockStore",
+        "_emptyDir",
+        "_gcePersistentDisk",
+        "_gitRepo",
+        "_hostPath",
+        "_name",
+        "_nfs",
+        "_persistentVolumeClaim",
+        "_secret",
+        "_config_map",
+    )
+
     VOLUME_TYPES_TO_SOURCE_MAP = {
         "awsElasticBlockStore": AWSElasticBlockStoreVolumeSource,
         "emptyDir": EmptyDirVolumeSource,
@@ -14,6 +14,8 @@ class VolumeMount(object):
     http://kubernetes.io/docs/api-reference/v1/definitions/#_v1_volumemount
     """
 
+    __slots__ = ("_name", "_mount_path", "_read_only", "_sub_path")
+
     def __init__(self, model=None):
         super(VolumeMount, self).__init__()
 
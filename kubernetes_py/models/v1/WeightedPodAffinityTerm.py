@@ -14,6 +14,8 @@ class WeightedPodAffinityTerm(object):
     https://kubernetes.io/docs/api-reference/v1.6/#weightedpodaffinityterm-v1-core
     """
 
+    __slots__ = ("_pod_affinity_term", "_weight")
+
     def __init__(self, model=None):
         super(WeightedPodAffinityTerm, self).__init__()
 
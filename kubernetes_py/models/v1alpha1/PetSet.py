@@ -17,6 +17,8 @@ class PetSet(BaseModel):
     http://kubernetes.io/docs/api-reference/apps/v1alpha1/definitions/#_v1alpha1_petset
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(PetSet, self).__init__()
 
@@ -17,6 +17,8 @@ class PetSetSpec(object):
     http://kubernetes.io/docs/api-reference/apps/v1alpha1/definitions/#_v1alpha1_petsetspec
     """
 
+    __slots__ = ("_replicas", "_selector", "_template", "_volume_claim_templates", "_service_name")
+
     def __init__(self, model=None):
         super(PetSetSpec, self).__init__()
 
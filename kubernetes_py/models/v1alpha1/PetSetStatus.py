@@ -12,6 +12,8 @@ class PetSetStatus(object):
     http://kubernetes.io/docs/api-reference/apps/v1alpha1/definitions/#_v1alpha1_petsetstatus
     """
 
+    __slots__ = ("_observed_generation", "_replicas")
+
     def __init__(self, model=None):
         super(PetSetStatus, self).__init__()
 
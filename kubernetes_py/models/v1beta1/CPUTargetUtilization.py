@@ -12,6 +12,8 @@ class CPUTargetUtilization(object):
     https://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_cputargetutilization
     """
 
+    __slots__ = ("_target_percentage",)
+
     def __init__(self, model=None):
         super(CPUTargetUtilization, self).__init__()
 
@@ -11,6 +11,8 @@ from kubernetes_py.utils import is_valid_string
 
 
 class CronJobSpec(object):
+    __slots__ = ("_schedule", "_job_template", "_starting_deadline_seconds", "_concurrency_policy", "_suspend")
+
 
     VALID_CONCURRENCY_POLICIES = ["Allow", "Forbid", "Replace"]
 
@@ -11,6 +11,8 @@ from kubernetes_py.models.v1.ObjectMeta import ObjectMeta
 
 
 class CronJobTemplate(object):
+    __slots__ = ("_metadata", "_spec")
+
     def __init__(self, model=None):
         super(CronJobTemplate, self).__init__()
 
@@ -13,6 +13,8 @@ from kubernetes_py.models.v1beta1.DaemonSetStatus import DaemonSetStatus
 
 
 class DaemonSet(BaseModel):
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(DaemonSet, self).__init__()
 
@@ -11,6 +11,8 @@ from kubernetes_py.models.v1.PodTemplateSpec import PodTemplateSpec
 
 
 class DaemonSetSpec(object):
+    __slots__ = ("_selector", "_template")
+
     def __init__(self, model=None):
         super(DaemonSetSpec, self).__init__()
 
@@ -8,6 +8,8 @@
 
 
 class DaemonSetStatus(object):
+    __slots__ = ("_current_number_scheduled", "_number_misscheduled", "_desired_number_scheduled")
+
     def __init__(self, model=None):
         super(DaemonSetStatus, self).__init__()
 
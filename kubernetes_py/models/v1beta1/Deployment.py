@@ -17,6 +17,8 @@ class Deployment(BaseModel):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_deployment
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(Deployment, self).__init__()
 
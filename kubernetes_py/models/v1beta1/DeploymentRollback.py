@@ -15,6 +15,8 @@ class DeploymentRollback(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_deploymentrollback
     """
 
+    __slots__ = ("_kind", "_api_version", "_name", "_updated_annotations", "_rollback_to")
+
     def __init__(self, model=None):
         super(DeploymentRollback, self).__init__()
 
@@ -17,6 +17,17 @@ class DeploymentSpec(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_deploymentspec
     """
 
+    __slots__ = (
+        "_replicas",
+        "_selector",
+        "_template",
+        "_strategy",
+        "_min_ready_seconds",
+        "_revision_history_limit",
+        "_paused",
+        "_rollback_to",
+    )
+
     def __init__(self, model=None):
         super(DeploymentSpec, self).__init__()
 
@@ -12,6 +12,14 @@ class DeploymentStatus(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_deploymentstatus
     """
 
+    __slots__ = (
+        "_observed_generation",
+        "_replicas",
+        "_updated_replicas",
+        "_available_replicas",
+        "_unavailable_replicas",
+    )
+
     def __init__(self, model=None):
         super(DeploymentStatus, self).__init__()
 
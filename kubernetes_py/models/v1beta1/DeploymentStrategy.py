@@ -15,6 +15,8 @@ class DeploymentStrategy(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_deploymentstrategy
     """
 
+    __slots__ = ("_type", "_rolling_update")
+
     def __init__(self, model=None):
         super(DeploymentStrategy, self).__init__()
 
@@ -15,6 +15,8 @@ class LabelSelector(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_labelselector
     """
 
+    __slots__ = ("_match_labels", "_match_expressions")
+
     def __init__(self, model=None):
         super(LabelSelector, self).__init__()
 
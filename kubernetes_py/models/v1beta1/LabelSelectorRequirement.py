@@ -14,6 +14,8 @@ class LabelSelectorRequirement(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_labelselectorrequirement
     """
 
+    __slots__ = ("_key", "_operator", "_values")
+
     def __init__(self, model=None):
         super(LabelSelectorRequirement, self).__init__()
 
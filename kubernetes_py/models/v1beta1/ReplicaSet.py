@@ -17,6 +17,8 @@ class ReplicaSet(BaseModel):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_replicaset
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(ReplicaSet, self).__init__()
 
@@ -15,6 +15,8 @@ class ReplicaSetSpec(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_replicasetspec
     """
 
+    __slots__ = ("_replicas", "_selector", "_template")
+
     def __init__(self, model=None):
         super(ReplicaSetSpec, self).__init__()
 
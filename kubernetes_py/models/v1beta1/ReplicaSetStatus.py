@@ -12,6 +12,8 @@ class ReplicaSetStatus(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_replicasetstatus
     """
 
+    __slots__ = ("_replicas", "_fully_labeled_replicas", "_ready_replicas", "_observed_generation")
+
     def __init__(self, model=None):
         super(ReplicaSetStatus, self).__init__()
 
@@ -14,14 +14,16 @@ class RollingUpdateDeployment(object):
     http://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_rollingupdatedeployment
     """
 
+    __slots__ = ("_max_unavailable", "_max_surge")
+
+    percent_pattern = re.compile(r"^\d+%*$")
+
     def __init__(self, model=None):
         super(RollingUpdateDeployment, self).__init__()
 
         self._max_unavailable = 1
         self._max_surge = 1
 
-        self.percent_pattern = re.compile(r"^\d+%*$")
-
         if model is not None:
             self._build_with_model(model)
 
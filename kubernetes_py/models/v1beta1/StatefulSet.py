@@ -13,6 +13,8 @@ from kubernetes_py.models.v1beta1.StatefulSetStatus import StatefulSetStatus
 
 
 class StatefulSet(BaseModel):
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(StatefulSet, self).__init__()
 
@@ -13,6 +13,8 @@ from kubernetes_py.utils import is_valid_list, is_valid_string
 
 
 class StatefulSetSpec(object):
+    __slots__ = ("_replicas", "_selector", "_template", "_volume_claim_templates", "_service_name")
+
     def __init__(self, model=None):
         super(StatefulSetSpec, self).__init__()
 
@@ -8,6 +8,8 @@
 
 
 class StatefulSetStatus(object):
+    __slots__ = ("_observed_generation", "_replicas")
+
     def __init__(self, model=None):
         super(StatefulSetStatus, self).__init__()
 
@@ -17,6 +17,8 @@ class StorageClass(BaseModel):
     https://kubernetes.io/docs/user-guide/persistent-volumes/#storageclasses
     """
 
+    __slots__ = ("_provisioner", "_parameters")
+
     def __init__(self, model=None):
         super(StorageClass, self).__init__()
 
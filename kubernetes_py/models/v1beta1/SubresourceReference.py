@@ -14,6 +14,8 @@ class SubresourceReference(object):
     https://kubernetes.io/docs/api-reference/extensions/v1beta1/definitions/#_v1beta1_subresourcereference
     """
 
+    __slots__ = ("_kind", "_name", "_api_version", "_subresource")
+
     def __init__(self, model=None):
         super(SubresourceReference, self).__init__()
 
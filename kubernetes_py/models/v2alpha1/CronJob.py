@@ -17,6 +17,8 @@ class CronJob(BaseModel):
     http://kubernetes.io/docs/user-guide/cron-jobs/#creating-a-cron-job
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(CronJob, self).__init__()
 
@@ -11,6 +11,8 @@ from kubernetes_py.utils import is_valid_list, is_valid_string
 
 
 class CronJobStatus(object):
+    __slots__ = ("_active", "_successful", "_failed", "_last_schedule_time")
+
     def __init__(self, model=None):
         super(CronJobStatus, self).__init__()
 
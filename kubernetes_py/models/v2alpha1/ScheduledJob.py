@@ -17,6 +17,8 @@ class ScheduledJob(CronJob):
     CronJobs exist from Kubernetes 1.5.x onwards.
     """
 
+    __slots__ = ()
+
     def __init__(self, model=None):
         super(ScheduledJob, self).__init__(model=model)
         self.kind = "ScheduledJob"
@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import asyncio
+import base64
+import collections
+import json
+import weakref
+
+from six.moves.urllib.parse import urlencode, urlparse
+
+from kubernetes_py.utils.JsonBackend import loads
+from kubernetes_py.utils.HttpSession import PoolCounters, DEFAULT_POOL_MAXSIZE
+from kubernetes_py.utils.RateLimiter import IDEMPOTENT_METHODS
+from kubernetes_py.utils.TLSContext import build_ssl_context, ssl_context_for
+
+# the number of seconds a connection may take to open, and a response to arrive, unless told otherwise.
+DEFAULT_TIMEOUT_SECONDS = 60
+
+_UNVERIFIED = []
+
+
+def _unverified_context():
+    if not _UNVERIFIED:
+        _UNVERIFIED.append(build_ssl_context(verify=False))
+    return _UNVERIFIED[0]
+
+
+class _Connection(object):
+    def __init__(self, reader=None, writer=None):
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def is_stale(self):
+        # closed by the server while idle: nothing was sent on it yet.
+        return self.reader.at_eof() or self.writer.transport.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncHttpSession(object):
+    """
+    A pool of keep-alive HTTP/1.1 connections to the API server, driven by asyncio.
+
+    Connections belong to the event loop that opened them; each loop gets its own idle
+    connections and its own limit of 'pool_maxsize' in-flight requests per host.
+    """
+
+    def __init__(
+        self, pool_maxsize=DEFAULT_POOL_MAXSIZE, keep_alive=True, ssl_context=None, timeout=DEFAULT_TIMEOUT_SECONDS
+    ):
+        """
+        :param pool_maxsize: The maximum number of concurrent connections per host.
+        :param keep_alive: Whether to keep connections open between requests.
+        :param ssl_context: The SSL context used for every TLS connection, if any.
+        :param timeout: The number of seconds a connection may take to open, and a response to arrive.
+            Waits forever if None.
+        """
+
+        if not isinstance(pool_maxsize, int) or pool_maxsize < 1:
+            raise SyntaxError("AsyncHttpSession: pool_maxsize: [ {0} ] must be a positive int.".format(pool_maxsize))
+        if timeout is not None and (not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0):
+            raise SyntaxError("AsyncHttpSession: timeout: [ {0} ] must be a positive number.".format(timeout))
+
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.ssl_context = ssl_context
+        self.timeout = timeout
+        self.counters = PoolCounters()
+        self._pools = weakref.WeakKeyDictionary()
+
+    def _pool(self, key=None):
+        loop = asyncio.get_event_loop()
+        pools = self._pools.get(loop, None)
+        if pools is None:
+            pools = self._pools[loop] = dict()
+        if key not in pools:
+            pools[key] = (asyncio.Semaphore(self.pool_maxsize), collections.deque())
+        return pools[key]
+
+    def use_ssl_context(self, ssl_context=None):
+        """
+        Switches to another SSL context. Idle connections opened with the previous credentials are dropped.
+        """
+
+        if ssl_context is not self.ssl_context:
+            self.ssl_context = ssl_context
+            self.close()
+        return self
+
+    async def _connect(self, scheme=None, host=None, port=None, ssl_context=None):
+        self.counters.miss()
+        context = None
+        if scheme == "https":
+            context = ssl_context
+            if context is None:
+                # without credentials, HttpRequest doesn't verify the server either.
+                context = _unverified_context()
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=context, server_hostname=host if context is not None else None
+        )
+        return _Connection(reader, writer)
+
+    async def request(self, method="GET", url=None, headers=None, body=None, ssl_context=None, timeout=None):
+        """
+        Sends a request and reads the full response.
+
+        :param ssl_context: The SSL context of this request, rather than the session's.
+        :param timeout: The number of seconds the connection may take to open, and the response to arrive,
+            rather than the session's.
+        :return: A tuple of (status, reason, headers, body).
+        """
+
+        parsed = urlparse(url)
+        scheme = parsed.scheme or "http"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        host = parsed.hostname
+        path = parsed.path or "/"
+        if parsed.query:
+            path = "{0}?{1}".format(path, parsed.query)
+        if ssl_context is None:
+            ssl_context = self.ssl_context
+        if timeout is None:
+            timeout = self.timeout
+
+        # IPv6 addresses are bracketed, as in the URL.
+        netloc = "[{0}]".format(host) if ":" in host else host
+        head = ["{0} {1} HTTP/1.1".format(method, path), "Host: {0}:{1}".format(netloc, port)]
+        for k, v in (headers or {}).items():
+            head.append("{0}: {1}".format(k, v))
+        body = body or b""
+        head.append("Content-Length: {0}".format(len(body)))
+        if not self.keep_alive:
+            head.append("Connection: close")
+        payload = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+        semaphore, idle = self._pool((scheme, host, port, ssl_context))
+        async with semaphore:
+            self.counters.checkout()
+            response = None
+            while idle and response is None:
+                conn = idle.pop()
+                if conn.is_stale:
+                    conn.close()
+                    continue
+                try:
+                    response = await asyncio.wait_for(self._exchange(conn, payload, method), timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conn.close()
+                    # the server may have read the request before closing the connection: only a request
+                    # it can apply twice is sent again.
+                    if method not in IDEMPOTENT_METHODS:
+                        raise
+                except BaseException:
+                    conn.close()
+                    raise
+
+            if response is None:
+                conn = await asyncio.wait_for(self._connect(scheme, host, port, ssl_context), timeout)
+                try:
+                    response = await asyncio.wait_for(self._exchange(conn, payload, method), timeout)
+                except BaseException:
+                    conn.close()
+                    raise
+
+            status, reason, resp_headers, resp_body, reusable = response
+            if reusable and self.keep_alive:
+                idle.append(conn)
+            else:
+                conn.close()
+
+        return status, reason, resp_headers, resp_body
+
+    @staticmethod
+    async def _exchange(conn=None, payload=None, method=None):
+        conn.writer.write(payload)
+        await conn.writer.drain()
+
+        while True:
+            version, status, reason, headers = await AsyncHttpSession._read_head(conn)
+            # interim responses, e.g. 100 Continue, come before the final one.
+            if not 100 <= status < 200 or status == 101:
+                break
+
+        connection = headers.get("connection", "").lower()
+        closing = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+        reusable = not closing
+        if method == "HEAD" or 100 <= status < 200 or status in (204, 304):
+            # these never have a body, whatever their headers say.
+            body = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await conn.reader.readline()).split(b";")[0].strip(), 16)
+                if size == 0:
+                    await conn.reader.readline()
+                    break
+                chunks.append(await conn.reader.readexactly(size))
+                await conn.reader.readline()
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await conn.reader.readexactly(int(headers["content-length"]))
+        elif closing:
+            # the body ends with the connection.
+            body = await conn.reader.read()
+        else:
+            body = b""
+
+        return status, reason, headers, body, reusable
+
+    @staticmethod
+    async def _read_head(conn=None):
+        status_line = await conn.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("AsyncHttpSession: connection closed by the server.")
+        parts = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        version = parts[0]
+        status = int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ""
+
+        headers = dict()
+        while True:
+            line = await conn.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            k, _, v = line.decode("latin-1").partition(":")
+            headers[k.strip().lower()] = v.strip()
+        return version, status, reason, headers
+
+    def close(self):
+        for loop, pools in list(self._pools.items()):
+            for _, idle in pools.values():
+                while idle:
+                    conn = idle.pop()
+                    # the transports of a closed loop can't be closed through it anymore.
+                    if not loop.is_closed():
+                        conn.close()
+        self._pools.clear()
+
+    # ------------------------------------------------------------------------------------- counters
+
+    @property
+    def pool_hits(self):
+        return self.counters.hits
+
+    @property
+    def pool_misses(self):
+        return self.counters.misses
+
+    def stats(self):
+        return {
+            "requests": self.counters.checkouts,
+            "hits": self.counters.hits,
+            "misses": self.counters.misses,
+        }
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class AsyncHttpRequest(object):
+    """
+    The asyncio counterpart of HttpRequest; send() returns the same state dictionary.
+    """
+
+    def __init__(
+        self,
+        method="GET",
+        host="localhost:80",
+        url="/",
+        data=None,
+        auth=None,
+        cert=None,
+        cert_data=None,
+        ca_cert=None,
+        ca_cert_data=None,
+        token=None,
+        session=None,
+        text=False,
+        timeout=None,
+        rate_limiter=None,
+        retry_policy=None,
+    ):
+        self.http_method = method
+        self.http_host = host
+        self.url = url
+        self.data = data
+        self.auth = auth
+        self.cert = cert
+        self.cert_data = cert_data
+        self.ca_cert = ca_cert
+        self.ca_cert_data = ca_cert_data
+        self.token = token
+        self.session = session
+        self.text = text
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+
+    async def send(self):
+        state = dict(success=False, reason=None, status=None, data=None)
+        http_headers = dict()
+        http_headers["Accept"] = "application/json"
+
+        if self.http_method in ["PUT", "POST", "PATCH"]:
+            http_headers["Content-type"] = "application/json"
+
+        if self.token is not None:
+            http_headers["Authorization"] = "Bearer {token}".format(token=self.token)
+        elif self.auth is not None:
+            creds = base64.b64encode("{0}:{1}".format(*self.auth).encode("utf-8")).decode("ascii")
+            http_headers["Authorization"] = "Basic {0}".format(creds)
+
+        url = self.url
+        body = None
+        if self.data is not None and self.http_method in ["GET"]:
+            url = "{0}?{1}".format(url, urlencode(self.data))
+        elif self.data is not None:
+            body = json.dumps(self.data).encode("utf-8")
+
+        # the same cached context as the config's, unless the credentials were overridden for this request.
+        ssl_context = ssl_context_for(
+            host=self.http_host,
+            ca_cert=self.ca_cert,
+            ca_cert_data=self.ca_cert_data,
+            cert=self.cert,
+            cert_data=self.cert_data,
+        )
+        status, reason, headers, content = await self._request(self.http_host + url, http_headers, body, ssl_context)
+
+        state["status"] = status
+        state["reason"] = reason
+
+        # a successful text response, like a log, is never decoded as JSON, even where a line would be.
+        if self.text and 200 <= status <= 299:
+            state["data"] = content.decode("utf-8", "replace")
+        elif len(content) > 0:
+            try:
+                state["data"] = loads(content)
+            except Exception:
+                try:
+                    state["data"] = content.decode("utf-8")
+                except UnicodeDecodeError:
+                    state["data"] = content
+
+        if 200 <= state["status"] <= 299:
+            state["success"] = True
+
+        return state
+
+    async def _request(self, url=None, headers=None, body=None, ssl_context=None):
+        attempt = 0
+        policy = self.retry_policy
+        while True:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                response = await self.session.request(
+                    method=self.http_method,
+                    url=url,
+                    headers=headers,
+                    body=body,
+                    ssl_context=ssl_context,
+                    timeout=self.timeout,
+                )
+            except (ConnectionResetError, ConnectionAbortedError, asyncio.IncompleteReadError):
+                if policy is None or not policy.should_retry(attempt, self.http_method):
+                    raise
+                await asyncio.sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+
+            status, headers_received = response[0], response[2]
+            if policy is None or not policy.should_retry(attempt, self.http_method, status):
+                return response
+            await asyncio.sleep(policy.delay(attempt, headers_received.get("retry-after", None)))
+            attempt += 1
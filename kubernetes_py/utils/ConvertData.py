@@ -6,16 +6,20 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
-import collections
 from six import string_types
 
+try:
+    from collections.abc import Iterable, Mapping
+except ImportError:  # python 2
+    from collections import Iterable, Mapping
+
 
 def convert(data):
     if isinstance(data, string_types):
         return str(data)
-    elif isinstance(data, collections.Mapping):
+    elif isinstance(data, Mapping):
         return dict(map(convert, data.items()))
-    elif isinstance(data, collections.Iterable):
+    elif isinstance(data, Iterable):
         return type(data)(map(convert, data))
     else:
         return data
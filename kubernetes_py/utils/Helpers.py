@@ -7,15 +7,15 @@
 #
 
 import copy
-import importlib
 import re
 import socket
+import threading
 
 from dateutil.parser import parse
 from six import string_types
 
-from kubernetes_py.K8sExceptions import NotFoundException
 from kubernetes_py.utils.HttpRequest import HttpRequest
+from kubernetes_py.utils.ModelRegistry import ModelRegistry
 
 RE_VALID_IP = re.compile(
     r"^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])$"
@@ -25,7 +25,29 @@ RE_VALID_IP = re.compile(
 RE_EXTRACT_VERSION_NUMBER = re.compile("^(\d+)")
 
 
+_TRUST = threading.local()
+
+
+def build_trusted(model_class=None, *args, **kwargs):
+    """
+    Builds model_class(*args, **kwargs) from data sent by the API server: while its constructor runs,
+    the validators below accept every value without checking it. The setters still convert and store
+    the values as usual, and the values set on the model later on are validated.
+
+        pod = build_trusted(Pod, state)
+    """
+
+    previous = getattr(_TRUST, "active", False)
+    _TRUST.active = True
+    try:
+        return model_class(*args, **kwargs)
+    finally:
+        _TRUST.active = previous
+
+
 def is_valid_string(target=None):
+    if getattr(_TRUST, "active", False):
+        return True
     if target is None:
         return False
     if not isinstance(target, string_types):
@@ -34,6 +56,8 @@ def is_valid_string(target=None):
 
 
 def is_valid_list(target=None, element_class=None):
+    if getattr(_TRUST, "active", False):
+        return True
     if target is None:
         return False
     if not isinstance(target, list):
@@ -46,6 +70,8 @@ def is_valid_list(target=None, element_class=None):
 
 
 def is_valid_dict(target=None, keys=None, type=None):
+    if getattr(_TRUST, "active", False):
+        return True
     if target is None:
         return False
     if not isinstance(target, dict):
@@ -63,6 +89,8 @@ def is_valid_dict(target=None, keys=None, type=None):
 
 
 def is_valid_date_time(target=None):
+    if getattr(_TRUST, "active", False):
+        return True
     rc = True
     if target is None:
         rc = False
@@ -128,32 +156,29 @@ def sanitize_version_number(v_num):
 
 
 def filter_model(model=None):
-    mutable = copy.deepcopy(model)
-    for key in model:
-        if model[key] is None:
-            mutable.pop(key)
+    """
+    :param model: A dict a model is built from.
+    :return: A copy of 'model' without its None values.
+
+    Only the dicts and lists found at the top of 'model' are copied, not their contents: each nested
+    model filters its own dict in turn, so the whole tree is copied once rather than once per level.
+    """
+
+    mutable = {}
+    for key, value in model.items():
+        if value is None:
+            continue
+        if isinstance(value, (dict, list)):
+            value = copy.copy(value)
+        mutable[key] = value
     return mutable
 
 
-def str_to_class(obj_type=None):
-    import_paths = [
-        "kubernetes_py.models.unversioned.{}".format(obj_type),
-        "kubernetes_py.models.v1.{}".format(obj_type),
-        "kubernetes_py.models.v1alpha1.{}".format(obj_type),
-        "kubernetes_py.models.v1beta1.{}".format(obj_type),
-        "kubernetes_py.models.v2alpha1.{}".format(obj_type),
-    ]
-
-    module = None
-    for path in import_paths:
-        try:
-            module = importlib.import_module(path)
-            break
-        except ImportError:
-            pass
-
-    if module is not None:
-        _class = getattr(module, obj_type)()
-        return _class
+def str_to_class(obj_type=None, version=None):
+    """
+    :param obj_type: A kind: 'Pod', 'CronJob'...
+    :param version: The version of its model, as in ModelRegistry.resolve().
+    :return: A new, empty model of that kind.
+    """
 
-    raise NotFoundException("Could not import obj_type: [ {} ]".format(obj_type))
+    return ModelRegistry.resolve(obj_type, version)()
@@ -5,19 +5,19 @@
 # This file is subject to the terms and conditions defined in
 # file 'LICENSE.md', which is part of this source code package.
 #
-import re
-import base64
 import json
-import os
-import tempfile
+import socket
+import time
 import requests
 import urllib3
-from kubernetes_py.utils.ConvertData import convert
+from urllib3.exceptions import NewConnectionError
+from kubernetes_py.utils.JsonBackend import loads
+from kubernetes_py.utils.HttpSession import HttpSession
+from kubernetes_py.utils.TLSContext import RE_VALID_SSL_IP, ssl_context_for, is_verifying
 from six.moves.urllib.parse import urlencode
 
-RE_VALID_SSL_IP = re.compile(
-    r"^https://(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])"
-)
+# the number of bytes read at once from a streamed response that isn't chunked.
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class HttpRequest:
@@ -33,6 +33,12 @@ class HttpRequest:
         ca_cert=None,
         ca_cert_data=None,
         token=None,
+        session=None,
+        stream=False,
+        text=False,
+        timeout=None,
+        rate_limiter=None,
+        retry_policy=None,
     ):
 
         self.http_method = method
@@ -45,6 +51,12 @@ class HttpRequest:
         self.ca_cert = ca_cert
         self.ca_cert_data = ca_cert_data
         self.token = token
+        self.session = session
+        self.stream = stream
+        self.text = text
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
 
     def send(self):
         state = dict(success=False, reason=None, status=None, data=None)
@@ -63,77 +75,188 @@ class HttpRequest:
 
         self.url = self.http_host + self.url
 
-        temp = None
-        this_cert_file = None
-        this_key_file = None
-        verify = False
-        if self.ca_cert is not None:
-            verify = self.ca_cert
-        if self.ca_cert_data is not None:
-            temp = tempfile.NamedTemporaryFile(delete=False)
-            data = base64.b64decode(self.ca_cert_data)
-            temp.write(data)
-            temp.close()
-            verify = temp.name
-        if self.cert_data is not None:
-            (this_cert_data, this_key_data) = self.cert_data
-            this_cert_file = tempfile.NamedTemporaryFile(delete=False)
-            decoded_cert = base64.b64decode(this_cert_data)
-            this_cert_file.write(decoded_cert)
-            this_cert_file.close()
-            this_key_file = tempfile.NamedTemporaryFile(delete=False)
-            decoded_key = base64.b64decode(this_key_data)
-            this_key_file.write(decoded_key)
-            this_key_file.close()
-            self.cert = (this_cert_file.name, this_key_file.name)
-
-        # TODO: TLS issue with Python 2.7 and urllib3 when hostname is an IP address
-        # A better fix should be found but I can't think of anything else for now.
+        # The API server certificate authority and client certificate are loaded once in an in-memory
+        # SSL context, cached per set of credentials, rather than written to temporary files on each request.
+        ssl_context = ssl_context_for(
+            host=self.http_host, ca_cert=self.ca_cert, ca_cert_data=self.ca_cert_data, cert=self.cert, cert_data=self.cert_data
+        )
+
+        # the certificate of an IP address is not verified, see tls_fingerprint().
         search_result = RE_VALID_SSL_IP.search(self.http_host)
         if search_result:
-            verify = False
             urllib3.disable_warnings()
 
-        try:
+        # Reuse the caller's pooled keep-alive connections when available.
+        session = self.session
+        transient = session is None or session.ssl_context is not ssl_context
+        if transient:
+            session = HttpSession(pool_connections=1, pool_maxsize=1, ssl_context=ssl_context)
 
-            response = requests.request(
-                method=self.http_method,
-                url=self.url,
-                auth=self.auth,
-                cert=self.cert,
-                headers=http_headers,
-                data="" if self.data is None else json.dumps(self.data),
-                verify=verify,
-            )
+        try:
+            response = self._request(session, http_headers, ssl_context)
 
         except Exception as err:
+            if transient:
+                session.close()
             raise err
 
-        finally:
-            if temp is not None:
-                os.unlink(temp.name)
-            if this_cert_file is not None:
-                os.unlink(this_cert_file.name)
-            if this_key_file is not None:
-                os.unlink(this_key_file.name)
-
         state["status"] = response.status_code
         state["reason"] = response.reason
 
-        # There was an issue with "kubectl logs" type requests where returned content is "text/plain" and
-        # we do have characters of unknown origin.
-        try:
-            resp_data = response.content.decode("utf-8")
-        except UnicodeDecodeError:
-            resp_data = response.content
+        # A successful streamed response is handed over as a LineStream of JSON documents, one per line,
+        # or of text lines when 'text' is set, read as they arrive; the connection is released when the
+        # stream is exhausted or closed.
+        if self.stream and 200 <= state["status"] <= 299:
+            state["success"] = True
+            if self.text:
+                lines = self._iter_text_lines(response, session if transient else None)
+            else:
+                lines = self._iter_json_lines(response, session if transient else None)
+            state["data"] = LineStream(lines, response)
+            return state
 
-        if len(resp_data) > 0:
+        if transient:
+            session.close()
+
+        # The body is decoded from bytes straight into the dicts the models are built from. Bodies that
+        # aren't JSON, like "kubectl logs" type requests returning "text/plain", are handed over as text;
+        # or as bytes when they hold characters of unknown origin.
+        content = response.content
+        if len(content) > 0:
             try:
-                state["data"] = convert(data=json.loads(resp_data))
+                state["data"] = loads(content)
             except Exception:
-                state["data"] = resp_data
+                try:
+                    state["data"] = content.decode("utf-8")
+                except UnicodeDecodeError:
+                    state["data"] = content
 
         if 200 <= state["status"] <= 299:
             state["success"] = True
 
         return state
+
+    def _request(self, session=None, headers=None, ssl_context=None):
+        """
+        Sends the request, once the rate limiter allows it, and again while the retry policy allows it.
+        """
+
+        data = "" if self.data is None else json.dumps(self.data)
+        attempt = 0
+        policy = self.retry_policy
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = session.request(
+                    method=self.http_method,
+                    url=self.url,
+                    auth=self.auth,
+                    headers=headers,
+                    data=data,
+                    verify=is_verifying(ssl_context),
+                    stream=self.stream,
+                    timeout=self.timeout,
+                )
+            except requests.exceptions.ConnectionError as err:
+                if policy is None or not _is_connection_reset(err):
+                    raise
+                if not policy.should_retry(attempt, self.http_method):
+                    raise
+                time.sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+
+            if policy is None or not policy.should_retry(attempt, self.http_method, response.status_code):
+                return response
+            delay = policy.delay(attempt, response.headers.get("Retry-After", None))
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _iter_json_lines(response=None, session=None):
+        try:
+            for line in response.iter_lines():
+                if line:
+                    yield loads(line)
+        finally:
+            response.close()
+            if session is not None:
+                session.close()
+
+    @staticmethod
+    def _iter_text_lines(response=None, session=None, chunk_size=STREAM_CHUNK_SIZE):
+        # chunked responses, like followed logs, are read one chunk at a time as the server flushes them,
+        # rather than blocking until 'chunk_size' bytes arrived.
+        try:
+            if getattr(response.raw, "chunked", False) and hasattr(response.raw, "read_chunked"):
+                chunks = response.raw.read_chunked(decode_content=True)
+            else:
+                chunks = response.iter_content(chunk_size=chunk_size)
+            pending = b""
+            for chunk in chunks:
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    yield _decode_line(line)
+            if pending:
+                yield _decode_line(pending)
+        finally:
+            response.close()
+            if session is not None:
+                session.close()
+
+
+class LineStream(object):
+    """
+    The lines of a streamed response, read as a generator reads them. Unlike a generator, it can be closed
+    from another thread while a read is blocked on the response: the connection is shut down, which ends the read.
+    """
+
+    def __init__(self, lines=None, response=None):
+        self._lines = lines
+        self._response = response
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._lines)
+
+    next = __next__
+
+    def close(self):
+        _shutdown(self._response)
+        try:
+            self._lines.close()
+        except ValueError:
+            # read by another thread: its read fails on the connection shut down, and the lines end there.
+            pass
+
+
+def _shutdown(response=None):
+    # closing a socket does not wake a thread blocked reading it: shutting it down does. A response read
+    # to the end has handed its connection back to the pool already.
+    sock = getattr(getattr(response.raw, "_connection", None), "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except (OSError, socket.error):
+            pass
+
+
+def _decode_line(line=None):
+    if line.endswith(b"\r"):
+        line = line[:-1]
+    return line.decode("utf-8", "replace")
+
+
+def _is_connection_reset(err=None):
+    # a connection that couldn't be opened (refused, unknown host, timed out) isn't retried: the server is down.
+    # nor is one refused by the proxy, or whose certificate failed: the same would happen again.
+    exceptions = requests.exceptions
+    if isinstance(err, (exceptions.ConnectTimeout, exceptions.SSLError, exceptions.ProxyError)):
+        return False
+    reason = err.args[0] if err.args else None
+    return not isinstance(getattr(reason, "reason", reason), NewConnectionError)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class PoolCounters(object):
+    """
+    Thread-safe hit/miss counters shared by every connection pool of an HttpSession.
+
+    A 'hit' is a request served by an already-open (kept-alive) connection,
+    a 'miss' is a request that had to open a new TCP (and TLS) connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.misses = 0
+
+    def checkout(self):
+        with self._lock:
+            self.checkouts += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    @property
+    def hits(self):
+        return max(self.checkouts - self.misses, 0)
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.misses = 0
+
+
+def _counting_pool(base, counters):
+    class CountingConnection(base.ConnectionCls):
+        def connect(self):
+            counters.miss()
+            return super(CountingConnection, self).connect()
+
+    class CountingPool(base):
+        ConnectionCls = CountingConnection
+
+        def _get_conn(self, *args, **kwargs):
+            counters.checkout()
+            return super(CountingPool, self)._get_conn(*args, **kwargs)
+
+    return CountingPool
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    A requests HTTPAdapter whose urllib3 connection pools report checkouts and new connections.
+    """
+
+    def __init__(self, counters=None, ssl_context=None, **kwargs):
+        self.counters = counters if counters is not None else PoolCounters()
+        self.ssl_context = ssl_context
+        super(PooledAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.ssl_context is not None:
+            pool_kwargs["ssl_context"] = self.ssl_context
+        super(PooledAdapter, self).init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self.counters),
+            "https": _counting_pool(HTTPSConnectionPool, self.counters),
+        }
+
+    def cert_verify(self, conn, url, verify, cert):
+        if self.ssl_context is None or not url.lower().startswith("https"):
+            return super(PooledAdapter, self).cert_verify(conn, url, verify, cert)
+        # The CA bundle and client certificate are already loaded in the shared SSL context;
+        # don't have urllib3 load them again from disk on each new connection.
+        conn.cert_reqs = "CERT_REQUIRED" if verify else "CERT_NONE"
+        conn.ca_certs = None
+        conn.ca_cert_dir = None
+
+
+class HttpSession(object):
+    """
+    A pool of keep-alive HTTP connections to the API server.
+
+    One HttpSession is owned by each K8sConfig and shared by every K8sObject built from that config,
+    so consecutive API calls reuse established TCP+TLS connections instead of opening a new one each time.
+    """
+
+    def __init__(
+        self,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=False,
+        keep_alive=True,
+        ssl_context=None,
+    ):
+        """
+        :param pool_connections: The number of per-host connection pools to cache.
+        :param pool_maxsize: The maximum number of connections kept open per host.
+        :param pool_block: Whether to block when all connections to a host are in use, rather than open an extra one.
+        :param keep_alive: Whether to keep connections open between requests.
+        :param ssl_context: The SSL context used for every TLS connection, if any.
+        """
+
+        if not isinstance(pool_connections, int) or pool_connections < 1:
+            raise SyntaxError("HttpSession: pool_connections: [ {0} ] must be a positive int.".format(pool_connections))
+        if not isinstance(pool_maxsize, int) or pool_maxsize < 1:
+            raise SyntaxError("HttpSession: pool_maxsize: [ {0} ] must be a positive int.".format(pool_maxsize))
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.ssl_context = ssl_context
+        self.counters = PoolCounters()
+
+        self.session = requests.Session()
+        self.adapter = None
+        self.mount()
+
+    def mount(self):
+        """
+        (Re)builds the connection pools. Any idle connection held by the previous pools is closed.
+        """
+
+        adapter = PooledAdapter(
+            counters=self.counters,
+            ssl_context=self.ssl_context,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        previous, self.adapter = self.adapter, adapter
+        if previous is not None:
+            previous.close()
+        return adapter
+
+    def use_ssl_context(self, ssl_context=None):
+        """
+        Switches to another SSL context, e.g. after credentials changed. Connections opened
+        with the previous credentials are dropped.
+        """
+
+        if ssl_context is not self.ssl_context:
+            self.ssl_context = ssl_context
+            self.mount()
+        return self
+
+    def request(self, method=None, url=None, headers=None, **kwargs):
+        if not self.keep_alive:
+            headers = dict(headers or {})
+            headers["Connection"] = "close"
+        return self.session.request(method=method, url=url, headers=headers, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def __deepcopy__(self, memo):
+        # Copies of a K8sConfig (or of a K8sObject holding one) keep sharing the same connection pools.
+        return self
+
+    # ------------------------------------------------------------------------------------- counters
+
+    @property
+    def pool_hits(self):
+        return self.counters.hits
+
+    @property
+    def pool_misses(self):
+        return self.counters.misses
+
+    def stats(self):
+        return {
+            "requests": self.counters.checkouts,
+            "hits": self.counters.hits,
+            "misses": self.counters.misses,
+        }
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+
+# ------------------------------------------------------------------------------------- index functions
+#
+# An index function maps a raw object (as returned by the API server) to the list of values it is indexed under.
+
+
+def index_by_namespace(obj=None):
+    namespace = obj.get("metadata", {}).get("namespace", None)
+    return [namespace] if namespace is not None else []
+
+
+def index_by_label(obj=None):
+    labels = obj.get("metadata", {}).get("labels", None) or {}
+    return ["{0}={1}".format(k, v) for k, v in labels.items()]
+
+
+def index_by_node_name(obj=None):
+    node_name = (obj.get("spec", None) or {}).get("nodeName", None)
+    return [node_name] if node_name is not None else []
+
+
+def index_by_owner_uid(obj=None):
+    owners = obj.get("metadata", {}).get("ownerReferences", None) or []
+    return [x["uid"] for x in owners if "uid" in x]
+
+
+DEFAULT_INDEXERS = {
+    "namespace": index_by_namespace,
+    "label": index_by_label,
+    "nodeName": index_by_node_name,
+    "owner": index_by_owner_uid,
+}
+
+
+def object_key(obj=None):
+    meta = obj.get("metadata", {})
+    return meta.get("namespace", None), meta.get("name", None)
+
+
+class Indexer(object):
+    """
+    A thread-safe store of raw objects, keyed by (namespace, name), with secondary indexes.
+
+    Each index maps a value (a namespace, a 'key=value' label, a node name, an owner UID...) to the keys
+    of the objects indexed under it, so lookups cost O(matches) rather than O(objects).
+    """
+
+    def __init__(self, indexers=None):
+        """
+        :param indexers: A dict of index name to index function. Defaults to DEFAULT_INDEXERS.
+        """
+
+        if indexers is None:
+            indexers = DEFAULT_INDEXERS
+        if not isinstance(indexers, dict):
+            raise SyntaxError("Indexer: indexers: [ {0} ] is invalid.".format(indexers))
+
+        self._lock = threading.RLock()
+        self._items = dict()
+        self._indexers = dict(indexers)
+        self._indices = dict((name, dict()) for name in self._indexers)
+
+    def __len__(self):
+        return len(self._items)
+
+    # ------------------------------------------------------------------------------------- write
+
+    def add(self, obj=None):
+        with self._lock:
+            key = object_key(obj)
+            previous = self._items.get(key, None)
+            if previous is not None:
+                self._unindex(key, previous)
+            self._items[key] = obj
+            self._index(key, obj)
+
+    update = add
+
+    def delete(self, obj=None):
+        with self._lock:
+            key = object_key(obj)
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self._unindex(key, previous)
+
+    def replace(self, objs=None):
+        with self._lock:
+            self._items = dict()
+            self._indices = dict((name, dict()) for name in self._indexers)
+            for obj in objs or []:
+                self.add(obj)
+
+    def apply(self, event_type=None, obj=None):
+        """
+        Applies a watch event (ADDED, MODIFIED or DELETED) to the store.
+        """
+
+        if event_type in ("ADDED", "MODIFIED"):
+            self.add(obj)
+        elif event_type == "DELETED":
+            self.delete(obj)
+
+    def _index(self, key=None, obj=None):
+        for name, func in self._indexers.items():
+            index = self._indices[name]
+            for value in func(obj):
+                index.setdefault(value, set()).add(key)
+
+    def _unindex(self, key=None, obj=None):
+        for name, func in self._indexers.items():
+            index = self._indices[name]
+            for value in func(obj):
+                keys = index.get(value, None)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        index.pop(value)
+
+    # ------------------------------------------------------------------------------------- read
+
+    def get(self, namespace=None, name=None):
+        return self._items.get((namespace, name), None)
+
+    def list(self):
+        with self._lock:
+            return list(self._items.values())
+
+    def keys(self):
+        with self._lock:
+            return list(self._items.keys())
+
+    def index_values(self, index_name=None):
+        with self._lock:
+            return list(self._get_index(index_name).keys())
+
+    def by_index(self, index_name=None, value=None):
+        """
+        :return: The objects indexed under 'value' in the index 'index_name'.
+        """
+
+        with self._lock:
+            keys = self._get_index(index_name).get(value, ())
+            return [self._items[k] for k in keys]
+
+    def by_indexes(self, **criteria):
+        """
+        Returns the objects matching every criteria, e.g. by_indexes(namespace='default', label=['app=yo']).
+        A criteria value can be a single value or a list of values, all of which must match.
+
+        The intersection starts from the smallest set of keys, so the cost follows the number of matches.
+        """
+
+        with self._lock:
+            sets = []
+            for index_name, values in criteria.items():
+                if values is None:
+                    continue
+                if not isinstance(values, (list, tuple, set)):
+                    values = [values]
+                index = self._get_index(index_name)
+                for value in values:
+                    sets.append(index.get(value, set()))
+            if not sets:
+                return list(self._items.values())
+            sets.sort(key=len)
+            keys = set(sets[0])
+            for s in sets[1:]:
+                keys &= s
+                if not keys:
+                    break
+            return [self._items[k] for k in keys]
+
+    def _get_index(self, index_name=None):
+        if index_name not in self._indices:
+            raise SyntaxError("Indexer: index: [ {0} ] is not defined.".format(index_name))
+        return self._indices[index_name]
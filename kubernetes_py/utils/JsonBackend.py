@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import json
+import logging
+import os
+
+import six
+
+from kubernetes_py.utils.ConvertData import convert
+
+JSON_BACKEND_ENV_VAR = "KUBERNETES_PY_JSON"
+VALID_BACKENDS = ["orjson", "json"]
+
+
+def _json_loads(data=None):
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _select(name=None):
+    """
+    :param name: The backend to use. The fastest one installed if None.
+    :return: A tuple of (the backend name, its loads function).
+    """
+
+    if name is not None and name not in VALID_BACKENDS:
+        raise SyntaxError("JsonBackend: backend: [ {0} ] must be in: [ {1} ]".format(name, ", ".join(VALID_BACKENDS)))
+    if name in (None, "orjson") and not six.PY2:
+        try:
+            import orjson
+
+            return "orjson", orjson.loads
+        except ImportError:
+            if name is not None:
+                logging.warning("JsonBackend: orjson is not installed, falling back to json.")
+    return "json", _json_loads
+
+
+BACKEND, _loads = _select(os.environ.get(JSON_BACKEND_ENV_VAR, None) or None)
+
+
+def use_backend(name=None):
+    """
+    Switches the JSON backend decoding API server responses.
+
+    :param name: 'orjson' or 'json'. The fastest one installed if None.
+    :return: The name of the backend now used.
+    """
+
+    global BACKEND, _loads
+    BACKEND, _loads = _select(name)
+    return BACKEND
+
+
+def loads(data=None):
+    """
+    Decodes a JSON document, from bytes or text, straight into the dicts and lists the models are built from.
+
+    Python 3 strings need no conversion, so nothing is copied after decoding. Under Python 2
+    the unicode strings are converted to str as they always were.
+    """
+
+    if six.PY2:
+        return convert(_loads(data))
+    try:
+        return _loads(data)
+    except ValueError:
+        if _loads is _json_loads:
+            raise
+        # orjson rejects some documents json accepts, e.g. NaN, 1e400, or the integers wider than 64 bits
+        # for some of its versions: json has the last word.
+        return _json_loads(data)
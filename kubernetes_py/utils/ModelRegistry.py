@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import importlib
+import pkgutil
+import threading
+
+from kubernetes_py.K8sExceptions import NotFoundException
+
+MODELS_PACKAGE = "kubernetes_py.models"
+
+# the packages searched for a kind, in order, when no version is asked for.
+MODEL_VERSIONS = ["unversioned", "v1", "v1alpha1", "v1beta1", "v2alpha1"]
+
+
+class ModelRegistry(object):
+    """
+    The model classes of kubernetes_py.models, by kind and version. Each model module is named after its class.
+
+    The modules are listed once per process, without importing them. A class is imported the first time
+    it is resolved, and kept, so resolving a kind costs a dict lookup from then on.
+    """
+
+    _lock = threading.Lock()
+    _modules = None
+    _classes = {}
+
+    @classmethod
+    def modules(cls):
+        """
+        :return: A dict of kind to the list of (version, module path) defining it, in MODEL_VERSIONS order.
+        """
+
+        if cls._modules is None:
+            with cls._lock:
+                if cls._modules is None:
+                    modules = {}
+                    for version in MODEL_VERSIONS:
+                        package = importlib.import_module("{0}.{1}".format(MODELS_PACKAGE, version))
+                        for _, name, is_package in pkgutil.iter_modules(package.__path__):
+                            if not is_package:
+                                path = "{0}.{1}.{2}".format(MODELS_PACKAGE, version, name)
+                                modules.setdefault(name, []).append((version, path))
+                    cls._modules = modules
+        return cls._modules
+
+    @classmethod
+    def versions(cls, kind=None):
+        """
+        :return: The versions defining 'kind', in MODEL_VERSIONS order.
+        """
+
+        return [version for version, _ in cls.modules().get(kind, [])]
+
+    @classmethod
+    def resolve(cls, kind=None, version=None):
+        """
+        :param kind: A kind: 'Pod', 'CronJob'...
+        :param version: The version of its model: 'v1beta1', 'v2alpha1'... The first in MODEL_VERSIONS if None.
+        :return: The model class.
+        """
+
+        key = (kind, version)
+        model_class = cls._classes.get(key, None)
+        if model_class is None:
+            for v, path in cls.modules().get(kind, []):
+                if version is None or v == version:
+                    model_class = getattr(importlib.import_module(path), kind)
+                    break
+            if model_class is None:
+                if version is not None:
+                    raise NotFoundException("Could not import obj_type: [ {0} ] version: [ {1} ]".format(kind, version))
+                raise NotFoundException("Could not import obj_type: [ {0} ]".format(kind))
+            cls._classes[key] = model_class
+        return model_class
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import functools
+import re
+from fractions import Fraction
+
+import six
+
+# the (decimal exponent, binary exponent) of each suffix.
+SUFFIXES = {
+    "": (0, 0),
+    "n": (-9, 0),
+    "u": (-6, 0),
+    "m": (-3, 0),
+    "k": (3, 0),
+    "M": (6, 0),
+    "G": (9, 0),
+    "T": (12, 0),
+    "P": (15, 0),
+    "E": (18, 0),
+    "Ki": (0, 10),
+    "Mi": (0, 20),
+    "Gi": (0, 30),
+    "Ti": (0, 40),
+    "Pi": (0, 50),
+    "Ei": (0, 60),
+}
+
+# a number, then either a decimal exponent or a suffix: '1E3' is 1000 but '1E' is 10**18.
+RE_QUANTITY = re.compile(r"^([+-]?)([0-9]*)(?:\.([0-9]*))?(?:[eE]([+-]?[0-9]+)|(Ki|Mi|Gi|Ti|Pi|Ei|[numkMGTPE]))?$")
+
+# the same few quantities come back over and over ('100m', '0', '128Mi'...): their values are kept.
+_CACHE = dict()
+_CACHE_SIZE = 4096
+
+
+def parse_quantity(value=None, scale=0):
+    """
+    Parses a Kubernetes quantity: '250m', '1.5', '128Mi', '1e3'...
+
+    :param value: The quantity, a string or a number.
+    :param scale: The decimal exponent of the unit returned: -3 for millicores, -9 for nanocores, 0 for bytes.
+    :return: The int number of units, rounded up as the API server does, e.g. parse_quantity('1.5', -3) == 1500.
+    """
+
+    key = (value, scale)
+    try:
+        return _CACHE[key]
+    except KeyError:
+        pass
+    except TypeError:
+        raise SyntaxError("parse_quantity(): value: [ {0} ] is invalid.".format(value))
+
+    if isinstance(value, Quantity):
+        return value._scaled(scale)
+    if isinstance(value, bool) or not isinstance(value, six.string_types + six.integer_types + (float,)):
+        raise SyntaxError("parse_quantity(): value: [ {0} ] is invalid.".format(value))
+    match = RE_QUANTITY.match(repr(value) if isinstance(value, float) else str(value))
+    if match is None or not (match.group(2) or match.group(3)):
+        raise SyntaxError("parse_quantity(): value: [ {0} ] is invalid.".format(value))
+
+    sign, whole, fraction, exponent, suffix = match.groups()
+    fraction = fraction or ""
+    exponent, binary = (int(exponent), 0) if exponent is not None else SUFFIXES[suffix or ""]
+    number = int((whole or "0") + fraction) << binary
+    if sign == "-":
+        number = -number
+    exponent -= len(fraction) + scale
+    if exponent >= 0:
+        number *= 10 ** exponent
+    else:
+        quotient, remainder = divmod(number, 10 ** -exponent)
+        number = quotient + 1 if remainder else quotient
+
+    if len(_CACHE) >= _CACHE_SIZE:
+        _CACHE.clear()
+    _CACHE[key] = number
+    return number
+
+
+def cpu_millicores(value=None):
+    """
+    :return: The int millicores of a cpu quantity: cpu_millicores('250m') == 250, cpu_millicores('2') == 2000.
+    """
+
+    return parse_quantity(value, -3)
+
+
+def memory_bytes(value=None):
+    """
+    :return: The int bytes of a memory quantity: memory_bytes('128Mi') == 134217728.
+    """
+
+    return parse_quantity(value, 0)
+
+
+# the decimal suffixes, largest first, as a quantity is written back.
+_DECIMAL = [("E", 18), ("P", 15), ("T", 12), ("G", 9), ("M", 6), ("k", 3), ("", 0), ("m", -3), ("u", -6), ("n", -9)]
+_BINARY = [("Ei", 60), ("Pi", 50), ("Ti", 40), ("Gi", 30), ("Mi", 20), ("Ki", 10)]
+
+
+def _format(nanos=None, binary=False):
+    if binary and nanos % 10 ** 9 == 0:
+        number = nanos // 10 ** 9
+        for suffix, shift in _BINARY:
+            if number and number % (1 << shift) == 0:
+                return "{0}{1}".format(number >> shift, suffix)
+        return str(number)
+    for suffix, exponent in _DECIMAL:
+        unit = 10 ** (exponent + 9)
+        if nanos % unit == 0:
+            return "{0}{1}".format(nanos // unit, suffix)
+
+
+@functools.total_ordering
+class Quantity(object):
+    """
+    A Kubernetes quantity: '500m' of cpu, '1536Mi' of memory...
+
+    The quantity is held as an int number of nano-units, so that sums and comparisons are exact:
+    Quantity('0.5') == Quantity('500m'), and Quantity('1Gi') - '512Mi' == Quantity('512Mi'). It is written
+    back as it was given, and results as the API server writes them, in the binary suffixes if the left
+    operand had one.
+
+    Quantities add up with strings, but only compare with quantities and numbers: like numbers, they are
+    never equal to a string, so that equal values hash the same, and Quantity('1') == 1 but not '1'.
+    """
+
+    __slots__ = ("_nanos", "_string", "_binary")
+
+    def __init__(self, value=None):
+        """
+        :param value: The quantity: a string, a number, or a Quantity.
+        """
+
+        if isinstance(value, Quantity):
+            self._nanos, self._string, self._binary = value._nanos, value._string, value._binary
+        else:
+            self._nanos = parse_quantity(value, -9)
+            self._string = value if isinstance(value, six.string_types) else None
+            self._binary = self._string is not None and self._string.endswith("i")
+
+    @classmethod
+    def _from_nanos(cls, nanos=None, binary=False):
+        # results are written out only if asked for: sums of many quantities build many of them.
+        quantity = cls.__new__(cls)
+        quantity._nanos = nanos
+        quantity._string = None
+        quantity._binary = binary
+        return quantity
+
+    @staticmethod
+    def _coerce(other=None):
+        if isinstance(other, Quantity):
+            return other
+        try:
+            return Quantity(other)
+        except SyntaxError:
+            return None
+
+    @staticmethod
+    def _comparable(other=None):
+        if isinstance(other, six.string_types):
+            return None
+        return Quantity._coerce(other)
+
+    # ------------------------------------------------------------------------------------- values
+
+    def _scaled(self, scale=None):
+        exponent = -9 - scale
+        if exponent >= 0:
+            return self._nanos * 10 ** exponent
+        return -(-self._nanos // 10 ** -exponent)
+
+    @property
+    def nanos(self):
+        return self._nanos
+
+    @property
+    def value(self):
+        """
+        The quantity in units, rounded up: Quantity('1500m').value == 2.
+        """
+
+        return self._scaled(0)
+
+    @property
+    def milli_value(self):
+        """
+        The quantity in thousandths, rounded up: Quantity('1.5').milli_value == 1500.
+        """
+
+        return self._scaled(-3)
+
+    @property
+    def binary(self):
+        return self._binary
+
+    # ------------------------------------------------------------------------------------- str
+
+    def __str__(self):
+        if self._string is None:
+            self._string = _format(self._nanos, self._binary)
+        return self._string
+
+    def __repr__(self):
+        return "Quantity({0!r})".format(str(self))
+
+    def __float__(self):
+        return self._nanos / 1e9
+
+    def __bool__(self):
+        return self._nanos != 0
+
+    __nonzero__ = __bool__
+
+    def __hash__(self):
+        # the hash of the number it is equal to.
+        return hash(Fraction(self._nanos, 10 ** 9))
+
+    # ------------------------------------------------------------------------------------- compare
+
+    def __eq__(self, other):
+        other = self._comparable(other)
+        if other is None:
+            return NotImplemented
+        return self._nanos == other._nanos
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        other = self._comparable(other)
+        if other is None:
+            return NotImplemented
+        return self._nanos < other._nanos
+
+    # ------------------------------------------------------------------------------------- arithmetic
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Quantity._from_nanos(self._nanos + other._nanos, self._binary)
+
+    def __radd__(self, other):
+        # sum() starts from 0.
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Quantity._from_nanos(other._nanos + self._nanos, self._binary)
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Quantity._from_nanos(self._nanos - other._nanos, self._binary)
+
+    def __rsub__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Quantity._from_nanos(other._nanos - self._nanos, self._binary)
+
+    def __mul__(self, other):
+        if not isinstance(other, six.integer_types) or isinstance(other, bool):
+            return NotImplemented
+        return Quantity._from_nanos(self._nanos * other, self._binary)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Quantity._from_nanos(-self._nanos, self._binary)
+
+    def __abs__(self):
+        return Quantity._from_nanos(abs(self._nanos), self._binary)
+
+
+def to_quantities(resources=None):
+    """
+    :return: A dict of resource name to Quantity, from a dict of resource name to quantity: {'cpu': '500m'}.
+    """
+
+    return dict((k, Quantity(v)) for k, v in (resources or {}).items())
+
+
+def to_strings(resources=None):
+    """
+    :return: 'resources' with its Quantity values written back as strings, as the models serialize them.
+    """
+
+    if not any(isinstance(x, Quantity) for x in resources.values()):
+        return resources
+    return dict((k, str(v) if isinstance(v, Quantity) else v) for k, v in resources.items())
+
+
+# ------------------------------------------------------------------------------------- arrays
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("quantity_array() needs numpy: pip install kubernetes-py[numpy]")
+    return numpy
+
+
+def quantity_array(values=None, scale=0, default=0):
+    """
+    Parses many quantities at once into a NumPy array, for sums and comparisons across a cluster.
+    Each distinct quantity is parsed once: resources are mostly set to the same few values.
+
+    :param values: An iterable of quantities: strings, numbers, Quantity objects, or None.
+    :param scale: The decimal exponent of the unit, as for parse_quantity(): -3 for millicores, 0 for bytes.
+    :param default: The number of units given for None.
+    :return: A numpy int64 array.
+    """
+
+    numpy = _numpy()
+    index, distinct, codes = dict(), list(), list()
+    for x in values:
+        code = index.get(x, None)
+        if code is None:
+            code = index[x] = len(distinct)
+            distinct.append(x)
+        codes.append(code)
+    parsed = numpy.array([default if x is None else parse_quantity(x, scale) for x in distinct], dtype=numpy.int64)
+    return parsed[numpy.array(codes, dtype=numpy.intp)]
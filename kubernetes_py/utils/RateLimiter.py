@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import random
+import threading
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 0.1
+DEFAULT_MAX_BACKOFF_SECONDS = 10
+
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+
+class RateLimiter(object):
+    """
+    A token bucket: requests are let through at 'qps' per second on average, with bursts of up to 'burst'
+    requests after a quiet period. Callers beyond that wait for their turn.
+
+    One RateLimiter is owned by each K8sConfig and shared by every K8sObject built from that config.
+    The time spent waiting is reported by stats().
+    """
+
+    def __init__(self, qps=None, burst=None):
+        """
+        :param qps: The sustained number of requests per second. Unlimited if None.
+        :param burst: The number of requests let through at once. Defaults to 'qps', and at least 1.
+        """
+
+        if qps is not None and (isinstance(qps, bool) or not isinstance(qps, (int, float)) or qps <= 0):
+            raise SyntaxError("RateLimiter: qps: [ {0} ] must be a positive number.".format(qps))
+        if burst is not None and (isinstance(burst, bool) or not isinstance(burst, int) or burst < 1):
+            raise SyntaxError("RateLimiter: burst: [ {0} ] must be a positive int.".format(burst))
+
+        self.qps = qps
+        self.burst = burst if burst is not None else max(int(qps or 1), 1)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last = time.time()
+        self.requests = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    @property
+    def enabled(self):
+        return self.qps is not None
+
+    def reserve(self):
+        """
+        Takes a token, and returns the number of seconds the caller must wait before using it.
+        Tokens are handed out in order, so callers waiting concurrently are spread 1/qps apart.
+        """
+
+        with self._lock:
+            self.requests += 1
+            if self.qps is None:
+                return 0
+            now = time.time()
+            self._tokens = min(self._tokens + (now - self._last) * self.qps, float(self.burst))
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            delay = -self._tokens / self.qps
+            self.waits += 1
+            self.wait_seconds += delay
+            return delay
+
+    def acquire(self):
+        """
+        Blocks until the next request is allowed.
+
+        :return: The number of seconds waited.
+        """
+
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def stats(self):
+        with self._lock:
+            return {"requests": self.requests, "waits": self.waits, "wait_seconds": self.wait_seconds}
+
+    def __deepcopy__(self, memo):
+        # Copies of a K8sConfig keep sharing the same budget of requests.
+        return self
+
+
+class RetryPolicy(object):
+    """
+    When and how long to wait before sending a request again.
+
+    Requests answered with 429 (Too Many Requests) are always retried, the server didn't process them.
+    Requests answered with 500, 502, 503 or 504, or whose connection was reset, are retried when
+    their method is idempotent. The wait doubles on each attempt, up to 'max_backoff', with full jitter
+    so that clients throttled together don't retry together. A Retry-After header sent by the server
+    takes precedence, up to 'max_backoff' as well.
+    """
+
+    def __init__(
+        self,
+        max_retries=DEFAULT_MAX_RETRIES,
+        backoff=DEFAULT_BACKOFF_SECONDS,
+        max_backoff=DEFAULT_MAX_BACKOFF_SECONDS,
+        jitter=True,
+    ):
+        """
+        :param max_retries: The number of times a request is sent again. Never retried if 0.
+        :param backoff: The base number of seconds to wait, doubled on each attempt.
+        :param max_backoff: The maximum number of seconds to wait between attempts.
+        :param jitter: Whether to wait a random time between 0 and the backoff, rather than the backoff.
+        """
+
+        if isinstance(max_retries, bool) or not isinstance(max_retries, int) or max_retries < 0:
+            raise SyntaxError("RetryPolicy: max_retries: [ {0} ] must be a positive int.".format(max_retries))
+        if not isinstance(backoff, (int, float)) or backoff < 0:
+            raise SyntaxError("RetryPolicy: backoff: [ {0} ] must be a positive number.".format(backoff))
+        if not isinstance(max_backoff, (int, float)) or max_backoff < 0:
+            raise SyntaxError("RetryPolicy: max_backoff: [ {0} ] must be a positive number.".format(max_backoff))
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self.retries = 0
+
+    def should_retry(self, attempt=0, method=None, status=None):
+        """
+        :param attempt: The number of times the request was already retried.
+        :param method: The HTTP method of the request.
+        :param status: The HTTP status of the response, or None if the connection was reset.
+        """
+
+        if attempt >= self.max_retries:
+            return False
+        if status == 429:
+            return True
+        if status is None or status in RETRY_STATUSES:
+            return method in IDEMPOTENT_METHODS
+        return False
+
+    def delay(self, attempt=0, retry_after=None):
+        """
+        :param attempt: The number of times the request was already retried.
+        :param retry_after: The value of the Retry-After header of the response, if any.
+        :return: The number of seconds to wait before the next attempt.
+        """
+
+        with self._lock:
+            self.retries += 1
+        seconds = parse_retry_after(retry_after)
+        if seconds is not None:
+            # a server asking for a day, or a date far off, doesn't block the caller that long.
+            return min(seconds, self.max_backoff)
+        backoff = min(self.backoff * 2 ** attempt, self.max_backoff)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def parse_retry_after(value=None):
+    """
+    :param value: A Retry-After header: a number of seconds, or an HTTP date.
+    :return: The number of seconds to wait, or None if 'value' is missing or invalid.
+    """
+
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0)
+    except (TypeError, ValueError):
+        pass
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(mktime_tz(parsed) - time.time(), 0)
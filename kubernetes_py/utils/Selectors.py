@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import re
+
+import six
+
+EQUALS = "="
+NOT_EQUALS = "!="
+IN = "in"
+NOT_IN = "notin"
+EXISTS = "exists"
+DOES_NOT_EXIST = "!"
+
+VALID_OPERATORS = [EQUALS, NOT_EQUALS, IN, NOT_IN, EXISTS, DOES_NOT_EXIST]
+
+# the operators of a LabelSelectorRequirement.
+MODEL_OPERATORS = {"In": IN, "NotIn": NOT_IN, "Exists": EXISTS, "DoesNotExist": DOES_NOT_EXIST}
+
+# the cheaper operators are evaluated first, so that most objects are rejected early.
+_COST = {EQUALS: 0, EXISTS: 0, DOES_NOT_EXIST: 0, NOT_EQUALS: 1, IN: 1, NOT_IN: 1}
+
+RE_KEY = re.compile(
+    r"^([a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*/)?[A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?$"
+)
+RE_VALUE = re.compile(r"^([A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?)?$")
+
+RE_REQUIREMENT = re.compile(
+    r"""\s*(?:
+        !\s*(?P<absent>[^\s,!=()]+)
+      | (?P<key>[^\s,!=()]+)\s*(?:
+            (?P<set_op>notin|in)\s*\((?P<values>[^()]*)\)
+          | (?P<op>==|=|!=)\s*(?P<value>[^\s,!=()]*)
+        )?
+    )\s*(?:,|$)""",
+    re.VERBOSE,
+)
+
+
+class Requirement(object):
+    """
+    One requirement of a label selector: a key, an operator and the values the operator applies to.
+    """
+
+    def __init__(self, key=None, operator=None, values=None):
+        if not isinstance(key, six.string_types) or not RE_KEY.match(key):
+            raise SyntaxError("Requirement: key: [ {0} ] is invalid.".format(key))
+        if operator not in VALID_OPERATORS:
+            raise SyntaxError("Requirement: operator: [ {0} ] is invalid.".format(operator))
+
+        values = list(values or [])
+        for v in values:
+            if not isinstance(v, six.string_types) or not RE_VALUE.match(v):
+                raise SyntaxError("Requirement: value: [ {0} ] is invalid.".format(v))
+        if operator in (EQUALS, NOT_EQUALS) and len(values) != 1:
+            raise SyntaxError("Requirement: [ {0} ] takes exactly one value: [ {1} ]".format(operator, values))
+        if operator in (IN, NOT_IN) and not values:
+            raise SyntaxError("Requirement: [ {0} ] takes at least one value.".format(operator))
+        if operator in (EXISTS, DOES_NOT_EXIST) and values:
+            raise SyntaxError("Requirement: [ {0} ] takes no values: [ {1} ]".format(operator, values))
+
+        self.key = key
+        self.operator = operator
+        self.values = sorted(set(values))
+
+    def __str__(self):
+        if self.operator in (EQUALS, NOT_EQUALS):
+            return "{0}{1}{2}".format(self.key, self.operator, self.values[0])
+        if self.operator in (IN, NOT_IN):
+            return "{0} {1} ({2})".format(self.key, self.operator, ",".join(self.values))
+        if self.operator == DOES_NOT_EXIST:
+            return "!{0}".format(self.key)
+        return self.key
+
+    def __repr__(self):
+        return "Requirement({0})".format(self)
+
+    def __eq__(self, other):
+        return isinstance(other, Requirement) and str(self) == str(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def matcher(self):
+        """
+        :return: A function of a dict of labels, true if the labels meet this requirement.
+        """
+
+        key = self.key
+        if self.operator == EQUALS:
+            value = self.values[0]
+            return lambda labels: labels.get(key, None) == value
+        if self.operator == NOT_EQUALS:
+            value = self.values[0]
+            return lambda labels: labels.get(key, None) != value
+        if self.operator == IN:
+            values = frozenset(self.values)
+            return lambda labels: labels.get(key, None) in values
+        if self.operator == NOT_IN:
+            values = frozenset(self.values)
+            return lambda labels: labels.get(key, None) not in values
+        if self.operator == EXISTS:
+            return lambda labels: key in labels
+        return lambda labels: key not in labels
+
+
+class Selector(object):
+    """
+    A label selector: the requirements an object's labels must all meet, following the Kubernetes grammar.
+
+        selector = Selector.parse('app in (web,api),tier!=cache,!canary')
+        str(selector)                   # the labelSelector query parameter
+        match = selector.compile()      # a matcher, to filter many objects without parsing again
+        [p for p in pods if match(p['metadata'].get('labels') or {})]
+
+    A Selector can be passed wherever K8sObject.list() and list_iter() take labels.
+    """
+
+    def __init__(self, requirements=None):
+        self._requirements = []
+        self._matcher = None
+        for r in requirements or []:
+            self.add_requirement(r)
+
+    # ------------------------------------------------------------------------------------- builders
+
+    @classmethod
+    def parse(cls, selector=None):
+        """
+        :param selector: A selector string, e.g. 'env=prod,tier in (web,api),canary,!legacy'.
+        """
+
+        if not isinstance(selector, six.string_types):
+            raise SyntaxError("Selector: [ {0} ] is invalid.".format(selector))
+
+        requirements = []
+        pos = 0
+        text = selector.strip()
+        while pos < len(text):
+            m = RE_REQUIREMENT.match(text, pos)
+            if m is None or m.end() == pos:
+                raise SyntaxError("Selector: [ {0} ] is invalid at: [ {1} ]".format(selector, text[pos:]))
+            if m.group("absent") is not None:
+                requirements.append(Requirement(m.group("absent"), DOES_NOT_EXIST))
+            elif m.group("set_op") is not None:
+                values = [v.strip() for v in m.group("values").split(",")]
+                requirements.append(Requirement(m.group("key"), m.group("set_op"), values))
+            elif m.group("op") is not None:
+                op = EQUALS if m.group("op") == "==" else m.group("op")
+                requirements.append(Requirement(m.group("key"), op, [m.group("value")]))
+            else:
+                requirements.append(Requirement(m.group("key"), EXISTS))
+            pos = m.end()
+        return cls(requirements)
+
+    @classmethod
+    def from_dict(cls, labels=None):
+        """
+        :param labels: A dict of labels the objects must all have.
+        """
+
+        if not isinstance(labels, dict):
+            raise SyntaxError("Selector: labels: [ {0} ] is invalid.".format(labels))
+        return cls([Requirement(k, EQUALS, [v]) for k, v in sorted(labels.items())])
+
+    @classmethod
+    def from_model(cls, selector=None):
+        """
+        :param selector: A LabelSelector, or its serialized dict with 'matchLabels' and 'matchExpressions'.
+        """
+
+        if hasattr(selector, "serialize"):
+            selector = selector.serialize()
+        if not isinstance(selector, dict):
+            raise SyntaxError("Selector: selector: [ {0} ] is invalid.".format(selector))
+
+        sel = cls.from_dict(selector.get("matchLabels", None) or {})
+        for exp in selector.get("matchExpressions", None) or []:
+            op = exp.get("operator", None)
+            if op not in MODEL_OPERATORS:
+                raise SyntaxError("Selector: operator: [ {0} ] is invalid.".format(op))
+            sel.add_requirement(Requirement(exp.get("key", None), MODEL_OPERATORS[op], exp.get("values", None)))
+        return sel
+
+    @classmethod
+    def coerce(cls, selector=None):
+        """
+        :param selector: A Selector, a selector string, a dict of labels or a LabelSelector.
+        :return: A Selector, or None if 'selector' is None.
+        """
+
+        if selector is None or isinstance(selector, Selector):
+            return selector
+        if isinstance(selector, six.string_types):
+            return cls.parse(selector)
+        if isinstance(selector, dict):
+            return cls.from_dict(selector)
+        return cls.from_model(selector)
+
+    def add_requirement(self, requirement=None):
+        if not isinstance(requirement, Requirement):
+            raise SyntaxError("Selector: requirement: [ {0} ] is invalid.".format(requirement))
+        if requirement not in self._requirements:
+            self._requirements.append(requirement)
+            self._matcher = None
+        return self
+
+    def add(self, key=None, operator=EQUALS, values=None):
+        if isinstance(values, six.string_types):
+            values = [values]
+        return self.add_requirement(Requirement(key, operator, values))
+
+    # ------------------------------------------------------------------------------------- requirements
+
+    @property
+    def requirements(self):
+        return list(self._requirements)
+
+    @property
+    def equalities(self):
+        """
+        The 'key=value' requirements, as a dict. Objects matching the selector all have these labels.
+        """
+
+        return dict((r.key, r.values[0]) for r in self._requirements if r.operator == EQUALS)
+
+    def __len__(self):
+        return len(self._requirements)
+
+    def __str__(self):
+        return ",".join(str(r) for r in self._requirements)
+
+    def __repr__(self):
+        return "Selector({0})".format(self)
+
+    def __eq__(self, other):
+        return isinstance(other, Selector) and set(self._requirements) == set(other._requirements)
+
+    def __ne__(self, other):
+        return not self == other
+
+    # ------------------------------------------------------------------------------------- matching
+
+    def compile(self):
+        """
+        :return: A function of a dict of labels, true if the labels meet every requirement.
+        """
+
+        if self._matcher is None:
+            requirements = sorted(self._requirements, key=lambda r: _COST[r.operator])
+            matchers = tuple(r.matcher() for r in requirements)
+            if not matchers:
+                self._matcher = lambda labels: True
+            elif len(matchers) == 1:
+                self._matcher = matchers[0]
+            else:
+
+                def match(labels):
+                    for m in matchers:
+                        if not m(labels):
+                            return False
+                    return True
+
+                self._matcher = match
+        return self._matcher
+
+    def matches(self, labels=None):
+        return self.compile()(labels or {})
+
+    def filter(self, objects=None):
+        """
+        :param objects: Raw objects, or objects with labels (K8sObjects, models).
+        :return: The objects matching.
+        """
+
+        match = self.compile()
+        found = []
+        for obj in objects or []:
+            if isinstance(obj, dict):
+                labels = obj.get("metadata", {}).get("labels", None)
+            else:
+                labels = obj.labels
+            if match(labels or {}):
+                found.append(obj)
+        return found
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import base64
+import os
+import re
+import ssl
+import tempfile
+import threading
+
+RE_VALID_SSL_IP = re.compile(
+    r"^https://(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])"
+)
+
+PROTOCOL = getattr(ssl, "PROTOCOL_TLS_CLIENT", ssl.PROTOCOL_SSLv23)
+MAX_CACHED_CONTEXTS = 16
+
+_cache = dict()
+_cache_lock = threading.Lock()
+
+
+def tls_fingerprint(host=None, ca_cert=None, ca_cert_data=None, cert=None, cert_data=None):
+    """
+    The set of credentials an SSL context depends on. Contexts are rebuilt only when it changes.
+    """
+
+    if host is None or not host.startswith("https"):
+        return None
+    if ca_cert is None and ca_cert_data is None and cert is None and cert_data is None:
+        return None
+
+    # TODO: TLS issue with Python 2.7 and urllib3 when hostname is an IP address
+    # A better fix should be found but I can't think of anything else for now.
+    verify = (ca_cert is not None or ca_cert_data is not None) and not RE_VALID_SSL_IP.search(host)
+
+    return (
+        verify,
+        ca_cert,
+        ca_cert_data,
+        tuple(cert) if cert is not None else None,
+        tuple(cert_data) if cert_data is not None else None,
+    )
+
+
+def build_ssl_context(verify=False, ca_cert=None, ca_cert_data=None, cert=None, cert_data=None):
+    """
+    Builds an SSL context from the kubeconfig credentials, entirely in memory.
+
+    :param verify: Whether to verify the API server certificate.
+    :param ca_cert: Path to the certificate authority bundle.
+    :param ca_cert_data: Base64-encoded certificate authority bundle.
+    :param cert: A tuple of (certificate path, key path) for client authentication.
+    :param cert_data: A tuple of base64-encoded (certificate, key) for client authentication.
+    :return: An ssl.SSLContext.
+    """
+
+    context = ssl.SSLContext(PROTOCOL)
+    if verify:
+        context.verify_mode = ssl.CERT_REQUIRED
+        context.check_hostname = True
+        if ca_cert is not None:
+            context.load_verify_locations(cafile=ca_cert)
+        if ca_cert_data is not None:
+            context.load_verify_locations(cadata=base64.b64decode(ca_cert_data).decode("utf-8"))
+    else:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+
+    if cert_data is not None:
+        # The ssl module only loads client certificates from a file. The decoded chain
+        # touches the disk once, when the context is built, and never on a request.
+        cert_pem, key_pem = [base64.b64decode(x) for x in cert_data]
+        chain = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            chain.write(cert_pem.rstrip(b"\n") + b"\n" + key_pem)
+            chain.close()
+            context.load_cert_chain(chain.name)
+        finally:
+            os.unlink(chain.name)
+    elif cert is not None:
+        context.load_cert_chain(*cert)
+
+    return context
+
+
+def ssl_context_for(host=None, ca_cert=None, ca_cert_data=None, cert=None, cert_data=None):
+    """
+    Returns the cached SSL context matching these credentials, building it on first use.
+
+    :return: An ssl.SSLContext, or None if the host is not served over TLS or there are no credentials.
+    """
+
+    fingerprint = tls_fingerprint(host, ca_cert, ca_cert_data, cert, cert_data)
+    if fingerprint is None:
+        return None
+
+    context = _cache.get(fingerprint, None)
+    if context is None:
+        with _cache_lock:
+            context = _cache.get(fingerprint, None)
+            if context is None:
+                context = build_ssl_context(*fingerprint)
+                if len(_cache) >= MAX_CACHED_CONTEXTS:
+                    _cache.pop(next(iter(_cache)))
+                _cache[fingerprint] = context
+    return context
+
+
+def is_verifying(context=None):
+    return context is not None and context.verify_mode != ssl.CERT_NONE
@@ -7,7 +7,11 @@
 #
 
 from kubernetes_py.utils.HttpRequest import HttpRequest
+from kubernetes_py.utils.HttpSession import HttpSession
 from kubernetes_py.utils.ConvertData import convert
+from kubernetes_py.utils.Selectors import Selector, Requirement
+from kubernetes_py.utils.ModelRegistry import ModelRegistry
+from kubernetes_py.utils.Quantity import Quantity, parse_quantity, cpu_millicores, memory_bytes, quantity_array
 from kubernetes_py.utils.Helpers import (
     is_valid_dict,
     is_valid_list,
@@ -18,4 +22,5 @@ from kubernetes_py.utils.Helpers import (
     str_to_class,
     is_valid_ip,
     sanitize_version_number,
+    build_trusted,
 )
@@ -24,9 +24,11 @@ setup(
         "kubernetes_py.models.v1alpha1",
         "kubernetes_py.models.v1beta1",
         "kubernetes_py.models.v2alpha1",
+        "kubernetes_py.models.generated",
         "kubernetes_py.utils",
     ],
     install_requires=["six>=1.10.0", "PyYAML>=3.13", "requests>=2.10.0", "uuid>=1.30", "python-dateutil>=2.6.0"],
+    extras_require={"fast": ["orjson>=2.0"], "numpy": ["numpy>=1.13"]},
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
         "Topic :: Software Development :: Libraries :: Python Modules",
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import json
+import os
+import socket
+import ssl
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import urlparse, parse_qs
+
+
+TLS_DIR = os.path.join(os.path.abspath(os.path.dirname(os.path.realpath(__file__))), "tls")
+TLS_CERT = os.path.join(TLS_DIR, "localhost.crt")
+TLS_KEY = os.path.join(TLS_DIR, "localhost.key")
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        # the headers and the body are written apart: without this, the body waits for the client's delayed ACK.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.server.stand_in.connection_opened()
+
+    def log_message(self, *args):
+        return
+
+    def _handle(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        request = {
+            "method": self.command,
+            "path": parsed.path,
+            "query": dict((k, v[-1]) for k, v in parse_qs(parsed.query).items()),
+            "headers": dict(self.headers.items()),
+            "body": json.loads(body.decode("utf-8")) if body else None,
+        }
+        self.server.stand_in.record(request)
+        status, headers, payload = self.server.stand_in.dispatch(request)
+
+        if isinstance(payload, (dict, list)):
+            payload = json.dumps(payload)
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+
+        if payload is None or isinstance(payload, bytes):
+            payload = payload or b""
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        # any other payload is an iterable of chunks, streamed with chunked transfer encoding.
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for chunk in payload:
+                if isinstance(chunk, (dict, list)):
+                    chunk = json.dumps(chunk) + "\n"
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                self.wfile.write("{0:x}\r\n".format(len(chunk)).encode("ascii") + chunk + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (IOError, OSError):
+            self.close_connection = True
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+    do_PATCH = _handle
+    do_DELETE = _handle
+
+
+class StandInServer(object):
+    """
+    A local stand-in for the API server, answering canned responses.
+
+    Routes map (method, path) to either a (status, payload) tuple, a (status, headers, payload) tuple,
+    or a callable receiving the request dict and returning one of those tuples.
+    Payloads can be dicts (sent as JSON), strings, bytes, or an iterable of chunks to stream.
+    """
+
+    def __init__(self, tls=False):
+        self.routes = dict()
+        self.requests = list()
+        self.connections = 0
+        self.tls = tls
+        self._lock = threading.Lock()
+        self._server = _ThreadingServer(("127.0.0.1", 0), _Handler)
+        self._server.stand_in = self
+        self._thread = None
+        if tls:
+            # self-signed certificate for 'localhost', also usable as its own certificate authority.
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(TLS_CERT, TLS_KEY)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        if self.tls:
+            return "https://localhost:{0}".format(port)
+        return "http://{0}:{1}".format(host, port)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def route(self, method=None, path=None, response=None):
+        self.routes[(method, path)] = response
+        return self
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections += 1
+
+    def record(self, request=None):
+        with self._lock:
+            self.requests.append(request)
+
+    def dispatch(self, request=None):
+        response = self.routes.get((request["method"], request["path"]), None)
+        if response is None:
+            return 404, None, {"kind": "Status", "status": "Failure", "message": "not found", "code": 404}
+        if callable(response):
+            response = response(request)
+        if len(response) == 2:
+            return response[0], None, response[1]
+        return response
@@ -0,0 +1,447 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import asyncio
+import base64
+
+from kubernetes_py import AsyncK8sDeployment, AsyncK8sObject, AsyncK8sPod, AsyncK8sReplicationController, K8sConfig
+from kubernetes_py.K8sExceptions import BadRequestException, NotFoundException, UnprocessableEntityException
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.utils.AsyncHttpRequest import AsyncHttpSession
+from tests._server import StandInServer, TLS_CERT
+from tests.BaseTest import BaseTest
+
+PODS = "/api/v1/namespaces/default/pods"
+
+
+def _pod(name=None, ip=None, ready=True, labels=None):
+    return {
+        "kind": "Pod",
+        "apiVersion": "v1",
+        "metadata": {"name": name, "namespace": "default", "labels": labels or {"name": name}},
+        "spec": {"containers": [{"name": name, "image": "nginx"}]},
+        "status": {
+            "phase": "Running" if ready else "Pending",
+            "podIP": ip,
+            "conditions": [{"type": "Ready", "status": "True" if ready else "False"}],
+        },
+    }
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncK8sObjectTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.config.async_session.close()
+        self.server.stop()
+
+    # ------------------------------------------------------------------------------------- crud
+
+    def test_get(self):
+        self.server.route("GET", PODS + "/yo", (200, _pod("yo", ip="10.0.0.1")))
+        pod = _run(AsyncK8sPod(config=self.config, name="yo").get())
+        self.assertIsInstance(pod, AsyncK8sPod)
+        self.assertIsInstance(pod.model, Pod)
+        self.assertEqual("10.0.0.1", pod.pod_ip)
+        self.assertEqual("application/json", self.server.requests[0]["headers"]["Accept"])
+
+    def test_get_not_found(self):
+        with self.assertRaises(NotFoundException):
+            _run(AsyncK8sPod(config=self.config, name="yo").get())
+
+    def test_list_with_labels(self):
+        items = [_pod("yo-1", labels={"app": "yo"}), _pod("yo-2", labels={"app": "yo"}), _pod("ma", labels={"app": "yo"})]
+        self.server.route("GET", PODS, (200, {"kind": "PodList", "items": items}))
+        pods = _run(AsyncK8sPod(config=self.config, name="yo").list(pattern="yo", labels={"app": "yo"}))
+        self.assertEqual(["yo-1", "yo-2"], [p.name for p in pods])
+        self.assertTrue(all(isinstance(p, AsyncK8sPod) for p in pods))
+        self.assertEqual({"labelSelector": "app=yo"}, self.server.requests[0]["query"])
+
+    def test_create_waits_for_readiness(self):
+        answers = [_pod("yo", ready=False), _pod("yo", ready=False), _pod("yo")]
+        self.server.route("POST", PODS, lambda req: (201, req["body"]))
+        self.server.route("GET", PODS + "/yo", lambda req: (200, answers.pop(0) if len(answers) > 1 else answers[0]))
+        pod = AsyncK8sPod(config=self.config, name="yo")
+        pod.add_container(_container("yo"))
+        _run(pod.create())
+        self.assertTrue(pod._is_ready_status())
+        self.assertEqual("POST", self.server.requests[0]["method"])
+        self.assertEqual("yo", self.server.requests[0]["body"]["metadata"]["name"])
+
+    def test_update_unprocessable(self):
+        self.server.route("PUT", PODS + "/yo", (422, {"kind": "Status", "message": "nope"}))
+        with self.assertRaises(UnprocessableEntityException):
+            _run(AsyncK8sPod(config=self.config, name="yo").update())
+
+    def test_patch(self):
+        self.server.route("PATCH", PODS + "/yo", lambda req: (200, req["body"]))
+        obj = AsyncK8sObject(config=self.config, obj_type="Pod", name="yo")
+        _run(obj.patch())
+        self.assertEqual("PATCH", self.server.requests[0]["method"])
+
+    def test_delete_waits_until_gone(self):
+        gets = []
+        self.server.route("DELETE", PODS + "/yo", (200, {"kind": "Status", "status": "Success"}))
+        self.server.route("GET", PODS + "/yo", lambda req: gets.append(1) or ((200, _pod("yo")) if len(gets) < 2 else (404, {})))
+        pod = AsyncK8sPod(config=self.config, name="yo")
+        pod.add_container(_container("yo"))
+        before = pod.serialize()
+        _run(pod.delete())
+        self.assertEqual(2, len(gets))
+        # the copy the server still had is not kept.
+        self.assertEqual(before, pod.serialize())
+        self.assertTrue(self.server.requests[0]["body"]["orphanDependents"])
+
+    def test_server_version(self):
+        self.server.route("GET", "/version", (200, {"major": "1", "minor": "9"}))
+        version = _run(AsyncK8sObject(config=self.config, obj_type="Pod", name="yo").server_version())
+        self.assertEqual("9", version["minor"])
+
+    def test_token_auth(self):
+        self.config.token = "s3cr3t"
+        self.server.route("GET", PODS + "/yo", (200, _pod("yo")))
+        _run(AsyncK8sPod(config=self.config, name="yo").get())
+        self.assertEqual("Bearer s3cr3t", self.server.requests[0]["headers"]["Authorization"])
+
+    def test_chunked_response(self):
+        self.server.route("GET", PODS + "/yo/log", (200, iter(["line 1\n", "line 2\n", "line 3"])))
+        logs = _run(AsyncK8sPod(config=self.config, name="yo").get_log())
+        self.assertEqual(["line 1", "line 2", "line 3"], logs)
+
+    def test_log_is_text(self):
+        self.server.route("GET", PODS + "/yo/log", (200, iter(['{"level": "info"}\n', "42"])))
+        logs = _run(AsyncK8sPod(config=self.config, name="yo").get_log())
+        self.assertEqual(['{"level": "info"}', "42"], logs)
+
+    # ------------------------------------------------------------------------------------- concurrency
+
+    def test_concurrent_requests_share_pool(self):
+        names = ["pod-{0}".format(i) for i in range(50)]
+        for name in names:
+            self.server.route("GET", "{0}/{1}".format(PODS, name), (200, _pod(name)))
+
+        async def fetch_all():
+            return await asyncio.gather(*[AsyncK8sPod(config=self.config, name=n).get() for n in names])
+
+        pods = _run(fetch_all())
+        self.assertEqual(names, [p.name for p in pods])
+        stats = self.config.async_session.stats()
+        self.assertEqual(50, stats["requests"])
+        self.assertLessEqual(self.server.connections, self.config.pool_maxsize)
+        self.assertEqual(self.server.connections, stats["misses"])
+
+    def test_sequential_requests_reuse_connection(self):
+        self.server.route("GET", PODS + "/yo", (200, _pod("yo")))
+
+        async def fetch():
+            for _ in range(5):
+                await AsyncK8sPod(config=self.config, name="yo").get()
+
+        _run(fetch())
+        self.assertEqual(1, self.server.connections)
+        self.assertEqual({"requests": 5, "hits": 4, "misses": 1}, self.config.async_session.stats())
+
+    def test_list_iter(self):
+        pages = [
+            (200, {"kind": "PodList", "metadata": {"continue": "t1"}, "items": [_pod("yo-1"), _pod("ma")]}),
+            (200, {"kind": "PodList", "metadata": {}, "items": [_pod("yo-2")]}),
+        ]
+        self.server.route("GET", PODS, lambda req: pages.pop(0))
+
+        async def collect():
+            return [p async for p in AsyncK8sPod(config=self.config, name="yo").list_iter(pattern="yo", limit=2)]
+
+        pods = _run(collect())
+        self.assertEqual(["yo-1", "yo-2"], [p.name for p in pods])
+        self.assertTrue(all(isinstance(p, AsyncK8sPod) for p in pods))
+        self.assertEqual("t1", self.server.requests[1]["query"]["continue"])
+
+    def test_get_by_labels_and_pod_ip(self):
+        items = [_pod("a", ip="10.0.0.1"), _pod("b", ip="10.0.0.2")]
+        self.server.route("GET", PODS, (200, {"kind": "PodList", "items": items}))
+        pods = _run(AsyncK8sPod.get_by_labels(config=self.config, labels={"app": "yo"}))
+        self.assertEqual(2, len(pods))
+        pod = _run(AsyncK8sPod.get_by_pod_ip(config=self.config, ip="10.0.0.2"))
+        self.assertEqual("b", pod.name)
+        self.assertEqual("status.podIP=10.0.0.2", self.server.requests[1]["query"]["fieldSelector"])
+
+    # ------------------------------------------------------------------------------------- controllers
+
+    def test_deployment_waits_for_replicas(self):
+        dep = AsyncK8sDeployment(config=self.config, name="yo", image="nginx", replicas=2)
+        url = "{0}/yo".format(dep.base_url)
+        answers = [0, 1, 2]
+
+        def deployment(req=None):
+            body = dep.serialize()
+            n = answers.pop(0) if len(answers) > 1 else answers[0]
+            body["status"] = {"replicas": n, "updatedReplicas": n, "availableReplicas": n}
+            return 200, body
+
+        self.server.route("POST", dep.base_url, lambda req: (201, req["body"]))
+        self.server.route("GET", url, deployment)
+        _run(dep.create())
+        self.assertEqual(2, dep.available_replicas)
+
+    def test_replication_controller_waits_for_pods(self):
+        rc = AsyncK8sReplicationController(config=self.config, name="yo", replicas=2)
+        rc.add_container(_container("yo"))
+        url = "{0}/yo".format(rc.base_url)
+        ready = [False, True]
+
+        def controller(req=None):
+            body = rc.serialize()
+            body["status"] = {"replicas": 2}
+            return 200, body
+
+        def pods(req=None):
+            flag = ready.pop(0) if len(ready) > 1 else ready[0]
+            return 200, {"kind": "PodList", "items": [_pod("yo-1"), _pod("yo-2", ready=flag)]}
+
+        self.server.route("POST", rc.base_url, lambda req: (201, req["body"]))
+        self.server.route("GET", url, controller)
+        self.server.route("GET", PODS, pods)
+        _run(rc.create())
+        self.assertEqual(2, rc.current_replicas)
+        self.assertEqual("rc_version={0}".format(rc.pod_labels["rc_version"]), _selector_part(self.server, "rc_version"))
+
+    def test_rolling_update(self):
+        with self.assertRaises(SyntaxError):
+            _run(AsyncK8sReplicationController.rolling_update(config=self.config, name="yo"))
+        with self.assertRaises(NotFoundException):
+            _run(AsyncK8sReplicationController.rolling_update(config=self.config, name="yo", image="nginx:1.15"))
+
+    def test_restart(self):
+        rc = AsyncK8sReplicationController(config=self.config, name="yo")
+        # a rolling update over asyncio, of an RC the server does not have.
+        with self.assertRaises(NotFoundException):
+            _run(rc.restart())
+
+    def test_streams_are_blocking_only(self):
+        objects = [
+            AsyncK8sObject(config=self.config, obj_type="Pod", name="yo"),
+            AsyncK8sPod(config=self.config, name="yo"),
+            AsyncK8sDeployment(config=self.config, name="yo"),
+            AsyncK8sReplicationController(config=self.config, name="yo"),
+        ]
+        for obj in objects:
+            with self.assertRaises(TypeError):
+                obj.watch()
+        with self.assertRaises(TypeError) as ctx:
+            AsyncK8sPod(config=self.config, name="yo").stream_log(follow=True)
+        self.assertIn("K8sPod.stream_log()", str(ctx.exception))
+        self.assertEqual([], self.server.requests)
+
+
+class AsyncK8sObjectTLSTest(BaseTest):
+    def setUp(self):
+        return
+
+    def tearDown(self):
+        return
+
+    def test_get_over_tls(self):
+        with open(TLS_CERT, "rb") as crt:
+            crt_data = base64.b64encode(crt.read()).decode()
+        with StandInServer(tls=True) as server:
+            server.route("GET", PODS + "/yo", (200, _pod("yo")))
+            config = K8sConfig(kubeconfig=None, api_host=server.url)
+            config.ca_cert_data = crt_data
+            pod = _run(AsyncK8sPod(config=config, name="yo").get())
+            self.assertEqual("yo", pod.name)
+            self.assertIs(config.ssl_context, config.async_session.ssl_context)
+            config.async_session.close()
+
+    def test_request_credentials(self):
+        with open(TLS_CERT, "rb") as crt:
+            crt_data = base64.b64encode(crt.read()).decode()
+        with StandInServer(tls=True) as server:
+            server.route("GET", PODS + "/yo", (200, _pod("yo")))
+            config = K8sConfig(kubeconfig=None, api_host=server.url)
+            obj = AsyncK8sObject(config=config, obj_type="Pod", name="yo")
+            # the credentials of the request are used, rather than the config's.
+            state = _run(obj.request(url=PODS + "/yo", ca_cert_data=crt_data))
+            self.assertEqual(200, state["status"])
+            with self.assertRaises(BadRequestException):
+                _run(obj.request(url=PODS + "/yo", ca_cert="/nowhere/ca.crt"))
+            config.async_session.close()
+
+
+def _handler(received=None, drop=None, close=None):
+    """
+    A bare HTTP/1.1 server answering '{}' to every request, except that the first connection is dropped
+    on reading its second request if 'drop', or right after its first answer if 'close'.
+    """
+
+    connections = list()
+
+    async def handle(reader=None, writer=None):
+        connections.append(writer)
+        first = len(connections) == 1
+        answered = 0
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                received.append(head.decode("latin-1"))
+                length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+                await reader.readexactly(length)
+                if first and drop and answered == 1:
+                    break
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+                await writer.drain()
+                answered += 1
+                if first and close:
+                    break
+        except asyncio.IncompleteReadError:
+            pass
+        writer.close()
+
+    return handle
+
+
+async def _serve(handle=None, host="127.0.0.1"):
+    server = await asyncio.start_server(handle, host, 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, "http://{0}:{1}/".format("[{0}]".format(host) if ":" in host else host, port)
+
+
+class AsyncHttpSessionTest(BaseTest):
+    def setUp(self):
+        return
+
+    def tearDown(self):
+        return
+
+    def _exchange(self, method=None, drop=False, close=False, timeout=None, handle=None, host="127.0.0.1"):
+        received = list()
+
+        async def scenario():
+            server, url = await _serve(handle or _handler(received, drop=drop, close=close), host)
+            session = AsyncHttpSession(timeout=timeout)
+            try:
+                await session.request("GET", url)
+                # the server closes an idle connection in its own time.
+                await asyncio.sleep(0.05)
+                return await session.request(method, url, body=b"{}"), session.stats()
+            finally:
+                session.close()
+                server.close()
+                # the handlers see their connections closed.
+                await asyncio.sleep(0.05)
+
+        try:
+            response, stats = _run(scenario())
+        except Exception as err:
+            return err, received, None
+        return response, received, stats
+
+    def test_stale_connection_is_not_used(self):
+        response, received, stats = self._exchange("POST", close=True)
+        self.assertEqual(200, response[0])
+        self.assertEqual(["GET", "POST"], [x.split(" ")[0] for x in received])
+        self.assertEqual(2, stats["misses"])
+
+    def test_idempotent_request_is_sent_again(self):
+        response, received, stats = self._exchange("GET", drop=True)
+        self.assertEqual(200, response[0])
+        self.assertEqual(["GET", "GET", "GET"], [x.split(" ")[0] for x in received])
+
+    def test_non_idempotent_request_is_not_sent_again(self):
+        for method in ("POST", "PATCH"):
+            err, received, _ = self._exchange(method, drop=True)
+            self.assertIsInstance(err, ConnectionError)
+            self.assertEqual(["GET", method], [x.split(" ")[0] for x in received])
+
+    def test_timeout(self):
+        async def silent(reader=None, writer=None):
+            await reader.read()
+            writer.close()
+
+        err, _, _ = self._exchange("GET", timeout=0.2, handle=silent)
+        self.assertIsInstance(err, asyncio.TimeoutError)
+        with self.assertRaises(SyntaxError):
+            AsyncHttpSession(timeout=0)
+
+    def test_ipv6_host_header(self):
+        received = list()
+        try:
+            response, _, _ = self._exchange("GET", handle=_handler(received), host="::1")
+        except OSError:
+            self.skipTest("IPv6 is not available")
+        if isinstance(response, OSError):
+            self.skipTest("IPv6 is not available")
+        self.assertEqual(200, response[0])
+        self.assertIn("Host: [::1]:", received[0])
+
+    def test_responses_without_a_body(self):
+        answers = {
+            "/head": b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n",
+            "/204": b"HTTP/1.1 204 No Content\r\n\r\n",
+            "/304": b"HTTP/1.1 304 Not Modified\r\nETag: yo\r\n\r\n",
+            "/100": b"HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}",
+            "/close": b"HTTP/1.1 200 OK\r\nConnection: close\r\n\r\nbye",
+        }
+        connections = list()
+
+        async def handle(reader=None, writer=None):
+            connections.append(writer)
+            try:
+                while True:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                    path = head.split(b" ")[1].decode("latin-1")
+                    writer.write(answers[path])
+                    await writer.drain()
+                    if path == "/close":
+                        break
+            except asyncio.IncompleteReadError:
+                pass
+            writer.close()
+
+        async def scenario():
+            server, url = await _serve(handle)
+            session = AsyncHttpSession(timeout=2)
+            try:
+                responses = [await session.request("HEAD", url + "head")]
+                for path in ("204", "304", "100", "close"):
+                    responses.append(await session.request("GET", url + path))
+                return responses
+            finally:
+                session.close()
+                server.close()
+                await asyncio.sleep(0.05)
+
+        responses = _run(scenario())
+        self.assertEqual([200, 204, 304, 200, 200], [x[0] for x in responses])
+        self.assertEqual([b"", b"", b"", b"{}", b"bye"], [x[3] for x in responses])
+        # none of them waited for the connection to close.
+        self.assertEqual(1, len(connections))
+
+
+def _container(name=None):
+    from kubernetes_py import K8sContainer
+
+    return K8sContainer(name=name, image="nginx")
+
+
+def _selector_part(server=None, key=None):
+    for req in server.requests:
+        selector = req["query"].get("labelSelector", "")
+        for part in selector.split(","):
+            if part.startswith(key):
+                return part
+    return None
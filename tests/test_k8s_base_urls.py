@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes_py import K8sConfig, K8sCronJob, K8sNode, K8sPod
+from kubernetes_py.models.unversioned.BaseUrls import BaseUrls
+from tests.BaseTest import BaseTest
+
+
+class K8sBaseUrlsTest(BaseTest):
+    def test_urls(self):
+        urls = BaseUrls(namespace="yo")
+        self.assertEqual("/api/v1/namespaces/yo/pods", urls.get_base_url("Pod"))
+        self.assertEqual("/api/v1/nodes", urls.get_base_url("Node"))
+        self.assertEqual("/apis/metrics.k8s.io/v1beta1/namespaces/yo/pods", urls.get_base_url("PodMetrics"))
+        self.assertEqual("/apis/metrics.k8s.io/v1beta1/nodes", urls.get_base_url("NodeMetrics"))
+        self.assertEqual("/apis/extensions/v1beta1/namespaces/yo/deployments", urls.get_base_url("Deployment"))
+        self.assertEqual("/apis/batch/v1beta1/namespaces/yo/cronjobs", urls.get_base_url("CronJob"))
+        self.assertIsNone(urls.get_base_url("Volume"))
+        self.assertEqual("/api/v1/pods", BaseUrls(namespace=None).get_base_url("Pod"))
+        urls = BaseUrls(namespace="yo", cron="v2alpha1")
+        self.assertEqual("/apis/batch/v2alpha1/namespaces/yo/cronjobs", urls.get_base_url("CronJob"))
+
+    def test_url(self):
+        for namespace in ("default", "yo", None):
+            for versions in ({}, {"batch": "v2alpha1", "cron": "v2alpha1"}, {"extensions": "v1", "autoscaling": "v2"}):
+                urls = BaseUrls(namespace=namespace, **versions).urls
+                for object_type, url in urls.items():
+                    self.assertEqual(url, BaseUrls.url(object_type, namespace=namespace, **versions))
+        with self.assertRaises(SyntaxError):
+            BaseUrls.url("Yo")
+        with self.assertRaises(SyntaxError):
+            BaseUrls().get_base_url("Yo")
+
+    def test_templates_are_kept(self):
+        self.assertIs(BaseUrls.templates(), BaseUrls.templates())
+        self.assertIs(BaseUrls.templates(cron="v2alpha1"), BaseUrls.templates(cron="v2alpha1"))
+        self.assertIsNot(BaseUrls.templates(), BaseUrls.templates(cron="v2alpha1"))
+
+    def test_objects(self):
+        config = K8sConfig(kubeconfig=None, namespace="yo")
+        self.assertEqual("/api/v1/namespaces/yo/pods", K8sPod(config=config, name="a").base_url)
+        metrics = K8sPod(config=config, name="a")._metrics_url()
+        self.assertEqual("/apis/metrics.k8s.io/v1beta1/namespaces/yo/pods/a", metrics)
+        self.assertEqual("/api/v1/nodes", K8sNode(config=config, name="a").base_url)
+        self.assertEqual("/apis/batch/v1beta1/namespaces/yo/cronjobs", K8sCronJob(config=config, name="a").base_url)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from kubernetes_py import K8sConfig, K8sInformer
+from kubernetes_py.K8sCapacity import K8sCapacity
+from tests.BaseTest import BaseTest
+from tests._server import StandInServer
+
+GI = 2 ** 30
+ZONE = "failure-domain.beta.kubernetes.io/zone"
+
+
+def _node(name=None, cpu=None, memory=None, pods="10", zone=None, taints=None, unschedulable=False):
+    node = {
+        "metadata": {"name": name, "labels": {ZONE: zone} if zone else {}},
+        "spec": {"taints": taints or [], "unschedulable": unschedulable},
+        "status": {"allocatable": {"cpu": cpu, "memory": memory, "pods": pods}},
+    }
+    return node
+
+
+def _container(requests=None, limits=None):
+    resources = dict()
+    if requests is not None:
+        resources["requests"] = dict(zip(("cpu", "memory"), requests))
+    if limits is not None:
+        resources["limits"] = dict(zip(("cpu", "memory"), limits))
+    return {"name": "c", "resources": resources}
+
+
+def _pod(name=None, node=None, containers=None, init=None, phase="Running"):
+    spec = {"containers": containers or []}
+    if node is not None:
+        spec["nodeName"] = node
+    if init is not None:
+        spec["initContainers"] = init
+    return {"metadata": {"name": name, "namespace": "default"}, "spec": spec, "status": {"phase": phase}}
+
+
+def _list_and_watch(listing=None):
+    def answer(req=None):
+        if req["query"].get("watch") != "true":
+            return 200, listing
+        return 200, iter([])
+
+    return answer
+
+
+NODES = [
+    _node("node-1", "4", "16Gi", zone="a"),
+    _node("node-2", "4", "16Gi", zone="a", taints=[{"key": "dedicated", "value": "db", "effect": "NoSchedule"}]),
+    _node("node-3", "2", "4Gi", zone="b", taints=[{"key": "spot", "effect": "PreferNoSchedule"}]),
+]
+
+PODS = [
+    _pod("web-1", "node-1", [_container(("1", "2Gi"), ("2", "4Gi")), _container(("500m", "1Gi"))]),
+    _pod("web-2", "node-1", [_container(("1", "2Gi"), ("2", "4Gi"))]),
+    # the init container needs more cpu than the containers together.
+    _pod("db-1", "node-2", [_container(("1", "12Gi"), ("1", "12Gi"))], init=[_container(("3", "1Gi"))]),
+    _pod("batch-1", "node-3", [_container(("1500m", "1Gi"), ("4", "1Gi"))]),
+    _pod("done", "node-3", [_container(("2", "2Gi"))], phase="Succeeded"),
+    _pod("pending", None, [_container(("2", "2Gi"))], phase="Pending"),
+    _pod("gone", "node-9", [_container(("2", "2Gi"))]),
+]
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class K8sCapacityTest(BaseTest):
+    def setUp(self):
+        self.capacity = K8sCapacity(nodes=NODES, pods=PODS)
+
+    def test_init_invalid(self):
+        with self.assertRaises(SyntaxError):
+            K8sCapacity(nodes="yo", pods=[])
+        with self.assertRaises(SyntaxError):
+            K8sCapacity(nodes=[], pods=None)
+        with self.assertRaises(SyntaxError):
+            K8sCapacity(nodes=[], pods=[], resources="cpu")
+        with self.assertRaises(SyntaxError):
+            self.capacity.fits({"gpu": "1"})
+
+    def test_matrices(self):
+        c = self.capacity
+        self.assertEqual(["node-1", "node-2", "node-3"], c.names)
+        self.assertEqual([[4000, 16 * GI, 10], [4000, 16 * GI, 10], [2000, 4 * GI, 10]], c.allocatable.tolist())
+        # unscheduled, terminated and unknown nodes' pods are left out.
+        self.assertEqual([[2500, 5 * GI, 2], [3000, 12 * GI, 1], [1500, 1 * GI, 1]], c.requested.tolist())
+        self.assertEqual([[4000, 8 * GI, 2], [1000, 12 * GI, 1], [4000, 1 * GI, 1]], c.limits.tolist())
+        # web-1 has a container with no limits.
+        self.assertEqual([[1, 1, 0], [0, 0, 0], [0, 0, 0]], c.unlimited.tolist())
+        self.assertEqual([2, 1, 1], c.pods.tolist())
+
+    def test_fits(self):
+        c = self.capacity
+        self.assertEqual([3, 2, 1], c.fits({"cpu": "500m", "memory": "1Gi"}).tolist())
+        self.assertEqual([0, 0, 0], c.fits({"memory": "16Gi"}).tolist())
+        c.unschedulable[0] = True
+        self.assertEqual([0, 2, 1], c.fits({"cpu": "500m"}).tolist())
+
+    def test_by_node(self):
+        report = self.capacity.by_node(shape={"cpu": "500m", "memory": "1Gi"})
+        node = report["node-3"]
+        self.assertEqual(1, node["nodes"])
+        self.assertEqual({"cpu": 500, "memory": 3 * GI, "pods": 9}, node["headroom"])
+        self.assertEqual({"cpu": 0.75, "memory": 0.25, "pods": 0.1}, node["utilization"])
+        self.assertEqual(2.0, node["overcommit"]["cpu"])
+        # one more pod fits: 2Gi of the 3Gi free can't be used, for want of cpu.
+        self.assertAlmostEqual(2 / 3.0, node["fragmentation"]["memory"])
+        self.assertEqual(0, node["fragmentation"]["cpu"])
+        self.assertEqual(0.5, node["stranded"])
+
+    def test_by_label(self):
+        report = self.capacity.by_label(ZONE)
+        self.assertEqual(["a", "b"], sorted(report))
+        self.assertEqual(2, report["a"]["nodes"])
+        self.assertEqual(3, report["a"]["pods"])
+        self.assertEqual({"cpu": 8000, "memory": 32 * GI, "pods": 20}, report["a"]["allocatable"])
+        self.assertEqual({"cpu": 5500, "memory": 17 * GI, "pods": 3}, report["a"]["requested"])
+        self.assertEqual([None], list(self.capacity.by_label("yo")))
+
+    def test_by_taint(self):
+        report = self.capacity.by_taint()
+        self.assertEqual({None, "dedicated=db:NoSchedule", "spot:PreferNoSchedule"}, set(report))
+        self.assertEqual(4000, report["dedicated=db:NoSchedule"]["allocatable"]["cpu"])
+        self.assertEqual(1, report[None]["nodes"])
+
+    def test_report(self):
+        report = self.capacity.report()
+        self.assertEqual(3, report["nodes"])
+        self.assertEqual(4, report["pods"])
+        self.assertEqual({"cpu": 10000, "memory": 36 * GI, "pods": 30}, report["allocatable"])
+        self.assertEqual({"cpu": 3000, "memory": 18 * GI, "pods": 26}, report["headroom"])
+
+    def test_resources(self):
+        capacity = K8sCapacity(nodes=NODES, pods=PODS, resources=["memory"])
+        self.assertEqual([[5 * GI], [12 * GI], [1 * GI]], capacity.requested.tolist())
+        self.assertEqual({"memory": 18 * GI}, capacity.report()["headroom"])
+
+    def test_empty(self):
+        capacity = K8sCapacity(nodes=[], pods=[])
+        self.assertEqual(0, capacity.report()["nodes"])
+        self.assertEqual({}, capacity.by_node())
+
+    def test_load(self):
+        server = StandInServer().start()
+        try:
+            server.route("GET", "/api/v1/nodes", (200, {"kind": "NodeList", "metadata": {}, "items": NODES}))
+            server.route("GET", "/api/v1/pods", _list_and_watch({"kind": "PodList", "metadata": {}, "items": PODS}))
+            config = K8sConfig(kubeconfig=None, api_host=server.url)
+            capacity = K8sCapacity.load(config=config)
+            self.assertEqual([2500, 5 * GI, 2], capacity.requested[0].tolist())
+            self.assertEqual(["/api/v1/nodes", "/api/v1/pods"], [x["path"] for x in server.requests])
+            self.assertEqual("default", config.namespace)
+
+            # the pods come from the informer, if one is kept.
+            informer = K8sInformer.shared(config=config, obj_type="Pod", namespace=None).start()
+            try:
+                self.assertTrue(informer.wait_for_sync(timeout=10))
+                count = len(server.requests)
+                K8sCapacity.load(config=config)
+                requests = [x["path"] for x in server.requests[count:] if "watch" not in x["query"]]
+                self.assertEqual(["/api/v1/nodes"], requests)
+            finally:
+                informer.stop()
+        finally:
+            server.stop()
@@ -6,8 +6,15 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
-from kubernetes_py import K8sConfig, K8sCronJob
+import base64
+import copy
+import tempfile
+
+import yaml
+
+from kubernetes_py import K8sConfig, K8sCronJob, K8sPod
 from tests import _utils
+from tests._server import StandInServer, TLS_CERT, TLS_KEY
 from tests.BaseTest import BaseTest
 
 DEFAULT_API_HOST = "localhost:8888"
@@ -165,3 +172,115 @@ class K8sConfigTest(BaseTest):
             cj.add_container(container)
             cj.create()
             self.assertIsInstance(cj, K8sCronJob)
+
+    # ------------------------------------------------------------------------------------- connection pool
+
+    def test_session_shared_by_objects(self):
+        config = K8sConfig(kubeconfig=None)
+        pod1 = K8sPod(config=config, name="yo")
+        pod2 = K8sPod(config=config, name="mama")
+        self.assertIs(pod1.config.session, pod2.config.session)
+        self.assertIs(config.session, copy.deepcopy(config).session)
+
+    def test_session_invalid_pool_size(self):
+        config = K8sConfig(kubeconfig=None, pool_maxsize=0)
+        with self.assertRaises(SyntaxError):
+            config.session
+
+    def test_session_reuses_connections(self):
+        pod = {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": "yo", "namespace": "default"}}
+        with StandInServer() as server:
+            server.route("GET", "/api/v1/namespaces/default/pods/yo", (200, pod))
+            config = K8sConfig(kubeconfig=None, api_host=server.url)
+            for _ in range(5):
+                K8sPod(config=config, name="yo").get()
+            self.assertEqual(1, server.connections)
+            self.assertEqual({"requests": 5, "hits": 4, "misses": 1}, config.pool_stats)
+
+    def test_session_without_keep_alive(self):
+        pod = {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": "yo", "namespace": "default"}}
+        with StandInServer() as server:
+            server.route("GET", "/api/v1/namespaces/default/pods/yo", (200, pod))
+            config = K8sConfig(kubeconfig=None, api_host=server.url, keep_alive=False)
+            for _ in range(3):
+                K8sPod(config=config, name="yo").get()
+            self.assertEqual(3, server.connections)
+            self.assertEqual(3, config.session.pool_misses)
+
+    # ------------------------------------------------------------------------------------- tls context
+
+    def test_ssl_context_from_data_built_once(self):
+        with open(TLS_CERT, "rb") as crt, open(TLS_KEY, "rb") as key:
+            crt_data, key_data = base64.b64encode(crt.read()).decode(), base64.b64encode(key.read()).decode()
+        pod = {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": "yo", "namespace": "default"}}
+
+        with StandInServer(tls=True) as server:
+            server.route("GET", "/api/v1/namespaces/default/pods/yo", (200, pod))
+            config = K8sConfig(kubeconfig=None, api_host=server.url)
+            config.ca_cert_data = crt_data
+            config.cert_data = (crt_data, key_data)
+            context = config.ssl_context
+            self.assertIsNotNone(context)
+
+            temp_files = []
+            original = tempfile.NamedTemporaryFile
+            tempfile.NamedTemporaryFile = lambda *args, **kwargs: temp_files.append(1) or original(*args, **kwargs)
+            try:
+                for _ in range(3):
+                    K8sPod(config=config, name="yo").get()
+            finally:
+                tempfile.NamedTemporaryFile = original
+
+            self.assertEqual([], temp_files)
+            self.assertIs(context, config.ssl_context)
+            self.assertIs(context, config.session.ssl_context)
+            self.assertEqual(1, server.connections)
+
+    def test_ssl_context_rebuilt_on_credentials_change(self):
+        with open(TLS_CERT, "rb") as crt:
+            crt_data = base64.b64encode(crt.read()).decode()
+        config = K8sConfig(kubeconfig=None, api_host="https://localhost:6443")
+        self.assertIsNone(config.ssl_context)
+        config.ca_cert_data = crt_data
+        first = config.session.ssl_context
+        self.assertIsNotNone(first)
+        config.ca_cert = TLS_CERT
+        self.assertIsNot(first, config.session.ssl_context)
+
+    # ------------------------------------------------------------------------------------- kubeconfig cache
+
+    def test_kubeconfig_parsed_once(self):
+        with open(_utils.kubeconfig_fallback) as f:
+            dotconf = f.read()
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml") as kubeconfig:
+            kubeconfig.write(dotconf)
+            kubeconfig.flush()
+
+            K8sConfig(kubeconfig=None)  # the default kubeconfig, if any, is parsed here.
+            loads = []
+            original = yaml.load
+            yaml.load = lambda *args, **kwargs: loads.append(1) or original(*args, **kwargs)
+            try:
+                configs = [K8sConfig(kubeconfig=kubeconfig.name) for _ in range(3)]
+                self.assertEqual(1, len(loads))
+
+                kubeconfig.write("\n# a longer file is parsed again\n")
+                kubeconfig.flush()
+                K8sConfig(kubeconfig=kubeconfig.name)
+                self.assertEqual(2, len(loads))
+            finally:
+                yaml.load = original
+
+        self.assertEqual("https://kubernetes:8443", configs[0].api_host)
+        self.assertEqual(configs[0].serialize(), configs[2].serialize())
+        configs[0].clusters[0]["cluster"]["server"] = "https://yo:443"
+        self.assertEqual("https://kubernetes:8443", configs[1].clusters[0]["cluster"]["server"])
+
+    def test_kubeconfig_invalid(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml") as kubeconfig:
+            kubeconfig.write("clusters: [")
+            kubeconfig.flush()
+            with self.assertRaises(SyntaxError):
+                K8sConfig(kubeconfig=kubeconfig.name)
+        with self.assertRaises(IOError):
+            K8sConfig(kubeconfig="/yo/mama/config")
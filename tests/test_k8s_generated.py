@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import os
+
+from codegen import generate
+from kubernetes_py.models.generated import (
+    autoscaling_v1,
+    batch_v1,
+    batch_v1beta1,
+    core_v1,
+    extensions_v1beta1,
+    meta_v1,
+)
+from kubernetes_py.models.v1.ConfigMap import ConfigMap
+from kubernetes_py.models.v1.HorizontalPodAutoscaler import HorizontalPodAutoscaler
+from kubernetes_py.models.v1.Job import Job
+from kubernetes_py.models.v1.Node import Node
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.models.v1.ReplicationController import ReplicationController
+from kubernetes_py.models.v1.Service import Service
+from kubernetes_py.models.v1beta1.CronJob import CronJob
+from kubernetes_py.models.v1beta1.DaemonSet import DaemonSet
+from kubernetes_py.models.v1beta1.Deployment import Deployment
+from tests import _constants
+from tests.BaseTest import BaseTest
+
+
+def _pod():
+    return {
+        "kind": "Pod",
+        "apiVersion": "v1",
+        "metadata": {
+            "name": "web-0",
+            "namespace": "default",
+            "labels": {"app": "web"},
+            "ownerReferences": [{"apiVersion": "v1", "kind": "ReplicationController", "name": "web", "uid": "1"}],
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "web",
+                    "image": "nginx",
+                    "env": [{"name": "NODE", "valueFrom": {"fieldRef": {"fieldPath": "spec.nodeName"}}}],
+                    "ports": [{"containerPort": 80, "protocol": "TCP"}],
+                    "livenessProbe": {"httpGet": {"path": "/healthz", "port": 80}, "periodSeconds": 10},
+                    "resources": {"limits": {"cpu": "500m"}, "requests": {"memory": "128Mi"}},
+                    "volumeMounts": [{"name": "config", "mountPath": "/etc/nginx"}],
+                }
+            ],
+            "volumes": [
+                {"name": "config", "configMap": {"name": "web", "defaultMode": 420}},
+                {"name": "data", "emptyDir": {}},
+            ],
+            "nodeSelector": {"disk": "ssd"},
+            "tolerations": [{"key": "dedicated", "operator": "Exists", "effect": "NoSchedule"}],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": "10.0.0.2",
+            "conditions": [{"type": "Ready", "status": "True", "lastTransitionTime": "2018-06-01T12:00:00Z"}],
+            "containerStatuses": [
+                {
+                    "name": "web",
+                    "ready": True,
+                    "restartCount": 0,
+                    "image": "nginx",
+                    "imageID": "docker-pullable://nginx@sha256:0",
+                    "state": {"running": {"startedAt": "2018-06-01T12:00:05Z"}},
+                }
+            ],
+        },
+    }
+
+
+def _node():
+    return {
+        "kind": "Node",
+        "apiVersion": "v1",
+        "metadata": {"name": "node-1", "labels": {"kubernetes.io/hostname": "node-1"}},
+        "spec": {"podCIDR": "10.0.1.0/24", "externalID": "node-1"},
+        "status": {
+            "capacity": {"cpu": "4", "memory": "16Gi", "pods": "110"},
+            "addresses": [{"type": "InternalIP", "address": "10.0.0.1"}],
+            "conditions": [{"type": "Ready", "status": "True", "lastHeartbeatTime": "2018-06-01T12:00:00Z"}],
+            "nodeInfo": {"kubeletVersion": "v1.10.5", "machineID": "0", "systemUUID": "0", "bootID": "0"},
+        },
+    }
+
+
+class K8sGeneratedTest(BaseTest):
+    def test_generated_models_are_up_to_date(self):
+        for module, source in generate.generate().items():
+            with open(os.path.join(generate.TARGET, "{0}.py".format(module))) as f:
+                self.assertEqual(source, f.read(), "{0}: run python -m codegen.generate".format(module))
+
+    def test_attribute_name(self):
+        self.assertEqual("pod_ip", generate.attribute_name("podIP"))
+        self.assertEqual("host_ipc", generate.attribute_name("hostIPC"))
+        self.assertEqual("external_ips", generate.attribute_name("externalIPs"))
+        self.assertEqual("target_cpu_utilization_percentage", generate.attribute_name("targetCPUUtilizationPercentage"))
+        self.assertEqual("continue_", generate.attribute_name("continue"))
+
+    def test_round_trip(self):
+        for model_class, raw in ((core_v1.Pod, _pod()), (core_v1.Node, _node())):
+            model = model_class(raw)
+            self.assertEqual(raw, model.serialize())
+        pod = core_v1.Pod(_pod())
+        self.assertIsInstance(pod.metadata, meta_v1.ObjectMeta)
+        self.assertIsInstance(pod.spec.containers[0].env[0].value_from, core_v1.EnvVarSource)
+        self.assertEqual("10.0.0.2", pod.status.pod_ip)
+        self.assertEqual({}, core_v1.Pod().serialize())
+
+    def test_unknown_fields_are_dropped(self):
+        raw = _pod()
+        raw["metadata"]["managedBy"] = "not-a-field-of-ObjectMeta"
+        self.assertEqual(_pod(), core_v1.Pod(raw).serialize())
+
+    def test_parity_with_models(self):
+        cases = [
+            (Pod, core_v1.Pod, _pod()),
+            (Pod, core_v1.Pod, _constants.pod_with_node_affinity()),
+            (Pod, core_v1.Pod, _constants.pod_with_pod_affinity()),
+            (Node, core_v1.Node, _node()),
+            (ReplicationController, core_v1.ReplicationController, _constants.frontend()),
+            (ReplicationController, core_v1.ReplicationController, _constants.cassandra_rc()),
+            (Service, core_v1.Service, _constants.nginx_service()),
+            (ConfigMap, core_v1.ConfigMap, _constants.configmap()),
+            (Job, batch_v1.Job, _constants.job()),
+            (CronJob, batch_v1beta1.CronJob, _constants.cronjob()),
+            (DaemonSet, extensions_v1beta1.DaemonSet, _constants.fluentd_daemonset()),
+            (Deployment, extensions_v1beta1.Deployment, _constants.hpa_example_deployment()),
+            (HorizontalPodAutoscaler, autoscaling_v1.HorizontalPodAutoscaler, _constants.hpa_example_autoscaler()),
+        ]
+        for model_class, generated_class, raw in cases:
+            expected = model_class(raw).serialize()
+            data = generated_class(expected).serialize()
+            self.assertEqual(expected, data)
+            self.assertEqual(expected, model_class(data).serialize())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import json
+import subprocess
+import sys
+
+import kubernetes_py
+from tests.BaseTest import BaseTest
+
+
+def _loaded(statement=None):
+    # the modules loaded by 'statement' in a fresh interpreter.
+    code = "import json, sys\nbefore = set(sys.modules)\n{0}\nprint(json.dumps(sorted(set(sys.modules) - before)))"
+    out = subprocess.check_output([sys.executable, "-c", code.format(statement)])
+    return json.loads(out.decode("utf-8"))
+
+
+class K8sImportTest(BaseTest):
+    def test_import_is_lazy(self):
+        loaded = _loaded("import kubernetes_py")
+        self.assertEqual(["kubernetes_py", "kubernetes_py.K8sExceptions"], [x for x in loaded if "kubernetes_py" in x])
+        for module in ("yaml", "dateutil", "requests"):
+            self.assertNotIn(module, loaded)
+
+    def test_import_loads_what_is_used(self):
+        loaded = _loaded("from kubernetes_py import K8sConfig")
+        self.assertIn("kubernetes_py.K8sConfig", loaded)
+        self.assertNotIn("kubernetes_py.K8sPod", loaded)
+        self.assertNotIn("kubernetes_py.K8sDeployment", loaded)
+
+    def test_public_names(self):
+        from kubernetes_py import K8sPod, NotFoundException
+        from kubernetes_py.K8sPod import K8sPod as cls
+        from kubernetes_py.K8sExceptions import NotFoundException as exc
+
+        self.assertIs(cls, K8sPod)
+        self.assertIs(exc, NotFoundException)
+        for name in kubernetes_py.__all__:
+            self.assertIsInstance(getattr(kubernetes_py, name), type)
+            self.assertIn(name, dir(kubernetes_py))
+        self.assertIn("K8sDeployment", kubernetes_py.__all__)
+        self.assertNotIn("K8sReplicaSet", kubernetes_py.__all__)
+        with self.assertRaises(AttributeError):
+            kubernetes_py.K8sNothing
+
+    def test_submodules_keep_the_classes(self):
+        import kubernetes_py.K8sStatefulSet
+
+        self.assertIsInstance(kubernetes_py.K8sStatefulSet, type)
+        self.assertIsInstance(kubernetes_py.utils.HttpRequest, type)
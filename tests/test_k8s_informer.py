@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+import time
+
+from kubernetes_py import K8sConfig, K8sDeployment, K8sInformer, K8sNode, K8sPod, K8sReplicationController
+from kubernetes_py.utils.Indexer import Indexer
+from kubernetes_py.utils.Selectors import Selector
+from tests._server import StandInServer
+from tests.BaseTest import BaseTest
+
+
+def _pod(name=None, namespace="default", rv="1", labels=None, node=None, owner=None):
+    meta = {"name": name, "namespace": namespace, "resourceVersion": rv, "labels": labels or {}}
+    if owner is not None:
+        meta["ownerReferences"] = [{"kind": "ReplicaSet", "name": owner, "uid": "uid-" + owner}]
+    return {"kind": "Pod", "apiVersion": "v1", "metadata": meta, "spec": {"nodeName": node}}
+
+
+def _list(items=None, rv="10"):
+    return {"kind": "List", "metadata": {"resourceVersion": rv}, "items": items}
+
+
+def _list_and_watch(listing=None, events=None):
+    streams = [iter(events or [])]
+
+    def answer(req=None):
+        if req["query"].get("watch") != "true":
+            return 200, listing
+        return 200, streams.pop(0) if streams else iter([])
+
+    return answer
+
+
+def _wait(predicate=None, timeout=5):
+    start = time.time()
+    while not predicate():
+        if time.time() - start > timeout:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+class K8sInformerTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+        self.informers = []
+
+    def tearDown(self):
+        for informer in self.informers:
+            informer.stop()
+        self.server.stop()
+
+    def _start(self, obj_type=None):
+        informer = K8sInformer.shared(config=self.config, obj_type=obj_type).start()
+        self.informers.append(informer)
+        self.assertTrue(informer.wait_for_sync(timeout=5))
+        return informer
+
+    def _requests_to(self, path=None):
+        return len([r for r in self.server.requests if r["path"] == path])
+
+    # ------------------------------------------------------------------------------------- indexer
+
+    def test_indexer_indexes(self):
+        store = Indexer()
+        store.replace([_pod("a", labels={"app": "yo"}, node="n1"), _pod("b", "kube-system", labels={"app": "yo"})])
+        self.assertEqual(2, len(store))
+        self.assertEqual(["a"], [x["metadata"]["name"] for x in store.by_index("nodeName", "n1")])
+        self.assertEqual(["b"], [x["metadata"]["name"] for x in store.by_indexes(namespace="kube-system", label="app=yo")])
+        store.apply("MODIFIED", _pod("a", labels={"app": "ma"}, node="n2"))
+        self.assertEqual([], store.by_index("nodeName", "n1"))
+        self.assertEqual(["a"], [x["metadata"]["name"] for x in store.by_index("label", "app=ma")])
+        store.apply("DELETED", _pod("a"))
+        self.assertIsNone(store.get("default", "a"))
+        self.assertEqual([], store.by_index("label", "app=ma"))
+        with self.assertRaises(SyntaxError):
+            store.by_index("nope", "x")
+
+    # ------------------------------------------------------------------------------------- list & watch
+
+    def test_cluster_wide_list_then_watch(self):
+        listing = _list([_pod("a"), _pod("b", "kube-system")])
+        events = [{"type": "ADDED", "object": _pod("c", rv="11")}, {"type": "DELETED", "object": _pod("a", rv="12")}]
+        self.server.route("GET", "/api/v1/pods", _list_and_watch(listing, events))
+        seen = []
+        informer = K8sInformer.shared(config=self.config, obj_type="Pod").add_handler(lambda e: seen.append(e.type))
+        informer = self._start("Pod")
+        self.assertTrue(_wait(lambda: len(seen) == 2))
+        self.assertEqual(["ADDED", "DELETED"], seen)
+        keys = sorted((x["metadata"]["namespace"], x["metadata"]["name"]) for x in informer.store.list())
+        self.assertEqual([("default", "c"), ("kube-system", "b")], keys)
+        watch = [r for r in self.server.requests if r["query"].get("watch") == "true"][0]
+        self.assertEqual("10", watch["query"]["resourceVersion"])
+
+    def test_shared_by_config_copies(self):
+        informer = K8sInformer.shared(config=self.config, obj_type="Pod")
+        self.assertIs(informer, K8sInformer.shared(config=copy.deepcopy(self.config), obj_type="Pod"))
+        self.assertIsNot(informer, K8sInformer.shared(config=self.config, obj_type="Node"))
+        self.assertIsNone(K8sInformer.lookup(config=self.config, obj_type="Pod"))
+
+    def test_shared_by_session(self):
+        informer = K8sInformer.shared(config=self.config, obj_type="Pod")
+        self.assertIn(self.config.session, K8sInformer._registry)
+        other = K8sConfig(kubeconfig=None, api_host=self.server.url)
+        self.assertIsNot(informer, K8sInformer.shared(config=other, obj_type="Pod"))
+        informer.stop()
+        self.assertIsNot(informer, K8sInformer.shared(config=self.config, obj_type="Pod"))
+
+    # ------------------------------------------------------------------------------------- cache lookups
+
+    def test_pods_by_labels_from_cache(self):
+        listing = _list(
+            [_pod("a", labels={"app": "yo"}), _pod("b", labels={"app": "ma"}), _pod("c", "other", labels={"app": "yo"})]
+        )
+        self.server.route("GET", "/api/v1/pods", _list_and_watch(listing))
+        self._start("Pod")
+        pods = K8sPod.get_by_labels(config=self.config, labels={"app": "yo"})
+        self.assertEqual(["a"], [p.name for p in pods])
+        self.assertEqual(0, self._requests_to("/api/v1/namespaces/default/pods"))
+
+    def test_pods_by_selector_from_cache(self):
+        listing = _list(
+            [
+                _pod("a", labels={"app": "yo", "tier": "web"}),
+                _pod("b", labels={"app": "yo", "tier": "cache"}),
+                _pod("c", labels={"app": "yo", "tier": "web", "canary": "true"}),
+                _pod("d", labels={"app": "ma", "tier": "web"}),
+            ]
+        )
+        self.server.route("GET", "/api/v1/pods", _list_and_watch(listing))
+        self._start("Pod")
+        selector = Selector.parse("app=yo,tier in (web,api),!canary")
+        pods = K8sPod.get_by_labels(config=self.config, labels=selector)
+        self.assertEqual(["a"], [p.name for p in pods])
+        self.assertEqual(0, self._requests_to("/api/v1/namespaces/default/pods"))
+
+    def test_replication_controller_pods_from_cache(self):
+        rc = K8sReplicationController(config=self.config, name="yo")
+        listing = _list([_pod("yo-1", labels=rc.pod_labels), _pod("yo-2", labels={"name": "yo"})])
+        self.server.route("GET", "/api/v1/pods", _list_and_watch(listing))
+        self._start("Pod")
+        self.assertEqual(["yo-1"], [p.name for p in rc.get_pods()])
+
+    def test_node_pods_from_cache(self):
+        listing = _list([_pod("a", node="n1"), _pod("b", "kube-system", node="n1"), _pod("c", node="n2")])
+        self.server.route("GET", "/api/v1/pods", _list_and_watch(listing))
+        self._start("Pod")
+        pods = K8sNode(config=self.config, name="n1").pods
+        keys = sorted((p.model.metadata.namespace, p.name) for p in pods)
+        self.assertEqual([("default", "a"), ("kube-system", "b")], keys)
+        kube_system = [p for p in pods if p.name == "b"][0]
+        self.assertEqual("/api/v1/namespaces/kube-system/pods", kube_system.base_url)
+        self.assertEqual("default", self.config.namespace)
+
+    def test_deployment_cascade_delete_from_cache(self):
+        meta = {"name": "yo-123", "namespace": "default", "uid": "uid-yo-123", "ownerReferences": [{"uid": "uid-yo"}]}
+        rs = {"kind": "ReplicaSet", "apiVersion": "extensions/v1beta1", "metadata": meta}
+        pods = [_pod("yo-123-a", owner="yo-123"), _pod("yo-zzz")]
+        self.server.route("GET", "/apis/extensions/v1beta1/replicasets", _list_and_watch(_list([rs])))
+        self.server.route("GET", "/api/v1/pods", _list_and_watch(_list(pods)))
+        self._start("ReplicaSet")
+        self._start("Pod")
+
+        deleted = []
+        paths = [
+            "/apis/extensions/v1beta1/namespaces/default/deployments/yo",
+            "/apis/extensions/v1beta1/namespaces/default/replicasets/yo-123",
+            "/api/v1/namespaces/default/pods/yo-123-a",
+        ]
+        for path in paths:
+            self.server.route(
+                "DELETE", path, lambda req: deleted.append(req["path"].split("/")[-1]) or (200, {"kind": "Status"})
+            )
+
+        dep = K8sDeployment(config=self.config, name="yo")
+        dep.model.metadata.uid = "uid-yo"
+        dep.delete(cascade=True)
+        self.assertEqual(["yo", "yo-123", "yo-123-a"], deleted)
+        self.assertEqual(0, self._requests_to("/apis/extensions/v1beta1/namespaces/default/replicasets"))
+        self.assertEqual(0, self._requests_to("/api/v1/namespaces/default/pods"))
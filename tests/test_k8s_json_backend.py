@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes_py import K8sConfig, K8sPod
+from kubernetes_py.utils import JsonBackend
+from tests._server import StandInServer
+from tests.BaseTest import BaseTest
+
+PODS = "/api/v1/namespaces/default/pods"
+
+
+class K8sJsonBackendTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        JsonBackend.use_backend(None)
+        self.server.stop()
+
+    def test_loads(self):
+        doc = b'{"kind": "Pod", "metadata": {"name": "caf\\u00e9", "labels": {"a": "b"}}, "items": [1, 2.5, true, null]}'
+        for backend in JsonBackend.VALID_BACKENDS:
+            JsonBackend.use_backend(backend)
+            for data in (doc, doc.decode("utf-8")):
+                decoded = JsonBackend.loads(data)
+                self.assertEqual(u"café", decoded["metadata"]["name"])
+                self.assertEqual([1, 2.5, True, None], decoded["items"])
+                self.assertIsInstance(decoded["metadata"]["labels"], dict)
+
+    def test_loads_what_json_accepts(self):
+        doc = b'{"kind": "Pod", "spec": {"ratio": NaN, "huge": 1e400, "name": "\\ud800"}}'
+        for backend in JsonBackend.VALID_BACKENDS:
+            JsonBackend.use_backend(backend)
+            for data in (doc, doc.decode("utf-8")):
+                spec = JsonBackend.loads(data)["spec"]
+                self.assertNotEqual(spec["ratio"], spec["ratio"])
+                self.assertEqual(float("inf"), spec["huge"])
+                self.assertEqual(u"\ud800", spec["name"])
+            with self.assertRaises(ValueError):
+                JsonBackend.loads(b"yo")
+
+        # a response is decoded, rather than handed back as text.
+        JsonBackend.use_backend(None)
+        self.server.route("GET", PODS + "/yo", (200, {"kind": "Pod", "metadata": {"name": "yo"}, "ratio": float("inf")}))
+        state = K8sPod(config=self.config, name="yo").request(method="GET", url=PODS + "/yo")
+        self.assertEqual(float("inf"), state["data"]["ratio"])
+
+    def test_invalid_backend(self):
+        with self.assertRaises(SyntaxError):
+            JsonBackend.use_backend("yaml")
+
+    def test_responses(self):
+        self.server.route("GET", PODS + "/yo", (200, {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": "yo"}}))
+        self.server.route("GET", PODS + "/yo/log", (200, {"Content-Type": "text/plain"}, "line 1\nline 2\n"))
+        for backend in JsonBackend.VALID_BACKENDS:
+            JsonBackend.use_backend(backend)
+            pod = K8sPod(config=self.config, name="yo").get()
+            self.assertEqual("yo", pod.name)
+            self.assertEqual("line 1\nline 2\n", pod.request(method="GET", url=PODS + "/yo/log")["data"])
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import io
+import threading
+import time
+
+from kubernetes_py import K8sConfig, K8sContainer, K8sDeployment, K8sPod, K8sReplicationController
+from kubernetes_py.K8sLogAggregator import K8sLogAggregator, LogLine
+from tests.BaseTest import BaseTest
+from tests._server import StandInServer
+
+PODS = "/api/v1/namespaces/default/pods"
+
+
+def _log(pod=None):
+    return "{0}/{1}/log".format(PODS, pod)
+
+
+class K8sLogAggregatorTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _pods(self, *names):
+        return [K8sPod(config=self.config, name=x) for x in names]
+
+    # ------------------------------------------------------------------------------------- init
+
+    def test_init_invalid(self):
+        for params in (dict(pods=None), dict(pods=["yo"]), dict(pods=[], max_workers=0), dict(pods=[], max_workers=True)):
+            with self.assertRaises(SyntaxError):
+                K8sLogAggregator(**params)
+        with self.assertRaises(SyntaxError):
+            K8sLogAggregator.from_owner(owner="yo")
+
+    # ------------------------------------------------------------------------------------- lines
+
+    def test_lines_merged_in_timestamp_order(self):
+        # the kubelet trims the trailing zeros of the nanoseconds: .25 is earlier than .5
+        self.server.route("GET", _log("a"), (200, iter(["2018-06-01T12:00:00.5Z a1\n", "2018-06-01T12:00:02Z a2\n"])))
+        self.server.route(
+            "GET",
+            _log("b"),
+            (200, iter(["2018-06-01T12:00:00.25Z b1\n", "  at line 12\n", "2018-06-01T12:00:01.123456789Z b2\n"])),
+        )
+        lines = list(K8sLogAggregator(pods=self._pods("a", "b")).lines())
+        expected = [
+            LogLine("2018-06-01T12:00:00.25Z", "b", None, "b1"),
+            LogLine(None, "b", None, "  at line 12"),
+            LogLine("2018-06-01T12:00:00.5Z", "a", None, "a1"),
+            LogLine("2018-06-01T12:00:01.123456789Z", "b", None, "b2"),
+            LogLine("2018-06-01T12:00:02Z", "a", None, "a2"),
+        ]
+        self.assertEqual(expected, lines)
+        self.assertEqual(["true", "true"], [x["query"]["timestamps"] for x in self.server.requests])
+
+    def test_lines_params(self):
+        self.server.route("GET", _log("a"), (200, ""))
+        list(K8sLogAggregator(pods=self._pods("a")).lines(tail_lines=10, since_seconds=60, previous=True))
+        expected = {"tailLines": "10", "sinceSeconds": "60", "previous": "true", "timestamps": "true"}
+        self.assertEqual(expected, self.server.requests[0]["query"])
+        with self.assertRaises(SyntaxError):
+            K8sLogAggregator(pods=self._pods("a")).lines(tail_lines=-1)
+        with self.assertRaises(SyntaxError):
+            K8sLogAggregator(pods=self._pods("a")).lines(reorder_seconds=-1)
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_lines_of_each_container(self):
+        pod = K8sPod(config=self.config, name="a")
+        pod.add_container(K8sContainer(name="redis", image="redis:3.2.3"))
+        pod.add_container(K8sContainer(name="sidecar", image="nginx:1.7.9"))
+
+        def log(request):
+            return 200, "2018-06-01T12:00:00Z {0}\n".format(request["query"]["container"])
+
+        self.server.route("GET", _log("a"), log)
+        lines = list(K8sLogAggregator(pods=[pod]).lines())
+        self.assertEqual([("a", "redis", "redis"), ("a", "sidecar", "sidecar")], [x[1:] for x in map(tuple, lines)])
+        self.assertEqual("2018-06-01T12:00:00Z a/redis redis", str(lines[0]))
+        lines = list(K8sLogAggregator(pods=[pod], container="redis").lines())
+        self.assertEqual(["redis"], [x.container for x in lines])
+
+    def test_lines_bounded_workers(self):
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def stream(name):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.05)
+            yield "2018-06-01T12:00:00Z {0}\n".format(name)
+            with lock:
+                active[0] -= 1
+
+        names = ["pod-{0}".format(i) for i in range(8)]
+        for name in names:
+            self.server.route("GET", _log(name), lambda r, name=name: (200, stream(name)))
+        lines = list(K8sLogAggregator(pods=self._pods(*names), max_workers=3).lines())
+        self.assertEqual(names, [x.message for x in lines])
+        self.assertLessEqual(active[1], 3)
+        self.assertGreater(active[1], 1)
+
+    def test_lines_skip_failed_logs(self):
+        self.server.route("GET", _log("a"), (200, "2018-06-01T12:00:00Z a1\n"))
+        aggregator = K8sLogAggregator(pods=self._pods("a", "gone"))
+        self.assertEqual(["a1"], [x.message for x in aggregator.lines()])
+        self.assertEqual(1, len(aggregator.errors))
+        self.assertEqual(("gone", None), aggregator.errors[0][:2])
+
+    def test_lines_follow(self):
+        written = threading.Event()
+
+        def a():
+            written.wait(10)
+            yield "2018-06-01T12:00:02Z a1\n"
+
+        def b():
+            yield "2018-06-01T12:00:01Z b1\n"
+            written.set()
+            yield "2018-06-01T12:00:03Z b2\n"
+
+        self.server.route("GET", _log("a"), (200, a()))
+        self.server.route("GET", _log("b"), (200, b()))
+        lines = K8sLogAggregator(pods=self._pods("a", "b")).lines(follow=True, reorder_seconds=0.5)
+        self.assertEqual(["b1", "a1", "b2"], [x.message for x in lines])
+        self.assertEqual(["true", "true"], [x["query"]["follow"] for x in self.server.requests])
+
+    def test_lines_follow_closed_early(self):
+        done = threading.Event()
+
+        def quiet(name=None):
+            yield "2018-06-01T12:00:01Z {0}1\n".format(name)
+            # nothing more is written, and the stream is never ended by the server.
+            done.wait(30)
+            yield ""
+
+        self.server.route("GET", _log("a"), (200, quiet("a")))
+        self.server.route("GET", _log("b"), (200, quiet("b")))
+        try:
+            lines = K8sLogAggregator(pods=self._pods("a", "b")).lines(follow=True, reorder_seconds=0)
+            self.assertIn(next(lines).message, ("a1", "b1"))
+            lines.close()
+            deadline = time.time() + 5
+            while time.time() < deadline and any(x.name == "K8sLogAggregator" for x in threading.enumerate()):
+                time.sleep(0.05)
+            self.assertEqual([], [x for x in threading.enumerate() if x.name == "K8sLogAggregator"])
+        finally:
+            done.set()
+
+    def test_lines_follow_needs_a_worker_per_log(self):
+        with self.assertRaises(SyntaxError):
+            K8sLogAggregator(pods=self._pods("a", "b"), max_workers=1).lines(follow=True)
+
+    # ------------------------------------------------------------------------------------- write
+
+    def test_write(self):
+        self.server.route("GET", _log("a"), (200, "2018-06-01T12:00:01Z a1\n"))
+        self.server.route("GET", _log("b"), (200, "2018-06-01T12:00:00Z b1\n"))
+        aggregator = K8sLogAggregator(pods=self._pods("a", "b"))
+        out = io.StringIO()
+        self.assertEqual(2, aggregator.write(out))
+        self.assertEqual("2018-06-01T12:00:00Z b b1\n2018-06-01T12:00:01Z a a1\n", out.getvalue())
+        received = []
+        self.assertEqual(2, aggregator.write(received.append))
+        self.assertEqual(["b", "a"], [x.pod for x in received])
+        with self.assertRaises(SyntaxError):
+            aggregator.write(out=None)
+
+    # ------------------------------------------------------------------------------------- sources
+
+    def _route_pods(self, *names):
+        items = [{"metadata": {"name": x}, "spec": {"containers": [{"name": "redis", "image": "redis"}]}} for x in names]
+        self.server.route("GET", PODS, (200, {"kind": "PodList", "metadata": {}, "items": items}))
+        for name in names:
+            self.server.route("GET", _log(name), (200, "2018-06-01T12:00:00Z {0}\n".format(name)))
+
+    def test_from_labels(self):
+        self._route_pods("a", "b")
+        aggregator = K8sLogAggregator.from_labels(config=self.config, labels={"app": "redis"})
+        self.assertEqual(["a", "b"], [x.message for x in aggregator.lines()])
+        self.assertEqual("app=redis", self.server.requests[0]["query"]["labelSelector"])
+        self.assertEqual("redis", self.server.requests[1]["query"]["container"])
+
+    def test_from_owner(self):
+        self._route_pods("a")
+        for owner in (
+            K8sDeployment(config=self.config, name="yo"),
+            K8sReplicationController(config=self.config, name="yo"),
+        ):
+            aggregator = K8sLogAggregator.from_owner(owner=owner)
+            self.assertEqual(["a"], [x.message for x in aggregator.lines()])
+            self.assertIn("name=yo", self.server.requests[-2]["query"]["labelSelector"].split(","))
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes_py import K8sConfig, K8sInformer, K8sMetrics
+from kubernetes_py.K8sExceptions import NotFoundException, UnauthorizedException
+from tests.BaseTest import BaseTest
+from tests._server import StandInServer
+
+METRICS = "/apis/metrics.k8s.io/v1beta1"
+MI = 2 ** 20
+
+# namespace, name, node, (controller kind, controller name), containers usage
+PODS = [
+    ("default", "web-1", "node-1", ("ReplicaSet", "web-5d4f"), [("100m", "64Mi"), ("1500000n", "16Mi")]),
+    ("default", "web-2", "node-2", ("ReplicaSet", "web-5d4f"), [("250m", "128Mi")]),
+    ("default", "db-1", "node-1", ("ReplicationController", "db"), [("1", "1Gi")]),
+    ("default", "lone", "node-2", None, [("5m", "10Mi")]),
+    ("kube-system", "dns-1", "node-1", ("ReplicaSet", "dns-7c9b"), [("20m", "32Mi")]),
+]
+
+REPLICASETS = [("default", "web-5d4f", "web"), ("kube-system", "dns-7c9b", "dns")]
+
+
+def _metadata(namespace=None, name=None, owner=None):
+    metadata = {"namespace": namespace, "name": name}
+    if owner is not None:
+        metadata["ownerReferences"] = [{"kind": owner[0], "name": owner[1], "uid": owner[1], "controller": True}]
+    return metadata
+
+
+def _list(kind=None, items=None):
+    return 200, {"kind": kind, "metadata": {}, "items": items}
+
+
+def _pod_metrics(namespace=None):
+    items = list()
+    for ns, name, _, _, containers in PODS:
+        if namespace is None or ns == namespace:
+            usage = [{"name": "c", "usage": {"cpu": cpu, "memory": memory}} for cpu, memory in containers]
+            items.append({"metadata": _metadata(ns, name), "timestamp": "2018-06-01T12:00:00Z", "containers": usage})
+    return _list("PodMetricsList", items)
+
+
+def _pods(namespace=None):
+    items = list()
+    for ns, name, node, owner, _ in PODS:
+        if namespace is None or ns == namespace:
+            items.append({"metadata": _metadata(ns, name, owner), "spec": {"nodeName": node}})
+    return _list("PodList", items)
+
+
+def _replicasets(namespace=None):
+    items = list()
+    for ns, name, deployment in REPLICASETS:
+        if namespace is None or ns == namespace:
+            items.append({"metadata": _metadata(ns, name, ("Deployment", deployment))})
+    return _list("ReplicaSetList", items)
+
+
+class K8sMetricsTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+        self.server.route("GET", METRICS + "/namespaces/default/pods", _pod_metrics("default"))
+        self.server.route("GET", METRICS + "/pods", _pod_metrics())
+        self.server.route("GET", "/api/v1/namespaces/default/pods", _pods("default"))
+        self.server.route("GET", "/api/v1/pods", _pods())
+        self.server.route("GET", "/apis/extensions/v1beta1/namespaces/default/replicasets", _replicasets("default"))
+        self.server.route("GET", "/apis/extensions/v1beta1/replicasets", _replicasets())
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _paths(self):
+        return [x["path"] for x in self.server.requests]
+
+    def test_init_invalid(self):
+        with self.assertRaises(SyntaxError):
+            K8sMetrics(config="yo")
+        with self.assertRaises(SyntaxError):
+            K8sMetrics(config=self.config).usage_by(group="yo")
+
+    def test_pod_metrics(self):
+        metrics = K8sMetrics(config=self.config)
+        self.assertEqual(["web-1", "web-2", "db-1", "lone"], [x["metadata"]["name"] for x in metrics.pod_metrics()])
+        self.assertEqual(5, len(metrics.pod_metrics(all_namespaces=True)))
+        metrics.pod_metrics(labels={"app": "web"})
+        self.assertEqual("app=web", self.server.requests[-1]["query"]["labelSelector"])
+        self.assertEqual([METRICS + "/namespaces/default/pods", METRICS + "/pods"], self._paths()[:2])
+        self.assertEqual("default", self.config.namespace)
+
+    def test_pod_usage(self):
+        usage = K8sMetrics(config=self.config).pod_usage()
+        # 100m + 1.5m is rounded up once, from the nanocores summed.
+        self.assertEqual({"cpu": 102, "memory": 80 * MI}, usage[("default", "web-1")])
+        self.assertEqual({"cpu": 1000, "memory": 1024 * MI}, usage[("default", "db-1")])
+        self.assertEqual(4, len(usage))
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_node_usage(self):
+        items = [
+            {"metadata": {"name": "node-1"}, "usage": {"cpu": "1250m", "memory": "3Gi"}},
+            {"metadata": {"name": "node-2"}, "usage": {"cpu": "400001u", "memory": "2048Ki"}},
+        ]
+        self.server.route("GET", METRICS + "/nodes", _list("NodeMetricsList", items))
+        usage = K8sMetrics(config=self.config).node_usage()
+        expected = {"node-1": {"cpu": 1250, "memory": 3072 * MI}, "node-2": {"cpu": 401, "memory": 2 * MI}}
+        self.assertEqual(expected, usage)
+        self.assertEqual([METRICS + "/nodes"], self._paths())
+
+    def test_metrics_errors(self):
+        metrics = K8sMetrics(config=self.config)
+        self.server.route("GET", METRICS + "/nodes", (404, {"kind": "Status", "message": "the server could not find it"}))
+        with self.assertRaises(NotFoundException):
+            metrics.node_usage()
+        self.server.route("GET", METRICS + "/nodes", (401, {"kind": "Status", "message": "Unauthorized"}))
+        with self.assertRaises(UnauthorizedException):
+            metrics.node_metrics()
+
+    def test_usage_by_namespace(self):
+        usage = K8sMetrics(config=self.config).usage_by(group="namespace", all_namespaces=True)
+        expected = {
+            "default": {"cpu": 1357, "memory": (64 + 16 + 128 + 1024 + 10) * MI, "pods": 4},
+            "kube-system": {"cpu": 20, "memory": 32 * MI, "pods": 1},
+        }
+        self.assertEqual(expected, usage)
+        self.assertEqual([METRICS + "/pods"], self._paths())
+
+    def test_usage_by_node(self):
+        usage = K8sMetrics(config=self.config).usage_by(group="node")
+        expected = {
+            "node-1": {"cpu": 1102, "memory": (64 + 16 + 1024) * MI, "pods": 2},
+            "node-2": {"cpu": 255, "memory": (128 + 10) * MI, "pods": 2},
+        }
+        self.assertEqual(expected, usage)
+        self.assertEqual(["/api/v1/namespaces/default/pods", METRICS + "/namespaces/default/pods"], self._paths())
+
+    def test_usage_by_controller(self):
+        metrics = K8sMetrics(config=self.config)
+        web = {"cpu": 352, "memory": (64 + 16 + 128) * MI, "pods": 2}
+        self.assertEqual({("default", "web-5d4f"): web}, metrics.usage_by(group="replicaset"))
+        db = {"cpu": 1000, "memory": 1024 * MI, "pods": 1}
+        self.assertEqual({("default", "db"): db}, metrics.usage_by(group="replicationcontroller"))
+        dns = {"cpu": 20, "memory": 32 * MI, "pods": 1}
+        usage = metrics.usage_by(group="deployment", all_namespaces=True)
+        self.assertEqual({("default", "web"): web, ("kube-system", "dns"): dns}, usage)
+        expected = ["/apis/extensions/v1beta1/replicasets", "/api/v1/pods", METRICS + "/pods"]
+        self.assertEqual(expected, self._paths()[-3:])
+
+    def test_usage_by_with_informer(self):
+        informer = K8sInformer.shared(config=self.config, obj_type="Pod", namespace="default").start()
+        try:
+            self.assertTrue(informer.wait_for_sync(timeout=10))
+            count = len(self.server.requests)
+            usage = K8sMetrics(config=self.config).usage_by(group="node")
+            self.assertEqual(2, usage["node-1"]["pods"])
+            # the pods come from the informer: only the metrics are listed.
+            requests = [x["path"] for x in self.server.requests[count:] if "watch" not in x["query"]]
+            self.assertEqual([METRICS + "/namespaces/default/pods"], requests)
+        finally:
+            informer.stop()
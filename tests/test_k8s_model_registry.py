@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import importlib
+
+from kubernetes_py import K8sConfig, K8sCronJob, K8sObject
+from kubernetes_py.K8sExceptions import NotFoundException
+from kubernetes_py.models.unversioned.WatchEvent import WatchEvent
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.models.v1beta1 import CronJob as CronJobV1Beta1
+from kubernetes_py.models.v2alpha1 import CronJob as CronJobV2Alpha1
+from kubernetes_py.utils import ModelRegistry, str_to_class
+from tests.BaseTest import BaseTest
+
+
+class K8sModelRegistryTest(BaseTest):
+    def test_resolve(self):
+        self.assertIs(Pod, ModelRegistry.resolve("Pod"))
+        self.assertIs(WatchEvent, ModelRegistry.resolve("WatchEvent"))
+        self.assertIs(Pod, ModelRegistry.resolve("Pod", "v1"))
+
+    def test_resolve_versions(self):
+        self.assertEqual(["v1beta1", "v2alpha1"], ModelRegistry.versions("CronJob"))
+        self.assertIs(CronJobV1Beta1.CronJob, ModelRegistry.resolve("CronJob"))
+        self.assertIs(CronJobV1Beta1.CronJob, ModelRegistry.resolve("CronJob", "v1beta1"))
+        self.assertIs(CronJobV2Alpha1.CronJob, ModelRegistry.resolve("CronJob", "v2alpha1"))
+        self.assertIsInstance(str_to_class("CronJob", "v2alpha1"), CronJobV2Alpha1.CronJob)
+
+    def test_resolve_unknown(self):
+        with self.assertRaises(NotFoundException):
+            ModelRegistry.resolve("Yo")
+        with self.assertRaises(NotFoundException):
+            ModelRegistry.resolve("Pod", "v2alpha1")
+        with self.assertRaises(NotFoundException):
+            str_to_class("Yo")
+
+    def test_str_to_class(self):
+        a, b = str_to_class("Pod"), str_to_class("Pod")
+        self.assertIsInstance(a, Pod)
+        self.assertIsNot(a, b)
+
+    def test_resolved_once(self):
+        imported = []
+        import_module = importlib.import_module
+
+        def counting(name, *args):
+            imported.append(name)
+            return import_module(name, *args)
+
+        ModelRegistry.resolve("Node")
+        ModelRegistry.resolve("CronJob")
+        importlib.import_module = counting
+        try:
+            for _ in range(3):
+                K8sObject(config=K8sConfig(kubeconfig=None), obj_type="Node", name="yo")
+                K8sCronJob(config=K8sConfig(kubeconfig=None), name="yo")
+        finally:
+            importlib.import_module = import_module
+        self.assertEqual([], imported)
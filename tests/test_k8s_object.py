@@ -6,13 +6,41 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+import itertools
+import threading
 import uuid
 
-from kubernetes_py import K8sObject, K8sConfig
+from kubernetes_py import K8sContainer, K8sObject, K8sConfig, K8sDeployment, K8sNode, K8sPod
+from kubernetes_py.K8sEvent import K8sEvent
 from kubernetes_py.K8sExceptions import UnprocessableEntityException, NotFoundException, InvalidObjectException
+from kubernetes_py.K8sExceptions import TimedOutException, WatchException
+from kubernetes_py.models.unversioned.BaseModel import LAZY_FIELDS, LazyModel
+from kubernetes_py.models.v1.Node import Node
+from kubernetes_py.models.v1.Pod import Pod
+from kubernetes_py.models.v1beta1.Deployment import Deployment
+from kubernetes_py.utils import build_trusted, is_valid_date_time, is_valid_string
 from tests import _utils
+from tests._server import StandInServer
 from tests.BaseTest import BaseTest
 
+PODS = "/api/v1/namespaces/default/pods"
+
+
+def _pod(name=None, rv=None):
+    return {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": name, "namespace": "default", "resourceVersion": rv}}
+
+
+def _event(event_type=None, obj=None):
+    return {"type": event_type, "object": obj}
+
+
+def _responses(*responses):
+    """
+    Answers each request with the next response, then with empty streams.
+    """
+    queue = list(responses)
+    return lambda req: queue.pop(0) if queue else (200, iter([]))
+
 
 class K8sObjectTest(BaseTest):
     def setUp(self):
@@ -377,3 +405,403 @@ class K8sObjectTest(BaseTest):
             self.assertIn("gitVersion", v)
             self.assertIn("major", v)
             self.assertIn("minor", v)
+
+
+class K8sObjectWatchTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _watches(self):
+        return [r["query"] for r in self.server.requests if r["query"].get("watch") == "true"]
+
+    def test_watch_typed_events(self):
+        events = [_event("ADDED", _pod("yo", "1")), _event("MODIFIED", _pod("yo", "2")), _event("DELETED", _pod("yo", "3"))]
+        self.server.route("GET", PODS, _responses((200, iter(events))))
+        pod = K8sPod(config=self.config, name="yo")
+        received = list(itertools.islice(pod.watch(timeout=5), 3))
+        self.assertEqual(["ADDED", "MODIFIED", "DELETED"], [e.type for e in received])
+        self.assertTrue(all(isinstance(e.object, Pod) for e in received))
+        self.assertEqual("yo", received[0].object.name)
+        self.assertEqual("3", received[2].resource_version)
+        self.assertNotIn("resourceVersion", self._watches()[0])
+
+    def test_watch_model_of_subclass(self):
+        dep = {"kind": "Deployment", "apiVersion": "extensions/v1beta1", "metadata": {"name": "yo", "resourceVersion": "1"}}
+        obj = K8sDeployment(config=self.config, name="yo")
+        self.server.route("GET", obj.base_url, _responses((200, iter([_event("ADDED", dep)]))))
+        event = next(obj.watch(timeout=5))
+        self.assertIsInstance(event.object, Deployment)
+
+    def test_watch_resumes_after_disconnect(self):
+        self.server.route(
+            "GET",
+            PODS,
+            _responses((200, iter([_event("ADDED", _pod("yo", "7"))])), (200, iter([_event("MODIFIED", _pod("yo", "9"))]))),
+        )
+        pod = K8sPod(config=self.config, name="yo")
+        received = list(itertools.islice(pod.watch(labels={"app": "yo"}, fields={"status.phase": "Running"}), 2))
+        self.assertEqual(["ADDED", "MODIFIED"], [e.type for e in received])
+        watches = self._watches()
+        self.assertEqual("7", watches[1]["resourceVersion"])
+        self.assertEqual("app=yo", watches[1]["labelSelector"])
+        self.assertEqual("status.phase=Running", watches[1]["fieldSelector"])
+        self.assertEqual("true", watches[1]["allowWatchBookmarks"])
+
+    def test_watch_bookmarks(self):
+        stream = [_event("BOOKMARK", _pod(None, "5")), _event("ADDED", _pod("yo", "6"))]
+        self.server.route("GET", PODS, _responses((200, iter(stream)), (200, iter([_event("BOOKMARK", _pod(None, "8"))]))))
+        pod = K8sPod(config=self.config, name="yo")
+        self.assertEqual("ADDED", next(pod.watch(timeout=5)).type)
+
+        self.server.route("GET", PODS, _responses((200, iter(stream)), (200, iter([_event("BOOKMARK", _pod(None, "8"))]))))
+        received = list(itertools.islice(pod.watch(timeout=5, bookmarks=True), 3))
+        self.assertEqual(["BOOKMARK", "ADDED", "BOOKMARK"], [e.type for e in received])
+        self.assertEqual("6", self._watches()[-1]["resourceVersion"])
+
+    def test_watch_relists_on_gone(self):
+        stream = [
+            _event("ADDED", _pod("a", "1")),
+            _event("ADDED", _pod("b", "2")),
+            _event("ERROR", {"kind": "Status", "code": 410, "message": "too old resource version"}),
+        ]
+        listing = {"kind": "PodList", "metadata": {"resourceVersion": "20"}, "items": [_pod("a", "3"), _pod("c", "4")]}
+
+        def pods(req=None):
+            if req["query"].get("watch") != "true":
+                return 200, listing
+            return watches(req)
+
+        watches = _responses((200, iter(stream)), (200, iter([_event("MODIFIED", _pod("c", "21"))])))
+        self.server.route("GET", PODS, pods)
+        pod = K8sPod(config=self.config, name="yo")
+        received = list(itertools.islice(pod.watch(timeout=5), 6))
+        self.assertEqual(
+            [("ADDED", "a"), ("ADDED", "b"), ("MODIFIED", "a"), ("ADDED", "c"), ("DELETED", "b"), ("MODIFIED", "c")],
+            [(e.type, e.object.name) for e in received],
+        )
+        self.assertEqual("20", self._watches()[1]["resourceVersion"])
+
+    def test_watch_http_gone(self):
+        listing = {"kind": "PodList", "metadata": {"resourceVersion": "20"}, "items": [_pod("a", "3")]}
+
+        def pods(req=None):
+            if req["query"].get("watch") != "true":
+                return 200, listing
+            if req["query"].get("resourceVersion") == "1":
+                return 410, {"kind": "Status", "code": 410}
+            return 200, iter([_event("MODIFIED", _pod("a", "21"))])
+
+        self.server.route("GET", PODS, pods)
+        pod = K8sPod(config=self.config, name="yo")
+        received = list(itertools.islice(pod.watch(resource_version="1", timeout=5), 2))
+        self.assertEqual([("ADDED", "a"), ("MODIFIED", "a")], [(e.type, e.object.name) for e in received])
+
+    def test_watch_error_event(self):
+        stream = [_event("ERROR", {"kind": "Status", "code": 500, "message": "boom"})]
+        self.server.route("GET", PODS, _responses((200, iter(stream))))
+        pod = K8sPod(config=self.config, name="yo")
+        with self.assertRaises(WatchException):
+            next(pod.watch(timeout=5))
+
+    def test_watch_timeout(self):
+        self.server.route("GET", PODS, _responses())
+        pod = K8sPod(config=self.config, name="yo")
+        self.assertEqual([], list(pod.watch(timeout=1)))
+        self.assertEqual("1", self._watches()[0]["timeoutSeconds"])
+
+
+def _ready_pod(name=None, rv=None, ready=True):
+    pod = _pod(name, rv)
+    pod["status"] = {"phase": "Running", "conditions": [{"type": "Ready", "status": "True" if ready else "False"}]}
+    return pod
+
+
+class K8sObjectWaitTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _gets(self):
+        return [r for r in self.server.requests if r["path"] == PODS + "/yo" and r["method"] == "GET"]
+
+    def test_wait_satisfied_by_watch_event(self):
+        self.server.route("GET", PODS + "/yo", (200, _ready_pod("yo", "1", ready=False)))
+        self.server.route("GET", PODS, _responses((200, iter([_event("MODIFIED", _ready_pod("yo", "2"))]))))
+        pod = K8sPod(config=self.config, name="yo")
+        pod._wait_for_readiness()
+        self.assertTrue(pod._is_ready_status())
+        self.assertEqual(1, len(self._gets()))
+        watch = [r["query"] for r in self.server.requests if r["query"].get("watch") == "true"][0]
+        self.assertEqual("metadata.name=yo", watch["fieldSelector"])
+        self.assertEqual("1", watch["resourceVersion"])
+
+    def test_delete_resolved_by_watch_event(self):
+        self.server.route("DELETE", PODS + "/yo", (200, {"kind": "Status", "status": "Success"}))
+        self.server.route("GET", PODS + "/yo", (200, _ready_pod("yo", "1")))
+        self.server.route("GET", PODS, _responses((200, iter([_event("DELETED", _ready_pod("yo", "2"))]))))
+        K8sPod(config=self.config, name="yo").delete()
+        self.assertEqual(1, len(self._gets()))
+
+    def test_delete_leaves_the_model_alone(self):
+        terminating = _ready_pod("yo", "2")
+        terminating["metadata"].update(deletionTimestamp="2020-01-01T00:00:00Z", finalizers=["yo/cleanup"])
+        self.server.route("DELETE", PODS + "/yo", (200, {"kind": "Status", "status": "Success"}))
+        self.server.route("GET", PODS + "/yo", (200, terminating))
+        stream = [_event("MODIFIED", dict(terminating, metadata=dict(terminating["metadata"], resourceVersion="3")))]
+        stream.append(_event("DELETED", terminating))
+        self.server.route("GET", PODS, _responses((200, iter(stream))))
+        pod = K8sPod(config=self.config, name="yo")
+        pod.add_container(K8sContainer(name="yo", image="nginx"))
+        before = pod.serialize()
+        pod.delete()
+        self.assertEqual(before, pod.serialize())
+
+        # nor does polling, when the server can't be watched.
+        answers = [(200, terminating), (404, {"kind": "Status", "code": 404})]
+        self.server.route("GET", PODS + "/yo", lambda req: answers.pop(0))
+        self.server.route("GET", PODS, (405, {"kind": "Status", "code": 405, "message": "watch not allowed"}))
+        pod.delete()
+        self.assertEqual(before, pod.serialize())
+
+    def test_wait_polls_when_watch_is_refused(self):
+        answers = [_ready_pod("yo", "1", ready=False), _ready_pod("yo", "2", ready=False), _ready_pod("yo", "3")]
+        self.server.route("GET", PODS + "/yo", lambda req: (200, answers.pop(0) if len(answers) > 1 else answers[0]))
+        self.server.route("GET", PODS, (405, {"kind": "Status", "code": 405, "message": "watch not allowed"}))
+        pod = K8sPod(config=self.config, name="yo")
+        pod._wait_for_readiness()
+        self.assertTrue(pod._is_ready_status())
+        self.assertEqual(3, len(self._gets()))
+
+    def test_wait_times_out(self):
+        self.server.route("GET", PODS + "/yo", (200, _ready_pod("yo", "1", ready=False)))
+        self.server.route("GET", PODS, _responses())
+        pod = K8sPod(config=self.config, name="yo")
+        with self.assertRaises(TimedOutException):
+            pod._wait_for(pod._is_ready_status, timeout=1, message="nope")
+
+
+def _page(names=None, token=None):
+    return 200, {"kind": "PodList", "metadata": {"continue": token}, "items": [_pod(n, "1") for n in names]}
+
+
+class K8sObjectListIterTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_list_iter_follows_continue_tokens(self):
+        self.server.route("GET", PODS, _responses(_page(["a", "b"], "t1"), _page(["c", "d"], "t2"), _page(["e"])))
+        obj = K8sObject(config=self.config, obj_type="Pod", name="yo")
+        names = [x["metadata"]["name"] for x in obj.list_iter(labels={"app": "yo"}, limit=2)]
+        self.assertEqual(["a", "b", "c", "d", "e"], names)
+        queries = [r["query"] for r in self.server.requests]
+        self.assertEqual([{"limit": "2", "labelSelector": "app=yo"}], queries[:1])
+        self.assertEqual(["t1", "t2"], [q["continue"] for q in queries[1:]])
+
+    def test_list_iter_fetches_pages_lazily(self):
+        self.server.route("GET", PODS, _responses(_page(["a", "b"], "t1"), _page(["c"])))
+        pods = K8sPod(config=self.config, name="yo").list_iter(limit=2)
+        first = next(pods)
+        self.assertIsInstance(first, K8sPod)
+        self.assertEqual("a", first.name)
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual(["b", "c"], [p.name for p in pods])
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_list_iter_pattern(self):
+        self.server.route("GET", PODS, _responses(_page(["yo-1", "ma"], "t1"), _page(["yo-2"])))
+        pods = K8sPod(config=self.config, name="yo").list_iter(pattern="yo")
+        self.assertEqual(["yo-1", "yo-2"], [p.name for p in pods])
+        self.assertEqual(str(K8sObject.LIST_PAGE_SIZE), self.server.requests[0]["query"]["limit"])
+
+    def test_list_iter_invalid_limit(self):
+        obj = K8sObject(config=self.config, obj_type="Pod", name="yo")
+        for limit in [0, -1, "10", True]:
+            with self.assertRaises(SyntaxError):
+                next(obj.list_iter(limit=limit))
+
+
+class K8sObjectFieldSelectorTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_list_fields(self):
+        self.server.route("GET", PODS, _page(["a"]))
+        obj = K8sObject(config=self.config, obj_type="Pod", name="yo")
+        obj.list(labels={"app": "yo"}, fields={"status.phase": "Running"})
+        query = self.server.requests[0]["query"]
+        self.assertEqual({"labelSelector": "app=yo", "fieldSelector": "status.phase=Running"}, query)
+
+    def test_list_iter_fields(self):
+        self.server.route("GET", PODS, _page(["a"]))
+        pods = list(K8sPod(config=self.config, name="yo").list_iter(fields={"spec.nodeName": "node-1"}))
+        self.assertEqual(["a"], [p.name for p in pods])
+        self.assertEqual("spec.nodeName=node-1", self.server.requests[0]["query"]["fieldSelector"])
+
+    def test_get_by_pod_ip(self):
+        pod = _pod("a", "1")
+        pod["status"] = {"podIP": "10.0.0.2"}
+        self.server.route("GET", PODS, (200, {"kind": "PodList", "items": [pod]}))
+        found = K8sPod.get_by_pod_ip(config=self.config, ip="10.0.0.2")
+        self.assertEqual("a", found.name)
+        self.assertEqual("status.podIP=10.0.0.2", self.server.requests[0]["query"]["fieldSelector"])
+
+    def test_node_pod_inventory(self):
+        items = [_pod("a", "1"), _pod("b", "2")]
+        items[1]["metadata"]["namespace"] = "kube-system"
+        self.server.route("GET", "/api/v1/pods", (200, {"kind": "PodList", "items": items}))
+        pods = K8sNode(config=self.config, name="node-1")._pod_inventory()
+        self.assertEqual(["default", "kube-system"], [p.config.namespace for p in pods])
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual({"fieldSelector": "spec.nodeName=node-1"}, self.server.requests[0]["query"])
+        self.assertEqual("default", self.config.namespace)
+
+    def test_event_warnings(self):
+        self.server.route("GET", "/api/v1/events", (200, {"kind": "EventList", "items": []}))
+        K8sEvent(config=self.config, name="yo").warnings(fields={"involvedObject.name": "yo"})
+        selector = self.server.requests[0]["query"]["fieldSelector"].split(",")
+        self.assertEqual(["involvedObject.name=yo", "type=Warning"], sorted(selector))
+
+
+def _full_pod(name=None):
+    pod = _pod(name, "1")
+    pod["metadata"]["labels"] = {"app": "yo"}
+    pod["metadata"]["managedBy"] = "not-a-field-of-ObjectMeta"
+    pod["spec"] = {"containers": [{"name": "yo", "image": "redis", "args": ["--verbose"]}], "nodeName": "node-1"}
+    pod["status"] = {"phase": "Running", "podIP": "10.0.0.2"}
+    return pod
+
+
+class K8sObjectLazyModelTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url, lazy_models=True)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_lazy_builds_fields_on_access(self):
+        pod = Pod.lazy(_full_pod("a"))
+        self.assertIsInstance(pod, Pod)
+        self.assertEqual([], [a for a in LAZY_FIELDS if pod._is_built(a)])
+        self.assertEqual("a", pod.name)
+        self.assertEqual("Running", pod.status.phase)
+        self.assertFalse(pod._is_built("_spec"))
+        self.assertEqual("redis", pod.spec.containers[0].image)
+        self.assertEqual("Pod", pod.kind)
+
+    def test_lazy_serializes_untouched(self):
+        raw = _full_pod("a")
+        pod = Pod.lazy(raw)
+        self.assertEqual(raw, pod.serialize())
+        self.assertEqual("a", pod.name)
+        self.assertEqual("Running", pod.status.phase)
+        self.assertEqual(raw, pod.serialize())
+        self.assertEqual("v1", pod.api_version)
+        self.assertEqual(raw, pod.serialize())
+
+    def test_lazy_serializes_modifications(self):
+        raw = _full_pod("a")
+        pod = Pod.lazy(raw)
+        pod.metadata.labels["tier"] = "web"
+        pod.spec.containers[0].args.append("--debug")
+        data = pod.serialize()
+        self.assertEqual({"app": "yo", "tier": "web"}, data["metadata"]["labels"])
+        self.assertEqual(["--verbose", "--debug"], data["spec"]["containers"][0]["args"])
+        self.assertEqual(raw["status"], data["status"])
+        self.assertEqual(_full_pod("a"), raw)
+
+    def test_lazy_equals_eager(self):
+        raw = _full_pod("a")
+        self.assertEqual(Pod(raw), Pod.lazy(raw))
+        self.assertEqual(Pod.lazy(raw), Pod(raw))
+        self.assertEqual(Pod(raw).spec.serialize(), Pod.lazy(raw).spec.serialize())
+
+    def test_lazy_invalid_model(self):
+        with self.assertRaises(SyntaxError):
+            Pod.lazy("yo")
+
+    def test_list_lazy_models(self):
+        self.server.route("GET", PODS, (200, {"kind": "PodList", "items": [_full_pod("a"), _full_pod("b")]}))
+        pods = K8sPod(config=self.config, name="yo").list()
+        self.assertEqual(["a", "b"], [p.name for p in pods])
+        self.assertFalse(pods[0].model._is_built("_spec"))
+        self.assertEqual("node-1", pods[0].model.spec.node_name)
+
+    def test_list_iter_eager_models(self):
+        self.server.route("GET", PODS, _page(["a"]))
+        self.config.lazy_models = False
+        pods = list(K8sPod(config=self.config, name="yo").list_iter())
+        self.assertNotIsInstance(pods[0].model, LazyModel)
+
+
+def _node(name=None, heartbeat=None):
+    condition = {"type": "Ready", "status": "True", "lastHeartbeatTime": heartbeat}
+    return {"kind": "Node", "apiVersion": "v1", "metadata": {"name": name}, "status": {"conditions": [condition]}}
+
+
+class K8sObjectTrustedTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_trusted_skips_validation(self):
+        with self.assertRaises(SyntaxError):
+            Node(_node("a", "a while ago"))
+        node = build_trusted(Node, _node("a", "a while ago"))
+        self.assertEqual("a while ago", node.status.conditions[0].last_heartbeat_time)
+        # only while the model is built.
+        self.assertFalse(is_valid_date_time("a while ago"))
+        with self.assertRaises(SyntaxError):
+            node.status.conditions[0].last_heartbeat_time = "a while ago"
+
+    def test_trusted_is_restored(self):
+        with self.assertRaises(TypeError):
+            build_trusted(Node, _node("a", "a while ago"), "yo")
+        self.assertFalse(is_valid_string(None))
+
+    def test_trusted_is_per_thread(self):
+        seen = []
+
+        def build(model=None):
+            t = threading.Thread(target=lambda: seen.append(is_valid_string(None)))
+            t.start()
+            t.join()
+            return Node(model)
+
+        build_trusted(build, _node("a", "a while ago"))
+        self.assertEqual([False], seen)
+
+    def test_list_and_get_trust_the_server(self):
+        self.server.route("GET", "/api/v1/nodes", (200, {"kind": "NodeList", "items": [_node("a", "a while ago")]}))
+        self.server.route("GET", "/api/v1/nodes/a", (200, _node("a", "a while ago")))
+        self.assertEqual(["a"], [n.name for n in K8sNode(config=self.config, name="yo").list()])
+        self.assertEqual(["a"], [n.name for n in K8sNode(config=self.config, name="yo").list_iter()])
+        node = K8sNode(config=self.config, name="a").get()
+        self.assertEqual("a while ago", node.model.status.conditions[0].last_heartbeat_time)
+        with self.assertRaises(SyntaxError):
+            node.model.status.conditions[0].last_heartbeat_time = "a while ago"
+
+    def test_lazy_models_trust_the_server(self):
+        self.config.lazy_models = True
+        self.server.route("GET", "/api/v1/nodes", (200, {"kind": "NodeList", "items": [_node("a", "a while ago")]}))
+        node = K8sNode(config=self.config, name="yo").list()[0]
+        self.assertEqual("a while ago", node.model.status.conditions[0].last_heartbeat_time)
+        self.assertIsInstance(K8sNode(config=self.config, name="a").from_model(node.model), K8sNode)
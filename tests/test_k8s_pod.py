@@ -6,6 +6,9 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+import copy
+import datetime
+import threading
 import uuid
 
 from kubernetes_py.K8sConfig import K8sConfig
@@ -18,6 +21,7 @@ from kubernetes_py.models.v1.Pod import Pod
 from kubernetes_py.models.v1.PodSpec import PodSpec
 from kubernetes_py.models.v1.PodStatus import PodStatus
 from tests import _utils, _constants
+from tests._server import StandInServer
 from tests.BaseTest import BaseTest
 
 
@@ -103,6 +107,40 @@ class K8sPodTest(BaseTest):
         self.assertIsInstance(pod.model.spec, PodSpec)
         self.assertIsInstance(pod.model.status, PodStatus)
 
+    def test_struct_pod_leaves_model_untouched(self):
+        model = _constants.pod_with_node_affinity()
+        model["metadata"]["labels"] = {"app": "web"}
+        model["metadata"]["annotations"] = {"owner": "team"}
+        model["spec"]["containers"][0]["resources"] = {"limits": {"cpu": "500m"}}
+        model["spec"]["containers"][0]["args"] = ["--verbose"]
+        model["spec"]["nodeSelector"] = {"disk": "ssd"}
+        original = copy.deepcopy(model)
+
+        pod = K8sPod(config=_utils.create_config(), name="yo")
+        pod.model = Pod(model)
+        pod.add_label("tier", "frontend")
+        pod.del_label("app")
+        pod.add_annotation("team", "core")
+        pod.model.spec.containers[0].resources.limits["memory"] = "256Mi"
+        pod.model.spec.containers[0].args.append("--debug")
+        pod.model.spec.node_selector["zone"] = "a"
+        pod.model.spec.containers[0].name = "renamed"
+
+        self.assertEqual(original, model)
+        self.assertEqual({"tier": "frontend"}, pod.labels)
+        self.assertEqual({"owner": "team", "team": "core"}, pod.annotations)
+
+    def test_struct_pod_slots(self):
+        model = _constants.pod_with_node_affinity()
+        model["metadata"]["ownerReferences"] = [{"apiVersion": "v1", "kind": "ReplicaSet", "name": "yo", "uid": "u"}]
+        pod = Pod(model)
+        container = pod.spec.containers[0]
+        for obj in [pod, pod.metadata, pod.metadata.owner_references[0], pod.spec, pod.spec.affinity, container]:
+            self.assertFalse(hasattr(obj, "__dict__"), obj.__class__.__name__)
+        with self.assertRaises(AttributeError):
+            container.imagee = "redis"
+        self.assertEqual("yo", pod.serialize()["metadata"]["ownerReferences"][0]["name"])
+
     # ------------------------------------------------------------------------------------- add annotation
 
     def test_add_annotation_none_args(self):
@@ -1338,3 +1376,90 @@ class K8sPodTest(BaseTest):
             self.assertEqual(3, len(pod.tolerations))
             for node in nodes:
                 node.untaint(key=key, value=value)
+
+
+LOG = "/api/v1/namespaces/default/pods/yo/log"
+
+
+class K8sPodLogTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_stream_log(self):
+        self.server.route("GET", LOG, (200, iter(["line 1\nli", "ne 2\r\n", "café\n", "line 4"])))
+        lines = K8sPod(config=self.config, name="yo").stream_log()
+        self.assertEqual("line 1", next(lines))
+        self.assertEqual(["line 2", "café", "line 4"], list(lines))
+        self.assertEqual({}, self.server.requests[0]["query"])
+
+    def test_stream_log_params(self):
+        self.server.route("GET", LOG, (200, "yo\n"))
+        pod = K8sPod(config=self.config, name="yo")
+        params = dict(follow=True, tail_lines=10, since_seconds=60, limit_bytes=1024, timestamps=True, previous=True)
+        self.assertEqual(["yo"], list(pod.stream_log(container="redis", **params)))
+        expected = {
+            "container": "redis",
+            "follow": "true",
+            "tailLines": "10",
+            "sinceSeconds": "60",
+            "limitBytes": "1024",
+            "timestamps": "true",
+            "previous": "true",
+        }
+        self.assertEqual(expected, self.server.requests[0]["query"])
+
+        since = datetime.datetime(2018, 6, 1, 12, 0, 0)
+        list(pod.stream_log(since_time=since, tail_lines=0))
+        self.assertEqual({"sinceTime": "2018-06-01T12:00:00Z", "tailLines": "0"}, self.server.requests[1]["query"])
+        list(pod.stream_log(since_time="2018-06-01T12:00:00Z"))
+        self.assertEqual({"sinceTime": "2018-06-01T12:00:00Z"}, self.server.requests[2]["query"])
+
+    def test_stream_log_invalid_params(self):
+        pod = K8sPod(config=self.config, name="yo")
+        for params in (
+            dict(tail_lines=-1),
+            dict(tail_lines="10"),
+            dict(since_seconds=0),
+            dict(limit_bytes=True),
+            dict(since_time="yesterday-ish"),
+            dict(since_time=5),
+            dict(since_seconds=60, since_time="2018-06-01T12:00:00Z"),
+        ):
+            with self.assertRaises(SyntaxError):
+                pod.stream_log(**params)
+        self.assertEqual([], self.server.requests)
+
+    def test_stream_log_follow(self):
+        written = threading.Event()
+        read = threading.Event()
+
+        def follow():
+            yield "line 1\n"
+            written.set()
+            read.wait(10)
+            yield "line 2\n"
+
+        self.server.route("GET", LOG, (200, follow()))
+        lines = K8sPod(config=self.config, name="yo").stream_log(follow=True)
+        self.assertEqual("line 1", next(lines))
+        self.assertTrue(written.is_set())
+        self.assertFalse(read.is_set())
+        read.set()
+        self.assertEqual(["line 2"], list(lines))
+
+    def test_stream_log_not_found(self):
+        with self.assertRaises(NotFoundException):
+            K8sPod(config=self.config, name="yo").stream_log()
+
+    def test_get_log_is_not_decoded(self):
+        pod = K8sPod(config=self.config, name="yo")
+        self.server.route("GET", LOG, (200, '{"level": "info"}\n123'))
+        self.assertEqual(['{"level": "info"}', "123"], pod.get_log())
+        self.server.route("GET", LOG, (200, ""))
+        self.assertEqual("", pod.get_log())
+        pod.get_log(container="redis")
+        self.assertEqual({"container": "redis"}, self.server.requests[-1]["query"])
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import sys
+import unittest
+
+from kubernetes_py.models.v1.NodeStatus import NodeStatus
+from kubernetes_py.models.v1.ResourceRequirements import ResourceRequirements
+from kubernetes_py.utils import Quantity, cpu_millicores, memory_bytes, parse_quantity, quantity_array
+from tests.BaseTest import BaseTest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class K8sQuantityTest(BaseTest):
+    def test_parse_quantity(self):
+        for value, scale, expected in (
+            ("0", 0, 0),
+            ("2", 0, 2),
+            ("250m", -3, 250),
+            ("1.5", -3, 1500),
+            (".5", -3, 500),
+            ("1234567n", -9, 1234567),
+            ("1u", -9, 1000),
+            ("128Mi", 0, 128 * 2 ** 20),
+            ("1.5Gi", 0, 3 * 2 ** 29),
+            ("1k", 0, 1000),
+            ("1E", 0, 10 ** 18),
+            ("1e3", 0, 1000),
+            ("1E3", 0, 1000),
+            ("5e-3", -3, 5),
+            ("+1", 0, 1),
+            ("-2", -3, -2000),
+            (3, -3, 3000),
+            (0.25, -3, 250),
+        ):
+            self.assertEqual(expected, parse_quantity(value, scale), value)
+
+    def test_parse_quantity_rounds_up(self):
+        self.assertEqual(2, parse_quantity("1234567n", -3))
+        self.assertEqual(1, parse_quantity("100m", 0))
+        self.assertEqual(0, parse_quantity("-100m", 0))
+        self.assertEqual(-1, parse_quantity("-1.5", 0))
+
+    def test_parse_quantity_invalid(self):
+        for value in ("", "m", "Mi", "1x", "1.2.3", "1 Mi", "1mi", "e3", None, True, [1]):
+            with self.assertRaises(SyntaxError):
+                parse_quantity(value)
+
+    def test_units(self):
+        self.assertEqual(250, cpu_millicores("250m"))
+        self.assertEqual(2000, cpu_millicores("2"))
+        self.assertEqual(1, cpu_millicores("1n"))
+        self.assertEqual(134217728, memory_bytes("128Mi"))
+        self.assertEqual(10 ** 9, memory_bytes("1G"))
+
+    # ------------------------------------------------------------------------------------- Quantity
+
+    def test_quantity(self):
+        q = Quantity("1536Mi")
+        self.assertEqual("1536Mi", str(q))
+        self.assertEqual("Quantity('1536Mi')", repr(q))
+        self.assertEqual(1536 * 2 ** 20, q.value)
+        self.assertEqual("0.5", str(Quantity("0.5")))
+        self.assertEqual("3", str(Quantity(3)))
+        self.assertEqual("250m", str(Quantity(0.25)))
+        self.assertEqual(2, Quantity("1500m").value)
+        self.assertEqual(1500, Quantity("1.5").milli_value)
+        self.assertEqual(1, Quantity("1n").milli_value)
+        self.assertEqual(1, Quantity("1n").nanos)
+        self.assertEqual(0.25, float(Quantity("250m")))
+        self.assertFalse(Quantity("0m"))
+        self.assertEqual(q, Quantity(q))
+        with self.assertRaises(SyntaxError):
+            Quantity("yo")
+
+    def test_quantity_compare(self):
+        self.assertEqual(Quantity("0.5"), Quantity("500m"))
+        self.assertEqual(Quantity("1Ki"), Quantity("1024"))
+        self.assertEqual(Quantity("1k"), 1000)
+        self.assertEqual(Quantity("250m"), 0.25)
+        self.assertLess(Quantity("999m"), 1)
+        self.assertGreater(Quantity("1Gi"), Quantity("1G"))
+        self.assertGreaterEqual(Quantity("1"), Quantity("1000m"))
+        self.assertEqual(["100m", "0.5", "1", "2"], [str(x) for x in sorted(map(Quantity, ["1", "2", "0.5", "100m"]))])
+        self.assertEqual(1, len({Quantity("1"), Quantity("1000m"), Quantity("1000000000n"), 1}))
+        self.assertEqual(hash(0.25), hash(Quantity("250m")))
+        # never equal to a string, which hashes differently.
+        self.assertNotEqual(Quantity("1"), "1")
+        self.assertNotEqual(Quantity("1"), "yo")
+        self.assertNotIn(Quantity("1"), {"1": True})
+        with self.assertRaises(TypeError):
+            Quantity("1") < "2"
+        with self.assertRaises(TypeError):
+            Quantity("1") >= "1"
+
+    def test_quantity_arithmetic(self):
+        self.assertEqual("512Mi", str(Quantity("1Gi") - "512Mi"))
+        self.assertEqual("2Gi", str(Quantity("1536Mi") + "512Mi"))
+        self.assertEqual("1536Mi", str(Quantity("1Gi") + "0.5Gi"))
+        self.assertEqual("300m", str(sum([Quantity("100m")] * 3)))
+        self.assertEqual("1100m", str(Quantity("1") + "100m"))
+        self.assertEqual("1k", str(Quantity("600") + 400))
+        self.assertEqual("-1500m", str(Quantity("1") - "2.5"))
+        self.assertEqual("1500m", str(abs(-Quantity("1.5"))))
+        self.assertEqual("1500m", str(Quantity("500m") * 3))
+        self.assertEqual("3Gi", str(3 * Quantity("1Gi")))
+        self.assertEqual("1500m", str(2 - Quantity("500m")))
+        # exact, where floats are not: 0.1 + 0.2 == 0.3
+        self.assertEqual(Quantity("0.3"), Quantity("0.1") + Quantity("0.2"))
+        with self.assertRaises(TypeError):
+            Quantity("1") + "yo"
+        with self.assertRaises(TypeError):
+            Quantity("1") * 1.5
+
+    # ------------------------------------------------------------------------------------- models
+
+    def test_resource_requirements(self):
+        resources = ResourceRequirements({"limits": {"cpu": "500m", "memory": "1536Mi"}, "requests": {"cpu": "0.1"}})
+        self.assertEqual({"cpu": "500m", "memory": "1536Mi"}, resources.limits)
+        self.assertEqual({"cpu": Quantity("500m"), "memory": Quantity("1.5Gi")}, resources.limit_quantities)
+        self.assertEqual(100, resources.request_quantities["cpu"].milli_value)
+        resources.requests = {"cpu": Quantity("250m"), "memory": "1Gi"}
+        self.assertEqual({"cpu": "250m", "memory": "1Gi"}, resources.requests)
+        self.assertEqual({"cpu": "250m", "memory": "1Gi"}, resources.serialize()["requests"])
+
+    def test_node_status(self):
+        capacity = {"cpu": "4", "memory": "16Gi", "pods": "110"}
+        status = NodeStatus({"capacity": capacity, "allocatable": {"cpu": "3920m"}})
+        self.assertEqual({"cpu": "4", "memory": "16Gi", "pods": "110"}, status.capacity)
+        self.assertEqual(110, status.capacity_quantities["pods"].value)
+        headroom = status.capacity_quantities["cpu"] - status.allocatable_quantities["cpu"]
+        self.assertEqual("80m", str(headroom))
+        status.allocatable = {"cpu": Quantity("3.5")}
+        self.assertEqual({"cpu": "3.5"}, status.serialize()["allocatable"])
+
+    # ------------------------------------------------------------------------------------- arrays
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_quantity_array(self):
+        values = ["100m", "1", None, "250m", "100m", Quantity("2"), 3]
+        millicores = quantity_array(values, -3)
+        self.assertEqual(numpy.int64, millicores.dtype)
+        self.assertEqual([100, 1000, 0, 250, 100, 2000, 3000], millicores.tolist())
+        self.assertEqual([1, 2], quantity_array([None, "2"], 0, default=1).tolist())
+        self.assertEqual(3 * 2 ** 30, int(quantity_array(["1Gi"] * 3, 0).sum()))
+        self.assertEqual([], quantity_array([], -3).tolist())
+        with self.assertRaises(SyntaxError):
+            quantity_array(["1", "yo"])
+
+    def test_quantity_array_needs_numpy(self):
+        installed = sys.modules.get("numpy", None)
+        sys.modules["numpy"] = None
+        try:
+            with self.assertRaises(ImportError):
+                quantity_array(["1"])
+        finally:
+            if installed is None:
+                del sys.modules["numpy"]
+            else:
+                sys.modules["numpy"] = installed
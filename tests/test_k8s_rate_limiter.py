@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import asyncio
+import copy
+import socket
+import time
+from email.utils import formatdate
+
+import requests
+from urllib3.exceptions import ProtocolError
+
+from kubernetes_py import AsyncK8sPod, K8sConfig, K8sObject, K8sPod
+from kubernetes_py.K8sExceptions import BadRequestException, NotFoundException
+from kubernetes_py.utils.HttpRequest import _is_connection_reset
+from kubernetes_py.utils.RateLimiter import RateLimiter, RetryPolicy, parse_retry_after
+from tests._server import StandInServer
+from tests.BaseTest import BaseTest
+
+PODS = "/api/v1/namespaces/default/pods"
+
+
+def _pod(name=None):
+    return {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": name, "namespace": "default"}}
+
+
+def _answers(*answers):
+    queue = list(answers)
+    return lambda req: queue.pop(0) if len(queue) > 1 else queue[0]
+
+
+class K8sRateLimiterTest(BaseTest):
+    def setUp(self):
+        return
+
+    def tearDown(self):
+        return
+
+    # ------------------------------------------------------------------------------------- token bucket
+
+    def test_unlimited(self):
+        limiter = RateLimiter()
+        self.assertFalse(limiter.enabled)
+        self.assertEqual([0] * 100, [limiter.reserve() for _ in range(100)])
+        self.assertEqual({"requests": 100, "waits": 0, "wait_seconds": 0.0}, limiter.stats())
+
+    def test_burst_then_qps(self):
+        limiter = RateLimiter(qps=10, burst=3)
+        delays = [limiter.reserve() for _ in range(5)]
+        self.assertEqual([0, 0, 0], delays[:3])
+        self.assertAlmostEqual(0.1, delays[3], delta=0.02)
+        self.assertAlmostEqual(0.2, delays[4], delta=0.02)
+        stats = limiter.stats()
+        self.assertEqual(2, stats["waits"])
+        self.assertAlmostEqual(0.3, stats["wait_seconds"], delta=0.04)
+
+    def test_refills(self):
+        limiter = RateLimiter(qps=50, burst=1)
+        self.assertEqual(0, limiter.acquire())
+        time.sleep(0.05)
+        self.assertEqual(0, limiter.acquire())
+
+    def test_invalid(self):
+        for kwargs in [{"qps": 0}, {"qps": -1}, {"qps": "5"}, {"qps": 5, "burst": 0}, {"qps": 5, "burst": 1.5}]:
+            with self.assertRaises(SyntaxError):
+                RateLimiter(**kwargs)
+        with self.assertRaises(SyntaxError):
+            RetryPolicy(max_retries=-1)
+
+    # ------------------------------------------------------------------------------------- retry policy
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry(0, "POST", 429))
+        self.assertTrue(policy.should_retry(1, "GET", 503))
+        self.assertTrue(policy.should_retry(0, "DELETE", None))
+        self.assertFalse(policy.should_retry(2, "GET", 503))
+        self.assertFalse(policy.should_retry(0, "POST", 503))
+        self.assertFalse(policy.should_retry(0, "PATCH", None))
+        self.assertFalse(policy.should_retry(0, "GET", 404))
+        self.assertFalse(policy.should_retry(0, "GET", 200))
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff=0.1, max_backoff=0.5, jitter=False)
+        self.assertEqual([0.1, 0.2, 0.4, 0.5], [policy.delay(n) for n in range(4)])
+        jittered = RetryPolicy(backoff=0.1, max_backoff=0.5)
+        for n in range(10):
+            self.assertTrue(0 <= jittered.delay(n) <= 0.5)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(backoff=0.1, jitter=False)
+        self.assertEqual(3, policy.delay(0, "3"))
+        self.assertAlmostEqual(5, policy.delay(0, formatdate(time.time() + 5, usegmt=True)), delta=1.5)
+        self.assertEqual(0, parse_retry_after(formatdate(time.time() - 60, usegmt=True)))
+        self.assertEqual(0.1, policy.delay(0, "soon"))
+        # capped to max_backoff.
+        self.assertEqual(10, policy.delay(0, "86400"))
+        self.assertEqual(10, policy.delay(0, formatdate(time.time() + 86400, usegmt=True)))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class K8sRateLimiterRequestTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+        self.config.retry_policy.backoff = 0.01
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_retries_throttled_request(self):
+        throttled = (429, {"Retry-After": "0"}, {"kind": "Status", "code": 429})
+        self.server.route("POST", PODS, _answers(throttled, throttled, (201, _pod("yo"))))
+        K8sObject(config=self.config, obj_type="Pod", name="yo").create()
+        self.assertEqual(3, len(self.server.requests))
+        self.assertEqual(2, self.config.rate_limit_stats["retries"])
+
+    def test_honors_retry_after(self):
+        self.server.route("GET", PODS + "/yo", _answers((429, {"Retry-After": "1"}, {}), (200, _pod("yo"))))
+        start = time.time()
+        K8sPod(config=self.config, name="yo").get()
+        self.assertGreaterEqual(time.time() - start, 1)
+
+    def test_retries_server_errors_of_idempotent_requests(self):
+        self.server.route("GET", PODS + "/yo", _answers((503, {}), (500, {}), (200, _pod("yo"))))
+        self.assertEqual("yo", K8sPod(config=self.config, name="yo").get().name)
+        self.assertEqual(3, len(self.server.requests))
+
+        self.server.route("POST", PODS, (503, {"kind": "Status", "message": "unavailable"}))
+        with self.assertRaises(BadRequestException):
+            K8sObject(config=self.config, obj_type="Pod", name="yo").create()
+        self.assertEqual(4, len(self.server.requests))
+
+    def test_gives_up(self):
+        self.server.route("GET", PODS + "/yo", (503, {}))
+        with self.assertRaises(Exception):
+            K8sPod(config=self.config, name="yo").get()
+        self.assertEqual(1 + self.config.retry_policy.max_retries, len(self.server.requests))
+
+    def test_no_retries(self):
+        config = K8sConfig(kubeconfig=None, api_host=self.server.url, max_retries=0)
+        self.server.route("GET", PODS + "/yo", (503, {}))
+        with self.assertRaises(Exception):
+            K8sPod(config=config, name="yo").get()
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_does_not_retry_refused_connections(self):
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        config = K8sConfig(kubeconfig=None, api_host="http://127.0.0.1:{0}".format(port))
+        with self.assertRaises(BadRequestException):
+            K8sPod(config=config, name="yo").get()
+        self.assertEqual(0, config.rate_limit_stats["retries"])
+
+    def test_does_not_retry_certificate_or_proxy_errors(self):
+        self.assertFalse(_is_connection_reset(requests.exceptions.SSLError("certificate verify failed")))
+        self.assertFalse(_is_connection_reset(requests.exceptions.ProxyError("407 Proxy Authentication Required")))
+        reset = requests.exceptions.ConnectionError(ProtocolError("Connection aborted.", ConnectionResetError()))
+        self.assertTrue(_is_connection_reset(reset))
+
+    def test_not_found_is_not_retried(self):
+        with self.assertRaises(NotFoundException):
+            K8sPod(config=self.config, name="yo").get()
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_rate_limited(self):
+        config = K8sConfig(kubeconfig=None, api_host=self.server.url, qps=20, burst=1)
+        self.server.route("GET", PODS + "/yo", (200, _pod("yo")))
+        start = time.time()
+        for _ in range(5):
+            K8sPod(config=config, name="yo").get()
+        self.assertGreaterEqual(time.time() - start, 0.15)
+        stats = config.rate_limit_stats
+        self.assertEqual(5, stats["requests"])
+        self.assertEqual(4, stats["waits"])
+        self.assertGreater(stats["wait_seconds"], 0.15)
+
+    def test_shared_by_config_copies(self):
+        config = K8sConfig(kubeconfig=None, api_host=self.server.url, qps=5)
+        clone = copy.deepcopy(config)
+        self.assertIs(config.rate_limiter, clone.rate_limiter)
+        self.assertIs(config.retry_policy, clone.retry_policy)
+
+    def test_async_retries_throttled_request(self):
+        self.server.route("GET", PODS + "/yo", _answers((429, {"Retry-After": "0"}, {}), (200, _pod("yo"))))
+        loop = asyncio.new_event_loop()
+        try:
+            pod = loop.run_until_complete(AsyncK8sPod(config=self.config, name="yo").get())
+            self.config.async_session.close()
+        finally:
+            loop.close()
+        self.assertEqual("yo", pod.name)
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(1, self.config.rate_limit_stats["retries"])
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes_py import K8sConfig, K8sObject, K8sPod
+from kubernetes_py.models.v1beta1.LabelSelector import LabelSelector
+from kubernetes_py.utils.Selectors import Selector, Requirement
+from tests._server import StandInServer
+from tests.BaseTest import BaseTest
+
+
+def _pod(name=None, labels=None):
+    return {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": name, "namespace": "default", "labels": labels}}
+
+
+class K8sSelectorTest(BaseTest):
+    def setUp(self):
+        return
+
+    def tearDown(self):
+        return
+
+    # ------------------------------------------------------------------------------------- parse
+
+    def test_parse_and_serialize(self):
+        sel = Selector.parse(" app in (web, api) ,tier!=cache,!canary, env==prod,release,track notin (beta)")
+        self.assertEqual("app in (api,web),tier!=cache,!canary,env=prod,release,track notin (beta)", str(sel))
+        self.assertEqual(sel, Selector.parse(str(sel)))
+        self.assertEqual({"env": "prod"}, sel.equalities)
+        self.assertEqual(6, len(sel))
+
+    def test_parse_qualified_keys(self):
+        sel = Selector.parse("app.kubernetes.io/name=redis,example.com/tier")
+        self.assertEqual(["app.kubernetes.io/name", "example.com/tier"], [r.key for r in sel.requirements])
+
+    def test_parse_empty(self):
+        sel = Selector.parse("")
+        self.assertEqual(0, len(sel))
+        self.assertTrue(sel.matches({"anything": "goes"}))
+
+    def test_parse_invalid(self):
+        for s in ["a in b", "a=b=c", ",", "a,,b", "-a", "a in (b", "a notin ()x", "a=b c", None, 42]:
+            with self.assertRaises(SyntaxError):
+                Selector.parse(s)
+
+    def test_requirement_invalid(self):
+        with self.assertRaises(SyntaxError):
+            Requirement("app", "in")
+        with self.assertRaises(SyntaxError):
+            Requirement("app", "=", ["a", "b"])
+        with self.assertRaises(SyntaxError):
+            Requirement("app", "exists", ["a"])
+        with self.assertRaises(SyntaxError):
+            Requirement("app", "~", ["a"])
+        with self.assertRaises(SyntaxError):
+            Requirement("app", "=", ["not valid"])
+
+    # ------------------------------------------------------------------------------------- builders
+
+    def test_from_dict(self):
+        self.assertEqual("app=yo,tier=web", str(Selector.from_dict({"tier": "web", "app": "yo"})))
+
+    def test_from_model(self):
+        model = LabelSelector(
+            {
+                "matchLabels": {"app": "yo"},
+                "matchExpressions": [
+                    {"key": "tier", "operator": "In", "values": ["web", "api"]},
+                    {"key": "track", "operator": "NotIn", "values": ["beta"]},
+                    {"key": "release", "operator": "Exists"},
+                    {"key": "canary", "operator": "DoesNotExist"},
+                ],
+            }
+        )
+        sel = Selector.from_model(model)
+        self.assertEqual("app=yo,tier in (api,web),track notin (beta),release,!canary", str(sel))
+        self.assertEqual(sel, Selector.from_model(model.serialize()))
+
+    def test_from_model_invalid_operator(self):
+        with self.assertRaises(SyntaxError):
+            Selector.from_model({"matchExpressions": [{"key": "a", "operator": "Gt", "values": ["1"]}]})
+
+    def test_add(self):
+        sel = Selector().add("app", values="yo").add("tier", "in", ["web"]).add("canary", "!")
+        self.assertEqual("app=yo,tier in (web),!canary", str(sel))
+        sel.add("app", values="yo")
+        self.assertEqual(3, len(sel))
+
+    # ------------------------------------------------------------------------------------- match
+
+    def test_matches(self):
+        sel = Selector.parse("app in (web,api),tier!=cache,!canary,release,track notin (beta)")
+        self.assertTrue(sel.matches({"app": "web", "release": "1"}))
+        self.assertTrue(sel.matches({"app": "api", "release": "1", "tier": "front", "track": "stable"}))
+        self.assertFalse(sel.matches({"app": "db", "release": "1"}))
+        self.assertFalse(sel.matches({"app": "web", "release": "1", "tier": "cache"}))
+        self.assertFalse(sel.matches({"app": "web", "release": "1", "canary": "true"}))
+        self.assertFalse(sel.matches({"app": "web"}))
+        self.assertFalse(sel.matches({"app": "web", "release": "1", "track": "beta"}))
+        self.assertFalse(sel.matches(None))
+
+    def test_compile_is_cached(self):
+        sel = Selector.parse("app=yo")
+        self.assertIs(sel.compile(), sel.compile())
+        match = sel.compile()
+        sel.add("tier", values="web")
+        self.assertIsNot(match, sel.compile())
+        self.assertFalse(sel.matches({"app": "yo"}))
+
+    def test_filter(self):
+        items = [_pod("a", {"app": "yo"}), _pod("b", {"app": "ma"}), _pod("c", None)]
+        self.assertEqual(["a"], [x["metadata"]["name"] for x in Selector.parse("app=yo").filter(items)])
+        self.assertEqual(["b", "c"], [x["metadata"]["name"] for x in Selector.parse("app!=yo").filter(items)])
+        pods = [K8sPod(name="a"), K8sPod(name="b")]
+        pods[0].labels = {"app": "yo"}
+        pods[1].labels = {"app": "ma"}
+        self.assertEqual(["a"], [p.name for p in Selector.parse("app in (yo)").filter(pods)])
+
+
+class K8sSelectorListTest(BaseTest):
+    def setUp(self):
+        self.server = StandInServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_list_with_selector(self):
+        self.server.route("GET", "/api/v1/namespaces/default/pods", (200, {"kind": "PodList", "items": []}))
+        obj = K8sObject(config=self.config, obj_type="Pod", name="yo")
+        obj.list(labels=Selector.parse("app in (web,api),!canary"))
+        obj.list(labels="tier notin (cache)")
+        obj.list(labels=Selector())
+        queries = [r["query"] for r in self.server.requests]
+        self.assertEqual("app in (api,web),!canary", queries[0]["labelSelector"])
+        self.assertEqual("tier notin (cache)", queries[1]["labelSelector"])
+        self.assertNotIn("labelSelector", queries[2])